@@ -82,6 +82,13 @@ from aeromaps.models.air_transport.markets.markets_factory import (
 # Climate model imports
 from aeromaps.models.impacts.climate.climate import ClimateModel
 
+# Fused disciplines substituted to standard models on configuration request
+from aeromaps.models.impacts.costs.airlines.direct_operating_costs import (
+    PassengerAircraftDocEnergyFused,
+)
+from aeromaps.models.impacts.emissions.non_co2_emissions import NonCO2EmissionsFused
+from aeromaps.models.impacts.energy_resources.energy_consumption import EnergyConsumptionFused
+
 # LCA models imports
 # Check if LCA packages for custom model are installed
 try:
@@ -339,6 +346,13 @@ class AeroMAPSProcess(object):
                         f"aeromaps.core.models. Available models: {[name for name in dir(aeromaps_models) if name.startswith('models_')]}"
                     )
 
+        if self._get_config_value("models", "non_co2_emissions", "fused", default=False):
+            models = self._fuse_non_co2_emissions(models)
+        if self._get_config_value("models", "energy_consumption", "fused", default=False):
+            models = self._fuse_energy_consumption(models)
+        if self._get_config_value("models", "direct_operating_costs", "fused", default=False):
+            models = self._fuse_direct_operating_costs(models)
+
         # Load custom models from config if specified
         customs = self._get_user_config_value("models", "customs", default=None)
         if customs is not None:
@@ -347,6 +361,155 @@ class AeroMAPSProcess(object):
 
         return models
 
+    @staticmethod
+    def _remove_models(models: dict, model_names: set) -> tuple:
+        """Remove models by name from (possibly nested) model groups.
+
+        The shared groups of aeromaps.core.models are not modified.
+
+        Parameters
+        ----------
+        models
+            Model groups loaded from the configuration.
+        model_names
+            Names of the models to remove.
+
+        Returns
+        -------
+        tuple
+            The model groups without the removed models, and the set of removed names.
+        """
+        removed_models = set()
+
+        def remove(group):
+            # Groups may be nested (e.g. default_models_bottom_up)
+            kept_models = {}
+            for name, value in group.items():
+                if isinstance(value, dict):
+                    kept_models[name] = remove(value)
+                elif name in model_names:
+                    removed_models.add(name)
+                else:
+                    kept_models[name] = value
+            return kept_models
+
+        return remove(models), removed_models
+
+    def _fuse_non_co2_emissions(self, models: dict) -> dict:
+        """Replace the per-species non-CO2 emission models by a single fused discipline.
+
+        The NOx, soot, H2O and sulfur emission index models and NonCO2Emissions are
+        removed from the standard model groups and a NonCO2EmissionsFused instance
+        publishing the same outputs is added. The NOx and soot emission indices are each
+        fleet based if their complex model was used.
+
+        Parameters
+        ----------
+        models
+            Standard model groups loaded from the configuration.
+
+        Returns
+        -------
+        dict
+            Model groups with the fused discipline.
+        """
+        fused_models, removed_models = self._remove_models(
+            models,
+            {
+                "nox_emission_index",
+                "nox_emission_index_complex",
+                "soot_emission_index",
+                "soot_emission_index_complex",
+                "h2o_emission_index",
+                "sulfur_emission_index",
+                "non_co2_emissions",
+            },
+        )
+
+        if removed_models:
+            fused_model = NonCO2EmissionsFused("non_co2_emissions_fused")
+            fused_model.fleet_based_species = {
+                species
+                for species in NonCO2EmissionsFused.EVOLVING_SPECIES
+                if f"{species}_emission_index_complex" in removed_models
+            }
+            fused_models["models_non_co2_emissions_fused"] = {
+                "non_co2_emissions_fused": fused_model
+            }
+        return fused_models
+
+    def _fuse_energy_consumption(self, models: dict) -> dict:
+        """Replace the per-carrier energy consumption models by a single fused discipline.
+
+        DropInFuelConsumption, HydrogenConsumption, ElectricConsumption and
+        EnergyConsumption are removed from the standard model groups and an
+        EnergyConsumptionFused instance publishing the same outputs is added.
+        DropInFuelDetailledConsumption is kept: its shares depend on these totals.
+
+        Parameters
+        ----------
+        models
+            Standard model groups loaded from the configuration.
+
+        Returns
+        -------
+        dict
+            Model groups with the fused discipline.
+        """
+        fused_models, removed_models = self._remove_models(
+            models,
+            {
+                "drop_in_fuel_consumption",
+                "hydrogen_consumption",
+                "electric_consumption",
+                "energy_consumption",
+            },
+        )
+
+        if removed_models:
+            fused_models["models_energy_consumption_fused"] = {
+                "energy_consumption_fused": EnergyConsumptionFused("energy_consumption_fused")
+            }
+        return fused_models
+
+    def _fuse_direct_operating_costs(self, models: dict) -> dict:
+        """Replace the energy-related DOC models by a single fused discipline.
+
+        PassengerAircraftDocEnergy, PassengerAircraftDocEnergyCarbonTax,
+        PassengerAircraftDocEnergySubsidy, PassengerAircraftDocEnergyTax and
+        PassengerAircraftTotalDoc are removed from the standard model groups and a
+        PassengerAircraftDocEnergyFused instance publishing the same outputs is added.
+        The non-energy DOC models are kept.
+
+        Parameters
+        ----------
+        models
+            Standard model groups loaded from the configuration.
+
+        Returns
+        -------
+        dict
+            Model groups with the fused discipline.
+        """
+        fused_models, removed_models = self._remove_models(
+            models,
+            {
+                "passenger_aircraft_doc_energy",
+                "passenger_aircraft_doc_energy_carbon_tax",
+                "passenger_aircraft_doc_energy_subsidy",
+                "passenger_aircraft_doc_energy_tax",
+                "passenger_aircraft_total_doc",
+            },
+        )
+
+        if removed_models:
+            fused_models["models_direct_operating_costs_fused"] = {
+                "passenger_aircraft_doc_energy_fused": PassengerAircraftDocEnergyFused(
+                    "passenger_aircraft_doc_energy_fused"
+                )
+            }
+        return fused_models
+
     def _load_custom_models_from_config(self, customs: dict) -> dict:
         """Load custom model classes from user-specified paths.
 
@@ -467,6 +630,8 @@ class AeroMAPSProcess(object):
         self.data = {}
         self.json = {}
         self._initialize_data()
+        # Number of updates of the data from the models, to invalidate data derived from outputs
+        self._data_updates = 0
 
     def setup_mda(self):
         """Configure the process for a standalone MDA chain.
@@ -601,6 +766,11 @@ class AeroMAPSProcess(object):
                 raise ValueError("MDA chain not created. Please call setup_mda() first.")
             else:
                 logging.info("Running MDA")
+                # The dataframes of the models are reset before each computation, so no discipline
+                # may be skipped on the cached inputs of a previous computation
+                for disc in self.disciplines:
+                    if disc.cache is not None:
+                        disc.cache.clear()
                 self.mda_chain.execute(input_data=input_data)
 
         self._update_data_from_model()
@@ -1544,17 +1714,29 @@ class AeroMAPSProcess(object):
 
         This method calls the internal methods to read resource and
         process data, and to instantiate the generic energy carrier models.
-        Skipped if models.energy key is not present in the user configuration.
+        With models.energy.batched, the models of each family are evaluated in a
+        single discipline. Skipped if models.energy key is not present in the user
+        configuration.
         """
         # Check if energy models should be used (key must be present in user config)
         energy_config = self._get_user_config_value("models", "energy", default=None)
         if energy_config is None:
             return
 
+        models_before_energy = set(self.models)
         self._read_generic_resources_data()
         self._read_generic_process_data()
         self._instantiate_generic_energy_models()
 
+        if self._get_config_value("models", "energy", "batched", default=False):
+            # One discipline per model family instead of one per pathway, resource or input
+            energy_models = {
+                name: self.models.pop(name)
+                for name in list(self.models)
+                if name not in models_before_energy
+            }
+            self.models.update(AviationEnergyCarriersFactory.batch_models(energy_models))
+
     def _read_generic_resources_data(self):
         """Read and process generic energy resources data.
 
@@ -1765,6 +1947,10 @@ class AeroMAPSProcess(object):
 
         if climate_model_file_path and climate_model_file_path.exists():
             climate_model_data = read_yaml_file(str(climate_model_file_path))
+            # Kernels of the climate surrogate are cached next to the configuration file
+            cache_directory = None
+            if self.configuration_file is not None:
+                cache_directory = Path(self.configuration_file).resolve().parent / "tmp"
             self.models.update(
                 {
                     "climate_model": ClimateModel(
@@ -1772,6 +1958,13 @@ class AeroMAPSProcess(object):
                         climate_model=climate_model_data.get("climate_model", "FaIR"),
                         species_settings=climate_model_data.get("species_settings", {}),
                         model_settings=climate_model_data.get("model_settings", {}),
+                        surrogate=self._get_config_value(
+                            "models", "climate", "surrogate", default=False
+                        ),
+                        validate_surrogate=self._get_config_value(
+                            "models", "climate", "validate_surrogate", default=False
+                        ),
+                        cache_directory=cache_directory,
                     )
                 }
             )
@@ -1960,6 +2153,13 @@ class AeroMAPSProcess(object):
                 fkey: str(self._resolve_config_path("models", "fleet_push", fkey))
                 for fkey in PUSH_FLEET_INPUT_FILE_KEYS
             }
+            # Optional per-segment process pool (sequential by default).
+            self.push_fleet_model.parallel = self._get_config_value(
+                "models", "fleet_push", "parallel", default=False
+            )
+            self.push_fleet_model.max_workers = self._get_config_value(
+                "models", "fleet_push", "max_workers", default=None
+            )
 
         def check_instance_in_dict(d):
             # todo rename that function as it is now clearly much more than just checking instance in dict... ;)
@@ -1999,6 +2199,10 @@ class AeroMAPSProcess(object):
                             needs_custom_setup = True
                     if needs_custom_setup:
                         model.custom_setup()
+                    if hasattr(model, "incremental_cumsum"):
+                        model.incremental_cumsum = self._get_config_value(
+                            "models", "emissions", "incremental_cumsum", default=False
+                        )
                     if hasattr(model, "climate_historical_data"):
                         if not hasattr(self, "climate_historical_data"):
                             raise RuntimeError(
@@ -2376,6 +2580,8 @@ class AeroMAPSProcess(object):
         vector inputs, and aggregates all discipline outputs into shared
         vector, climate, and LCA output structures.
         """
+        self._data_updates += 1
+
         # Inputs: if we have and mda_cain (no optim), we get the inputs from there, else we get them from each discipline
         if hasattr(self, "mda_chain") and self.mda_chain:
             all_inputs = self.mda_chain.get_input_data()
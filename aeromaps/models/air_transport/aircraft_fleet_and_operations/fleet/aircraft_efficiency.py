@@ -9,6 +9,7 @@ import numpy as np
 import pandas as pd
 
 from aeromaps.models.base import AeroMAPSModel, aeromaps_interpolation_function
+from aeromaps.utils.functions import _compound_yearly_gains
 
 
 class PassengerAircraftEfficiencySimpleShares(AeroMAPSModel):
@@ -158,10 +159,9 @@ class PassengerAircraftEfficiencySimpleShares(AeroMAPSModel):
             # FIXME not as gemseo variable ? do we want it ?
             self.df.loc[:, f"energy_per_ask_{mid}_dropin_fuel_gain"] = gain
 
-            for k in range(self.prospection_start_year, self.end_year + 1):
-                self.df.loc[k, dropin_col] = self.df.loc[k - 1, dropin_col] * (
-                    1 - gain.loc[k] / 100
-                )
+            self.df.loc[idx_proj, dropin_col] = _compound_yearly_gains(
+                self.df.loc[self.last_historical_year, dropin_col], gain.loc[idx_proj]
+            )
 
             if self.prospection_start_year <= 2020:
                 self.df.loc[2020, dropin_col] = self.df.loc[
@@ -848,6 +848,45 @@ class FreightAircraftEfficiency(AeroMAPSModel):
         electric_zero_mask = rtk_electric_share == 0
         electric_nonzero_mask = ~electric_zero_mask
 
+        # Drop-in efficiency of each passenger market relative to the last historical year
+        # (markets x projection years), compounded from its year-on-year ratios. Empty
+        # passenger markets have undefined (NaN) per-ASK efficiency; their ratio is kept at
+        # 1.0 so the proxy stays finite. They contribute nothing once weighted by their
+        # zero ASK below.
+        proj_years = list(range(self.prospection_start_year, self.end_year + 1))
+        cumulative_efficiency_ratio = np.empty((len(passenger_markets), len(proj_years)))
+        for i, m in enumerate(passenger_markets):
+            energy_per_ask_dropin_fuel = (
+                energy_per_ask_without_operations_dropin_fuel_per_market[m.id]
+                .loc[self.last_historical_year : self.end_year]
+                .to_numpy(dtype=float)
+            )
+            energy_per_ask_dropin_fuel_prev = energy_per_ask_dropin_fuel[:-1]
+            energy_per_ask_dropin_fuel_k = energy_per_ask_dropin_fuel[1:]
+            valid = (
+                (energy_per_ask_dropin_fuel_prev != 0)
+                & np.isfinite(energy_per_ask_dropin_fuel_prev)
+                & np.isfinite(energy_per_ask_dropin_fuel_k)
+            )
+            with np.errstate(invalid="ignore", divide="ignore"):
+                efficiency_ratio = np.where(
+                    valid, energy_per_ask_dropin_fuel_k / energy_per_ask_dropin_fuel_prev, 1.0
+                )
+            cumulative_efficiency_ratio[i] = np.cumprod(efficiency_ratio)
+
+        # Weighted average across passenger markets by dropin ASK share. Empty markets (zero
+        # dropin ASK) are skipped so that ``NaN * 0`` cannot leak into the freight efficiency.
+        ask_dropin_fuel_proj = np.array(
+            [
+                ask_dropin_fuel_per_market[m.id].loc[proj_years].to_numpy(dtype=float)
+                for m in passenger_markets
+            ]
+        ).reshape(len(passenger_markets), len(proj_years))
+        ask_total_dropin_fuel = ask_dropin_fuel_proj.sum(axis=0)
+        ask_weighted_efficiency_ratio = np.where(
+            ask_dropin_fuel_proj != 0, cumulative_efficiency_ratio * ask_dropin_fuel_proj, 0.0
+        ).sum(axis=0)
+
         hist_years = list(range(self.historic_start_year, self.prospection_start_year))
         output_data = {}
         total_rtk_dropin_fuel = None
@@ -877,57 +916,17 @@ class FreightAircraftEfficiency(AeroMAPSModel):
                 self.last_historical_year,
                 f"energy_per_rtk_without_operations_{freight_mid}_dropin_fuel",
             ]
-            energy_per_rtk_without_operations_dropin_fuel_per_market_k = {
-                mid: init_energy_per_rtk_without_operations_dropin_fuel
-                for mid in ask_dropin_fuel_per_market
-            }
-
-            for k in range(self.prospection_start_year, self.end_year + 1):
-                # Apply the passenger year-on-year efficiency ratio to each market's freight proxy
-                for mid in ask_per_market:
-                    energy_per_ask_dropin_fuel_prev = (
-                        energy_per_ask_without_operations_dropin_fuel_per_market[mid].loc[k - 1]
-                    )
-                    energy_per_ask_dropin_fuel_k = (
-                        energy_per_ask_without_operations_dropin_fuel_per_market[mid].loc[k]
-                    )
-                    # Empty passenger markets have undefined (NaN) per-ASK efficiency; keep their
-                    # proxy unchanged (ratio 1.0) so it stays finite. They contribute nothing once
-                    # weighted by their zero ASK below.
-                    efficiency_ratio = (
-                        energy_per_ask_dropin_fuel_k / energy_per_ask_dropin_fuel_prev
-                        if energy_per_ask_dropin_fuel_prev != 0
-                        and np.isfinite(energy_per_ask_dropin_fuel_prev)
-                        and np.isfinite(energy_per_ask_dropin_fuel_k)
-                        else 1.0
-                    )
-                    energy_per_rtk_without_operations_dropin_fuel_per_market_k[mid] = (
-                        energy_per_rtk_without_operations_dropin_fuel_per_market_k[mid]
-                        * efficiency_ratio
-                    )
-
-                # Weighted average across passenger markets by dropin ASK share
-                ask_total_dropin_fuel_k = sum(
-                    ask_dropin_fuel_per_market[mid].loc[k] for mid in ask_dropin_fuel_per_market
+            with np.errstate(invalid="ignore", divide="ignore"):
+                self.df.loc[
+                    proj_years, f"energy_per_rtk_without_operations_{freight_mid}_dropin_fuel"
+                ] = np.where(
+                    ask_total_dropin_fuel > 0,
+                    init_energy_per_rtk_without_operations_dropin_fuel
+                    * ask_weighted_efficiency_ratio
+                    / ask_total_dropin_fuel,
+                    init_energy_per_rtk_without_operations_dropin_fuel,
                 )
 
-                if ask_total_dropin_fuel_k > 0:
-                    # Skip empty markets (zero dropin ASK): their proxy may be undefined and
-                    # ``NaN * 0`` would leak into the freight efficiency.
-                    self.df.loc[
-                        k, f"energy_per_rtk_without_operations_{freight_mid}_dropin_fuel"
-                    ] = sum(
-                        energy_per_rtk_without_operations_dropin_fuel_per_market_k[mid]
-                        * ask_dropin_fuel_per_market[mid].loc[k]
-                        / ask_total_dropin_fuel_k
-                        for mid in ask_dropin_fuel_per_market
-                        if ask_dropin_fuel_per_market[mid].loc[k] != 0
-                    )
-                else:
-                    self.df.loc[
-                        k, f"energy_per_rtk_without_operations_{freight_mid}_dropin_fuel"
-                    ] = init_energy_per_rtk_without_operations_dropin_fuel
-
             # Covid: reset 2020 value
             if self.prospection_start_year <= 2020:
                 self.df.loc[
@@ -1134,6 +1133,7 @@ class FreightAircraftEfficiencySimple(AeroMAPSModel):
         covid_increase = float(input_data["covid_energy_intensity_per_rtk_increase_2020"])
 
         hist_years = list(range(self.historic_start_year, self.prospection_start_year))
+        proj_years = list(range(self.prospection_start_year, self.end_year + 1))
         output_data = {}
         total_rtk_dropin_fuel = None
         total_rtk_hydrogen = None
@@ -1168,10 +1168,9 @@ class FreightAircraftEfficiencySimple(AeroMAPSModel):
                 model_name=self.name,
             )
 
-            for k in range(self.prospection_start_year, self.end_year + 1):
-                self.df.loc[k, dropin_col] = self.df.loc[k - 1, dropin_col] * (
-                    1 - gain.loc[k] / 100
-                )
+            self.df.loc[proj_years, dropin_col] = _compound_yearly_gains(
+                self.df.loc[self.last_historical_year, dropin_col], gain.loc[proj_years]
+            )
 
             # COVID: reset 2020 value.
             if self.prospection_start_year <= 2020:
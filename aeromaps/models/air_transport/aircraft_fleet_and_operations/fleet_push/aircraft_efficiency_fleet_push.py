@@ -47,6 +47,8 @@ Fleet-output year alignment (verified empirically against the engine)
 """
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 import pandas as pd
@@ -241,6 +243,37 @@ def _sanitize_type_name(name: str) -> str:
     return "_".join(str(name).split()).replace(":", "_")
 
 
+# Engine inputs of a pool worker, set once per process by :func:`_init_push_worker`
+# so that segment tasks only carry their label and traffic series.
+_WORKER_ENGINE_INPUTS = None
+
+
+def _init_push_worker(engine_inputs):
+    global _WORKER_ENGINE_INPUTS
+    _WORKER_ENGINE_INPUTS = engine_inputs
+
+
+def _run_segment(cfg, market_data, ask_series, last_historical_year):
+    """Run :func:`market_process` for one engine segment of ``engine_inputs``."""
+    return market_process(
+        market_data,
+        cfg["distance_per_aircraft"],
+        cfg["fleet_market"],
+        cfg["old_ac_carac"],
+        cfg["in_prod_ac_carac"],
+        cfg["future_ac_carac"],
+        ask_series=ask_series,
+        last_historical_year=last_historical_year,
+    )
+
+
+def _run_segment_in_worker(job):
+    engine_label, market_data, ask_series, last_historical_year = job
+    return _run_segment(
+        _WORKER_ENGINE_INPUTS[engine_label], market_data, ask_series, last_historical_year
+    )
+
+
 class PassengerAircraftEfficiencyFleetPush(AeroMAPSModel):
     """Per-market energy per ASK from Paco's delivery-driven ("push") fleet engine.
 
@@ -265,6 +298,12 @@ class PassengerAircraftEfficiencyFleetPush(AeroMAPSModel):
         # Engine inputs loaded once in custom_setup() (mirrors Fleet loading its YAMLs
         # at build time); reused across segments and every compute().
         self._engine_inputs = None
+        # Segment dispatch: market_process runs once per engine segment, each call being
+        # independent. When ``parallel`` is set (models.fleet_push.parallel, injected by
+        # process.py), segments run in a process pool of ``max_workers`` processes
+        # (None -> min(n_segments, cpu_count)); results are reassembled in market order.
+        self.parallel = False
+        self.max_workers = None
         # Per-segment engine arrays cached on the last compute() for plot().
         # Keyed by market id; each value holds the raw (age-resolved) engine
         # returns that the flat output columns sum away.
@@ -372,6 +411,53 @@ class PassengerAircraftEfficiencyFleetPush(AeroMAPSModel):
         # Full year index for the fleet-state columns (NaN pre-pivot history).
         full_years = np.arange(self.historic_start_year, self.end_year + 1)
 
+        # --- Engine runs: one independent market_process call per mapped segment ---
+        segment_jobs = {}
+        for m in passenger_markets:
+            mid = m.id
+            if mid not in engine_inputs:
+                continue
+            cfg = engine_inputs[mid]
+            ask_proj = input_data[f"ask_{mid}"].reindex(ask_sample_years).to_numpy(dtype=float)
+            # Append the horizon-year (end_year + 1) entry, held flat at end_year,
+            # so the engine has modeled_periods + 1 finite traffic targets.
+            ask_series = np.concatenate([ask_proj, ask_proj[-1:]])
+
+            # Start-year consistency check. The injected AeroMAPS pivot-year ASK
+            # (ask_proj[0], top-down) and the engine's calibrated pivot-year ASK
+            # (cfg["calibrated_ask_anchor"], bottom-up Σ total_ask_produced_2024) are
+            # never reconciled numerically. Surface their relative gap so a silent
+            # mismatch at the 2024 seam doesn't go unnoticed.
+            top_down_ask = float(ask_proj[0])
+            bottom_up_ask = cfg["calibrated_ask_anchor"]
+            if bottom_up_ask > 0:
+                rel_gap = (top_down_ask - bottom_up_ask) / bottom_up_ask
+                if abs(rel_gap) > _ASK_ANCHOR_REL_TOL:
+                    logger.warning(
+                        "Market '%s': injected AeroMAPS %d ASK (%.3e) differs from the "
+                        "engine's calibrated fleet ASK (%.3e) by %+.1f%% (tol %.0f%%). The "
+                        "two are not reconciled; re-check rpk_share_last_historical_year "
+                        "and the historic ASK vectors for this segment.",
+                        mid,
+                        self.last_historical_year,
+                        top_down_ask,
+                        bottom_up_ask,
+                        rel_gap * 100.0,
+                        _ASK_ANCHOR_REL_TOL * 100.0,
+                    )
+
+            # The engine's production_profile is only used to size the year axis
+            # (its last year). Growth is injected as ASK, so build the axis straight
+            # from the calendar [first_projection_year .. horizon]; the rates are inert.
+            market_data = cfg["market_data"].copy()
+            market_data["production_profile"] = [
+                [self.last_historical_year + 1, horizon],
+                [0.0, 0.0],
+            ]
+            segment_jobs[mid] = (market_data, ask_series)
+
+        engine_outputs = self._run_engine_segments(segment_jobs)
+
         output_data = {}
 
         for m in passenger_markets:
@@ -409,59 +495,13 @@ class PassengerAircraftEfficiencyFleetPush(AeroMAPSModel):
                 self.df.loc[full_years, fleet_total_col] = np.nan
             else:
                 cfg = engine_inputs[mid]
-                ask_proj = input_data[f"ask_{mid}"].reindex(ask_sample_years).to_numpy(dtype=float)
-                # Append the horizon-year (end_year + 1) entry, held flat at end_year,
-                # so the engine has modeled_periods + 1 finite traffic targets.
-                ask_series = np.concatenate([ask_proj, ask_proj[-1:]])
-
-                # Start-year consistency check. The injected AeroMAPS pivot-year ASK
-                # (ask_proj[0], top-down) and the engine's calibrated pivot-year ASK
-                # (cfg["calibrated_ask_anchor"], bottom-up Σ total_ask_produced_2024) are
-                # never reconciled numerically. Surface their relative gap so a silent
-                # mismatch at the 2024 seam doesn't go unnoticed.
-                top_down_ask = float(ask_proj[0])
-                bottom_up_ask = cfg["calibrated_ask_anchor"]
-                if bottom_up_ask > 0:
-                    rel_gap = (top_down_ask - bottom_up_ask) / bottom_up_ask
-                    if abs(rel_gap) > _ASK_ANCHOR_REL_TOL:
-                        logger.warning(
-                            "Market '%s': injected AeroMAPS %d ASK (%.3e) differs from the "
-                            "engine's calibrated fleet ASK (%.3e) by %+.1f%% (tol %.0f%%). The "
-                            "two are not reconciled; re-check rpk_share_last_historical_year "
-                            "and the historic ASK vectors for this segment.",
-                            mid,
-                            self.last_historical_year,
-                            top_down_ask,
-                            bottom_up_ask,
-                            rel_gap * 100.0,
-                            _ASK_ANCHOR_REL_TOL * 100.0,
-                        )
-
-                # The engine's production_profile is only used to size the year axis
-                # (its last year). Growth is injected as ASK, so build the axis straight
-                # from the calendar [first_projection_year .. horizon]; the rates are inert.
-                market_data = cfg["market_data"].copy()
-                market_data["production_profile"] = [
-                    [self.last_historical_year + 1, horizon],
-                    [0.0, 0.0],
-                ]
-
                 (
                     _years,
                     deliveries,
                     ask_volumes,
                     aircraft_seats_volumes,
                     energy_consumption,
-                ) = market_process(
-                    market_data,
-                    cfg["distance_per_aircraft"],
-                    cfg["fleet_market"],
-                    cfg["old_ac_carac"],
-                    cfg["in_prod_ac_carac"],
-                    cfg["future_ac_carac"],
-                    ask_series=ask_series,
-                    last_historical_year=self.last_historical_year,
-                )
+                ) = engine_outputs[mid]
 
                 # Cache the raw (age-resolved) engine arrays for plot(). The flat
                 # output columns below sum these over the age axis; the retirement /
@@ -568,6 +608,37 @@ class PassengerAircraftEfficiencyFleetPush(AeroMAPSModel):
         self._store_outputs(output_data)
         return output_data
 
+    def _run_engine_segments(self, segment_jobs: dict) -> dict:
+        """Run :func:`market_process` for every ``{mid: (market_data, ask_series)}`` job.
+
+        Segments are independent, so with ``parallel`` set they are dispatched to a
+        process pool. The static engine inputs are handed to each worker once, through
+        the pool initializer; tasks only carry the segment label and its traffic
+        series. Results are returned keyed and ordered like ``segment_jobs``.
+        """
+        engine_inputs = self._engine_inputs
+        n_workers = self.max_workers or min(len(segment_jobs), os.cpu_count() or 1)
+        if not self.parallel or len(segment_jobs) < 2 or n_workers < 2:
+            return {
+                mid: _run_segment(
+                    engine_inputs[mid], market_data, ask_series, self.last_historical_year
+                )
+                for mid, (market_data, ask_series) in segment_jobs.items()
+            }
+
+        jobs = [
+            (mid, market_data, ask_series, self.last_historical_year)
+            for mid, (market_data, ask_series) in segment_jobs.items()
+        ]
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_push_worker,
+            initargs=(engine_inputs,),
+        ) as executor:
+            # map() yields in submission order, so the reassembly is deterministic.
+            results = list(executor.map(_run_segment_in_worker, jobs))
+        return dict(zip(segment_jobs, results))
+
     def list_available_plots(self):
         print(["ASK evolution", "Aircraft seats evolution", "Aircraft production", "Aircraft seats production",
                "Aircraft seats retirements", "Aircraft ASKs losses",
@@ -130,6 +130,54 @@ def calculate_stats_by_market(
     ]
 
 
+def _fleet_composition(
+    fleet_delivered_activity_type_y,
+    ret_year_delay_type_y,
+    period_utilisation_array,
+    age_utilisation_array,
+    kms_array,
+    yearly_traffic,
+    modeled_periods,
+):
+    """Retained fleet per period, written into preallocated (period, age, type) arrays.
+
+    At period ``t`` only the ages delivered before the period are active (the last
+    ``modeled_periods - t`` rows of the delivered activity are future deliveries),
+    so the retirement solver works on that leading block in place instead of on a
+    zero-padded copy of the full matrix. The retirement exponent is warm-started
+    from one period to the next, which keeps the loop sequential.
+
+    Returns
+    -------
+    tuple
+        ``(ask_volumes, aircraft_seats_volumes)``, both of shape
+        ``(modeled_periods, n_ages, n_types)``.
+    """
+    n_ages, n_types = fleet_delivered_activity_type_y.shape
+    ask_volumes = np.zeros((modeled_periods, n_ages, n_types))
+    x_eq = 1
+    for t in range(modeled_periods):
+        n_active = n_ages - modeled_periods + t
+        ask_volumes[t, :n_active], x_eq = fleet_content(
+            x_eq,
+            fleet_delivered_activity_type_y[:n_active] * period_utilisation_array[t],
+            ret_year_delay_type_y[:n_active],
+            yearly_traffic[t],
+            epsilon=1e-6,
+        )
+        if x_eq < 1e-30:
+            x_eq = x_eq ** (1 / 8)
+            ret_year_delay_type_y = ret_year_delay_type_y - 3 * np.log(2)
+
+    # ASK volumes back to seat volumes, one broadcast over all periods.
+    aircraft_seats_volumes = ask_volumes / (
+        period_utilisation_array[:modeled_periods, None, None]
+        * age_utilisation_array[None, :, None]
+        * kms_array[None, None, :]
+    )
+    return ask_volumes, aircraft_seats_volumes
+
+
 def market_process(
     market_data,
     distance_per_aircraft,
@@ -253,12 +301,12 @@ def market_process(
             / delivery_params[ac, 4]
         )
         mu, gamma = solve_deliv(time_to_market, duration)
-        for t in range(duration):
-            if eis + t + 1 < modeled_periods:
-                deliveries_ac_t = prod_volume * mu * i_d(gamma, duration, t, (t + 1))
-                deliveries[-modeled_periods + eis + t, n_old_ac + n_prod_ac + ac] = (
-                    deliveries_ac_t  # +1->empty_delivery first
-                )
+        # Yearly delivery slices of the production profile, integrated in one call.
+        t = np.arange(duration)
+        t = t[eis + t + 1 < modeled_periods]
+        deliveries[-modeled_periods + eis + t, n_old_ac + n_prod_ac + ac] = (
+            prod_volume * mu * i_d(gamma, duration, t, t + 1)  # +1->empty_delivery first
+        )
     # fleet activity check
     fleet_delivered = fleet_ini.copy()
     fleet_delivered[-modeled_periods:, :] = deliveries
@@ -291,38 +339,15 @@ def market_process(
         fleet_ini.shape[0] - modeled_periods
     )
     # fleet composition convergence
-    aircraft_seats_volumes = []
-    ask_volumes = []
-    x_eq = 1
     logger.debug("Computing fleet composition...")
-    for t in range(modeled_periods):
-        fleet_delivered_activity_type_y_t = fleet_delivered_activity_type_y.copy()
-        fleet_delivered_activity_type_y_t[-modeled_periods + t :, :] = 0
-        fleet_delivered_activity_type_y_t = (
-            fleet_delivered_activity_type_y_t * period_utilisation_array[t]
-        )
-        ask_volumes_type_y_t, x_eq = fleet_content(
-            0,
-            x_eq,
-            fleet_delivered_activity_type_y_t,
-            ret_year_delay_type_y,
-            yearly_traffic[t],
-            epsilon=1e-6,
-            first=True,
-        )
-        if x_eq < 1e-30:
-            x_eq = x_eq ** (1 / 8)
-            ret_year_delay_type_y = ret_year_delay_type_y - 3 * np.log(2)
-
-        aircraft_seats_volumes_t = (
-            ask_volumes_type_y_t
-            / period_utilisation_array[t]
-            / age_utilisation_array[:, None]
-            / kms_array[None, :]
-        )
-        aircraft_seats_volumes.append(aircraft_seats_volumes_t)
-        ask_volumes.append(ask_volumes_type_y_t)
-    ask_volumes = np.array(ask_volumes)
-    aircraft_seats_volumes = np.array(aircraft_seats_volumes)
-    energy_consumption = energy_intensity[None, None, :] * ask_volumes
+    ask_volumes, aircraft_seats_volumes = _fleet_composition(
+        fleet_delivered_activity_type_y,
+        ret_year_delay_type_y,
+        period_utilisation_array,
+        age_utilisation_array,
+        kms_array,
+        yearly_traffic,
+        modeled_periods,
+    )
+    energy_consumption = ask_volumes * energy_intensity
     return years, deliveries[:-1], ask_volumes, aircraft_seats_volumes, energy_consumption
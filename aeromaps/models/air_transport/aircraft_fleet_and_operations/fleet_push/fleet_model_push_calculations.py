@@ -6,32 +6,76 @@ Module for calculating the result of the push fleet model.
 """
 
 import logging
+from functools import lru_cache
+from math import factorial
 
-from scipy import integrate, optimize
+from scipy import optimize
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Below this |γ·h| the exponential moments are evaluated by their power series: the
+# upward recurrence divides by γ·h and loses digits to cancellation near γ = 0.
+_SERIES_THRESHOLD = 1.0
+_SERIES_TERMS = np.arange(25)
+_SERIES_FACTORIALS = np.array([float(factorial(j)) for j in _SERIES_TERMS])
+
+
+def _exp_moments(x, n):
+    """Mₖ(x) = ∫₀¹ uᵏ exp(x·u) du for k = 0..n, stacked on the first axis."""
+    x = np.asarray(x, dtype=float)
+    small = np.abs(x) < _SERIES_THRESHOLD
+    # Power series Σⱼ xʲ / (j! (k + j + 1)), exact to machine precision for |x| < 1.
+    x_pow = x[..., None] ** _SERIES_TERMS / _SERIES_FACTORIALS
+    # Upward recurrence Mₖ = (eˣ - k Mₖ₋₁) / x, stable away from x = 0.
+    x_safe = np.where(small, 1.0, x)
+    exp_x = np.exp(x_safe)
+    moments = np.empty((n + 1,) + x.shape)
+    m_prev = np.expm1(x_safe) / x_safe
+    for k in range(n + 1):
+        if k > 0:
+            m_prev = (exp_x - k * m_prev) / x_safe
+        series = (x_pow / (k + _SERIES_TERMS + 1)).sum(axis=-1)
+        moments[k] = np.where(small, series, m_prev)
+    return moments
+
+
+def _shifted_exp_integrals(gamma, a, b, n):
+    """Sₖ = ∫₀ʰ sᵏ exp(γ(a+s)) ds with h = b - a, for k = 0..n (vectorised on a, b)."""
+    a = np.asarray(a, dtype=float)
+    h = np.asarray(b, dtype=float) - a
+    moments = _exp_moments(gamma * h, n)
+    powers = h ** np.arange(1, n + 2).reshape((-1,) + (1,) * h.ndim)
+    return np.exp(gamma * a) * powers * moments
+
 
 def i1(gamma, m):
     """∫₀ᵐ t(m-t) exp(γt) dt"""
-    val, _ = integrate.quad(lambda t: t * (m - t) * np.exp(gamma * t), 0, m)
-    return val
+    s = _shifted_exp_integrals(gamma, 0.0, m, 2)
+    return m * s[1] - s[2]
 
 
 def i_d(gamma, m, a, b):
-    """∫₀ᵐ t(m-t) exp(γt) dt"""
-    val, _ = integrate.quad(lambda t: t * (m - t) * np.exp(gamma * t), a, b)
-    return val
+    """∫ₐᵇ t(m-t) exp(γt) dt, vectorised over the bounds ``a`` and ``b``."""
+    a = np.asarray(a, dtype=float)
+    s = _shifted_exp_integrals(gamma, a, b, 2)
+    # t(m-t) expanded around t = a + s.
+    return (m * a - a**2) * s[0] + (m - 2 * a) * s[1] - s[2]
 
 
 def i2(gamma, m):
     """∫₀ᵐ t²(m-t) exp(γt) dt"""
-    val, _ = integrate.quad(lambda t: t**2 * (m - t) * np.exp(gamma * t), 0, m)
-    return val
+    s = _shifted_exp_integrals(gamma, 0.0, m, 3)
+    return m * s[2] - s[3]
 
 
+@lru_cache(maxsize=None)
 def solve_deliv(B, m, gamma_bounds=(-10, 10)):
+    """Delivery-profile shape (μ, γ) whose mean delivery time over [0, m] is ``B``.
+
+    Results are memoised on ``(B, m, gamma_bounds)``: many aircraft programs share the
+    same time-to-market and production duration.
+    """
     if not (0 < B / 1 < m):
         raise ValueError(
             f"B/A = {B:.4f} doit être strictement dans (0, {m}) "
@@ -41,10 +85,10 @@ def solve_deliv(B, m, gamma_bounds=(-10, 10)):
     ratio = B
 
     def g(gamma):
-        i_1 = i1(gamma, m)
+        i_1 = float(i1(gamma, m))
         if abs(i_1) < 1e-14:
             return np.inf
-        return i2(gamma, m) / i_1 - ratio
+        return float(i2(gamma, m)) / i_1 - ratio
 
     # Vérification que g change de signe sur l'intervalle
     ga, gb = gamma_bounds
@@ -57,30 +101,86 @@ def solve_deliv(B, m, gamma_bounds=(-10, 10)):
         )
 
     gamma_sol = optimize.brentq(g, ga, gb, xtol=1e-12, rtol=1e-12)
-    mu_sol = 1 / i1(gamma_sol, m)
+    mu_sol = 1 / float(i1(gamma_sol, m))
 
     return mu_sol, gamma_sol
 
 
-def fleet_content(a, b, fleet_obs_t, retirement_coeffs, constraint, epsilon=0.0001, first=False):
-    if first:
-        fleets_b = b ** (np.exp(-retirement_coeffs)) * fleet_obs_t
-        if fleets_b.sum().sum() < constraint:
-            logger.debug("temporary aircraft parking")
-            # return fleet_content(b, 1,fleet_obs_t, retirement_coeffs, constraint, epsilon)
-            # print(b)
-            return fleet_content(
-                b, b * 2, fleet_obs_t, retirement_coeffs, constraint, epsilon, first=True
-            )
-
-    fleets = ((a + b) / 2) ** (np.exp(-retirement_coeffs)) * fleet_obs_t
-    e = (fleets.sum().sum() - constraint) / constraint
-    # print('power: '+str((a+b)/2) + ' constraint: '+str(constraint) + ' '+str(fleets.sum().sum())+' error: '+str(np.abs(e)))
-    if b == 0:
-        logger.debug("reso bug")
-    if np.abs(e) < epsilon:
-        return fleets, (a + b) / 2
-    elif e > 0:
-        return fleet_content(a, (a + b) / 2, fleet_obs_t, retirement_coeffs, constraint, epsilon)
-    else:
-        return fleet_content((a + b) / 2, b, fleet_obs_t, retirement_coeffs, constraint, epsilon)
+def fleet_content(
+    x_start, fleet_obs_t, retirement_coeffs, constraint, epsilon=0.0001, max_iter=100
+):
+    """Retirement exponent x such that Σ x^exp(-retirement_coeffs) · fleet_obs_t = constraint.
+
+    The fleet sum S(x) is increasing in x and log S is convex in y = ln(x), so the
+    equation is solved by Newton's method on y with the analytic derivative
+    dS/dy = Σ c · x^c · fleet_obs_t (c = exp(-retirement_coeffs)), safeguarded by
+    bisection on the bracket found so far. ``x_start`` warm-starts the iteration,
+    typically with the previous period's solution.
+
+    Parameters
+    ----------
+    x_start : float
+        Initial guess for the exponent (previous period's ``x_eq``).
+    fleet_obs_t : np.ndarray
+        Age × type activity available at the period.
+    retirement_coeffs : np.ndarray
+        Age × type retirement propensities.
+    constraint : float
+        Activity to be met by the retained fleet.
+    epsilon : float
+        Relative tolerance on the fleet sum.
+    max_iter : int
+        Maximum number of iterations.
+
+    Returns
+    -------
+    tuple
+        ``(fleets, x)``: the retained age × type activity and the exponent.
+
+    Raises
+    ------
+    ValueError
+        When the iteration does not converge within ``max_iter`` iterations.
+    """
+    coeffs = np.exp(-retirement_coeffs)
+    log_constraint = np.log(constraint)
+    y = np.log(x_start) if x_start > 0 else 0.0
+    y_low, y_high = -np.inf, np.inf
+
+    for i in range(max_iter):
+        fleets = np.exp(coeffs * y) * fleet_obs_t
+        fleet_sum = fleets.sum()
+        if np.isfinite(fleet_sum) and fleet_sum > 0:
+            if np.abs(fleet_sum - constraint) < epsilon * constraint:
+                return fleets, np.exp(y)
+            residual = np.log(fleet_sum) - log_constraint
+        else:
+            # Overflow (or empty fleet): treat as an upper (resp. lower) bound.
+            residual = np.inf if not np.isfinite(fleet_sum) else -np.inf
+
+        if residual > 0:
+            y_high = y
+        else:
+            if i == 0:
+                logger.debug("temporary aircraft parking")
+            y_low = y
+
+        if np.isfinite(residual):
+            derivative = (coeffs * fleets).sum() / fleet_sum
+            y_new = y - residual / derivative if derivative > 0 else np.nan
+        else:
+            y_new = np.nan
+        if not (y_low < y_new < y_high):
+            if np.isfinite(y_low) and np.isfinite(y_high):
+                y_new = 0.5 * (y_low + y_high)
+            elif np.isfinite(y_low):
+                # No upper bound yet: double x (legacy "temporary parking" expansion).
+                y_new = y_low + np.log(2)
+            else:
+                y_new = y_high - np.log(2)
+        y = y_new
+
+    raise ValueError(
+        f"Retirement exponent did not converge in {max_iter} iterations "
+        f"(constraint={constraint:.3e})."
+    )
@@ -61,25 +61,16 @@ class OperationsContrailsSimple(AeroMAPSModel):
         transition_year = operations_contrails_start_year + operations_contrails_duration / 2
         operations_contrails_limit = 0.02 * operations_contrails_final_gain
         operations_parameter = np.log(100 / 2 - 1) / (operations_contrails_duration / 2)
-        for k in range(self.historic_start_year, self.prospection_start_year):
-            self.df.loc[k, "operations_contrails_gain"] = 0
-            self.df.loc[k, "operations_contrails_overconsumption"] = 0
-        for k in range(self.prospection_start_year, self.end_year + 1):
-            if (
-                operations_contrails_final_gain
-                / (1 + np.exp(-operations_parameter * (k - transition_year)))
-                < operations_contrails_limit
-            ):
-                self.df.loc[k, "operations_contrails_gain"] = 0
-                self.df.loc[k, "operations_contrails_overconsumption"] = 0
-            else:
-                self.df.loc[k, "operations_contrails_gain"] = operations_contrails_final_gain / (
-                    1 + np.exp(-operations_parameter * (k - transition_year))
-                )
-                self.df.loc[k, "operations_contrails_overconsumption"] = (
-                    operations_contrails_final_overconsumption
-                    / (1 + np.exp(-operations_parameter * (k - transition_year)))
-                )
+        years = self.df.index.to_numpy()
+        logistic_denominator = 1 + np.exp(-operations_parameter * (years - transition_year))
+        gain = operations_contrails_final_gain / logistic_denominator
+        # Overconsumption follows the gain: both are zero before the prospective period
+        # and until the gain reaches 2% of its final value.
+        inactive = (years < self.prospection_start_year) | (gain < operations_contrails_limit)
+        self.df["operations_contrails_gain"] = np.where(inactive, 0.0, gain)
+        self.df["operations_contrails_overconsumption"] = np.where(
+            inactive, 0.0, operations_contrails_final_overconsumption / logistic_denominator
+        )
 
         operations_contrails_gain = self.df["operations_contrails_gain"]
         operations_contrails_overconsumption = self.df["operations_contrails_overconsumption"]
@@ -203,17 +194,30 @@ class FuelEffectCorrectionContrails(AeroMAPSModel):
                     f"{default_pathway.name}_emission_index_particles_number"
                 ]
 
-                for pathway in self.pathways_manager.get(
-                    aircraft_type=aircraft_type,
-                ):
-                    relative_particles_number += (
+                # Blend all pathways at once: (years × pathways) massic shares weighted by
+                # the square root of each pathway's particle emission index relative to
+                # the default pathway.
+                pathways = self.pathways_manager.get(aircraft_type=aircraft_type)
+                massic_shares = pd.concat(
+                    [
                         input_data[f"{pathway.name}_massic_share_{aircraft_type}"]
-                        / 100
-                        * np.sqrt(
+                        for pathway in pathways
+                    ],
+                    axis=1,
+                )
+                relative_emission_index = np.sqrt(
+                    np.array(
+                        [
                             input_data[f"{pathway.name}_emission_index_particles_number"]
-                            / default_emission_index_number_particles
-                        )
-                    ).fillna(0)
+                            for pathway in pathways
+                        ],
+                        dtype=float,
+                    )
+                    / default_emission_index_number_particles
+                )
+                relative_particles_number += (
+                    (massic_shares / 100 * relative_emission_index).fillna(0).sum(axis=1)
+                )
 
                 fuel_effect_correction_contrails += (
                     distance_share_dropin_fuel * relative_particles_number
@@ -268,8 +272,7 @@ class WithoutFuelEffectCorrectionContrails(AeroMAPSModel):
             forcing over the scenario, equal to 1 for all years.
         """
 
-        for k in range(self.historic_start_year, self.end_year + 1):
-            self.df.loc[k, "fuel_effect_correction_contrails"] = 1
+        self.df["fuel_effect_correction_contrails"] = 1.0
 
         fuel_effect_correction_contrails = self.df["fuel_effect_correction_contrails"]
         return fuel_effect_correction_contrails
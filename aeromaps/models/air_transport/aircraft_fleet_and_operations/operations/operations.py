@@ -54,18 +54,16 @@ class OperationsLogistic(AeroMAPSModel):
         transition_year = operations_start_year + operations_duration / 2
         operations_limit = 0.02 * operations_final_gain
         operations_parameter = np.log(100 / 2 - 1) / (operations_duration / 2)
-        for k in range(self.historic_start_year, self.prospection_start_year):
-            self.df.loc[k, "operations_gain"] = 0
-        for k in range(self.prospection_start_year - 1, self.end_year + 1):
-            if (
-                operations_final_gain / (1 + np.exp(-operations_parameter * (k - transition_year)))
-                < operations_limit
-            ):
-                self.df.loc[k, "operations_gain"] = 0
-            else:
-                self.df.loc[k, "operations_gain"] = operations_final_gain / (
-                    1 + np.exp(-operations_parameter * (k - transition_year))
-                )
+        years = self.df.index.to_numpy()
+        logistic_gain = operations_final_gain / (
+            1 + np.exp(-operations_parameter * (years - transition_year))
+        )
+        # The logistic curve also overwrites the last historical year.
+        self.df["operations_gain"] = np.where(
+            (years < self.prospection_start_year - 1) | (logistic_gain < operations_limit),
+            0.0,
+            logistic_gain,
+        )
 
         operations_gain = self.df["operations_gain"]
 
@@ -110,9 +108,9 @@ class OperationsInterpolation(AeroMAPSModel):
             operations_gain_reference_years_values,
             model_name=self.name,
         )
-        self.df.loc[:, "operations_gain"] = operations_gain_prospective
-        for k in range(self.historic_start_year, self.prospection_start_year):
-            self.df.loc[k, "operations_gain"] = 0
+        self.df["operations_gain"] = operations_gain_prospective.where(
+            self.df.index >= self.prospection_start_year, 0.0
+        )
         operations_gain = self.df["operations_gain"]
 
         return operations_gain
@@ -7,6 +7,7 @@ import pandas as pd
 import numpy as np
 from scipy.interpolate import interp1d
 import warnings
+from functools import lru_cache
 
 
 class AeroMapsCustomDataType:
@@ -271,7 +272,34 @@ def aeromaps_interpolation_function(
     interpolation_function_values
         Series of interpolated values indexed by year taken from the model's DataFrame.
     """
-    # Main
+    values = _interpolation_values(
+        self.df.index.to_numpy(),
+        reference_years,
+        reference_years_values,
+        self.prospection_start_year,
+        self.end_year,
+        method=method,
+        positive_constraint=positive_constraint,
+        model_name=model_name,
+    )
+    interpolation_function_values = pd.Series(
+        values, index=self.df.index, name="interpolation_function_values"
+    )
+
+    return interpolation_function_values
+
+
+def _interpolation_values(
+    years,
+    reference_years,
+    reference_years_values,
+    prospection_start_year,
+    end_year,
+    method="linear",
+    positive_constraint=False,
+    model_name="Not provided",
+):
+    """Array kernel of `aeromaps_interpolation_function` over ``years``."""
     if len(reference_years_values) == 0:
         raise ValueError(f"[{model_name}] reference_years_values must not be empty.")
     if len(reference_years) > 0 and len(reference_years) != len(reference_years_values):
@@ -279,9 +307,9 @@ def aeromaps_interpolation_function(
             f"[{model_name}] reference_years and reference_years_values must have the same length "
             f"(got {len(reference_years)} years and {len(reference_years_values)} values)."
         )
+    values = np.full(len(years), np.nan)
     if len(reference_years) == 0:
-        for k in range(self.prospection_start_year, self.end_year + 1):
-            self.df.loc[k, "interpolation_function_values"] = reference_years_values[0]
+        values[years >= prospection_start_year] = reference_years_values[0]
     else:
         interpolation_function = interp1d(
             reference_years,
@@ -290,23 +318,17 @@ def aeromaps_interpolation_function(
         )
 
         # If first reference year is lower than prospection start year, we start interpolating before
-        if reference_years[0] != self.prospection_start_year:
+        if reference_years[0] != prospection_start_year:
             warnings.warn(
                 f"\n[Interpolation Model: {model_name} Warning]\n"
-                f"The first reference year ({reference_years[0]}) differs from the prospection start year ({self.prospection_start_year}).\n"
+                f"The first reference year ({reference_years[0]}) differs from the prospection start year ({prospection_start_year}).\n"
                 f"Interpolation will begin at the first reference year."
             )
-            prospection_start_year = reference_years[0]
+            interpolation_start_year = reference_years[0]
         else:
-            prospection_start_year = self.prospection_start_year
+            interpolation_start_year = prospection_start_year
 
-        if reference_years[-1] == self.end_year:
-            for k in range(prospection_start_year, reference_years[-1] + 1):
-                if positive_constraint and interpolation_function(k) <= 0.0:
-                    self.df.loc[k, "interpolation_function_values"] = 0.0
-                else:
-                    self.df.loc[k, "interpolation_function_values"] = interpolation_function(k)
-        elif reference_years[-1] > self.end_year:
+        if reference_years[-1] > end_year:
             warnings.warn(
                 "Warning Message - "
                 + "Model name: "
@@ -314,12 +336,7 @@ def aeromaps_interpolation_function(
                 + " - Warning on aeromaps_interpolation_function:"
                 + " The last reference year for the interpolation is higher than end_year, the interpolation function is therefore not used in its entirety.",
             )
-            for k in range(prospection_start_year, self.end_year + 1):
-                if positive_constraint and interpolation_function(k) <= 0.0:
-                    self.df.loc[k, "interpolation_function_values"] = 0.0
-                else:
-                    self.df.loc[k, "interpolation_function_values"] = interpolation_function(k)
-        else:
+        elif reference_years[-1] < end_year:
             warnings.warn(
                 "Warning Message - "
                 + "Model name: "
@@ -327,22 +344,89 @@ def aeromaps_interpolation_function(
                 + " - Warning on aeromaps_interpolation_function:"
                 + " The last reference year for the interpolation is lower than end_year, the value associated to the last reference year is therefore used as a constant for the upper years.",
             )
-            for k in range(prospection_start_year, reference_years[-1] + 1):
-                if positive_constraint and interpolation_function(k) <= 0.0:
-                    self.df.loc[k, "interpolation_function_values"] = 0.0
-                else:
-                    self.df.loc[k, "interpolation_function_values"] = interpolation_function(k)
-            for k in range(reference_years[-1] + 1, self.end_year + 1):
-                self.df.loc[k, "interpolation_function_values"] = self.df.loc[
-                    k - 1, "interpolation_function_values"
-                ]
 
-    interpolation_function_values = self.df.loc[:, "interpolation_function_values"]
+        # All interpolated years in one call; the value of the last reference year is
+        # held constant up to end_year.
+        interpolated = (years >= interpolation_start_year) & (years <= reference_years[-1])
+        values[interpolated] = interpolation_function(years[interpolated])
+        if positive_constraint:
+            values[interpolated] = np.where(values[interpolated] <= 0.0, 0.0, values[interpolated])
+        held = years > reference_years[-1]
+        if held.any() and interpolated.any():
+            values[held] = values[interpolated][-1]
 
-    # Delete intermediate df column
-    self.df.pop("interpolation_function_values")
+    return values
 
-    return interpolation_function_values
+
+def aeromaps_price_trajectory(
+    self,
+    reference_years,
+    reference_years_values,
+    historic_value=None,
+    model_name="Not provided",
+):
+    """
+    Price trajectory over the model years, interpolated from reference years and values.
+
+    Trajectories are memoised on their reference years and values: price models are evaluated
+    with the same inputs at each iteration of the MDA, and across scenarios sharing them.
+
+    Parameters
+    ----------
+    reference_years
+        Sequence of reference years used for interpolation.
+    reference_years_values
+        Sequence of prices corresponding to the reference years.
+    historic_value
+        Price of the years before the prospection start year; the price of the prospection
+        start year is used if None.
+    model_name
+        Optional name used in warnings.
+
+    Returns
+    -------
+    np.ndarray
+        Read-only array of prices over the years of the model's DataFrame.
+    """
+    years = self.df.index
+    return _price_trajectory(
+        int(years[0]),
+        int(years[-1]),
+        self.prospection_start_year,
+        self.end_year,
+        tuple(np.asarray(reference_years).tolist()),
+        tuple(np.asarray(reference_years_values, dtype=float).tolist()),
+        historic_value,
+        model_name,
+    )
+
+
+@lru_cache(maxsize=256)
+def _price_trajectory(
+    first_year,
+    last_year,
+    prospection_start_year,
+    end_year,
+    reference_years,
+    reference_years_values,
+    historic_value,
+    model_name,
+):
+    years = np.arange(first_year, last_year + 1)
+    values = _interpolation_values(
+        years,
+        list(reference_years),
+        list(reference_years_values),
+        prospection_start_year,
+        end_year,
+        model_name=model_name,
+    )
+    historic = years < prospection_start_year
+    if historic_value is None:
+        historic_value = values[prospection_start_year - first_year]
+    values[historic] = historic_value
+    values.setflags(write=False)
+    return values
 
 
 def aeromaps_leveling_function(
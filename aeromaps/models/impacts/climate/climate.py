@@ -1,8 +1,12 @@
+import logging
+
 import pandas as pd
 
 from aeromaps.models.base import (
     AeroMAPSModel,
 )
+from aeromaps.models.impacts.climate.spin_up import HistoricalSpinUp
+from aeromaps.models.impacts.climate.surrogate import ImpulseResponseSurrogate, surrogate_errors
 from aerocm.climate_models.aviation_climate_simulation import AviationClimateSimulation
 
 
@@ -21,6 +25,12 @@ class ClimateModel(AeroMAPSModel):
         Dictionary containing species-specific settings for the climate model, by default None (which uses default settings from AeroCM).
     model_settings : dict | None, optional
         Dictionary containing model-wide settings for the climate model, by default None (which uses default settings from AeroCM).
+    surrogate : bool, optional
+        Whether to evaluate the climate model with its impulse-response surrogate, by default False.
+    validate_surrogate : bool, optional
+        Whether to also run the full climate model and report the errors of the surrogate, by default False.
+    cache_directory : str | None, optional
+        Directory where the impulse-response kernels of the surrogate are cached, by default None (no cache on disk).
 
     Attributes
     ----------
@@ -30,6 +40,9 @@ class ClimateModel(AeroMAPSModel):
         Species-specific settings for the climate model.
     model_settings : dict | None
         Model settings for the climate model.
+    surrogate_errors : pd.DataFrame | None
+        Relative errors of the surrogate against the full climate model for each AeroCM result and response,
+        computed in validation mode only.
     mapping : dict
         Mapping between AeroCM output keys and AeroMAPS variable names.
 
@@ -41,6 +54,15 @@ class ClimateModel(AeroMAPSModel):
 
     The climate simulation is performed using the `AviationClimateSimulation` class from AeroCM.
     More details can be found on the AeroCM repository: https://github.com/AeroMAPS/AeroCM
+
+    For the climate models of AeroCM (IPCC, GWP*, LWE, FaIR), the simulation of the historical years is
+    reused from one computation to the other as long as the historical inventory is unchanged, and only the
+    prospective years are simulated (see `HistoricalSpinUp`).
+
+    With the surrogate, the response to the prospective inventory is instead obtained by FFT convolution with
+    impulse-response kernels computed once with AeroCM (see `ImpulseResponseSurrogate`). The surrogate is exact
+    for the linear models (IPCC, GWP*, LWE) apart from the methane response to NOx, and approximate for FaIR.
+    Its errors can be checked in validation mode.
     """
 
     def __init__(
@@ -49,6 +71,9 @@ class ClimateModel(AeroMAPSModel):
             name: str = "climate",
             species_settings: dict | None = None,
             model_settings: dict | None = None,
+            surrogate: bool = False,
+            validate_surrogate: bool = False,
+            cache_directory: str | None = None,
             *args,
             **kwargs
     ):
@@ -58,6 +83,14 @@ class ClimateModel(AeroMAPSModel):
         self.climate_model = climate_model
         self.species_settings = species_settings
         self.model_settings = model_settings
+        self.surrogate = surrogate
+        self.validate_surrogate = validate_surrogate
+        self.cache_directory = cache_directory
+        self.surrogate_errors = None
+
+        # Historical spin-up of the simulation and its surrogate, set up on first computation
+        self._historical_spin_up = None
+        self._surrogate = None
 
         # --- Declare input names ---
         self.input_names = [
@@ -137,15 +170,51 @@ class ClimateModel(AeroMAPSModel):
         }
 
         # --- Run climate simulation ---
+        climate_model = self.climate_model
+        species_settings = self.species_settings
+        model_settings = self.model_settings
+        historical_spin_up = self._get_historical_spin_up()
+        if historical_spin_up is not None:
+            climate_model = historical_spin_up
+            species_settings = historical_spin_up.species_settings
+            model_settings = historical_spin_up.model_settings
+            if self.surrogate:
+                climate_model = self._get_surrogate(historical_spin_up)
+        elif self.surrogate:
+            raise ValueError(
+                f"The climate surrogate is not available for the climate model '{self.climate_model}' "
+                f"and the years of the simulation. Available climate models: "
+                f"{HistoricalSpinUp.available_climate_models}."
+            )
+
         results = AviationClimateSimulation(
-            climate_model=self.climate_model,
+            climate_model=climate_model,
             start_year=self.climate_historic_start_year,
             end_year=self.end_year,
             species_inventory=species_inventory,
-            species_settings=self.species_settings,
-            model_settings=self.model_settings
+            species_settings=species_settings,
+            model_settings=model_settings
         ).run()
 
+        # --- Validate the surrogate against the full climate model ---
+        if self.surrogate and self.validate_surrogate:
+            reference = AviationClimateSimulation(
+                climate_model=historical_spin_up,
+                start_year=self.climate_historic_start_year,
+                end_year=self.end_year,
+                species_inventory=species_inventory,
+                species_settings=species_settings,
+                model_settings=model_settings
+            ).run()
+            self.surrogate_errors = surrogate_errors(results, reference)
+            result_key, response = self.surrogate_errors.stack().idxmax()
+            logging.info(
+                "Climate surrogate: largest relative error of %.2e on %s (%s).",
+                self.surrogate_errors.loc[result_key, response],
+                result_key,
+                response,
+            )
+
         # --- Convert back results from np.ndarray (list) to pd.Series ---
         for key in results.keys():
             for subkey in results[key].keys():
@@ -206,4 +275,37 @@ class ClimateModel(AeroMAPSModel):
         output_data["co2_h2o_nox_erf"] = self.df_climate["co2_h2o_nox_erf"]
         output_data["co2_h2o_nox_contrails_erf"] = self.df_climate["co2_h2o_nox_contrails_erf"]
 
-        return output_data
\ No newline at end of file
+        return output_data
+
+    def _get_historical_spin_up(self) -> HistoricalSpinUp | None:
+        """Historical spin-up of the simulation, None if the climate model or the years do not allow it."""
+        last_historic_year = self.prospection_start_year - 1
+        if (
+            self.climate_model not in HistoricalSpinUp.available_climate_models
+            or not self.climate_historic_start_year < last_historic_year < self.end_year
+        ):
+            return None
+
+        spin_up = self._historical_spin_up
+        if spin_up is None or (spin_up.start_year, spin_up.last_historic_year, spin_up.end_year) != (
+            self.climate_historic_start_year,
+            last_historic_year,
+            self.end_year,
+        ):
+            spin_up = self._historical_spin_up = HistoricalSpinUp(
+                self.climate_model,
+                self.climate_historic_start_year,
+                last_historic_year,
+                self.end_year,
+                species_settings=self.species_settings,
+                model_settings=self.model_settings,
+            )
+        return spin_up
+
+    def _get_surrogate(self, historical_spin_up: HistoricalSpinUp) -> ImpulseResponseSurrogate:
+        """Impulse-response surrogate of the climate model, rebuilt with the historical spin-up."""
+        if self._surrogate is None or self._surrogate.spin_up is not historical_spin_up:
+            self._surrogate = ImpulseResponseSurrogate(
+                historical_spin_up, cache_directory=self.cache_directory
+            )
+        return self._surrogate
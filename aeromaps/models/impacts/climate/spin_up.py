@@ -0,0 +1,436 @@
+"""
+spin_up
+=======
+
+Reuse of the historical part of aviation climate simulations.
+
+The emission inventory of the historical years is the same from one computation to the other,
+only the prospective years change. Simulations are therefore split at the last historical year:
+the historical part is run once per species and cached, and each computation only simulates the
+prospective years. For models whose response is linear in the inventory (IPCC, GWP*, LWE), the
+cached part is the response to the historical inventory over the whole simulation. For FaIR, it
+is the state of the model at the last historical year, from which the prospective years are run.
+"""
+
+import numpy as np
+from scipy.interpolate import interp1d
+
+from aerocm.climate_models.aviation_climate_simulation import (
+    add_default_model_settings,
+    add_default_species_settings,
+)
+from aerocm.climate_models.fair_climate_model import FairClimateModel, FairRunner
+from aerocm.climate_models.gwpstar_climate_model import GWPStarClimateModel
+from aerocm.climate_models.ipcc_climate_model import IPCCClimateModel
+from aerocm.climate_models.lwe_climate_model import LWEClimateModel
+from fair.interface import fill
+
+# Climate models whose response is linear in the species inventory
+LINEAR_CLIMATE_MODELS = {
+    "IPCC": IPCCClimateModel,
+    "GWP*": GWPStarClimateModel,
+    "LWE": LWEClimateModel,
+}
+
+# Species given to FaIR as an effective radiative forcing rather than as emissions
+FAIR_FORCING_SPECIES = [
+    "Contrails",
+    "NOx - ST O3 increase",
+    "NOx - CH4 decrease and induced",
+    "H2O",
+]
+
+
+class HistoricalSpinUp:
+    """
+    Climate model for `AviationClimateSimulation` reusing the simulation of the historical years.
+
+    Instances are called by `AviationClimateSimulation` for each species, like any callable climate
+    model of AeroCM. The historical simulation of a species is run again only when its historical
+    inventory changes.
+
+    Parameters
+    ----------
+    climate_model : str
+        Name of the AeroCM climate model, one of `available_climate_models`.
+    start_year : int
+        Start year of the simulation.
+    last_historic_year : int
+        Last year of the historical inventory.
+    end_year : int
+        End year of the simulation.
+    species_settings : dict | None, optional
+        Species-specific settings for the climate model, completed with the AeroCM defaults.
+    model_settings : dict | None, optional
+        Model settings for the climate model, completed with the AeroCM defaults.
+
+    Attributes
+    ----------
+    species_settings : dict
+        Species settings completed with the AeroCM defaults, to be given to
+        `AviationClimateSimulation`.
+    model_settings : dict
+        Model settings completed with the AeroCM defaults.
+
+    Notes
+    -----
+    The settings given when calling an instance are ignored: the cached historical simulations
+    were run with the settings of the instance.
+    """
+
+    available_climate_models = [*LINEAR_CLIMATE_MODELS, "FaIR"]
+
+    def __init__(
+        self,
+        climate_model: str,
+        start_year: int,
+        last_historic_year: int,
+        end_year: int,
+        species_settings: dict | None = None,
+        model_settings: dict | None = None,
+    ):
+        if climate_model == "FaIR":
+            self.model_class = FairClimateModel
+        else:
+            self.model_class = LINEAR_CLIMATE_MODELS[climate_model]
+        self.climate_model = climate_model
+        self.start_year = start_year
+        self.last_historic_year = last_historic_year
+        self.end_year = end_year
+        self.species_settings = add_default_species_settings(self.model_class, species_settings)
+        self.model_settings = add_default_model_settings(self.model_class, model_settings)
+
+        # Historical inventory and simulation of each species
+        self._historical = {}
+
+        # FaIR background scenario and runner of the prospective years, set up on first use
+        self._fair_background = None
+        self._fair_runner = None
+
+    def __call__(
+        self,
+        start_year: int,
+        end_year: int,
+        specie_name: str,
+        specie_inventory: np.ndarray,
+        specie_settings: dict,
+        model_settings: dict,
+    ) -> dict:
+        """Simulate a species, reusing its historical simulation when possible."""
+        specie_inventory = np.asarray(specie_inventory, dtype=float)
+        if (start_year, end_year) != (self.start_year, self.end_year) or (
+            specie_name not in self.model_class.available_species
+        ):
+            return self.model_class(
+                start_year,
+                end_year,
+                specie_name,
+                specie_inventory,
+                self.species_settings.get(specie_name, {}),
+                self.model_settings,
+            ).run()
+
+        if self.climate_model == "FaIR":
+            return self._run_fair(specie_name, specie_inventory)
+        return self._run_linear(specie_name, specie_inventory)
+
+    @property
+    def n_historic_years(self) -> int:
+        return self.last_historic_year - self.start_year + 1
+
+    def _historical_simulation(self, specie_name, historical_inventory, simulate):
+        """Cached historical simulation of a species, run again if its inventory changed."""
+        cached = self._historical.get(specie_name)
+        if cached is None or not np.array_equal(cached[0], historical_inventory, equal_nan=True):
+            cached = (historical_inventory.copy(), simulate())
+            self._historical[specie_name] = cached
+        return cached[1]
+
+    # --- Linear models ---
+
+    def _run_linear(self, specie_name, specie_inventory):
+        """Superpose the responses to the historical and prospective inventories."""
+        n_historic = self.n_historic_years
+
+        def simulate():
+            inventory = np.zeros_like(specie_inventory)
+            inventory[:n_historic] = specie_inventory[:n_historic]
+            return self._simulate_linear(self.start_year, specie_name, inventory)
+
+        historical = self._historical_simulation(
+            specie_name, specie_inventory[:n_historic], simulate
+        )
+        prospective = self._simulate_linear(
+            self.last_historic_year + 1, specie_name, specie_inventory[n_historic:]
+        )
+
+        results = {}
+        for key, historical_response in historical.items():
+            response = np.asarray(historical_response, dtype=float).copy()
+            response[n_historic:] += prospective[key]
+            results[key] = response
+        return results
+
+    def _simulate_linear(self, start_year, specie_name, specie_inventory):
+        return self.model_class(
+            start_year,
+            self.end_year,
+            specie_name,
+            specie_inventory,
+            self.species_settings[specie_name],
+            self.model_settings,
+        ).run()
+
+    # --- FaIR ---
+
+    def _run_fair(self, specie_name, specie_inventory):
+        """Run FaIR over the prospective years from its state at the last historical year."""
+        specie_settings = self.species_settings[specie_name]
+        efficacy_erf = specie_settings.get("efficacy_erf", 1.0)
+        ratio_erf_rf = specie_settings.get("ratio_erf_rf", 1.0)
+        n_historic = self.n_historic_years
+        background_species_quantities, background = self._get_fair_background()
+        fair_inventory = self._fair_inventory(specie_name, specie_inventory)
+
+        def simulate():
+            runner = FairRunner(
+                self.start_year,
+                self.last_historic_year,
+                {key: value[:n_historic] for key, value in background_species_quantities.items()},
+            )
+            results = runner.run(specie_name, efficacy_erf, fair_inventory[:n_historic])
+            return {
+                "effective_radiative_forcing": results["effective_radiative_forcing"][:, 0],
+                "temperature": results["temperature"][:, 0],
+                "state": _fair_state(runner.f),
+            }
+
+        historical = self._historical_simulation(
+            specie_name, specie_inventory[:n_historic], simulate
+        )
+        prospective = self._get_fair_runner().restart(
+            historical["state"], specie_name, efficacy_erf, fair_inventory[n_historic - 1 :]
+        )
+
+        # --- Contribution of the species: difference with the background scenario ---
+        temperature = (
+            np.concatenate((historical["temperature"], prospective["temperature"][1:]))
+            - background["temperature"]
+        )
+        if specie_name in FAIR_FORCING_SPECIES:
+            effective_radiative_forcing = fair_inventory
+        else:
+            effective_radiative_forcing = (
+                np.concatenate(
+                    (
+                        historical["effective_radiative_forcing"],
+                        prospective["effective_radiative_forcing"][1:],
+                    )
+                )
+                - background["effective_radiative_forcing"]
+            )
+
+        return {
+            "radiative_forcing": effective_radiative_forcing / ratio_erf_rf,
+            "effective_radiative_forcing": effective_radiative_forcing,
+            "temperature": temperature,
+        }
+
+    def _fair_inventory(self, specie_name, specie_inventory):
+        """Inventory as given to FaIR by `FairClimateModel`: emissions, or forcing in W/m2."""
+        specie_settings = self.species_settings[specie_name]
+        if specie_name == "CO2":
+            return specie_inventory / 10**12  # Conversion from kgCO2 to GtCO2
+        if specie_name in ("Soot", "Sulfur"):
+            return specie_inventory / 10**9  # Conversion from kg to Mt
+
+        if specie_name == "NOx - CH4 decrease and induced":
+            years = np.arange(self.start_year, self.end_year + 1)
+            min_year = min(self.start_year, 1939)
+            max_year = max(self.end_year, 2051)
+            tau_reference_year = [min_year, 1940, 1980, 1994, 2004, 2050, max_year]
+            tau_reference_values = [11, 11, 10.1, 10, 9.85, 10.25, 10.25]
+            tau_function = interp1d(tau_reference_year, tau_reference_values, kind="linear")
+            tau = tau_function(years)
+            ch4_molar_mass = 16.04e-3  # [kg/mol]
+            air_molar_mass = 28.97e-3  # [kg/mol]
+            atmosphere_total_mass = 5.1352e18  # [kg]
+            radiative_efficiency = 3.454545e-4  # [W/m^2/ppb]
+            A_CH4_unit = (
+                radiative_efficiency
+                * 1e9
+                * air_molar_mass
+                / (ch4_molar_mass * atmosphere_total_mass)
+            )  # RF per unit mass increase in atmospheric abundance of CH4 [W/m^2/kg]
+            A_CH4 = A_CH4_unit * specie_settings.get("ch4_loss_per_nox", 0.0) * specie_inventory
+            f1 = 0.5  # Indirect effect on ozone
+            f2 = 0.15  # Indirect effect on stratospheric water
+            # Radiative forcing induced in year j (columns) by the species emitted in year i (rows)
+            age = years[None, :] - years[:, None]
+            decay = np.exp(-np.maximum(age, 0) / tau[None, :])
+            radiative_forcing_from_year = np.where(
+                age >= 0, (1 + f1 + f2) * A_CH4[:, None] * decay, 0.0
+            )
+            radiative_forcing = radiative_forcing_from_year.sum(axis=0)
+        else:
+            radiative_forcing = specie_settings.get("sensitivity_rf", 0.0) * specie_inventory
+
+        return radiative_forcing * specie_settings.get("ratio_erf_rf", 1.0)
+
+    def _get_fair_background(self):
+        """Background species quantities and FaIR background scenario over the whole simulation."""
+        if self._fair_background is None:
+            background_species_quantities = FairClimateModel.get_background_species_quantities(
+                self.model_settings, self.start_year, self.end_year
+            )
+            results = FairRunner(
+                self.start_year, self.end_year, background_species_quantities
+            ).run()
+            self._fair_background = (
+                background_species_quantities,
+                {key: value[:, 0] for key, value in results.items()},
+            )
+        return self._fair_background
+
+    def _get_fair_runner(self):
+        if self._fair_runner is None:
+            background_species_quantities, _ = self._get_fair_background()
+            self._fair_runner = _FairRestartRunner(
+                self.last_historic_year,
+                self.end_year,
+                {
+                    key: value[self.n_historic_years - 1 :]
+                    for key, value in background_species_quantities.items()
+                },
+                reference_year=self.start_year,
+            )
+        return self._fair_runner
+
+
+def _fair_state(f) -> dict:
+    """State of a FaIR run at its last timebound."""
+    return {
+        "concentration": f.concentration.data[-1].copy(),
+        "airborne_emissions": f.airborne_emissions.data[-1].copy(),
+        "cumulative_emissions": f.cumulative_emissions.data[-1].copy(),
+        "gas_partitions": f.gas_partitions.data.copy(),
+        "temperature": f.temperature.data[-1].copy(),
+        # Forcing term of the energy balance state, autocorrelated in FaIR
+        "forcing": f.stochastic_forcing.data[-1].copy(),
+    }
+
+
+class _FairRestartRunner(FairRunner):
+    """
+    FairRunner set up once, whose runs start from the state of a previous run.
+
+    Parameters
+    ----------
+    start_year : int
+        Start year of the run, last year of the run restarted from.
+    end_year : int
+        End year of the run.
+    background_species_quantities : dict
+        Background species quantities from the start year to the end year.
+    reference_year : int
+        Start year of the run restarted from, which sets the baseline concentrations.
+    """
+
+    def __init__(
+        self,
+        start_year: int,
+        end_year: int,
+        background_species_quantities: dict,
+        reference_year: int,
+    ):
+        super().__init__(start_year, end_year, background_species_quantities)
+
+        # FaIR only uses the time axis through its length: the model is set up as if it started at
+        # the reference year, for its baseline concentrations to be those of the run restarted from.
+        self.start_year = reference_year
+        self.end_year = reference_year + end_year - start_year
+        self._setup_model()
+        self.start_year = start_year
+        self.end_year = end_year
+
+        f = self.f
+        self._emissions = f.emissions.data.copy()
+        self._forcing = f.forcing.data.copy()
+        self._forcing_efficacy = f.species_configs["forcing_efficacy"].data.copy()
+
+    def restart(
+        self,
+        state: dict,
+        specie_name: str = None,
+        efficacy_erf: int | float = 1.0,
+        specie_inventory: np.ndarray = None,
+    ) -> dict:
+        """
+        Run FaIR from a state, for a (single) given species and its emission profile.
+
+        Parameters
+        ----------
+        state : dict
+            State of the run restarted from at its last timebound, see `_fair_state`.
+        specie_name : str, optional
+            Name of the species. If None, run the background scenario.
+        efficacy_erf : int | float, optional
+            Efficacy of the species for effective radiative forcing.
+        specie_inventory : np.ndarray, optional
+            Annual emissions or forcing of the species from the start year.
+
+        Returns
+        -------
+        dict
+            Effective radiative forcing and temperature from the start year.
+        """
+        f = self.f
+        config, scenario = f.configs[0], f.scenarios[0]
+
+        # --- Inputs of the background scenario ---
+        f.emissions.data[...] = self._emissions
+        f.forcing.data[...] = self._forcing
+        f.species_configs["forcing_efficacy"].data[...] = self._forcing_efficacy
+
+        # --- Inputs of the species, as in FairRunner.run ---
+        if specie_name is not None:
+            fill(f.species_configs["forcing_efficacy"], efficacy_erf, specie=specie_name)
+            if specie_name == "CO2":
+                total_co2 = (
+                    f.emissions.loc[dict(specie="CO2", config=config, scenario=scenario)].data
+                    + specie_inventory[1:]
+                )
+                fill(f.emissions, total_co2, specie="CO2", config=config, scenario=scenario)
+            elif self.properties[specie_name]["input_mode"] == "forcing":
+                fill(
+                    f.forcing,
+                    specie_inventory,
+                    specie=specie_name,
+                    config=config,
+                    scenario=scenario,
+                )
+            else:
+                fill(
+                    f.emissions,
+                    specie_inventory[1:],
+                    specie=specie_name,
+                    config=config,
+                    scenario=scenario,
+                )
+
+        # --- State at the first timebound ---
+        # The forcing of the first timebound only initialises the forcing term of the energy balance
+        f.forcing.data[0] = 0.0
+        f.forcing.data[0, ..., 0] = state["forcing"]
+        f.temperature.data[0] = state["temperature"]
+        f.concentration.data[0] = state["concentration"]
+        f.airborne_emissions.data[0] = state["airborne_emissions"]
+        f.cumulative_emissions.data[0] = state["cumulative_emissions"]
+        f.gas_partitions.data[...] = state["gas_partitions"]
+
+        f.run(progress=False)
+
+        return {
+            "effective_radiative_forcing": f.forcing_sum.data[:, 0, 0],
+            "temperature": f.temperature.data[:, 0, 0, 0],
+        }
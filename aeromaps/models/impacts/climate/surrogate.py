@@ -0,0 +1,239 @@
+"""
+surrogate
+=========
+
+Impulse-response surrogate of the aviation climate simulations.
+
+The response to the prospective inventory of each species is approximated by the convolution of
+this inventory with impulse-response kernels, evaluated by FFT. The kernels are the responses of the
+climate model to an emission pulse in the first prospective year. They are computed once with
+AeroCM and cached on disk for the model settings. The response to the historical inventory is the
+one of the full model (see `HistoricalSpinUp`).
+
+The surrogate is exact for responses that are linear and time-invariant, which is the case of the
+IPCC, GWP* and LWE models except for the methane response to NOx, whose lifetime depends on the
+emission year. For FaIR, it also neglects the dependence of the response on the background scenario
+and on the aviation inventory itself.
+"""
+
+import hashlib
+import pickle
+from importlib.metadata import version
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from aerocm.climate_models.aviation_climate_simulation import AviationClimateSimulation
+from scipy.fft import next_fast_len
+
+from aeromaps.models.impacts.climate.spin_up import HistoricalSpinUp
+
+# Emission pulses from which the kernels are computed, of the order of the annual aviation inventory
+PULSE_SIZES = {
+    "CO2": 1e12,  # in kg
+    "Contrails": 5e10,  # in km
+    "NOx - ST O3 increase": 3e9,  # in kg
+    "NOx - CH4 decrease and induced": 3e9,  # in kg
+    "H2O": 4e11,  # in kg
+    "Soot": 1e7,  # in kg
+    "Sulfur": 1e8,  # in kg
+}
+
+# Responses of the climate models, in the order of the kernels
+RESPONSES = ["radiative_forcing", "effective_radiative_forcing", "temperature"]
+
+
+class ImpulseResponseSurrogate:
+    """
+    Climate model for `AviationClimateSimulation` convolving the prospective inventory with kernels.
+
+    Parameters
+    ----------
+    spin_up : HistoricalSpinUp
+        Historical spin-up of the climate model, giving the response to the historical inventory.
+    cache_directory : str | Path | None, optional
+        Directory where the kernels are cached, by default None (kernels are not cached on disk).
+
+    Attributes
+    ----------
+    species_settings : dict
+        Species settings of the climate model, to be given to `AviationClimateSimulation`.
+    model_settings : dict
+        Model settings of the climate model.
+    """
+
+    def __init__(self, spin_up: HistoricalSpinUp, cache_directory: str | Path | None = None):
+        self.spin_up = spin_up
+        self.cache_directory = cache_directory
+        self.species_settings = spin_up.species_settings
+        self.model_settings = spin_up.model_settings
+
+        # Kernels and their spectra for each species, set up on first use
+        self._kernels = None
+        self._spectra = None
+        self._n_fft = None
+
+        # Historical inventory and response of each species
+        self._historical = {}
+
+    def __call__(
+        self,
+        start_year: int,
+        end_year: int,
+        specie_name: str,
+        specie_inventory: np.ndarray,
+        specie_settings: dict,
+        model_settings: dict,
+    ) -> dict:
+        """Approximate the response to the inventory of a species."""
+        spin_up = self.spin_up
+        kernels = self.kernels
+        specie_inventory = np.asarray(specie_inventory, dtype=float)
+        if (start_year, end_year) != (spin_up.start_year, spin_up.end_year) or (
+            specie_name not in kernels
+        ):
+            return spin_up(
+                start_year, end_year, specie_name, specie_inventory, specie_settings, model_settings
+            )
+
+        n_historic = spin_up.n_historic_years
+        historical = self._historical_response(specie_name, specie_inventory[:n_historic])
+
+        prospective_inventory = specie_inventory[n_historic:]
+        prospective = np.fft.irfft(
+            np.fft.rfft(prospective_inventory, self._n_fft) * self._spectra[specie_name],
+            self._n_fft,
+        )[:, : len(prospective_inventory)]
+
+        results = {}
+        for response, prospective_response in zip(RESPONSES, prospective):
+            results[response] = historical[response].copy()
+            results[response][n_historic:] += prospective_response
+        return results
+
+    @property
+    def kernels(self) -> dict:
+        """Response of each species to a unit inventory in the first prospective year."""
+        if self._kernels is None:
+            cache_file = self._cache_file()
+            if cache_file is not None and cache_file.exists():
+                with np.load(cache_file) as data:
+                    kernels = dict(zip(data["species"], data["kernels"]))
+            else:
+                kernels = self._compute_kernels()
+                if cache_file is not None:
+                    cache_file.parent.mkdir(parents=True, exist_ok=True)
+                    np.savez(
+                        cache_file,
+                        species=np.array(list(kernels)),
+                        kernels=np.array(list(kernels.values())),
+                    )
+
+            n_prospective = self.spin_up.end_year - self.spin_up.last_historic_year
+            self._n_fft = next_fast_len(2 * n_prospective - 1, real=True)
+            self._spectra = {
+                specie: np.fft.rfft(kernel, self._n_fft) for specie, kernel in kernels.items()
+            }
+            self._kernels = kernels
+        return self._kernels
+
+    def _compute_kernels(self) -> dict:
+        """Run the climate model with an emission pulse of each species."""
+        spin_up = self.spin_up
+        n_historic = spin_up.n_historic_years
+        species = [
+            specie for specie in PULSE_SIZES if specie in spin_up.model_class.available_species
+        ]
+
+        species_inventory = {}
+        for specie in species:
+            inventory = np.zeros(spin_up.end_year - spin_up.start_year + 1)
+            inventory[n_historic] = PULSE_SIZES[specie]
+            species_inventory[specie] = inventory
+
+        results = AviationClimateSimulation(
+            climate_model=spin_up.climate_model,
+            start_year=spin_up.start_year,
+            end_year=spin_up.end_year,
+            species_inventory=species_inventory,
+            species_settings=self.species_settings,
+            model_settings=self.model_settings,
+        ).run()
+
+        return {
+            specie: np.array(
+                [np.ravel(results[specie][response])[n_historic:] for response in RESPONSES]
+            )
+            / PULSE_SIZES[specie]
+            for specie in species
+        }
+
+    def _cache_file(self) -> Path | None:
+        """File of the kernels, named after the climate model, its settings and the years."""
+        if self.cache_directory is None:
+            return None
+        spin_up = self.spin_up
+        key = pickle.dumps(
+            (
+                version("aerocm"),
+                spin_up.climate_model,
+                spin_up.start_year,
+                spin_up.last_historic_year,
+                spin_up.end_year,
+                self.species_settings,
+                self.model_settings,
+                PULSE_SIZES,
+            )
+        )
+        return Path(self.cache_directory) / (
+            f"climate_kernels_{hashlib.sha256(key).hexdigest()[:16]}.npz"
+        )
+
+    def _historical_response(self, specie_name, historical_inventory):
+        """Cached response of the full model to the historical inventory of a species."""
+        cached = self._historical.get(specie_name)
+        if cached is None or not np.array_equal(cached[0], historical_inventory, equal_nan=True):
+            spin_up = self.spin_up
+            inventory = np.zeros(spin_up.end_year - spin_up.start_year + 1)
+            inventory[: spin_up.n_historic_years] = historical_inventory
+            response = spin_up(
+                spin_up.start_year,
+                spin_up.end_year,
+                specie_name,
+                inventory,
+                self.species_settings[specie_name],
+                self.model_settings,
+            )
+            cached = (
+                historical_inventory.copy(),
+                {key: np.asarray(response[key], dtype=float) for key in RESPONSES},
+            )
+            self._historical[specie_name] = cached
+        return cached[1]
+
+
+def surrogate_errors(results: dict, reference: dict) -> pd.DataFrame:
+    """
+    Errors of the surrogate against the full model.
+
+    Parameters
+    ----------
+    results : dict
+        Results of `AviationClimateSimulation` run with the surrogate.
+    reference : dict
+        Results of `AviationClimateSimulation` run with the full model.
+
+    Returns
+    -------
+    pd.DataFrame
+        Largest absolute error over the years relative to the largest absolute value of the full
+        model, for each result (rows) and response (columns).
+    """
+    errors = pd.DataFrame(index=list(reference), columns=RESPONSES, dtype=float)
+    for key, reference_results in reference.items():
+        for response in RESPONSES:
+            reference_response = np.ravel(reference_results[response])
+            scale = np.max(np.abs(reference_response))
+            error = np.max(np.abs(np.ravel(results[key][response]) - reference_response))
+            errors.loc[key, response] = error / scale if scale > 0 else error
+    return errors
@@ -9,6 +9,7 @@ import numpy as np
 import pandas as pd
 
 from aeromaps.models.base import AeroMAPSModel
+from aeromaps.utils.functions import _compound_yearly_gains, _fill_nan, _values_at_years
 
 
 class PassengerAircraftDocNonEnergyComplex(AeroMAPSModel):
@@ -225,13 +226,11 @@ class PassengerAircraftDocNonEnergySimple(AeroMAPSModel):
 
             col_dropin = f"doc_non_energy_per_ask_{mid}_dropin_fuel"
 
-            # Historical block: fixed at init.
-            for k in range(self.historic_start_year, self.prospection_start_year):
-                self.df.loc[k, col_dropin] = init
-
-            # Projection block: recurrence.
-            for k in range(self.prospection_start_year, self.end_year + 1):
-                self.df.loc[k, col_dropin] = self.df.loc[k - 1, col_dropin] * (1 - gain / 100)
+            # Historical block fixed at init, then constant yearly gain compounded from init.
+            self.df.loc[: self.last_historical_year, col_dropin] = init
+            self.df.loc[self.prospection_start_year :, col_dropin] = _compound_yearly_gains(
+                init, np.full(self.end_year - self.prospection_start_year + 1, gain)
+            )
 
             dropin_series = self.df[col_dropin]
             hydrogen_series = dropin_series * rel_h
@@ -493,76 +492,56 @@ class PassengerAircraftDocEnergyCarbonTax(AeroMAPSModel):
         """
         energy_types = ["dropin_fuel", "hydrogen", "electric"]
         output_data = {}
+        index = self.df.index
 
-        unit_carbon_tax = {
-            "dropin_fuel": input_data["dropin_fuel_mean_unit_carbon_tax"],
-            "hydrogen": input_data["hydrogen_mean_unit_carbon_tax"],
-            "electric": input_data["electric_mean_unit_carbon_tax"],
-        }
+        def values(name):
+            # Inputs aligned on the model years
+            return _values_at_years(input_data[name], index)
 
-        doc_carbon_tax_per_market_energy_type = {}  # (mid, et) -> pd.Series (per-market per-energy-type carbon tax DOC per ASK)
-        ask_per_market = {}  # mid -> pd.Series (per-market total ASK)
-        ask_market_energy_type_share = {}  # (mid, et) -> pd.Series (ASK share per energy type on a given market [%])
-        doc_carbon_tax_mean = {}  # mid -> pd.Series (per-market ASK-weighted mean carbon tax DOC)
+        ask_per_market = {}  # mid -> per-market total ASK
+        doc_carbon_tax_mean = {}  # mid -> per-market ASK-weighted mean carbon tax DOC
 
         for market in self.markets.get(traffic_type="passenger"):
             mid = market.id
-            ask_per_market[mid] = input_data[f"ask_{mid}"]
+            ask_per_market[mid] = values(f"ask_{mid}")
+            # Per-market mean (NaN treated as 0).
+            total = np.zeros(len(index))
             for et in energy_types:
-                energy = input_data[f"energy_per_ask_{mid}_{et}"]
-                ask_market_energy_type_share[(mid, et)] = input_data[f"ask_{mid}_{et}_share"]
-                doc = energy.replace(0, np.NaN) * unit_carbon_tax[et]
-                doc_carbon_tax_per_market_energy_type[(mid, et)] = doc
-                output_data[f"doc_energy_carbon_tax_per_ask_{mid}_{et}"] = doc
-
-        # Per-market mean (NaN treated as 0).
-        for market in self.markets.get(traffic_type="passenger"):
-            mid = market.id
-            total = None
-            for et in energy_types:
-                term = (
-                    doc_carbon_tax_per_market_energy_type[(mid, et)].fillna(0)
-                    * ask_market_energy_type_share[(mid, et)]
-                    / 100
+                energy = values(f"energy_per_ask_{mid}_{et}")
+                doc = np.where(energy == 0, np.nan, energy) * values(f"{et}_mean_unit_carbon_tax")
+                output_data[f"doc_energy_carbon_tax_per_ask_{mid}_{et}"] = pd.Series(
+                    doc, index=index
                 )
-                total = term if total is None else total + term
-            if total is None:
-                total = pd.Series(0.0, index=self.df.index)
+                total = total + _fill_nan(doc) * values(f"ask_{mid}_{et}_share") / 100
             doc_carbon_tax_mean[mid] = total
-            output_data[f"doc_energy_carbon_tax_per_ask_{mid}_mean"] = total
+            output_data[f"doc_energy_carbon_tax_per_ask_{mid}_mean"] = pd.Series(total, index=index)
 
         # Global mean: weighted by per-market ASK totals.
-        ask_weighted_doc_sum = None
-        ask_total = None
-        for mid, mm in doc_carbon_tax_mean.items():
-            ask_m = ask_per_market[mid]
-            num_term = mm * ask_m
-            ask_weighted_doc_sum = (
-                num_term if ask_weighted_doc_sum is None else ask_weighted_doc_sum + num_term
-            )
-            ask_total = ask_m if ask_total is None else ask_total + ask_m
-
-        if ask_weighted_doc_sum is None:
-            global_mean = pd.Series(0.0, index=self.df.index)
+        if doc_carbon_tax_mean:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                global_mean = sum(
+                    mm * ask_per_market[mid] for mid, mm in doc_carbon_tax_mean.items()
+                ) / sum(ask_per_market.values())
         else:
-            global_mean = ask_weighted_doc_sum / ask_total
+            global_mean = np.zeros(len(index))
 
-        output_data["doc_energy_carbon_tax_per_ask_mean"] = global_mean
+        output_data["doc_energy_carbon_tax_per_ask_mean"] = pd.Series(global_mean, index=index)
 
-        # Carbon offset lowering ratio (sliced over historic_start_year..end_year).
-        co2_emissions = input_data["co2_emissions"]
-        carbon_offset = input_data["carbon_offset"]
-        carbon_remaining_ratio = (
-            co2_emissions.loc[self.historic_start_year : self.end_year] - carbon_offset.fillna(0)
-        ) / co2_emissions.loc[self.historic_start_year : self.end_year]
-
-        output_data["doc_carbon_tax_lowering_offset_per_ask_mean"] = (
-            global_mean * carbon_remaining_ratio
+        # Carbon offset lowering ratio (over historic_start_year..end_year).
+        co2_emissions = values("co2_emissions")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            carbon_remaining_ratio = (
+                co2_emissions - _fill_nan(values("carbon_offset"))
+            ) / co2_emissions
+
+        output_data["doc_carbon_tax_lowering_offset_per_ask_mean"] = pd.Series(
+            global_mean * carbon_remaining_ratio, index=index
         )
 
         for mid, mm in doc_carbon_tax_mean.items():
-            lowering = mm * carbon_remaining_ratio
-            output_data[f"doc_carbon_tax_lowering_offset_per_ask_{mid}_mean"] = lowering
+            output_data[f"doc_carbon_tax_lowering_offset_per_ask_{mid}_mean"] = pd.Series(
+                mm * carbon_remaining_ratio, index=index
+            )
 
         self._store_outputs(output_data)
         return output_data
@@ -1206,3 +1185,202 @@ class PassengerAircraftTotalDoc(AeroMAPSModel):
 
         self._store_outputs(output_data)
         return output_data
+
+
+class PassengerAircraftDocEnergyFused(AeroMAPSModel):
+    """
+    Energy-related DOC layers and total DOC per ASK calculation in a single discipline.
+
+    Fused alternative to PassengerAircraftDocEnergy, PassengerAircraftDocEnergyCarbonTax,
+    PassengerAircraftDocEnergySubsidy, PassengerAircraftDocEnergyTax and
+    PassengerAircraftTotalDoc. The (layer × market × energy × year) DOC is computed once as
+    energy per ASK × unit price of each layer, then averaged over energy types and markets
+    and summed with the non-energy DOC. Output names are those of the separate models.
+
+    Parameters
+    ----------
+    name : str
+        Name of the model instance ('passenger_aircraft_doc_energy_fused' by default).
+
+    Documentation
+    --------------
+    Inputs
+        - <energy>_mean_mfsp: Mean fuel selling price per energy type [€/MJ].
+        - <energy>_mean_unit_carbon_tax: Carbon tax per energy unit per energy type [€/MJ].
+        - <energy>_mean_unit_subsidy: Subsidy per energy unit per energy type [€/MJ].
+        - <energy>_mean_unit_tax: Tax per energy unit per energy type [€/MJ].
+        - co2_emissions: Total CO2 emissions [MtCO2].
+        - carbon_offset: Carbon offset amount [MtCO2].
+        - ask_<market>: Passenger ASK per market [ASK].
+        - energy_per_ask_<market>_<energy>: Energy consumption per ASK per market and aircraft energy type [MJ/ASK].
+        - ask_<market>_<energy>_share: ASK share per energy type on a given market [%].
+        - doc_non_energy_per_ask_<market>_<energy>: Non-energy DOC per ASK [€/ASK].
+        - doc_non_energy_per_ask_<market>_mean: Non-energy DOC per market [€/ASK].
+        - doc_non_energy_per_ask_mean: Global non-energy DOC [€/ASK].
+        - load_factor: Average load factor across passenger markets [%].
+    Outputs
+        - Outputs of PassengerAircraftDocEnergy, PassengerAircraftDocEnergyCarbonTax,
+          PassengerAircraftDocEnergySubsidy, PassengerAircraftDocEnergyTax and
+          PassengerAircraftTotalDoc.
+    Notes
+        - <market> is the MarketManager id (passenger markets).
+        - <energy> is one of: dropin_fuel, hydrogen, electric.
+        - As in the separate models, zero energy consumption is converted to NaN for the
+          energy and carbon tax layers only.
+        - I/O names are generated from configuration and passed to GEMSEO via
+          self.input_names and self.output_names grammars.
+    """
+
+    ENERGY_TYPES = ("dropin_fuel", "hydrogen", "electric")
+    # Output prefix, unit price suffix and sparsity of each layer (zero energy -> NaN)
+    LAYERS = (
+        ("doc_energy_per_ask", "mean_mfsp", True),
+        ("doc_energy_carbon_tax_per_ask", "mean_unit_carbon_tax", True),
+        ("doc_energy_subsidy_per_ask", "mean_unit_subsidy", False),
+        ("doc_energy_tax_per_ask", "mean_unit_tax", False),
+    )
+
+    def __init__(self, name="passenger_aircraft_doc_energy_fused", *args, **kwargs):
+        super().__init__(name=name, model_type="custom", *args, **kwargs)
+        self.markets = None
+
+    def custom_setup(self):
+        """
+        Build input_names / output_names dynamically from the MarketManager.
+        Called once by AeroMAPSProcess after self.markets is injected.
+        """
+        self.input_names = {
+            f"{et}_{price}": pd.Series([0.0])
+            for _, price, _ in self.LAYERS
+            for et in self.ENERGY_TYPES
+        }
+        self.input_names["co2_emissions"] = pd.Series([0.0])
+        self.input_names["carbon_offset"] = pd.Series([0.0])
+        self.input_names["doc_non_energy_per_ask_mean"] = pd.Series([0.0])
+        self.input_names["load_factor"] = pd.Series([0.0])
+        self.output_names = {}
+
+        for market in self.markets.get(traffic_type="passenger"):
+            mid = market.id
+            self.input_names[f"ask_{mid}"] = pd.Series([0.0])
+            self.input_names[f"doc_non_energy_per_ask_{mid}_mean"] = pd.Series([0.0])
+            for et in self.ENERGY_TYPES:
+                self.input_names[f"energy_per_ask_{mid}_{et}"] = pd.Series([0.0])
+                self.input_names[f"ask_{mid}_{et}_share"] = pd.Series([0.0])
+                self.input_names[f"doc_non_energy_per_ask_{mid}_{et}"] = pd.Series([0.0])
+                for prefix, _, _ in self.LAYERS:
+                    self.output_names[f"{prefix}_{mid}_{et}"] = pd.Series([0.0])
+                self.output_names[f"doc_total_per_ask_{mid}_{et}"] = pd.Series([0.0])
+            for prefix, _, _ in self.LAYERS:
+                self.output_names[f"{prefix}_{mid}_mean"] = pd.Series([0.0])
+            self.output_names[f"doc_carbon_tax_lowering_offset_per_ask_{mid}_mean"] = pd.Series(
+                [0.0]
+            )
+            self.output_names[f"doc_total_per_ask_{mid}_mean"] = pd.Series([0.0])
+
+        for prefix, _, _ in self.LAYERS:
+            self.output_names[f"{prefix}_mean"] = pd.Series([0.0])
+        self.output_names["doc_carbon_tax_lowering_offset_per_ask_mean"] = pd.Series([0.0])
+        self.output_names["doc_total_per_ask_mean"] = pd.Series([0.0])
+        self.output_names["doc_net_energy_per_rpk_mean"] = pd.Series([0.0])
+
+    def compute(self, input_data) -> dict:
+        """
+        Energy, carbon tax, subsidy and tax DOC per ASK, and total DOC.
+        Per layer, market and energy type: doc = energy_per_ask * unit price; per-market
+        mean weighted by ASK shares (NaN treated as 0); global mean weighted by per-market
+        ASK. Totals add the non-energy DOC, with the subsidy layer subtracted.
+        """
+        output_data = {}
+        index = self.df.index
+        mids = [market.id for market in self.markets.get(traffic_type="passenger")]
+
+        def values(name):
+            return _values_at_years(input_data[name], index)
+
+        def stack(name_pattern):
+            # (markets, energy types, years) array of the inputs named by name_pattern.
+            return np.array(
+                [
+                    [values(name_pattern.format(mid=mid, et=et)) for et in self.ENERGY_TYPES]
+                    for mid in mids
+                ]
+            ).reshape(len(mids), len(self.ENERGY_TYPES), len(index))
+
+        energy = stack("energy_per_ask_{mid}_{et}")
+        sparse_energy = np.where(energy == 0.0, np.nan, energy)
+        share = stack("ask_{mid}_{et}_share")
+        ask = np.array([values(f"ask_{mid}") for mid in mids]).reshape(len(mids), len(index))
+        ask_total = ask.sum(axis=0)
+
+        # (layers, markets, energy types, years)
+        prices = np.array(
+            [[values(f"{et}_{price}") for et in self.ENERGY_TYPES] for _, price, _ in self.LAYERS]
+        )
+        doc = np.where(
+            np.array([sparse for _, _, sparse in self.LAYERS])[:, None, None, None],
+            sparse_energy,
+            energy,
+        )
+        doc = doc * prices[:, None]
+        market_mean = (np.where(np.isnan(doc), 0.0, doc) * share / 100).sum(axis=2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if mids:
+                global_mean = (market_mean * ask).sum(axis=1) / ask_total
+            else:
+                global_mean = np.zeros((len(self.LAYERS), len(index)))
+
+        for (prefix, _, _), layer_doc, layer_market_mean, layer_global_mean in zip(
+            self.LAYERS, doc, market_mean, global_mean
+        ):
+            for i, mid in enumerate(mids):
+                for j, et in enumerate(self.ENERGY_TYPES):
+                    output_data[f"{prefix}_{mid}_{et}"] = pd.Series(layer_doc[i, j], index=index)
+                output_data[f"{prefix}_{mid}_mean"] = pd.Series(layer_market_mean[i], index=index)
+            output_data[f"{prefix}_mean"] = pd.Series(layer_global_mean, index=index)
+
+        # Carbon offset lowering ratio (sliced over historic_start_year..end_year).
+        co2_emissions = values("co2_emissions")
+        carbon_offset = values("carbon_offset")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            carbon_remaining_ratio = (
+                co2_emissions - np.where(np.isnan(carbon_offset), 0.0, carbon_offset)
+            ) / co2_emissions
+        for i, mid in enumerate(mids):
+            output_data[f"doc_carbon_tax_lowering_offset_per_ask_{mid}_mean"] = pd.Series(
+                market_mean[1, i] * carbon_remaining_ratio, index=index
+            )
+        output_data["doc_carbon_tax_lowering_offset_per_ask_mean"] = pd.Series(
+            global_mean[1] * carbon_remaining_ratio, index=index
+        )
+
+        def total(non_energy, layers):
+            # Subsidy enters with a negative sign (income from subsidy reduces the cost).
+            energy_doc, carbon_tax, subsidy, tax = layers
+            return non_energy + energy_doc + carbon_tax - subsidy + tax
+
+        for i, mid in enumerate(mids):
+            for j, et in enumerate(self.ENERGY_TYPES):
+                output_data[f"doc_total_per_ask_{mid}_{et}"] = pd.Series(
+                    total(values(f"doc_non_energy_per_ask_{mid}_{et}"), doc[:, i, j]),
+                    index=index,
+                )
+            output_data[f"doc_total_per_ask_{mid}_mean"] = pd.Series(
+                total(values(f"doc_non_energy_per_ask_{mid}_mean"), market_mean[:, i]),
+                index=index,
+            )
+        output_data["doc_total_per_ask_mean"] = pd.Series(
+            total(values("doc_non_energy_per_ask_mean"), global_mean), index=index
+        )
+
+        # Convert to per-RPK using load factor: RPK = ASK * load_factor / 100
+        doc_net_energy_per_ask_mean = total(0.0, global_mean)
+        load_factor = values("load_factor")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            output_data["doc_net_energy_per_rpk_mean"] = pd.Series(
+                np.where(load_factor > 0, doc_net_energy_per_ask_mean * 100 / load_factor, 0.0),
+                index=index,
+            )
+
+        self._store_outputs(output_data)
+        return output_data
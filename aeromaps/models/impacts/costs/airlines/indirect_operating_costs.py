@@ -12,7 +12,12 @@ Module to compute indirect operating cost (IOC) and offsets cost.
 
 from typing import Tuple
 import pandas as pd
-from aeromaps.models.base import AeroMAPSModel, aeromaps_interpolation_function
+from aeromaps.models.base import (
+    AeroMAPSModel,
+    aeromaps_interpolation_function,
+    aeromaps_price_trajectory,
+)
+from aeromaps.utils.functions import _values_at_years
 
 
 class PassengerAircraftIndirectOpCosts(AeroMAPSModel):
@@ -104,19 +109,22 @@ class PassengerAircraftNocCarbonOffset(AeroMAPSModel):
         noc_carbon_offset_per_ask
             Non-operating cost per ASK due to carbon offset [€/ASK].
         """
-        carbon_offset_price_prospective = aeromaps_interpolation_function(
+        self.df["carbon_offset_price"] = aeromaps_price_trajectory(
             self,
             carbon_offset_price_reference_years,
             carbon_offset_price_reference_years_values,
+            historic_value=0.0,
             model_name=self.name,
         )
-        self.df.loc[:, "carbon_offset_price"] = carbon_offset_price_prospective
-        for k in range(self.historic_start_year, self.prospection_start_year):
-            self.df.loc[k, "carbon_offset_price"] = 0.0
         carbon_offset_price = self.df["carbon_offset_price"]
 
-        noc_carbon_offset_per_ask = carbon_offset * carbon_offset_price * 10**6 / ask
-
-        self.df.loc[:, "noc_carbon_offset_per_ask"] = noc_carbon_offset_per_ask
+        years = self.df.index
+        self.df["noc_carbon_offset_per_ask"] = (
+            _values_at_years(carbon_offset, years)
+            * carbon_offset_price.to_numpy()
+            * 10**6
+            / _values_at_years(ask, years)
+        )
+        noc_carbon_offset_per_ask = self.df["noc_carbon_offset_per_ask"]
 
         return (carbon_offset_price, noc_carbon_offset_per_ask)
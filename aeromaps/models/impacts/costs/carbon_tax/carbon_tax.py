@@ -9,7 +9,7 @@ Module to compute carbon tax evolution over the years.
 """
 
 import pandas as pd
-from aeromaps.models.base import AeroMAPSModel, aeromaps_interpolation_function
+from aeromaps.models.base import AeroMAPSModel, aeromaps_price_trajectory
 
 
 class CarbonTax(AeroMAPSModel):
@@ -47,15 +47,13 @@ class CarbonTax(AeroMAPSModel):
             Annual carbon tax [€/tCO2].
 
         """
-        carbon_tax_prospective = aeromaps_interpolation_function(
+        self.df["carbon_tax"] = aeromaps_price_trajectory(
             self,
             carbon_tax_reference_years,
             carbon_tax_reference_years_values,
+            historic_value=5.0,
             model_name=self.name,
         )
-        self.df.loc[:, "carbon_tax"] = carbon_tax_prospective
-        for k in range(self.historic_start_year, self.prospection_start_year):
-            self.df.loc[k, "carbon_tax"] = 5.0
         carbon_tax = self.df["carbon_tax"]
 
         return carbon_tax
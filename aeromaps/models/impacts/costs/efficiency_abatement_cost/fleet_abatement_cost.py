@@ -6,12 +6,135 @@
 Module to compute aircraft efficiency-related carbon abatement costs.
 """
 
+import numpy as np
 import pandas as pd
 
 from aeromaps.models.base import AeroMAPSModel
+from aeromaps.utils.discounting import carbon_value_factors, compound_factors
+from aeromaps.utils.functions import _values_at_years
 from typing import Tuple
 
 
+def _lifespan_abatement_sums(
+    extra_cost_non_fuel,
+    extra_cost_fuel,
+    emissions_reduction,
+    cac_reference_mfsp,
+    cac_reference_co2_emission_factor,
+    exogenous_carbon_price_trajectory,
+    discount_rate,
+    aircraft_lives,
+    vintages,
+    end_year,
+):
+    """
+    Discounted costs and emissions reductions of measures taken in each vintage year, cumulated
+    over their life.
+
+    Costs and emissions are cumulated over the life, with the reference fuel price and emission
+    factor of each operating year relative to those of the vintage year. Beyond the end year, the
+    reference fuel price and emission factor keep their end year value and the carbon price keeps
+    growing at its last yearly rate. Costs, and emissions for the generic specific cost, are
+    discounted to the vintage year.
+
+    Parameters
+    ----------
+    extra_cost_non_fuel
+        Aircraft × vintage extra non-fuel cost [€/ASK].
+    extra_cost_fuel
+        Aircraft × vintage extra fuel cost, at the vintage year fuel price [€/ASK].
+    emissions_reduction
+        Aircraft × vintage emissions reduction, at the vintage year emission factor [tCO2/ASK].
+    cac_reference_mfsp
+        CAC reference fuel's MFSP, indexed by year [€/MJ].
+    cac_reference_co2_emission_factor
+        CAC reference fuel's CO2 emission factor, indexed by year [gCO2/MJ].
+    exogenous_carbon_price_trajectory
+        Exogenous carbon price trajectory, indexed by year [€/tCO2].
+    discount_rate
+        Social discount rate [-].
+    aircraft_lives
+        Life of each aircraft [years].
+    vintages
+        Entry into service years.
+    end_year
+        Last year of the scenario.
+
+    Returns
+    -------
+    discounted_cumul_cost
+        Aircraft × vintage discounted extra cost [€/ASK].
+    cumul_emissions
+        Aircraft × vintage emissions reduction [tCO2/ASK].
+    generic_discounted_cumul_emissions
+        Aircraft × vintage emissions reduction weighted by the discounted carbon value relative to
+        the vintage year [tCO2/ASK].
+    """
+    vintages = np.asarray(vintages)
+    aircraft_lives = np.asarray(aircraft_lives).astype(int)
+    discounted_cumul_cost = np.full(np.shape(extra_cost_fuel), np.nan)
+    cumul_emissions = np.full(np.shape(extra_cost_fuel), np.nan)
+    generic_discounted_cumul_emissions = np.full(np.shape(extra_cost_fuel), np.nan)
+
+    def ratio_to_vintage(series, years):
+        # Vintage × age values of the series relative to their vintage year value
+        return _values_at_years(series, years) / _values_at_years(series, vintages)[:, None]
+
+    # Aircraft sharing a life share the vintage × age tables
+    for aircraft_life in np.unique(aircraft_lives):
+        rows = aircraft_lives == aircraft_life
+        years = np.minimum(vintages[:, None] + np.arange(aircraft_life), end_year)
+        discount = compound_factors(discount_rate, int(aircraft_life))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mfsp_ratio = ratio_to_vintage(cac_reference_mfsp, years)
+            emission_factor_ratio = ratio_to_vintage(cac_reference_co2_emission_factor, years)
+            carbon_value = carbon_value_factors(
+                exogenous_carbon_price_trajectory,
+                discount_rate,
+                vintages,
+                int(aircraft_life),
+                end_year,
+            )
+
+            discounted_cumul_cost[rows] = (
+                (extra_cost_non_fuel[rows, :, None] + extra_cost_fuel[rows, :, None] * mfsp_ratio)
+                / discount
+            ).sum(axis=-1)
+            emissions = emissions_reduction[rows, :, None] * emission_factor_ratio
+            cumul_emissions[rows] = emissions.sum(axis=-1)
+            # Discounting emissions for non-hotelling scc
+            generic_discounted_cumul_emissions[rows] = (emissions * carbon_value).sum(axis=-1)
+
+    return discounted_cumul_cost, cumul_emissions, generic_discounted_cumul_emissions
+
+
+def _lifespan_abatement_costs(*args):
+    """
+    Specific and generic specific carbon abatement costs of aircraft entering into service in
+    each vintage year.
+
+    Parameters
+    ----------
+    *args
+        Arguments of `_lifespan_abatement_sums`.
+
+    Returns
+    -------
+    specific_carbon_abatement_cost
+        Aircraft × vintage specific carbon abatement cost [€/tCO2].
+    generic_specific_carbon_abatement_cost
+        Aircraft × vintage generic specific carbon abatement cost [€/tCO2].
+    """
+    discounted_cumul_cost, cumul_emissions, generic_discounted_cumul_emissions = (
+        _lifespan_abatement_sums(*args)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (
+            discounted_cumul_cost / cumul_emissions,
+            discounted_cumul_cost / generic_discounted_cumul_emissions,
+        )
+
+
 class FleetCarbonAbatementCosts(AeroMAPSModel):
     """
     Class for aircraft efficiency-related carbon abatement costs with bottom-up fleet.
@@ -63,16 +186,22 @@ class FleetCarbonAbatementCosts(AeroMAPSModel):
         """
         Executes the computation of aircraft efficiency-related carbon abatement costs.
 
+        All aircraft of the fleet are evaluated together as aircraft × year arrays.
+
         Warning
         -------
         This model stores its outputs in fleet df. # TODO: as it is now possible to use dicts in gemseo, make non-dummy outputs?
         """
         output_data = {}
-        dummy_carbon_abatement_cost_aircraft_value_dict = {}
-        dummy_specific_carbon_abatement_cost_aircraft_value_dict = {}
-        dummy_generic_specific_carbon_abatement_cost_aircraft_value_dict = {}
-        dummy_carbon_abatement_volume_aircraft_value_dict = {}
         market_name_to_id = {m.name: m.id for m in self.markets.get(traffic_type="passenger")}
+        covid_energy_increase = input_data["covid_energy_intensity_per_ask_increase_2020"]
+
+        # Scalar deltas of each aircraft with respect to the reference aircraft of its category
+        aircraft_var_names = []
+        aircraft_energy_delta_vals = []
+        aircraft_doc_ne_deltas = []
+        category_reference_energies = []
+        aircraft_lives = []
         for category, sets in self.fleet_model.fleet.all_aircraft_elements.items():
             category_recent_reference = self.fleet_model.fleet.all_aircraft_elements[category][1]
 
@@ -85,240 +214,127 @@ class FleetCarbonAbatementCosts(AeroMAPSModel):
                 f"energy_per_ask_without_operations_{mid}_dropin_fuel"
             ][self.prospection_start_year - 1]
 
-            # Calculating values of interest for each aircraft
             for aircraft_var in sets:
                 # Check if it's a reference aircraft or a normal aircraft...
                 if hasattr(aircraft_var, "parameters"):
-                    aircraft_var_name = aircraft_var.parameters.full_name
-                    aircraft_energy_delta_val = (
-                        1 + float(aircraft_var.parameters.consumption_evolution) / 100
-                    ) * category_recent_reference.energy_per_ask - category_reference_energy
-
-                    aircraft_doc_ne_delta = (
-                        1 + float(aircraft_var.parameters.doc_non_energy_evolution) / 100
-                    ) * category_recent_reference.doc_non_energy_base - category_reference_doc_ne
-
+                    aircraft_var_names.append(aircraft_var.parameters.full_name)
+                    aircraft_energy_delta_vals.append(
+                        (1 + float(aircraft_var.parameters.consumption_evolution) / 100)
+                        * category_recent_reference.energy_per_ask
+                        - category_reference_energy
+                    )
+                    aircraft_doc_ne_deltas.append(
+                        (1 + float(aircraft_var.parameters.doc_non_energy_evolution) / 100)
+                        * category_recent_reference.doc_non_energy_base
+                        - category_reference_doc_ne
+                    )
                 else:
-                    aircraft_var_name = aircraft_var.full_name
-                    aircraft_energy_delta_val = (
+                    aircraft_var_names.append(aircraft_var.full_name)
+                    aircraft_energy_delta_vals.append(
                         aircraft_var.energy_per_ask - category_reference_energy
                     )
-                    aircraft_doc_ne_delta = (
+                    aircraft_doc_ne_deltas.append(
                         aircraft_var.doc_non_energy_base - category_reference_doc_ne
                     )
+                category_reference_energies.append(category_reference_energy)
+                aircraft_lives.append(self.fleet_model.fleet.categories[category].parameters.life)
+
+        years = self.fleet_model.df.index
+        prospective_years = range(self.prospection_start_year, self.end_year + 1)
+        in_prospective_years = years.isin(prospective_years)
+        aircraft_doc_ne_delta = np.array(aircraft_doc_ne_deltas, dtype=float)[:, None]
+        category_reference_energy = np.array(category_reference_energies, dtype=float)
+
+        # Aircraft × year energy delta, with the same transition as the aircraft efficiency model:
+        # from the reference in the last historical year, including covid energy per ask increase
+        # applied indifferently to the whole fleet.
+        aircraft_energy_delta = np.repeat(
+            np.array(aircraft_energy_delta_vals, dtype=float)[:, None], len(years), axis=1
+        )
+        aircraft_energy_delta[:, years == self.last_historical_year] = 0
+        if self.prospection_start_year <= 2020:
+            # Covid increase on top of the zero delta of the last historical year
+            aircraft_energy_delta[:, years == 2020] = (
+                category_reference_energy * covid_energy_increase / 100
+            )[:, None]
 
-                # include covid energy per ask increase, applied indifferently to the whole fleet.
-                # Initialisation of a uniform pd.series and modification of 2020 value.
-                aircraft_energy_delta = pd.Series(
-                    aircraft_energy_delta_val, index=self.fleet_model.df.index
-                )
-
-                # initialisation based on the same model transition than aircraft efficiency model, transitioning
-
-                aircraft_energy_delta[self.last_historical_year] = 0  # start from reference
-
-                if self.prospection_start_year <= 2020:
-                    aircraft_energy_delta[2020] = (
-                        aircraft_energy_delta[self.last_historical_year]
-                        * (1 + input_data["covid_energy_intensity_per_ask_increase_2020"] / 100)
-                        + category_reference_energy
-                        * input_data["covid_energy_intensity_per_ask_increase_2020"]
-                        / 100
-                    )
-
-                # Assumption: 100% kerosene for cost calculation. Effect of SAFs/Hydrogen is accounted for downwards in
-                # the calculation process. For instance a Hydrogen aircraft, that would consume more energy in this step
-                # would result in negative abatement; even though the total lifecycle could actually reduce emissions.
-
-                extra_cost_fuel = aircraft_energy_delta * input_data["cac_reference_mfsp"]
-
-                extra_emissions = (
-                    -aircraft_energy_delta * input_data["cac_reference_co2_emission_factor"]
-                ) / 1000000
-
-                aircraft_carbon_abatement_cost = (
-                    extra_cost_fuel + aircraft_doc_ne_delta
-                ) / extra_emissions  # €/ton
-
-                specific_cac_aircraft_var_name = (
-                    aircraft_var_name + ":aircraft_specific_carbon_abatement_cost"
-                )
-
-                generic_specific_cac_aircraft_var_name = (
-                    aircraft_var_name + ":aircraft_generic_specific_carbon_abatement_cost"
-                )
-
-                scac_vals = []
-                scac_vals_prime = []
-                for k in range(self.prospection_start_year, self.end_year + 1):
-                    scac, scac_prime = self._get_discounted_vals(
-                        k,
-                        input_data["social_discount_rate"],
-                        self.fleet_model.fleet.categories[category].parameters.life,
-                        aircraft_doc_ne_delta,
-                        extra_cost_fuel,
-                        input_data["cac_reference_mfsp"],
-                        input_data["cac_reference_co2_emission_factor"],
-                        extra_emissions,
-                        input_data["exogenous_carbon_price_trajectory"],
-                    )
-                    scac_vals.append(scac)
-                    scac_vals_prime.append(scac_prime)
-
-                scac_column = pd.DataFrame(
-                    {specific_cac_aircraft_var_name: scac_vals},
-                    index=range(self.prospection_start_year, self.end_year + 1),
-                )
-
-                scac_prime_column = pd.DataFrame(
-                    {generic_specific_cac_aircraft_var_name: scac_vals_prime},
-                    index=range(self.prospection_start_year, self.end_year + 1),
-                )
-
-                self.fleet_model.df = pd.concat([self.fleet_model.df, scac_column], axis=1)
-                self.fleet_model.df = pd.concat([self.fleet_model.df, scac_prime_column], axis=1)
-
-                # TODO use input dictionary if possible once implemented instead of looking in fleet model df + dummy output
-                aircraft_pseudo_ask = (
-                    self.fleet_model.df.loc[:, (aircraft_var_name + ":aircraft_rpk")]
-                    / input_data["load_factor"][self.prospection_start_year - 1]
-                    * 100
-                )
-
-                aircraft_carbon_abatement_volume = -(
-                    aircraft_pseudo_ask
-                    * aircraft_energy_delta
-                    * input_data["cac_reference_co2_emission_factor"]
-                    / 1000000
-                )  # in tons
-
-                cac_aircraft_var_name = aircraft_var_name + ":aircraft_carbon_abatement_cost"
-
-                abatement_volume_aircraft_var_name = (
-                    aircraft_var_name + ":aircraft_carbon_abatement_volume"
-                )
-
-                self.fleet_model.df = pd.concat(
-                    [
-                        self.fleet_model.df,
-                        aircraft_carbon_abatement_cost.rename(cac_aircraft_var_name),
-                    ],
-                    axis=1,
-                )
-
-                self.fleet_model.df = pd.concat(
-                    [
-                        self.fleet_model.df,
-                        aircraft_carbon_abatement_volume.rename(abatement_volume_aircraft_var_name),
-                    ],
-                    axis=1,
-                )
-
-                dummy_carbon_abatement_cost_aircraft_value_dict[aircraft_var_name] = (
-                    aircraft_carbon_abatement_cost
-                )
-                dummy_carbon_abatement_volume_aircraft_value_dict[aircraft_var_name] = (
-                    aircraft_carbon_abatement_volume
-                )
-
-                dummy_specific_carbon_abatement_cost_aircraft_value_dict[aircraft_var_name] = (
-                    scac_column
-                )
+        # Assumption: 100% kerosene for cost calculation. Effect of SAFs/Hydrogen is accounted for downwards in
+        # the calculation process. For instance a Hydrogen aircraft, that would consume more energy in this step
+        # would result in negative abatement; even though the total lifecycle could actually reduce emissions.
+        cac_reference_mfsp = input_data["cac_reference_mfsp"]
+        cac_reference_co2_emission_factor = input_data["cac_reference_co2_emission_factor"]
+        reference_mfsp = cac_reference_mfsp.reindex(years).to_numpy(dtype=float)
+        reference_co2_emission_factor = cac_reference_co2_emission_factor.reindex(years).to_numpy(
+            dtype=float
+        )
+
+        extra_cost_fuel = aircraft_energy_delta * reference_mfsp
+        extra_emissions = (-aircraft_energy_delta * reference_co2_emission_factor) / 1000000
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            aircraft_carbon_abatement_cost = (
+                extra_cost_fuel + aircraft_doc_ne_delta
+            ) / extra_emissions  # €/ton
+
+        scac_vals, scac_vals_prime = _lifespan_abatement_costs(
+            np.broadcast_to(
+                aircraft_doc_ne_delta, (len(aircraft_var_names), len(prospective_years))
+            ),
+            extra_cost_fuel[:, in_prospective_years],
+            extra_emissions[:, in_prospective_years],
+            cac_reference_mfsp,
+            cac_reference_co2_emission_factor,
+            input_data["exogenous_carbon_price_trajectory"],
+            input_data["social_discount_rate"],
+            aircraft_lives,
+            prospective_years,
+            self.end_year,
+        )
+
+        # TODO use input dictionary if possible once implemented instead of looking in fleet model df + dummy output
+        aircraft_rpk = self.fleet_model.df[
+            [aircraft_var_name + ":aircraft_rpk" for aircraft_var_name in aircraft_var_names]
+        ].to_numpy(dtype=float)
+        aircraft_pseudo_ask = (
+            aircraft_rpk.T / input_data["load_factor"][self.prospection_start_year - 1] * 100
+        )
+
+        aircraft_carbon_abatement_volume = -(
+            aircraft_pseudo_ask * aircraft_energy_delta * reference_co2_emission_factor / 1000000
+        )  # in tons
+
+        # Specific costs are only defined for aircraft entering into service in prospective years
+        specific_cost = np.full(aircraft_energy_delta.shape, np.nan)
+        specific_cost[:, in_prospective_years] = scac_vals
+        generic_specific_cost = np.full(aircraft_energy_delta.shape, np.nan)
+        generic_specific_cost[:, in_prospective_years] = scac_vals_prime
+
+        abatement_columns = {}
+        for i, aircraft_var_name in enumerate(aircraft_var_names):
+            abatement_columns[aircraft_var_name + ":aircraft_specific_carbon_abatement_cost"] = (
+                specific_cost[i]
+            )
+            abatement_columns[
+                aircraft_var_name + ":aircraft_generic_specific_carbon_abatement_cost"
+            ] = generic_specific_cost[i]
+            abatement_columns[aircraft_var_name + ":aircraft_carbon_abatement_cost"] = (
+                aircraft_carbon_abatement_cost[i]
+            )
+            abatement_columns[aircraft_var_name + ":aircraft_carbon_abatement_volume"] = (
+                aircraft_carbon_abatement_volume[i]
+            )
 
-                dummy_generic_specific_carbon_abatement_cost_aircraft_value_dict[
-                    aircraft_var_name
-                ] = scac_prime_column
-
-        # output_data["dummy_carbon_abatement_cost_aircraft_value_dict"] = (
-        #    dummy_carbon_abatement_cost_aircraft_value_dict
-        # )
-        # output_data["dummy_carbon_abatement_volume_aircraft_value_dict"] = (
-        #    dummy_carbon_abatement_volume_aircraft_value_dict
-        # )
-        # output_data["dummy_specific_carbon_abatement_cost_aircraft_value_dict"] = (
-        #   dummy_specific_carbon_abatement_cost_aircraft_value_dict
-        # )
-        # output_data["dummy_generic_specific_carbon_abatement_cost_aircraft_value_dict"] = (
-        #    dummy_generic_specific_carbon_abatement_cost_aircraft_value_dict
-        # )
+        self.fleet_model.df = pd.concat(
+            [
+                self.fleet_model.df.drop(columns=list(abatement_columns), errors="ignore"),
+                pd.DataFrame(abatement_columns, index=years),
+            ],
+            axis=1,
+        )
 
         self._store_outputs(output_data)
         return output_data
 
-    def _get_discounted_vals(
-        self,
-        year,
-        discount_rate,
-        aircraft_life,
-        extra_cost_non_fuel,
-        extra_cost_fuel,
-        cac_reference_mfsp,
-        cac_reference_co2_emission_factor,
-        emissions_reduction,
-        exogenous_carbon_price_trajectory,
-    ):
-        discounted_cumul_cost = 0
-        cumul_em = 0
-        generic_discounted_cumul_em = 0
-        for i in range(year, year + int(aircraft_life)):
-            if i < (self.end_year + 1):
-                discounted_cumul_cost += (
-                    extra_cost_non_fuel
-                    + extra_cost_fuel[year] * cac_reference_mfsp[i] / cac_reference_mfsp[year]
-                ) / (1 + discount_rate) ** (i - year)
-                cumul_em += (
-                    emissions_reduction[year]
-                    * cac_reference_co2_emission_factor[i]
-                    / cac_reference_co2_emission_factor[year]
-                )
-
-                # discounting emissions for non-hotelling scc
-                generic_discounted_cumul_em += (
-                    emissions_reduction[year]
-                    * cac_reference_co2_emission_factor[i]
-                    / cac_reference_co2_emission_factor[year]
-                    * exogenous_carbon_price_trajectory[i]
-                    / exogenous_carbon_price_trajectory[year]
-                    / (1 + discount_rate) ** (i - year)
-                )
-            else:
-                discounted_cumul_cost += (
-                    extra_cost_non_fuel
-                    + extra_cost_fuel[year]
-                    * cac_reference_mfsp[self.end_year]
-                    / cac_reference_mfsp[year]
-                ) / (1 + discount_rate) ** (i - year)
-                cumul_em += (
-                    emissions_reduction[year]
-                    * cac_reference_co2_emission_factor[self.end_year]
-                    / cac_reference_co2_emission_factor[year]
-                )
-
-                # discounting emissions for non-hotelling scc, keep last year scc growth rate as future scc growth rate
-                future_scc_growth = (
-                    exogenous_carbon_price_trajectory[self.end_year]
-                    / exogenous_carbon_price_trajectory[self.end_year - 1]
-                )
-
-                generic_discounted_cumul_em += (
-                    emissions_reduction[year]
-                    * (
-                        cac_reference_co2_emission_factor[self.end_year]
-                        / cac_reference_co2_emission_factor[year]
-                    )
-                    * (
-                        exogenous_carbon_price_trajectory[self.end_year]
-                        / exogenous_carbon_price_trajectory[year]
-                        * (future_scc_growth) ** (i - self.end_year)
-                    )
-                    / (1 + discount_rate) ** (i - year)
-                )
-
-        return (
-            discounted_cumul_cost / cumul_em,
-            discounted_cumul_cost / generic_discounted_cumul_em,
-        )
-
 
 class CargoEfficiencyCarbonAbatementCosts(AeroMAPSModel):
     """
@@ -423,58 +439,44 @@ class CargoEfficiencyCarbonAbatementCosts(AeroMAPSModel):
         ]
 
         category_reference_doc_ne = 0
+        aircraft_doc_ne_delta = 0 - category_reference_doc_ne
 
-        aircraft_energy_delta_dropin = (
-            energy_per_rtk_without_operations_freight_dropin_fuel - freight_reference_energy
-        )
-        aircraft_energy_delta_hydrogen = (
-            energy_per_rtk_without_operations_freight_hydrogen - freight_reference_energy
-        )
-        aircraft_energy_delta_electric = (
-            energy_per_rtk_without_operations_freight_electric - freight_reference_energy
-        )
-
-        aircraft_doc_ne_delta_dropin = 0 - category_reference_doc_ne
-        aircraft_doc_ne_delta_hydrogen = 0 - category_reference_doc_ne
-        aircraft_doc_ne_delta_electric = 0 - category_reference_doc_ne
-
-        # Assumption: 100% kerosene for cost calculation. Effect of SAFs/Hydrogen is accounted for downwards in
-        # the calculation process. For instance a Hydrogen aircraft, that would consume more energy in this step
-        # would result in negative abatement; even though the total lifecycle could actually reduce emissions.
-
-        extra_cost_fuel_dropin = aircraft_energy_delta_dropin * cac_reference_mfsp
-        extra_cost_fuel_hydrogen = aircraft_energy_delta_hydrogen * cac_reference_mfsp
-        extra_cost_fuel_electric = aircraft_energy_delta_electric * cac_reference_mfsp
-
-        extra_emissions_dropin = (
-            -aircraft_energy_delta_dropin * cac_reference_co2_emission_factor
-        ) / 1000000
-        extra_emissions_hydrogen = (
-            -aircraft_energy_delta_hydrogen * cac_reference_co2_emission_factor
-        ) / 1000000
-        extra_emissions_electric = (
-            -aircraft_energy_delta_electric * cac_reference_co2_emission_factor
-        ) / 1000000
+        energy_per_rtk_without_operations = {
+            "dropin": energy_per_rtk_without_operations_freight_dropin_fuel,
+            "hydrogen": energy_per_rtk_without_operations_freight_hydrogen,
+            "electric": energy_per_rtk_without_operations_freight_electric,
+        }
+        rtk = {"dropin": rtk_dropin_fuel, "hydrogen": rtk_hydrogen, "electric": rtk_electric}
+
+        aircraft_energy_delta = {}
+        extra_cost_fuel = {}
+        extra_emissions = {}
+        aircraft_carbon_abatement_cost = {}
+        aircraft_carbon_abatement_volume = {}
+        for energy_type, energy_per_rtk in energy_per_rtk_without_operations.items():
+            aircraft_energy_delta[energy_type] = energy_per_rtk - freight_reference_energy
+
+            # Assumption: 100% kerosene for cost calculation. Effect of SAFs/Hydrogen is accounted for downwards in
+            # the calculation process. For instance a Hydrogen aircraft, that would consume more energy in this step
+            # would result in negative abatement; even though the total lifecycle could actually reduce emissions.
+            extra_cost_fuel[energy_type] = aircraft_energy_delta[energy_type] * cac_reference_mfsp
+            extra_emissions[energy_type] = (
+                -aircraft_energy_delta[energy_type] * cac_reference_co2_emission_factor
+            ) / 1000000
+
+            aircraft_carbon_abatement_cost[energy_type] = (
+                extra_cost_fuel[energy_type] + aircraft_doc_ne_delta
+            ) / extra_emissions[energy_type]  # €/ton
+            self.df.loc[:, f"aircraft_carbon_abatement_cost_freight_{energy_type}"] = (
+                aircraft_carbon_abatement_cost[energy_type]
+            )
 
-        aircraft_carbon_abatement_cost_freight_dropin = (
-            extra_cost_fuel_dropin + aircraft_doc_ne_delta_dropin
-        ) / extra_emissions_dropin  # €/ton
-        aircraft_carbon_abatement_cost_freight_hydrogen = (
-            extra_cost_fuel_hydrogen + aircraft_doc_ne_delta_hydrogen
-        ) / extra_emissions_hydrogen  # €/ton
-        aircraft_carbon_abatement_cost_freight_electric = (
-            extra_cost_fuel_electric + aircraft_doc_ne_delta_electric
-        ) / extra_emissions_electric  # €/ton
-
-        self.df.loc[:, "aircraft_carbon_abatement_cost_freight_dropin"] = (
-            aircraft_carbon_abatement_cost_freight_dropin
-        )
-        self.df.loc[:, "aircraft_carbon_abatement_cost_freight_hydrogen"] = (
-            aircraft_carbon_abatement_cost_freight_hydrogen
-        )
-        self.df.loc[:, "aircraft_carbon_abatement_cost_freight_electric"] = (
-            aircraft_carbon_abatement_cost_freight_electric
-        )
+            aircraft_carbon_abatement_volume[energy_type] = -(
+                rtk[energy_type]
+                * aircraft_energy_delta[energy_type]
+                * cac_reference_co2_emission_factor
+                / 1000000
+            )
 
         # aircraft_life = (self.fleet_model.fleet.categories['Short Range'].parameters.life +
         #                  self.fleet_model.fleet.categories['Medium Range'].parameters.life +
@@ -482,133 +484,78 @@ class CargoEfficiencyCarbonAbatementCosts(AeroMAPSModel):
 
         aircraft_life = 25
 
-        scac_vals_dropin = []
-        scac_vals_prime_dropin = []
-        for k in range(self.prospection_start_year, self.end_year + 1):
-            scac, scac_prime = self._get_discounted_vals(
-                k,
-                social_discount_rate,
-                aircraft_life,
-                aircraft_doc_ne_delta_dropin,
-                extra_cost_fuel_dropin,
-                cac_reference_mfsp,
-                cac_reference_co2_emission_factor,
-                extra_emissions_dropin,
-                exogenous_carbon_price_trajectory,
+        # Energy types are evaluated together as the rows of the aircraft × vintage arrays
+        prospective_years = range(self.prospection_start_year, self.end_year + 1)
+        scac_vals, scac_vals_prime = _lifespan_abatement_costs(
+            np.full((len(extra_cost_fuel), len(prospective_years)), aircraft_doc_ne_delta),
+            np.array([series.reindex(prospective_years) for series in extra_cost_fuel.values()]),
+            np.array([series.reindex(prospective_years) for series in extra_emissions.values()]),
+            cac_reference_mfsp,
+            cac_reference_co2_emission_factor,
+            exogenous_carbon_price_trajectory,
+            social_discount_rate,
+            [aircraft_life] * len(extra_cost_fuel),
+            prospective_years,
+            self.end_year,
+        )
+
+        aircraft_specific_carbon_abatement_cost = {}
+        aircraft_generic_specific_carbon_abatement_cost = {}
+        for i, energy_type in enumerate(energy_per_rtk_without_operations):
+            aircraft_specific_carbon_abatement_cost[energy_type] = pd.Series(
+                scac_vals[i],
+                index=prospective_years,
+                name=f"aircraft_specific_carbon_abatement_cost_freight_{energy_type}",
             )
-            scac_vals_dropin.append(scac)
-            scac_vals_prime_dropin.append(scac_prime)
-        aircraft_specific_carbon_abatement_cost_freight_dropin = pd.Series(
-            scac_vals_dropin,
-            index=range(self.prospection_start_year, self.end_year + 1),
-            name="aircraft_specific_carbon_abatement_cost_freight_dropin",
-        )
-        aircraft_generic_specific_carbon_abatement_cost_freight_dropin = pd.Series(
-            scac_vals_prime_dropin,
-            index=range(self.prospection_start_year, self.end_year + 1),
-            name="aircraft_generic_specific_carbon_abatement_cost_freight_dropin",
-        )
-        self.df = pd.concat(
-            [self.df, aircraft_specific_carbon_abatement_cost_freight_dropin], axis=1
-        )
-        self.df = pd.concat(
-            [self.df, aircraft_generic_specific_carbon_abatement_cost_freight_dropin], axis=1
-        )
-
-        scac_vals_hydrogen = []
-        scac_vals_prime_hydrogen = []
-        for k in range(self.prospection_start_year, self.end_year + 1):
-            scac, scac_prime = self._get_discounted_vals(
-                k,
-                social_discount_rate,
-                aircraft_life,
-                aircraft_doc_ne_delta_hydrogen,
-                extra_cost_fuel_hydrogen,
-                cac_reference_mfsp,
-                cac_reference_co2_emission_factor,
-                extra_emissions_hydrogen,
-                exogenous_carbon_price_trajectory,
+            aircraft_generic_specific_carbon_abatement_cost[energy_type] = pd.Series(
+                scac_vals_prime[i],
+                index=prospective_years,
+                name=f"aircraft_generic_specific_carbon_abatement_cost_freight_{energy_type}",
             )
-            scac_vals_hydrogen.append(scac)
-            scac_vals_prime_hydrogen.append(scac_prime)
-        aircraft_specific_carbon_abatement_cost_freight_hydrogen = pd.Series(
-            scac_vals_hydrogen,
-            index=range(self.prospection_start_year, self.end_year + 1),
-            name="aircraft_specific_carbon_abatement_cost_freight_hydrogen",
-        )
-        aircraft_generic_specific_carbon_abatement_cost_freight_hydrogen = pd.Series(
-            scac_vals_prime_hydrogen,
-            index=range(self.prospection_start_year, self.end_year + 1),
-            name="aircraft_generic_specific_carbon_abatement_cost_freight_hydrogen",
-        )
-        self.df = pd.concat(
-            [self.df, aircraft_specific_carbon_abatement_cost_freight_hydrogen], axis=1
-        )
         self.df = pd.concat(
-            [self.df, aircraft_generic_specific_carbon_abatement_cost_freight_hydrogen], axis=1
+            [self.df]
+            + [
+                series
+                for energy_type in energy_per_rtk_without_operations
+                for series in (
+                    aircraft_specific_carbon_abatement_cost[energy_type],
+                    aircraft_generic_specific_carbon_abatement_cost[energy_type],
+                )
+            ],
+            axis=1,
         )
 
-        scac_vals_electric = []
-        scac_vals_prime_electric = []
-        for k in range(self.prospection_start_year, self.end_year + 1):
-            scac, scac_prime = self._get_discounted_vals(
-                k,
-                social_discount_rate,
-                aircraft_life,
-                aircraft_doc_ne_delta_electric,
-                extra_cost_fuel_electric,
-                cac_reference_mfsp,
-                cac_reference_co2_emission_factor,
-                extra_emissions_electric,
-                exogenous_carbon_price_trajectory,
-            )
-            scac_vals_electric.append(scac)
-            scac_vals_prime_electric.append(scac_prime)
-        aircraft_specific_carbon_abatement_cost_freight_electric = pd.Series(
-            scac_vals_electric,
-            index=range(self.prospection_start_year, self.end_year + 1),
-            name="aircraft_specific_carbon_abatement_cost_freight_electric",
-        )
-        aircraft_generic_specific_carbon_abatement_cost_freight_electric = pd.Series(
-            scac_vals_prime_electric,
-            index=range(self.prospection_start_year, self.end_year + 1),
-            name="aircraft_generic_specific_carbon_abatement_cost_freight_electric",
-        )
-        self.df = pd.concat(
-            [self.df, aircraft_specific_carbon_abatement_cost_freight_electric], axis=1
-        )
-        self.df = pd.concat(
-            [self.df, aircraft_generic_specific_carbon_abatement_cost_freight_electric], axis=1
-        )
+        for energy_type, volume in aircraft_carbon_abatement_volume.items():
+            self.df.loc[:, f"aircraft_carbon_abatement_volume_freight_{energy_type}"] = volume
 
-        aircraft_carbon_abatement_volume_freight_dropin = -(
-            rtk_dropin_fuel
-            * aircraft_energy_delta_dropin
-            * cac_reference_co2_emission_factor
-            / 1000000
+        aircraft_carbon_abatement_cost_freight_dropin = aircraft_carbon_abatement_cost["dropin"]
+        aircraft_carbon_abatement_cost_freight_hydrogen = aircraft_carbon_abatement_cost["hydrogen"]
+        aircraft_carbon_abatement_cost_freight_electric = aircraft_carbon_abatement_cost["electric"]
+        aircraft_generic_specific_carbon_abatement_cost_freight_dropin = (
+            aircraft_generic_specific_carbon_abatement_cost["dropin"]
         )
-        aircraft_carbon_abatement_volume_freight_hydrogen = -(
-            rtk_hydrogen
-            * aircraft_energy_delta_hydrogen
-            * cac_reference_co2_emission_factor
-            / 1000000
+        aircraft_generic_specific_carbon_abatement_cost_freight_hydrogen = (
+            aircraft_generic_specific_carbon_abatement_cost["hydrogen"]
         )
-        aircraft_carbon_abatement_volume_freight_electric = -(
-            rtk_electric
-            * aircraft_energy_delta_electric
-            * cac_reference_co2_emission_factor
-            / 1000000
+        aircraft_generic_specific_carbon_abatement_cost_freight_electric = (
+            aircraft_generic_specific_carbon_abatement_cost["electric"]
         )
-
-        self.df.loc[:, "aircraft_carbon_abatement_volume_freight_dropin"] = (
-            aircraft_carbon_abatement_volume_freight_dropin
+        aircraft_specific_carbon_abatement_cost_freight_dropin = (
+            aircraft_specific_carbon_abatement_cost["dropin"]
         )
-        self.df.loc[:, "aircraft_carbon_abatement_volume_freight_hydrogen"] = (
-            aircraft_carbon_abatement_volume_freight_hydrogen
+        aircraft_specific_carbon_abatement_cost_freight_hydrogen = (
+            aircraft_specific_carbon_abatement_cost["hydrogen"]
         )
-        self.df.loc[:, "aircraft_carbon_abatement_volume_freight_electric"] = (
-            aircraft_carbon_abatement_volume_freight_electric
+        aircraft_specific_carbon_abatement_cost_freight_electric = (
+            aircraft_specific_carbon_abatement_cost["electric"]
         )
+        aircraft_carbon_abatement_volume_freight_dropin = aircraft_carbon_abatement_volume["dropin"]
+        aircraft_carbon_abatement_volume_freight_hydrogen = aircraft_carbon_abatement_volume[
+            "hydrogen"
+        ]
+        aircraft_carbon_abatement_volume_freight_electric = aircraft_carbon_abatement_volume[
+            "electric"
+        ]
 
         return (
             aircraft_carbon_abatement_cost_freight_dropin,
@@ -625,80 +572,6 @@ class CargoEfficiencyCarbonAbatementCosts(AeroMAPSModel):
             aircraft_carbon_abatement_volume_freight_electric,
         )
 
-    def _get_discounted_vals(
-        self,
-        year,
-        discount_rate,
-        aircraft_life,
-        extra_cost_non_fuel,
-        extra_cost_fuel,
-        cac_reference_mfsp,
-        cac_reference_co2_emission_factor,
-        emissions_reduction,
-        exogenous_carbon_price_trajectory,
-    ):
-        discounted_cumul_cost = 0
-        cumul_em = 0
-        generic_discounted_cumul_em = 0
-        for i in range(year, year + int(aircraft_life)):
-            if i < (self.end_year + 1):
-                discounted_cumul_cost += (
-                    extra_cost_non_fuel
-                    + extra_cost_fuel[year] * cac_reference_mfsp[i] / cac_reference_mfsp[year]
-                ) / (1 + discount_rate) ** (i - year)
-                cumul_em += (
-                    emissions_reduction[year]
-                    * cac_reference_co2_emission_factor[i]
-                    / cac_reference_co2_emission_factor[year]
-                )
-
-                # discounting emissions for non-hotelling scc
-                generic_discounted_cumul_em += (
-                    emissions_reduction[year]
-                    * cac_reference_co2_emission_factor[i]
-                    / cac_reference_co2_emission_factor[year]
-                    * exogenous_carbon_price_trajectory[i]
-                    / exogenous_carbon_price_trajectory[year]
-                    / (1 + discount_rate) ** (i - year)
-                )
-            else:
-                discounted_cumul_cost += (
-                    extra_cost_non_fuel
-                    + extra_cost_fuel[year]
-                    * cac_reference_mfsp[self.end_year]
-                    / cac_reference_mfsp[year]
-                ) / (1 + discount_rate) ** (i - year)
-                cumul_em += (
-                    emissions_reduction[year]
-                    * cac_reference_co2_emission_factor[self.end_year]
-                    / cac_reference_co2_emission_factor[year]
-                )
-
-                # discounting emissions for non-hotelling scc, keep last year scc growth rate as future scc growth rate
-                future_scc_growth = (
-                    exogenous_carbon_price_trajectory[self.end_year]
-                    / exogenous_carbon_price_trajectory[self.end_year - 1]
-                )
-
-                generic_discounted_cumul_em += (
-                    emissions_reduction[year]
-                    * (
-                        cac_reference_co2_emission_factor[self.end_year]
-                        / cac_reference_co2_emission_factor[year]
-                    )
-                    * (
-                        exogenous_carbon_price_trajectory[self.end_year]
-                        / exogenous_carbon_price_trajectory[year]
-                        * (future_scc_growth) ** (i - self.end_year)
-                    )
-                    / (1 + discount_rate) ** (i - year)
-                )
-
-        return (
-            discounted_cumul_cost / cumul_em,
-            discounted_cumul_cost / generic_discounted_cumul_em,
-        )
-
 
 class FleetTopDownCarbonAbatementCost(AeroMAPSModel):
     """
@@ -798,23 +671,25 @@ class FleetTopDownCarbonAbatementCost(AeroMAPSModel):
 
         aircraft_life = 25
 
-        for k in range(self.prospection_start_year, self.end_year + 1):
-            scac, scac_prime = self._get_discounted_vals(
-                k,
-                social_discount_rate,
-                aircraft_life,
-                aircraft_doc_ne_delta_mean,
-                extra_cost_fuel_mean,
-                cac_reference_mfsp,
-                cac_reference_co2_emission_factor,
-                extra_emissions_dropin,
-                exogenous_carbon_price_trajectory,
-            )
-
-            self.df.loc[k, "aircraft_specific_carbon_abatement_cost_passenger_mean"] = scac
-            self.df.loc[k, "aircraft_generic_specific_carbon_abatement_cost_passenger_mean"] = (
-                scac_prime
-            )
+        prospective_years = range(self.prospection_start_year, self.end_year + 1)
+        scac_vals, scac_vals_prime = _lifespan_abatement_costs(
+            aircraft_doc_ne_delta_mean.reindex(prospective_years).to_numpy(dtype=float)[None, :],
+            extra_cost_fuel_mean.reindex(prospective_years).to_numpy(dtype=float)[None, :],
+            extra_emissions_dropin.reindex(prospective_years).to_numpy(dtype=float)[None, :],
+            cac_reference_mfsp,
+            cac_reference_co2_emission_factor,
+            exogenous_carbon_price_trajectory,
+            social_discount_rate,
+            [aircraft_life],
+            prospective_years,
+            self.end_year,
+        )
+        self.df.loc[prospective_years, "aircraft_specific_carbon_abatement_cost_passenger_mean"] = (
+            scac_vals[0]
+        )
+        self.df.loc[
+            prospective_years, "aircraft_generic_specific_carbon_abatement_cost_passenger_mean"
+        ] = scac_vals_prime[0]
 
         aircraft_specific_carbon_abatement_cost_passenger_mean = self.df.loc[
             :, "aircraft_specific_carbon_abatement_cost_passenger_mean"
@@ -837,77 +712,3 @@ class FleetTopDownCarbonAbatementCost(AeroMAPSModel):
             aircraft_specific_carbon_abatement_cost_passenger_mean,
             aircraft_carbon_abatement_volume_passenger_mean,
         )
-
-    def _get_discounted_vals(
-        self,
-        year,
-        discount_rate,
-        aircraft_life,
-        extra_cost_non_fuel,
-        extra_cost_fuel,
-        cac_reference_mfsp,
-        cac_reference_co2_emission_factor,
-        emissions_reduction,
-        exogenous_carbon_price_trajectory,
-    ):
-        discounted_cumul_cost = 0
-        cumul_em = 0
-        generic_discounted_cumul_em = 0
-        for i in range(year, year + int(aircraft_life)):
-            if i < (self.end_year + 1):
-                discounted_cumul_cost += (
-                    extra_cost_non_fuel[year]
-                    + extra_cost_fuel[year] * cac_reference_mfsp[i] / cac_reference_mfsp[year]
-                ) / (1 + discount_rate) ** (i - year)
-                cumul_em += (
-                    emissions_reduction[year]
-                    * cac_reference_co2_emission_factor[i]
-                    / cac_reference_co2_emission_factor[year]
-                )
-
-                # discounting emissions for non-hotelling scc
-                generic_discounted_cumul_em += (
-                    emissions_reduction[year]
-                    * cac_reference_co2_emission_factor[i]
-                    / cac_reference_co2_emission_factor[year]
-                    * exogenous_carbon_price_trajectory[i]
-                    / exogenous_carbon_price_trajectory[year]
-                    / (1 + discount_rate) ** (i - year)
-                )
-            else:
-                discounted_cumul_cost += (
-                    extra_cost_non_fuel[year]
-                    + extra_cost_fuel[year]
-                    * cac_reference_mfsp[self.end_year]
-                    / cac_reference_mfsp[year]
-                ) / (1 + discount_rate) ** (i - year)
-                cumul_em += (
-                    emissions_reduction[year]
-                    * cac_reference_co2_emission_factor[self.end_year]
-                    / cac_reference_co2_emission_factor[year]
-                )
-
-                # discounting emissions for non-hotelling scc, keep last year scc growth rate as future scc growth rate
-                future_scc_growth = (
-                    exogenous_carbon_price_trajectory[self.end_year]
-                    / exogenous_carbon_price_trajectory[self.end_year - 1]
-                )
-
-                generic_discounted_cumul_em += (
-                    emissions_reduction[year]
-                    * (
-                        cac_reference_co2_emission_factor[self.end_year]
-                        / cac_reference_co2_emission_factor[year]
-                    )
-                    * (
-                        exogenous_carbon_price_trajectory[self.end_year]
-                        / exogenous_carbon_price_trajectory[year]
-                        * (future_scc_growth) ** (i - self.end_year)
-                    )
-                    / (1 + discount_rate) ** (i - year)
-                )
-
-        return (
-            discounted_cumul_cost / cumul_em,
-            discounted_cumul_cost / generic_discounted_cumul_em,
-        )
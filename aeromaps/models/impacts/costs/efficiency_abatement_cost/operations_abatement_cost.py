@@ -11,6 +11,10 @@ from typing import Tuple
 import numpy as np
 import pandas as pd
 from aeromaps.models.base import AeroMAPSModel
+from aeromaps.models.impacts.costs.efficiency_abatement_cost.fleet_abatement_cost import (
+    _lifespan_abatement_sums,
+)
+from aeromaps.utils.functions import _values_at_years
 
 
 class OperationsAbatementCost(AeroMAPSModel):
@@ -154,21 +158,20 @@ class OperationsAbatementCost(AeroMAPSModel):
 
         # Definition of a specific abatement cost, comparable to a hotelling growth carbon value.
         # Discount the costs/benefits over the horizon necessary to deploy the incremental gains of a year
-        for k in range(int(operations_start_year), self.end_year + 1):
-            (scac, scac_prime) = self._get_discounted_vals(
-                k,
-                social_discount_rate,
-                operations_duration,
-                extra_cost_operations_non_fuel,
-                extra_cost_operations_fuel,
-                cac_reference_mfsp,
-                cac_reference_co2_emission_factor,
-                emissions_reduction_operations,
-                exogenous_carbon_price_trajectory,
-            )
-
-            self.df.loc[k, "operations_specific_abatement_cost"] = scac
-            self.df.loc[k, "operations_generic_specific_abatement_cost"] = scac_prime
+        (
+            self.df["operations_specific_abatement_cost"],
+            self.df["operations_generic_specific_abatement_cost"],
+        ) = self._get_discounted_vals(
+            operations_start_year,
+            social_discount_rate,
+            operations_duration,
+            extra_cost_operations_non_fuel,
+            extra_cost_operations_fuel,
+            cac_reference_mfsp,
+            cac_reference_co2_emission_factor,
+            emissions_reduction_operations,
+            exogenous_carbon_price_trajectory,
+        )
 
         operations_specific_abatement_cost = self.df["operations_specific_abatement_cost"]
         operations_generic_specific_abatement_cost = self.df[
@@ -206,21 +209,20 @@ class OperationsAbatementCost(AeroMAPSModel):
 
         # Definition of a specific abatement cost, comparable to a hotelling growth carbon value.
         # Discount the costs/benefits over the horizon necessary to deploy the incremental gains of a year
-        for k in range(int(operations_start_year), self.end_year + 1):
-            (scac, scac_prime) = self._get_discounted_vals(
-                k,
-                social_discount_rate,
-                operations_duration,
-                extra_cost_operations_non_fuel_freight,
-                extra_cost_operations_fuel_freight,
-                cac_reference_mfsp,
-                cac_reference_co2_emission_factor,
-                emissions_reduction_operations_freight,
-                exogenous_carbon_price_trajectory,
-            )
-
-            self.df.loc[k, "operations_specific_abatement_cost_freight"] = scac
-            self.df.loc[k, "operations_generic_specific_abatement_cost_freight"] = scac_prime
+        (
+            self.df["operations_specific_abatement_cost_freight"],
+            self.df["operations_generic_specific_abatement_cost_freight"],
+        ) = self._get_discounted_vals(
+            operations_start_year,
+            social_discount_rate,
+            operations_duration,
+            extra_cost_operations_non_fuel_freight,
+            extra_cost_operations_fuel_freight,
+            cac_reference_mfsp,
+            cac_reference_co2_emission_factor,
+            emissions_reduction_operations_freight,
+            exogenous_carbon_price_trajectory,
+        )
 
         operations_specific_abatement_cost_freight = self.df[
             "operations_specific_abatement_cost_freight"
@@ -258,21 +260,20 @@ class OperationsAbatementCost(AeroMAPSModel):
         # Definition of a specific abatement cost, comparable to a hotelling growth carbon value.
         # Discount the costs/benefits over the scenario temporal span.
         # Caution: the longer the scenario, the lower the specific abatement cost
-        for k in range(self.prospection_start_year, self.end_year + 1):
-            scac, scac_prime = self._get_discounted_vals(
-                k,
-                social_discount_rate,
-                self.end_year - self.prospection_start_year,
-                extra_cost_load_factor_non_fuel,
-                extra_cost_load_factor_fuel,
-                cac_reference_mfsp,
-                cac_reference_co2_emission_factor,
-                emissions_reduction_load_factor,
-                exogenous_carbon_price_trajectory,
-            )
-
-            self.df.loc[k, "load_factor_specific_abatement_cost"] = scac
-            self.df.loc[k, "load_factor_generic_specific_abatement_cost"] = scac_prime
+        (
+            self.df["load_factor_specific_abatement_cost"],
+            self.df["load_factor_generic_specific_abatement_cost"],
+        ) = self._get_discounted_vals(
+            self.prospection_start_year,
+            social_discount_rate,
+            self.end_year - self.prospection_start_year,
+            extra_cost_load_factor_non_fuel,
+            extra_cost_load_factor_fuel,
+            cac_reference_mfsp,
+            cac_reference_co2_emission_factor,
+            emissions_reduction_load_factor,
+            exogenous_carbon_price_trajectory,
+        )
 
         load_factor_specific_abatement_cost = self.df["load_factor_specific_abatement_cost"]
         load_factor_generic_specific_abatement_cost = self.df[
@@ -296,7 +297,7 @@ class OperationsAbatementCost(AeroMAPSModel):
 
     def _get_discounted_vals(
         self,
-        year,
+        start_year,
         discount_rate,
         measure_duration,
         extra_cost_non_fuel,
@@ -306,71 +307,39 @@ class OperationsAbatementCost(AeroMAPSModel):
         emissions_reduction,
         exogenous_carbon_price_trajectory,
     ):
-        discounted_cumul_cost = 0
-        cumul_em = 0
-        generic_discounted_cumul_em = 0
-        for i in range(year, year + int(measure_duration)):
-            if i < (self.end_year + 1):
-                discounted_cumul_cost += (
-                    extra_cost_non_fuel[year]
-                    + extra_cost_fuel[year] * cac_reference_mfsp[i] / cac_reference_mfsp[year]
-                ) / (1 + discount_rate) ** (i - year)
-                cumul_em += (
-                    emissions_reduction[year]
-                    * cac_reference_co2_emission_factor[i]
-                    / cac_reference_co2_emission_factor[year]
-                )
-
-                generic_discounted_cumul_em += (
-                    emissions_reduction[year]
-                    * cac_reference_co2_emission_factor[i]
-                    / cac_reference_co2_emission_factor[year]
-                    * exogenous_carbon_price_trajectory[i]
-                    / exogenous_carbon_price_trajectory[year]
-                    / (1 + discount_rate) ** (i - year)
-                )
-            else:
-                discounted_cumul_cost += (
-                    extra_cost_non_fuel[year]
-                    + extra_cost_fuel[year]
-                    * cac_reference_mfsp[self.end_year]
-                    / cac_reference_mfsp[year]
-                ) / (1 + discount_rate) ** (i - year)
-                cumul_em += (
-                    emissions_reduction[year]
-                    * cac_reference_co2_emission_factor[self.end_year]
-                    / cac_reference_co2_emission_factor[year]
-                )
-
-                # discounting emissions for non-hotelling scc, keep last year scc growth rate as future scc growth rate
-                future_scc_growth = (
-                    exogenous_carbon_price_trajectory[self.end_year]
-                    / exogenous_carbon_price_trajectory[self.end_year - 1]
-                )
-
-                generic_discounted_cumul_em += (
-                    emissions_reduction[year]
-                    * (
-                        cac_reference_co2_emission_factor[self.end_year]
-                        / cac_reference_co2_emission_factor[year]
-                    )
-                    * (
-                        exogenous_carbon_price_trajectory[self.end_year]
-                        / exogenous_carbon_price_trajectory[year]
-                        * (future_scc_growth) ** (i - self.end_year)
-                    )
-                    / (1 + discount_rate) ** (i - year)
-                )
-
-        if cumul_em == 0:
-            scac = np.NaN
-        else:
-            scac = discounted_cumul_cost / cumul_em
-
-        if generic_discounted_cumul_em == 0:
-            scac_prime = np.NaN
-        else:
-            scac_prime = discounted_cumul_cost / generic_discounted_cumul_em
+        """
+        Specific and generic specific abatement costs of the measures taken each year from
+        start_year, costs and emissions being cumulated over measure_duration.
+
+        Returns arrays over the model years, NaN before start_year or when the cumulated
+        emissions reduction is zero.
+        """
+        vintages = np.arange(int(start_year), self.end_year + 1)
+        discounted_cumul_cost, cumul_em, generic_discounted_cumul_em = _lifespan_abatement_sums(
+            _values_at_years(extra_cost_non_fuel, vintages)[None, :],
+            _values_at_years(extra_cost_fuel, vintages)[None, :],
+            _values_at_years(emissions_reduction, vintages)[None, :],
+            cac_reference_mfsp,
+            cac_reference_co2_emission_factor,
+            exogenous_carbon_price_trajectory,
+            discount_rate,
+            [int(measure_duration)],
+            vintages,
+            self.end_year,
+        )
+
+        scac = np.full(len(self.df.index), np.nan)
+        scac_prime = np.full(len(self.df.index), np.nan)
+        positions = vintages - self.df.index[0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scac[positions] = np.where(
+                cumul_em[0] == 0, np.nan, discounted_cumul_cost[0] / cumul_em[0]
+            )
+            scac_prime[positions] = np.where(
+                generic_discounted_cumul_em[0] == 0,
+                np.nan,
+                discounted_cumul_cost[0] / generic_discounted_cumul_em[0],
+            )
 
         return (
             scac,
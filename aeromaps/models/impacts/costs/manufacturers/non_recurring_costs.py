@@ -9,12 +9,75 @@ non_recurring_costs
 Module to compute non-recurring costs (NRC) for aircraft defined by the fleet model.
 """
 
+from typing import Tuple
+
 import numpy as np
 import pandas as pd
 
 from aeromaps.models.base import AeroMAPSModel
 
 
+def _spread_non_recurring_costs(
+    nrc_costs, entry_into_service_years, development_time, years
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Spread the non-recurring costs of several aircraft over their development years.
+
+    Each aircraft receives the same development profile, a tweaked Gaussian of the years
+    preceding its entry into service, which is scaled to its total NRC and placed on the
+    year grid at its own offset.
+
+    Parameters
+    ----------
+    nrc_costs
+        Total non-recurring costs of each aircraft [€].
+    entry_into_service_years
+        Entry into service year of each aircraft.
+    development_time
+        Number of development years preceding (and including) the entry into service [yr].
+    years
+        Consecutive years of the scenario.
+
+    Returns
+    -------
+    costs
+        Aircraft × year array of NRC [€], NaN outside the development years.
+    development
+        Aircraft × year boolean array flagging the development years within the scenario.
+    """
+    nrc_costs = np.asarray(nrc_costs, dtype=float)
+    entry_into_service_years = np.asarray(entry_into_service_years, dtype=int)
+    years = np.asarray(years)
+
+    development_steps = np.arange(1, development_time + 1)
+    sigma = development_time / 6.0  # Controls the spread of the distribution
+    weights = np.exp(-0.5 * ((development_steps - development_time / 2) / sigma) ** 2)
+    profiles = np.round(nrc_costs[:, None] * weights)
+
+    # Adjust the distributed costs to ensure their sum matches the total cost
+    total_distributed_costs = profiles.sum(axis=1)
+    scaling_factors = np.divide(
+        nrc_costs,
+        total_distributed_costs,
+        out=np.ones_like(nrc_costs),
+        where=total_distributed_costs != 0,
+    )
+    profiles = np.round(profiles * scaling_factors[:, None])
+
+    # Keep only the development years that are within the scope of scenario range to
+    # avoid adding out of range nrc (for old aircraft for instance)
+    columns = entry_into_service_years[:, None] - development_time + development_steps - years[0]
+    in_scope = (columns >= 0) & (columns < len(years))
+    rows = np.broadcast_to(np.arange(len(nrc_costs))[:, None], columns.shape)[in_scope]
+
+    costs = np.full((len(nrc_costs), len(years)), np.nan)
+    costs[rows, columns[in_scope]] = profiles[in_scope]
+    development = np.zeros(costs.shape, dtype=bool)
+    development[rows, columns[in_scope]] = True
+
+    return costs, development
+
+
 class NonRecurringCosts(AeroMAPSModel):
     """
     Class to compute non-recurring costs (NRC) for aircraft defined by the fleet model.
@@ -39,9 +102,10 @@ class NonRecurringCosts(AeroMAPSModel):
     def compute(
         self,
         aircraft_in_out_value_dict: dict,
-    ) -> dict:
+    ) -> Tuple[dict, pd.Series]:
         """
         Compute non-recurring costs (NRC) for each aircraft defined in the fleet model.
+        All aircraft are spread together over the scenario years.
         TODO: Currently uses dummy input and output dictionaries. Possible to use these now?
 
         Parameters
@@ -55,69 +119,47 @@ class NonRecurringCosts(AeroMAPSModel):
         nrc_aircraft_value_dict : dict
             Dummy dictionary containing NRC values for each aircraft.
             Real outputs are stored in the fleet model dataframe.
+        fleet_non_recurring_costs : pd.Series
+            Non-recurring costs of all the aircraft of the fleet [€].
         """
-        nrc_aircraft_value_dict = {}
+        aircraft_var_names = []
+        nrc_costs = []
+        entry_into_service_years = []
         for category, sets in self.fleet_model.fleet.all_aircraft_elements.items():
-            # Calculating values of interest for each aircraft
             for aircraft_var in sets:
                 # Check if it's a reference aircraft or a normal aircraft...
                 if hasattr(aircraft_var, "parameters"):
-                    aircraft_var_name = aircraft_var.parameters.full_name
-                    nrc_cost = aircraft_var.parameters.nrc_cost
-                    eis = int(aircraft_var.parameters.entry_into_service_year)
-                else:
-                    aircraft_var_name = aircraft_var.full_name
-                    nrc_cost = aircraft_var.nrc_cost
-                    eis = int(aircraft_var.entry_into_service_year)
-
-                nrc_aircraft_var_name = aircraft_var_name + ":aircraft_non_recurring_costs"
-
-                # TODO use dictionnary if possible once implementeed
-                # nrc_aircraft_value = max(0.0, aircraft_in_out_value_dict[aircraft_var_name] * nrc_cost)
-                # For now: direct use of fleet model df
-
-                nrc_aircraft_value = self._compute_nrc(float(nrc_cost), 5, eis)
-
-                self.fleet_model.df = pd.concat(
-                    [
-                        self.fleet_model.df,
-                        nrc_aircraft_value.rename(nrc_aircraft_var_name),
-                    ],
-                    axis=1,
-                )
-
-                nrc_aircraft_value_dict[aircraft_var_name] = nrc_aircraft_value
-
-        return nrc_aircraft_value_dict
-
-    def _compute_nrc(
-        self,
-        nrc_tot_aircraft_type,
-        development_time_aircraft_type,
-        entry_into_service_year,
-    ):
-        costs = []
-        years = []
-        sigma = development_time_aircraft_type / 6.0  # Controls the spread of the distribution
-
-        for i in range(1, development_time_aircraft_type + 1):
-            year = entry_into_service_year - development_time_aircraft_type + i
-            weight = np.exp(-0.5 * ((i - development_time_aircraft_type / 2) / sigma) ** 2)
-            cost = round(nrc_tot_aircraft_type * weight)
-            costs.append(cost)
-            years.append(year)
-
-        # Adjust the distributed costs to ensure their sum matches the total cost
-        total_distributed_cost = sum(costs)
-        scaling_factor = nrc_tot_aircraft_type / total_distributed_cost
-        costs = [round(cost * scaling_factor) for cost in costs]
-        nrc_distributed = pd.Series(costs, index=years)
-
-        # Keep only teh indexes that are within the scope of scenario range to
-        # avoid adding out of range nrc (for old aircraft for instance)
-        filtered_nrc_distributed = nrc_distributed[
-            (nrc_distributed.index >= self.historic_start_year)
-            & (nrc_distributed.index <= self.end_year)
-        ]
-
-        return filtered_nrc_distributed
+                    aircraft_var = aircraft_var.parameters
+                aircraft_var_names.append(aircraft_var.full_name)
+                nrc_costs.append(float(aircraft_var.nrc_cost))
+                entry_into_service_years.append(int(aircraft_var.entry_into_service_year))
+
+        # TODO use dictionnary if possible once implementeed
+        # For now: direct use of fleet model df
+        years = self.df.index
+        costs, development = _spread_non_recurring_costs(
+            nrc_costs, entry_into_service_years, 5, years
+        )
+
+        nrc_aircraft_value_dict = {
+            aircraft_var_name: pd.Series(costs[i, development[i]], index=years[development[i]])
+            for i, aircraft_var_name in enumerate(aircraft_var_names)
+        }
+
+        nrc_aircraft = pd.DataFrame(
+            costs.T,
+            index=years,
+            columns=[name + ":aircraft_non_recurring_costs" for name in aircraft_var_names],
+        )
+        self.fleet_model.df = pd.concat(
+            [
+                self.fleet_model.df.drop(columns=nrc_aircraft.columns, errors="ignore"),
+                nrc_aircraft,
+            ],
+            axis=1,
+        )
+
+        fleet_non_recurring_costs = pd.Series(np.nansum(costs, axis=0), index=years)
+        self.df.loc[:, "fleet_non_recurring_costs"] = fleet_non_recurring_costs
+
+        return nrc_aircraft_value_dict, fleet_non_recurring_costs
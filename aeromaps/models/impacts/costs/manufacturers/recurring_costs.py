@@ -9,6 +9,9 @@ recurring_costs
 Module to compute recurring costs (RC) for aircraft defined by the fleet model.
 """
 
+from typing import Tuple
+
+import numpy as np
 import pandas as pd
 
 from aeromaps.models.base import AeroMAPSModel
@@ -36,9 +39,11 @@ class RecurringCosts(AeroMAPSModel):
     def compute(
         self,
         aircraft_in_out_value_dict: dict,
-    ) -> dict:
+    ) -> Tuple[dict, pd.Series]:
         """
         Compute recurring costs (RC) for each aircraft defined in the fleet model.
+        All aircraft are evaluated together as a year × aircraft array.
+
         Parameters
         ----------
         aircraft_in_out_value_dict
@@ -50,36 +55,44 @@ class RecurringCosts(AeroMAPSModel):
         rc_aircraft_value_dict
             Dummy dictionary containing RC values for each aircraft.
             Real outputs are stored in the fleet model dataframe.
+        fleet_recurring_costs
+            Recurring costs of all the aircraft of the fleet [€].
         """
-        rc_aircraft_value_dict = {}
+        aircraft_var_names = []
+        rc_costs = []
         for category, sets in self.fleet_model.fleet.all_aircraft_elements.items():
-            # Calculating values of interest for each aircraft
             for aircraft_var in sets:
                 # Check if it's a reference aircraft or a normal aircraft...
                 if hasattr(aircraft_var, "parameters"):
-                    aircraft_var_name = aircraft_var.parameters.full_name
-                    rc_cost = aircraft_var.parameters.rc_cost
-                else:
-                    aircraft_var_name = aircraft_var.full_name
-                    rc_cost = aircraft_var.rc_cost
-
-                rc_aircraft_var_name = aircraft_var_name + ":aircraft_recurring_costs"
-
-                # TODO use dictionary if possible once implemented
-                # rc_aircraft_value = max(0.0, aircraft_in_out_value_dict[aircraft_var_name] * rc_cost)
-                # For now: direct use of fleet model df
-                rc_aircraft_value = self.fleet_model.df.loc[
-                    :, (aircraft_var_name + ":aircraft_in_out")
-                ] * float(rc_cost)
-                rc_aircraft_value[rc_aircraft_value < 0] = 0
-
-                self.fleet_model.df = pd.concat(
-                    [
-                        self.fleet_model.df,
-                        rc_aircraft_value.rename(rc_aircraft_var_name),
-                    ],
-                    axis=1,
-                )
-
-                rc_aircraft_value_dict[aircraft_var_name] = rc_aircraft_value
-        return rc_aircraft_value_dict
+                    aircraft_var = aircraft_var.parameters
+                aircraft_var_names.append(aircraft_var.full_name)
+                rc_costs.append(float(aircraft_var.rc_cost))
+
+        # TODO use dictionary if possible once implemented
+        # For now: direct use of fleet model df
+        aircraft_in_out = self.fleet_model.df.loc[
+            :, [name + ":aircraft_in_out" for name in aircraft_var_names]
+        ].to_numpy(dtype=float)
+        costs = aircraft_in_out * np.array(rc_costs)
+        # Only aircraft entering the fleet are produced
+        costs = np.where(costs < 0, 0.0, costs)
+
+        rc_aircraft = pd.DataFrame(
+            costs,
+            index=self.fleet_model.df.index,
+            columns=[name + ":aircraft_recurring_costs" for name in aircraft_var_names],
+        )
+        self.fleet_model.df = pd.concat(
+            [self.fleet_model.df.drop(columns=rc_aircraft.columns, errors="ignore"), rc_aircraft],
+            axis=1,
+        )
+
+        rc_aircraft_value_dict = {
+            aircraft_var_name: rc_aircraft.iloc[:, i]
+            for i, aircraft_var_name in enumerate(aircraft_var_names)
+        }
+
+        fleet_recurring_costs = pd.Series(np.nansum(costs, axis=1), index=rc_aircraft.index)
+        self.df.loc[:, "fleet_recurring_costs"] = fleet_recurring_costs
+
+        return rc_aircraft_value_dict, fleet_recurring_costs
@@ -9,7 +9,7 @@ Module to compute exogenous carbon price trajectory.
 """
 
 import pandas as pd
-from aeromaps.models.base import AeroMAPSModel, aeromaps_interpolation_function
+from aeromaps.models.base import AeroMAPSModel, aeromaps_price_trajectory
 
 
 class ExogenousCarbonPriceTrajectory(AeroMAPSModel):
@@ -46,17 +46,13 @@ class ExogenousCarbonPriceTrajectory(AeroMAPSModel):
             Exogenous carbon price trajectory [€/tCO2].
 
         """
-        exogenous_carbon_price_trajectory = aeromaps_interpolation_function(
+        # Held at the prospection start year price over historic years
+        self.df["exogenous_carbon_price_trajectory"] = aeromaps_price_trajectory(
             self,
             exogenous_carbon_price_reference_years,
             exogenous_carbon_price_reference_years_values,
             model_name=self.name,
         )
-        self.df.loc[:, "exogenous_carbon_price_trajectory"] = exogenous_carbon_price_trajectory
-        for k in range(self.historic_start_year, self.prospection_start_year):
-            self.df.loc[k, "exogenous_carbon_price_trajectory"] = self.df.loc[
-                self.prospection_start_year, "exogenous_carbon_price_trajectory"
-            ]
         exogenous_carbon_price_trajectory = self.df["exogenous_carbon_price_trajectory"]
 
         return exogenous_carbon_price_trajectory
@@ -14,6 +14,188 @@ import numpy as np
 import pandas as pd
 
 from aeromaps.models.base import AeroMAPSModel
+from aeromaps.utils.discounting import compound_factors
+from aeromaps.utils.functions import _series_on_grid
+
+
+def _compound_factors(model, social_discount_rate):
+    """Compounding factors (1 + rate) ** (year - prospection_start_year) over the model years."""
+    return compound_factors(
+        social_discount_rate,
+        len(model.df.index),
+        model.historic_start_year - model.prospection_start_year,
+    )
+
+
+# Reference year of the demand function and start of the cumulative welfare objectives
+WELFARE_REFERENCE_YEAR = 2025
+
+
+def _on_model_years(model, series) -> np.ndarray:
+    """Values of a Series over the model years, NaN for the years outside its index."""
+    return _series_on_grid(series, model.df.index)[0]
+
+
+def _cumsum(values) -> np.ndarray:
+    """Cumulative sum skipping NaN values, as pandas does."""
+    return np.where(np.isnan(values), np.nan, np.nancumsum(values))
+
+
+def _welfare_accounting(
+    model,
+    social_discount_rate,
+    rpk,
+    rpk_no_elasticity,
+    total_cost_per_rpk=None,
+    airfare_per_rpk=None,
+    total_extra_tax_per_rpk=None,
+    price_elasticity=None,
+) -> dict:
+    """
+    Surplus and loss components of the scenario with respect to the no-elasticity reference.
+
+    All inputs are aligned once as arrays over the model years, and every component whose
+    inputs are given is computed from them: airline costs (with ``total_cost_per_rpk``), area
+    and consumer surplus losses under the demand curve (with ``airfare_per_rpk`` and
+    ``price_elasticity``), airline surplus loss (with both cost and airfare) and tax revenue
+    loss (with ``total_extra_tax_per_rpk``). The total welfare loss is added when its three
+    components are available.
+
+    Parameters
+    ----------
+    model
+        Model whose years, prospection start year and end year are used.
+    social_discount_rate
+        Social discount rate [-].
+    rpk
+        Revenue passenger kilometers [RPK].
+    rpk_no_elasticity
+        Revenue passenger kilometers without demand elasticity [RPK].
+    total_cost_per_rpk
+        Total cost per RPK [€/RPK].
+    airfare_per_rpk
+        Airfare per RPK [€/RPK].
+    total_extra_tax_per_rpk
+        Total extra tax per RPK [€/RPK].
+    price_elasticity
+        Price elasticity of demand [-].
+
+    Returns
+    -------
+    components
+        Arrays of the components over the model years, with the compounding factors used to
+        discount them.
+    """
+    years = model.df.index
+    reference_index = years.get_loc(model.prospection_start_year - 1)
+    rpk = _on_model_years(model, rpk)
+    rpk_no_elasticity = _on_model_years(model, rpk_no_elasticity)
+    components = {"compound_factors": _compound_factors(model, social_discount_rate)}
+
+    if total_cost_per_rpk is not None:
+        total_cost_per_rpk = _on_model_years(model, total_cost_per_rpk)
+        total_airline_cost = total_cost_per_rpk * rpk
+        initial_airline_cost = total_cost_per_rpk[reference_index] * rpk_no_elasticity
+        components["total_airline_cost"] = total_airline_cost
+        components["total_airline_cost_increase"] = total_airline_cost - initial_airline_cost
+
+    if airfare_per_rpk is not None:
+        airfare_per_rpk = _on_model_years(model, airfare_per_rpk)
+
+    if airfare_per_rpk is not None and price_elasticity is not None:
+        # computation of demand function parameters: assumption => constant elasticity => P= beta * Q**(1/elasticity)
+        beta = airfare_per_rpk[years.get_loc(WELFARE_REFERENCE_YEAR)] / (
+            rpk_no_elasticity ** (1 / price_elasticity)
+        )
+        if price_elasticity == -1:
+            # surplus delta expressed by CS= beta * np.log(Qref/Qi)
+            components["area_loss"] = beta * np.log(rpk_no_elasticity / rpk)
+            # FIXME SHOULD NOT BE THE SAME AS IN TOTAL SURPLUS LOSS WITH E=1
+            components["delta_consumer_surplus"] = components["area_loss"]
+        else:
+            demand_integral_delta = rpk_no_elasticity ** (1 + 1 / price_elasticity) - rpk ** (
+                1 + 1 / price_elasticity
+            )
+            components["area_loss"] = (
+                beta * (1 / (1 + 1 / price_elasticity)) * demand_integral_delta
+            )
+            components["delta_consumer_surplus"] = (
+                beta * (-1 / (1 + price_elasticity)) * demand_integral_delta
+            )
+
+    if total_cost_per_rpk is not None and airfare_per_rpk is not None:
+        total_airline_surplus = airfare_per_rpk * rpk - total_airline_cost
+        initial_airline_surplus = (
+            airfare_per_rpk[reference_index] * rpk_no_elasticity - initial_airline_cost
+        )
+        components["total_airline_surplus"] = total_airline_surplus
+        components["delta_airline_surplus"] = initial_airline_surplus - total_airline_surplus
+
+    if total_extra_tax_per_rpk is not None:
+        total_extra_tax_per_rpk = _on_model_years(model, total_extra_tax_per_rpk)
+        total_tax_revenue = total_extra_tax_per_rpk * rpk
+        initial_tax_revenue = total_extra_tax_per_rpk[reference_index] * rpk_no_elasticity
+        components["total_tax_revenue"] = total_tax_revenue
+        components["delta_tax_revenue"] = initial_tax_revenue - total_tax_revenue
+
+    if {"delta_consumer_surplus", "delta_airline_surplus", "delta_tax_revenue"} <= set(components):
+        components["total_welfare_loss"] = (
+            components["delta_consumer_surplus"]
+            + components["delta_airline_surplus"]
+            + components["delta_tax_revenue"]
+        )
+
+    return components
+
+
+def _welfare_objective(model, cumulative_values) -> float:
+    """Cumulative value from the welfare reference year to the end of the prospection period."""
+    years = model.df.index
+    return (
+        cumulative_values[years.get_loc(model.end_year)]
+        - cumulative_values[years.get_loc(WELFARE_REFERENCE_YEAR)]
+    )
+
+
+def _total_airline_cost_outputs(model, components) -> tuple:
+    """Store the total airline cost series of the welfare components and compute the objective."""
+    years = model.df.index
+    total_airline_cost_increase = components["total_airline_cost_increase"]
+    total_airline_cost = pd.Series(components["total_airline_cost"], index=years)
+    cumulative_total_airline_cost = pd.Series(
+        _cumsum(components["total_airline_cost"]), index=years
+    )
+    cumulative_total_airline_cost_discounted = pd.Series(
+        _cumsum(components["total_airline_cost"] / components["compound_factors"]), index=years
+    )
+    cumulative_total_airline_cost_increase = pd.Series(
+        _cumsum(total_airline_cost_increase), index=years
+    )
+    cumulative_total_airline_cost_increase_discounted = pd.Series(
+        _cumsum(total_airline_cost_increase / components["compound_factors"]), index=years
+    )
+
+    model.df["total_airline_cost"] = total_airline_cost
+    model.df["cumulative_total_airline_cost"] = cumulative_total_airline_cost
+    model.df["cumulative_total_airline_cost_discounted"] = cumulative_total_airline_cost_discounted
+    model.df["total_airline_cost_increase"] = total_airline_cost_increase
+    model.df["cumulative_total_airline_cost_increase"] = cumulative_total_airline_cost_increase
+    model.df["cumulative_total_airline_cost_increase_discounted"] = (
+        cumulative_total_airline_cost_increase_discounted
+    )
+
+    cumulative_total_airline_cost_discounted_obj = _welfare_objective(
+        model, cumulative_total_airline_cost_increase_discounted.to_numpy()
+    )
+
+    return (
+        total_airline_cost,
+        cumulative_total_airline_cost,
+        cumulative_total_airline_cost_discounted,
+        cumulative_total_airline_cost_increase,
+        cumulative_total_airline_cost_increase_discounted,
+        cumulative_total_airline_cost_discounted_obj,
+    )
 
 
 class NonDiscountedScenarioCost(AeroMAPSModel):
@@ -90,33 +272,27 @@ class NonDiscountedScenarioCost(AeroMAPSModel):
             Dictionary containing all output data resulting from the computation. Contains outputs defined during model instantiation.
 
         """
-        # Compute the total energy expenses of the scenario
-        non_discounted_energy_expenses = None
-        non_discounted_net_energy_expenses = None
-        for p in self.pathways_manager.get_all():
-            net_mfsp = input_data.get(f"{p.name}_net_mfsp", pd.Series([0.0])).fillna(0)
-            mfsp = input_data.get(f"{p.name}_mean_mfsp", pd.Series([0.0])).fillna(0)
-            energy_consumption = input_data.get(
-                f"{p.name}_energy_consumption", pd.Series([0.0])
-            ).fillna(0)
-            cost = mfsp * energy_consumption
-            net_cost = net_mfsp * energy_consumption
-            if non_discounted_energy_expenses is None:
-                non_discounted_energy_expenses = cost
-                non_discounted_net_energy_expenses = net_cost
-            else:
-                non_discounted_energy_expenses = non_discounted_energy_expenses.add(
-                    cost, fill_value=0
-                )
-                non_discounted_net_energy_expenses = non_discounted_net_energy_expenses.add(
-                    net_cost, fill_value=0
+        # Compute the total energy expenses of the scenario, all pathways being aligned as
+        # pathway × year arrays over the model years
+        pathways = self.pathways_manager.get_all()
+        pathway_values = {}
+        for suffix in ("_net_mfsp", "_mean_mfsp", "_energy_consumption"):
+            values = np.zeros((len(pathways), len(self.df.index)))
+            for i, p in enumerate(pathways):
+                values[i] = _on_model_years(
+                    self, input_data.get(f"{p.name}{suffix}", pd.Series([0.0]))
                 )
-
-        non_discounted_energy_expenses = (
-            non_discounted_energy_expenses / 1000000
+            values[np.isnan(values)] = 0.0
+            pathway_values[suffix] = values
+        net_mfsp = pathway_values["_net_mfsp"]
+        mfsp = pathway_values["_mean_mfsp"]
+        energy_consumption = pathway_values["_energy_consumption"]
+
+        non_discounted_energy_expenses = pd.Series(
+            (mfsp * energy_consumption).sum(axis=0) / 1000000, index=self.df.index
         )  # Convert to millions euros
-        non_discounted_net_energy_expenses = (
-            non_discounted_net_energy_expenses / 1000000
+        non_discounted_net_energy_expenses = pd.Series(
+            (net_mfsp * energy_consumption).sum(axis=0) / 1000000, index=self.df.index
         )  # Convert to millions euros
 
         # Compute the business as usual energy expenses
@@ -214,13 +390,13 @@ class DicountedScenarioCost(AeroMAPSModel):
 
         """
         discounted_energy_expenses = non_discounted_energy_expenses.copy()
-        for k in range(self.prospection_start_year, self.end_year + 1):
-            # Compute the discounter at year k
-            discount_k = (1 + social_discount_rate) ** (k - self.prospection_start_year)
-            # Apply the discount to the non-discounted energy expenses
-            discounted_energy_expenses.loc[k] = discounted_energy_expenses.loc[k] / discount_k
+        # Apply the discount to the non-discounted energy expenses of the prospective years
+        prospective_years = range(self.prospection_start_year, self.end_year + 1)
+        discounted_energy_expenses.loc[prospective_years] = discounted_energy_expenses.loc[
+            prospective_years
+        ] / compound_factors(social_discount_rate, len(prospective_years))
 
-        self.df.loc[:, "discounted_energy_expenses"] = discounted_energy_expenses
+        self.df["discounted_energy_expenses"] = discounted_energy_expenses
 
         discounted_energy_expenses_obj = discounted_energy_expenses.cumsum()[self.end_year]
 
@@ -282,43 +458,17 @@ class TotalAirlineCostNoElast(AeroMAPSModel):
             Cumulative total airline cost increase discounted at the end of the prospection period [M€].
 
         """
-        initial_airline_cost = total_cost_per_rpk[self.prospection_start_year - 1] * rpk
-        total_airline_cost = total_cost_per_rpk * rpk
-        total_airline_cost_increase = total_airline_cost - initial_airline_cost
-
-        total_airline_cost_discounted = total_airline_cost / (1 + social_discount_rate) ** (
-            self.df.index - self.prospection_start_year
-        )
-
-        total_airline_cost_increase_discounted = total_airline_cost_increase / (
-            1 + social_discount_rate
-        ) ** (self.df.index - self.prospection_start_year)
-
-        cumulative_total_airline_cost = total_airline_cost.cumsum()
-        cumulative_total_airline_cost_discounted = total_airline_cost_discounted.cumsum()
-
-        cumulative_total_airline_cost_increase = total_airline_cost_increase.cumsum()
-        cumulative_total_airline_cost_increase_discounted = (
-            total_airline_cost_increase_discounted.cumsum()
-        )
-
-        self.df.loc[:, "total_airline_cost"] = total_airline_cost
-        self.df.loc[:, "cumulative_total_airline_cost"] = cumulative_total_airline_cost
-        self.df.loc[:, "cumulative_total_airline_cost_discounted"] = (
-            cumulative_total_airline_cost_discounted
-        )
-        self.df.loc[:, "total_airline_cost_increase"] = total_airline_cost_increase
-        self.df.loc[:, "cumulative_total_airline_cost_increase"] = (
-            cumulative_total_airline_cost_increase
-        )
-        self.df.loc[:, "cumulative_total_airline_cost_increase_discounted"] = (
-            cumulative_total_airline_cost_increase_discounted
-        )
-
-        cumulative_total_airline_cost_discounted_obj = (
-            cumulative_total_airline_cost_increase_discounted[self.end_year]
-            - cumulative_total_airline_cost_increase_discounted[2025]
+        components = _welfare_accounting(
+            self, social_discount_rate, rpk, rpk, total_cost_per_rpk=total_cost_per_rpk
         )
+        (
+            total_airline_cost,
+            cumulative_total_airline_cost,
+            cumulative_total_airline_cost_discounted,
+            cumulative_total_airline_cost_increase,
+            cumulative_total_airline_cost_increase_discounted,
+            cumulative_total_airline_cost_discounted_obj,
+        ) = _total_airline_cost_outputs(self, components)
 
         return (
             total_airline_cost,
@@ -387,45 +537,21 @@ class TotalAirlineCost(AeroMAPSModel):
             Cumulative total airline cost increase discounted at the end of the prospection period [M€].
 
         """
-        initial_airline_cost = (
-            total_cost_per_rpk[self.prospection_start_year - 1] * rpk_no_elasticity
-        )
-        total_airline_cost = total_cost_per_rpk * rpk
-        total_airline_cost_increase = total_airline_cost - initial_airline_cost
-
-        total_airline_cost_discounted = total_airline_cost / (1 + social_discount_rate) ** (
-            self.df.index - self.prospection_start_year
-        )
-
-        total_airline_cost_increase_discounted = total_airline_cost_increase / (
-            1 + social_discount_rate
-        ) ** (self.df.index - self.prospection_start_year)
-
-        cumulative_total_airline_cost = total_airline_cost.cumsum()
-        cumulative_total_airline_cost_discounted = total_airline_cost_discounted.cumsum()
-
-        cumulative_total_airline_cost_increase = total_airline_cost_increase.cumsum()
-        cumulative_total_airline_cost_increase_discounted = (
-            total_airline_cost_increase_discounted.cumsum()
-        )
-
-        self.df.loc[:, "total_airline_cost"] = total_airline_cost
-        self.df.loc[:, "cumulative_total_airline_cost"] = cumulative_total_airline_cost
-        self.df.loc[:, "cumulative_total_airline_cost_discounted"] = (
-            cumulative_total_airline_cost_discounted
-        )
-        self.df.loc[:, "total_airline_cost_increase"] = total_airline_cost_increase
-        self.df.loc[:, "cumulative_total_airline_cost_increase"] = (
-            cumulative_total_airline_cost_increase
-        )
-        self.df.loc[:, "cumulative_total_airline_cost_increase_discounted"] = (
-            cumulative_total_airline_cost_increase_discounted
-        )
-
-        cumulative_total_airline_cost_discounted_obj = (
-            cumulative_total_airline_cost_increase_discounted[self.end_year]
-            - cumulative_total_airline_cost_increase_discounted[2025]
-        )
+        components = _welfare_accounting(
+            self,
+            social_discount_rate,
+            rpk,
+            rpk_no_elasticity,
+            total_cost_per_rpk=total_cost_per_rpk,
+        )
+        (
+            total_airline_cost,
+            cumulative_total_airline_cost,
+            cumulative_total_airline_cost_discounted,
+            cumulative_total_airline_cost_increase,
+            cumulative_total_airline_cost_increase_discounted,
+            cumulative_total_airline_cost_discounted_obj,
+        ) = _total_airline_cost_outputs(self, components)
 
         return (
             total_airline_cost,
@@ -492,43 +618,37 @@ class TotalSurplusLoss(AeroMAPSModel):
         cumulative_total_surplus_loss_discounted_obj
             Cumulative relative total surplus loss discounted at the end of the prospection period [M€].
         """
-
-        # computation of demand function parameters: asummption => constant elasticity => P= beta * Q**(1/elasticity)
-        beta = airfare_per_rpk[2025] / (rpk_no_elasticity ** (1 / price_elasticity))
-
-        # Gloabl Surplus before removing total costs
-
-        if price_elasticity == -1:
-            # surplus delta extresssed by CS= beta * np.log(Qref/Qi)
-            area_loss = beta * np.log(rpk_no_elasticity / rpk)
-
-        else:
-            area_loss = (
-                beta
-                * (1 / (1 + 1 / price_elasticity))
-                * (
-                    rpk_no_elasticity ** (1 + 1 / price_elasticity)
-                    - rpk ** (1 + 1 / price_elasticity)
-                )
-            )
-
-        self.df.loc[:, "area_loss"] = area_loss
-
-        area_loss_discounted = area_loss / (1 + social_discount_rate) ** (
-            self.df.index - self.prospection_start_year
-        )
-
-        self.df.loc[:, "area_loss_discounted"] = area_loss_discounted
-
-        cumulative_total_surplus_loss = area_loss.cumsum() + cumulative_total_airline_cost_increase
-        cumulative_total_surplus_loss_discounted = (
-            area_loss_discounted.cumsum()
-            + cumulative_total_airline_cost_increase_discounted[self.end_year]
-            - cumulative_total_airline_cost_increase_discounted[2025]
-        )
-
-        self.df.loc[:, "cumulative_total_surplus_loss"] = cumulative_total_surplus_loss
-        self.df.loc[:, "cumulative_total_surplus_loss_discounted"] = (
+        components = _welfare_accounting(
+            self,
+            social_discount_rate,
+            rpk,
+            rpk_no_elasticity,
+            airfare_per_rpk=airfare_per_rpk,
+            price_elasticity=price_elasticity,
+        )
+        years = self.df.index
+        area_loss_discounted = components["area_loss"] / components["compound_factors"]
+        airline_cost_increase_discounted = _on_model_years(
+            self, cumulative_total_airline_cost_increase_discounted
+        )
+
+        area_loss = pd.Series(components["area_loss"], index=years)
+        cumulative_total_surplus_loss = pd.Series(
+            _cumsum(components["area_loss"])
+            + _on_model_years(self, cumulative_total_airline_cost_increase),
+            index=years,
+        )
+        cumulative_total_surplus_loss_discounted = pd.Series(
+            _cumsum(area_loss_discounted)
+            + airline_cost_increase_discounted[years.get_loc(self.end_year)]
+            - airline_cost_increase_discounted[years.get_loc(WELFARE_REFERENCE_YEAR)],
+            index=years,
+        )
+
+        self.df["area_loss"] = area_loss
+        self.df["area_loss_discounted"] = area_loss_discounted
+        self.df["cumulative_total_surplus_loss"] = cumulative_total_surplus_loss
+        self.df["cumulative_total_surplus_loss_discounted"] = (
             cumulative_total_surplus_loss_discounted
         )
 
@@ -590,38 +710,26 @@ class ConsumerSurplusLoss(AeroMAPSModel):
             Consumer relative surplus loss discounted [M€].
 
         """
-        # computation of demand function parameters: assumption => constant elasticity => P= beta * Q**(1/elasticity)
-        beta = airfare_per_rpk[2025] / (rpk_no_elasticity ** (1 / price_elasticity))
-
+        components = _welfare_accounting(
+            self,
+            social_discount_rate,
+            rpk,
+            rpk_no_elasticity,
+            airfare_per_rpk=airfare_per_rpk,
+            price_elasticity=price_elasticity,
+        )
+        years = self.df.index
         # Passenger Surplus = area under demand curve - price
-
-        if price_elasticity == -1:
-            # surplus delta expresssed by CS= beta * np.log(Qref/Qi)
-            delta_consumer_surplus = beta * np.log(rpk_no_elasticity / rpk)
-            # FIXME SHOULD NOT BE THE SAME AS IN TOTAL SURPLUS LOSS WITH E=1
-
-        else:
-            # surplus delta expressed by
-            delta_consumer_surplus = (
-                beta
-                * (-1 / (1 + price_elasticity))
-                * (
-                    rpk_no_elasticity ** (1 + 1 / price_elasticity)
-                    - rpk ** (1 + 1 / price_elasticity)
-                )
-            )
-
-        self.df.loc[:, "delta_consumer_surplus"] = delta_consumer_surplus
-
-        delta_consumer_surplus_discounted = delta_consumer_surplus / (1 + social_discount_rate) ** (
-            self.df.index - self.prospection_start_year
+        delta_consumer_surplus = pd.Series(components["delta_consumer_surplus"], index=years)
+        delta_consumer_surplus_discounted = pd.Series(
+            components["delta_consumer_surplus"] / components["compound_factors"], index=years
         )
 
-        self.df.loc[:, "delta_consumer_surplus_discounted"] = delta_consumer_surplus_discounted
+        self.df["delta_consumer_surplus"] = delta_consumer_surplus
+        self.df["delta_consumer_surplus_discounted"] = delta_consumer_surplus_discounted
 
-        cumulative_delta_consumer_surplus_obj = (
-            delta_consumer_surplus_discounted.cumsum()[self.end_year]
-            - delta_consumer_surplus_discounted.cumsum()[2025]
+        cumulative_delta_consumer_surplus_obj = _welfare_objective(
+            self, _cumsum(delta_consumer_surplus_discounted.to_numpy())
         )
 
         return (
@@ -681,31 +789,28 @@ class AirlineSurplusLoss(AeroMAPSModel):
             Cumulative airline relative surplus loss discounted at the end of the prospection period [M€
 
         """
-        total_airline_cost = total_cost_per_rpk * rpk
-        total_airline_revenue = airfare_per_rpk * rpk
-        total_airline_surplus = total_airline_revenue - total_airline_cost
-
-        initial_airline_cost = (
-            total_cost_per_rpk[self.prospection_start_year - 1] * rpk_no_elasticity
+        components = _welfare_accounting(
+            self,
+            social_discount_rate,
+            rpk,
+            rpk_no_elasticity,
+            total_cost_per_rpk=total_cost_per_rpk,
+            airfare_per_rpk=airfare_per_rpk,
         )
-        initial_airline_revenue = (
-            airfare_per_rpk[self.prospection_start_year - 1] * rpk_no_elasticity
+        years = self.df.index
+        delta_airline_surplus = pd.Series(components["delta_airline_surplus"], index=years)
+        delta_airline_surplus_discounted = pd.Series(
+            components["delta_airline_surplus"] / components["compound_factors"], index=years
         )
-        initial_airline_surplus = initial_airline_revenue - initial_airline_cost
+        total_airline_surplus = pd.Series(components["total_airline_surplus"], index=years)
 
-        delta_airline_surplus = initial_airline_surplus - total_airline_surplus
-        delta_airline_surplus_discounted = delta_airline_surplus / (1 + social_discount_rate) ** (
-            self.df.index - self.prospection_start_year
+        cumulative_delta_airline_surplus_obj = _welfare_objective(
+            self, _cumsum(delta_airline_surplus_discounted.to_numpy())
         )
 
-        cumulative_delta_airline_surplus_obj = (
-            delta_airline_surplus_discounted.cumsum()[self.end_year]
-            - delta_airline_surplus_discounted.cumsum()[2025]
-        )
-
-        self.df.loc[:, "delta_airline_surplus"] = delta_airline_surplus
-        self.df.loc[:, "delta_airline_surplus_discounted"] = delta_airline_surplus_discounted
-        self.df.loc[:, "total_airline_surplus"] = total_airline_surplus
+        self.df["delta_airline_surplus"] = delta_airline_surplus
+        self.df["delta_airline_surplus_discounted"] = delta_airline_surplus_discounted
+        self.df["total_airline_surplus"] = total_airline_surplus
 
         return (
             delta_airline_surplus,
@@ -767,24 +872,27 @@ class TaxRevenueLoss(AeroMAPSModel):
             Cumulative tax revenue loss discounted at the end of the prospection period [M€].
 
         """
-        total_tax_revenue = total_extra_tax_per_rpk * rpk
-        initial_tax_revenue = (
-            total_extra_tax_per_rpk[self.prospection_start_year - 1] * rpk_no_elasticity
+        components = _welfare_accounting(
+            self,
+            social_discount_rate,
+            rpk,
+            rpk_no_elasticity,
+            total_extra_tax_per_rpk=total_extra_tax_per_rpk,
         )
-        delta_tax_revenue = initial_tax_revenue - total_tax_revenue
-
-        delta_tax_revenue_discounted = delta_tax_revenue / (1 + social_discount_rate) ** (
-            self.df.index - self.prospection_start_year
+        years = self.df.index
+        total_tax_revenue = pd.Series(components["total_tax_revenue"], index=years)
+        delta_tax_revenue = pd.Series(components["delta_tax_revenue"], index=years)
+        delta_tax_revenue_discounted = pd.Series(
+            components["delta_tax_revenue"] / components["compound_factors"], index=years
         )
 
-        cumulative_delta_tax_revenue_obj = (
-            delta_tax_revenue_discounted.cumsum()[self.end_year]
-            - delta_tax_revenue_discounted.cumsum()[2025]
+        cumulative_delta_tax_revenue_obj = _welfare_objective(
+            self, _cumsum(delta_tax_revenue_discounted.to_numpy())
         )
 
-        self.df.loc[:, "total_tax_revenue"] = total_tax_revenue
-        self.df.loc[:, "delta_tax_revenue"] = delta_tax_revenue
-        self.df.loc[:, "delta_tax_revenue_discounted"] = delta_tax_revenue_discounted
+        self.df["total_tax_revenue"] = total_tax_revenue
+        self.df["delta_tax_revenue"] = delta_tax_revenue
+        self.df["delta_tax_revenue_discounted"] = delta_tax_revenue_discounted
 
         return (
             total_tax_revenue,
@@ -839,22 +947,29 @@ class TotalWelfareLoss(AeroMAPSModel):
         cumulative_total_welfare_loss_obj
             Cumulative total welfare loss discounted at the end of the prospection period [M€].
         """
-
-        total_welfare_loss = delta_consumer_surplus + delta_airline_surplus + delta_tax_revenue
-        total_welfare_loss_discounted = total_welfare_loss / (1 + social_discount_rate) ** (
-            self.df.index - self.prospection_start_year
+        years = self.df.index
+        total_welfare_loss = (
+            _on_model_years(self, delta_consumer_surplus)
+            + _on_model_years(self, delta_airline_surplus)
+            + _on_model_years(self, delta_tax_revenue)
+        )
+        total_welfare_loss_discounted = total_welfare_loss / _compound_factors(
+            self, social_discount_rate
         )
 
-        cumulative_total_welfare_loss_discounted = total_welfare_loss_discounted.cumsum()
+        cumulative_total_welfare_loss_discounted = pd.Series(
+            _cumsum(total_welfare_loss_discounted), index=years
+        )
+        total_welfare_loss = pd.Series(total_welfare_loss, index=years)
+        total_welfare_loss_discounted = pd.Series(total_welfare_loss_discounted, index=years)
 
-        cumulative_total_welfare_loss_obj = (
-            cumulative_total_welfare_loss_discounted[self.end_year]
-            - cumulative_total_welfare_loss_discounted[2025]
+        cumulative_total_welfare_loss_obj = _welfare_objective(
+            self, cumulative_total_welfare_loss_discounted.to_numpy()
         )
 
-        self.df.loc[:, "total_welfare_loss"] = total_welfare_loss
-        self.df.loc[:, "total_welfare_loss_discounted"] = total_welfare_loss_discounted
-        self.df.loc[:, "cumulative_total_welfare_loss_discounted"] = (
+        self.df["total_welfare_loss"] = total_welfare_loss
+        self.df["total_welfare_loss_discounted"] = total_welfare_loss_discounted
+        self.df["cumulative_total_welfare_loss_discounted"] = (
             cumulative_total_welfare_loss_discounted
         )
 
@@ -9,6 +9,23 @@ from typing import Tuple
 import pandas as pd
 
 from aeromaps.models.base import AeroMAPSModel
+from aeromaps.utils.functions import _incremental_cumsum
+
+
+def _cumulative_emissions(model, name, emissions):
+    """
+    Cumulative sum of emissions for output ``name`` of a cumulative emissions model.
+
+    If ``model.incremental_cumsum`` is set, the sum of the previous evaluation is reused up
+    to the first year whose emissions changed (e.g. when an optimiser only moves late-horizon
+    levers).
+    """
+    if not model.incremental_cumsum:
+        return emissions.cumsum()
+    cumulative_emissions, model._cumsum_states[name] = _incremental_cumsum(
+        emissions, model._cumsum_states.get(name)
+    )
+    return cumulative_emissions
 
 
 class KayaFactors(AeroMAPSModel):
@@ -347,6 +364,8 @@ class CumulativeCO2Emissions(AeroMAPSModel):
 
     def __init__(self, name="cumulative_co2_emissions", *args, **kwargs):
         super().__init__(name=name, *args, **kwargs)
+        self.incremental_cumsum = False
+        self._cumsum_states = {}
 
     def compute(
         self,
@@ -376,13 +395,17 @@ class CumulativeCO2Emissions(AeroMAPSModel):
             carbon budget regardless of prospection_start_year.
 
         """
-        cumulative_co2_emissions = (
-            co2_emissions.loc[self.prospection_start_year : self.end_year] / 1000
-        ).cumsum()
+        cumulative_co2_emissions = _cumulative_emissions(
+            self,
+            "cumulative_co2_emissions",
+            co2_emissions.loc[self.prospection_start_year : self.end_year] / 1000,
+        )
 
-        cumulative_co2_emissions_from_carbon_budget_reference_year = (
-            co2_emissions.loc[carbon_budget_reference_year : self.end_year] / 1000
-        ).cumsum()
+        cumulative_co2_emissions_from_carbon_budget_reference_year = _cumulative_emissions(
+            self,
+            "cumulative_co2_emissions_from_carbon_budget_reference_year",
+            co2_emissions.loc[carbon_budget_reference_year : self.end_year] / 1000,
+        )
 
         self.df["cumulative_co2_emissions"] = cumulative_co2_emissions
         self.df["cumulative_co2_emissions_from_carbon_budget_reference_year"] = (
@@ -641,6 +664,8 @@ class DetailedCumulativeCO2Emissions(AeroMAPSModel):
 
     def __init__(self, name="detailed_cumulative_co2_emissions", *args, **kwargs):
         super().__init__(name=name, *args, **kwargs)
+        self.incremental_cumsum = False
+        self._cumsum_states = {}
 
     def compute(
         self,
@@ -686,40 +711,52 @@ class DetailedCumulativeCO2Emissions(AeroMAPSModel):
             improvements and energy decarbonization [GtCO2].
 
         """
-        cumulative_co2_emissions_last_historical_year_technology_baseline3 = (
+        cumulative_co2_emissions_last_historical_year_technology_baseline3 = _cumulative_emissions(
+            self,
+            "cumulative_co2_emissions_last_historical_year_technology_baseline3",
             co2_emissions_last_historical_year_technology_baseline3.loc[
                 self.prospection_start_year : self.end_year
             ]
-            / 1000
-        ).cumsum()
+            / 1000,
+        )
 
-        cumulative_co2_emissions_last_historical_year_technology = (
+        cumulative_co2_emissions_last_historical_year_technology = _cumulative_emissions(
+            self,
+            "cumulative_co2_emissions_last_historical_year_technology",
             co2_emissions_last_historical_year_technology.loc[
                 self.prospection_start_year : self.end_year
             ]
-            / 1000
-        ).cumsum()
+            / 1000,
+        )
 
-        cumulative_co2_emissions_including_aircraft_efficiency = (
+        cumulative_co2_emissions_including_aircraft_efficiency = _cumulative_emissions(
+            self,
+            "cumulative_co2_emissions_including_aircraft_efficiency",
             co2_emissions_including_aircraft_efficiency.loc[
                 self.prospection_start_year : self.end_year
             ]
-            / 1000
-        ).cumsum()
+            / 1000,
+        )
 
-        cumulative_co2_emissions_including_operations = (
+        cumulative_co2_emissions_including_operations = _cumulative_emissions(
+            self,
+            "cumulative_co2_emissions_including_operations",
             co2_emissions_including_operations.loc[self.prospection_start_year : self.end_year]
-            / 1000
-        ).cumsum()
+            / 1000,
+        )
 
-        cumulative_co2_emissions_including_load_factor = (
+        cumulative_co2_emissions_including_load_factor = _cumulative_emissions(
+            self,
+            "cumulative_co2_emissions_including_load_factor",
             co2_emissions_including_load_factor.loc[self.prospection_start_year : self.end_year]
-            / 1000
-        ).cumsum()
+            / 1000,
+        )
 
-        cumulative_co2_emissions_including_energy = (
-            co2_emissions_including_energy.loc[self.prospection_start_year : self.end_year] / 1000
-        ).cumsum()
+        cumulative_co2_emissions_including_energy = _cumulative_emissions(
+            self,
+            "cumulative_co2_emissions_including_energy",
+            co2_emissions_including_energy.loc[self.prospection_start_year : self.end_year] / 1000,
+        )
 
         self.df["cumulative_co2_emissions_last_historical_year_technology_baseline3"] = (
             cumulative_co2_emissions_last_historical_year_technology_baseline3
@@ -804,30 +841,29 @@ class SimpleCO2Emissions(AeroMAPSModel):
         historical_co2_emissions_for_temperature = self.climate_historical_data[:, 1]
 
         # Calculation
-        for k in range(self.climate_historic_start_year, self.historic_start_year):
-            self.df_climate.loc[k, "co2_emissions"] = historical_co2_emissions_for_temperature[
-                k - self.climate_historic_start_year
+        historic_years = range(self.historic_start_year, self.prospection_start_year)
+        prospective_years = range(self.prospection_start_year, self.end_year + 1)
+        self.df_climate.loc[: self.historic_start_year - 1, "co2_emissions"] = (
+            historical_co2_emissions_for_temperature[
+                : self.historic_start_year - self.climate_historic_start_year
             ]
-
-        for k in range(self.historic_start_year, self.prospection_start_year):
-            self.df_climate.loc[k, "co2_emissions"] = (
-                dropin_fuel_mean_co2_emission_factor.loc[k]
-                / 10**12
-                * energy_consumption_init.loc[k]
-            )
-
-        for k in range(self.prospection_start_year, self.end_year + 1):
-            self.df_climate.loc[k, "co2_emissions"] = (
-                dropin_fuel_mean_co2_emission_factor.loc[k]
-                / 10**12
-                * energy_consumption_dropin_fuel.loc[k]
-                + electric_mean_co2_emission_factor.loc[k]
-                / 10**12
-                * energy_consumption_electricity.loc[k]
-                + hydrogen_mean_co2_emission_factor.loc[k]
-                / 10**12
-                * energy_consumption_hydrogen.loc[k]
-            )
+        )
+        self.df_climate.loc[historic_years, "co2_emissions"] = (
+            dropin_fuel_mean_co2_emission_factor.loc[historic_years].to_numpy()
+            / 10**12
+            * energy_consumption_init.loc[historic_years].to_numpy()
+        )
+        self.df_climate.loc[prospective_years, "co2_emissions"] = (
+            dropin_fuel_mean_co2_emission_factor.loc[prospective_years].to_numpy()
+            / 10**12
+            * energy_consumption_dropin_fuel.loc[prospective_years].to_numpy()
+            + electric_mean_co2_emission_factor.loc[prospective_years].to_numpy()
+            / 10**12
+            * energy_consumption_electricity.loc[prospective_years].to_numpy()
+            + hydrogen_mean_co2_emission_factor.loc[prospective_years].to_numpy()
+            / 10**12
+            * energy_consumption_hydrogen.loc[prospective_years].to_numpy()
+        )
 
         co2_emissions = self.df_climate.loc[:, "co2_emissions"]
 
@@ -1005,3 +1005,261 @@ class NonCO2Emissions(AeroMAPSModel):
         self.df_climate.loc[:, "sulfur_emissions"] = sulfur_emissions
 
         return output_data
+
+
+class NonCO2EmissionsFused(AeroMAPSModel):
+    """
+    Class to compute non-CO2 emission indices and emissions of all species in a single discipline.
+
+    Fused alternative to the NOx, soot, H2O and sulfur emission index models and
+    NonCO2Emissions. The share-weighted mean emission indices of all species and energy
+    carriers (aircraft type and energy origin) are evaluated as one
+    (species × carrier × year) array, from which the emissions are summed. Output names
+    are those of the separate models.
+
+    Parameters
+    --------------
+    name : str
+        Name of the model instance ('non_co2_emissions_fused' by default).
+
+    Attributes
+    --------------
+    fleet_based_species : set
+        Species among NOx and soot whose emission indices follow the fleet renewal model as
+        in NOxEmissionIndexComplex and SootEmissionIndexComplex; the others follow the
+        yearly evolution rates as in NOxEmissionIndex and SootEmissionIndex.
+    fleet_model : FleetModel(AeroMAPSModel)
+        AeroMAPSModel instance providing fleet renewal data for the fleet based species.
+    pathways_manager : EnergyCarrierManager
+        EnergyCarrierManager instance to manage generic energy pathways and their data.
+    input_names : dict
+        Dictionary of input variable names populated at model initialisation before MDA chain creation.
+    output_names : dict
+        Dictionary of output variable names populated at model initialisation before MDA chain creation.
+    """
+
+    SPECIES = ("nox", "soot", "h2o", "sulfur")
+    # Species whose emission index evolves with aircraft technology
+    EVOLVING_SPECIES = ("nox", "soot")
+    # Yearly evolution rates of the emission indices when not fleet based
+    EVOLUTION_INPUTS = {
+        "nox": (
+            "emission_index_nox_dropin_fuel_evolution",
+            "emission_index_nox_hydrogen_evolution",
+        ),
+        "soot": ("emission_index_soot_dropin_fuel_evolution",),
+    }
+    EMITTING_AIRCRAFT_TYPES = ("dropin_fuel", "hydrogen")
+    # Columns of the climate historical data
+    HISTORICAL_DATA_COLUMNS = {"nox": 2, "h2o": 3, "soot": 4, "sulfur": 5}
+
+    def __init__(self, name="non_co2_emissions_fused", *args, **kwargs):
+        super().__init__(name=name, model_type="custom", *args, **kwargs)
+        self.fleet_based_species = set()
+        self.fleet_model = None
+        self.pathways_manager = None
+        self.markets = None
+        self.climate_historical_data = None
+
+    def _carriers(self):
+        """List (aircraft_type, energy_origin, pathways) for each energy carrier with pathways."""
+        carriers = []
+        for aircraft_type in self.pathways_manager.get_all_types("aircraft_type"):
+            for energy_origin in self.pathways_manager.get_all_types("energy_origin"):
+                pathways = self.pathways_manager.get(
+                    aircraft_type=aircraft_type, energy_origin=energy_origin
+                )
+                if pathways:
+                    carriers.append((aircraft_type, energy_origin, pathways))
+        return carriers
+
+    def custom_setup(self):
+        """
+        Dynamically add all pathways variables to input_names and function outputs to output_names.
+        Specific function for custom AeroMAPSModel instances.
+
+        Returns
+        -------
+        None
+        """
+        self.input_names = {}
+        self.output_names = {}
+
+        carriers = self._carriers()
+        if self.fleet_based_species:
+            aircraft_types = {aircraft_type for aircraft_type, _, _ in carriers}
+            for market in self.markets.get(traffic_type="passenger"):
+                for aircraft_type in aircraft_types:
+                    self.input_names[f"ask_{market.id}_{aircraft_type}"] = pd.Series([0.0])
+        for species, names in self.EVOLUTION_INPUTS.items():
+            if species not in self.fleet_based_species:
+                self.input_names.update({name: 0.0 for name in names})
+
+        for aircraft_type, energy_origin, pathways in carriers:
+            for species in self.SPECIES:
+                self.output_names[
+                    f"{aircraft_type}_{energy_origin}_mean_emission_index_{species}"
+                ] = pd.Series([0.0])
+            if aircraft_type in self.EMITTING_AIRCRAFT_TYPES:
+                self.input_names.update(
+                    {
+                        f"{aircraft_type}_{energy_origin}_mean_lhv": pd.Series([0.0]),
+                        f"{aircraft_type}_{energy_origin}_energy_consumption": pd.Series([0.0]),
+                    }
+                )
+            for pathway in pathways:
+                self.input_names[f"{pathway.name}_massic_share_{aircraft_type}_{energy_origin}"] = (
+                    pd.Series([0.0])
+                )
+                for species in self.SPECIES:
+                    self.input_names[f"{pathway.name}_emission_index_{species}"] = 0.0
+
+        self.output_names.update(
+            {f"{species}_emissions": pd.Series([0.0]) for species in self.SPECIES}
+        )
+
+    def _emission_index_evolution(self, input_data, species, aircraft_type):
+        """Relative evolution of an aircraft type emission index over the model years."""
+        if species in self.fleet_based_species:
+            weighted_emission_index_sum = get_default_series(
+                self.historic_start_year, self.end_year
+            )
+            ask_sum = get_default_series(self.historic_start_year, self.end_year)
+            for market in self.markets.get(traffic_type="passenger"):
+                emission_index_market = self.fleet_model.df[
+                    f"{market.name}:emission_index_{species}:{aircraft_type}"
+                ]
+                ask_market_filled = (
+                    input_data[f"ask_{market.id}_{aircraft_type}"]
+                    .loc[self.historic_start_year : self.end_year]
+                    .fillna(0)
+                )
+                weighted_emission_index_sum = (
+                    weighted_emission_index_sum
+                    + emission_index_market.loc[self.historic_start_year : self.end_year]
+                    * ask_market_filled
+                )
+                ask_sum = ask_sum + ask_market_filled
+            emission_index = weighted_emission_index_sum / ask_sum
+            return (
+                (emission_index / emission_index.loc[self.prospection_start_year - 1])
+                .reindex(self.df.index)
+                .to_numpy(dtype=float)
+            )
+
+        cagr_aircraft = input_data.get(f"emission_index_{species}_{aircraft_type}_evolution", 0.0)
+        return np.concatenate(
+            (
+                np.ones(self.prospection_start_year - self.historic_start_year),
+                (1 + cagr_aircraft)
+                ** np.arange(0, self.end_year - self.prospection_start_year + 1),
+            )
+        )
+
+    def compute(self, input_data) -> dict:
+        """
+        Non-CO2 emission indices and emissions calculation.
+
+        Parameters
+        ----------
+        input_data
+            Dictionary containing all input data required for the computation, completed at model instantiation with information from yaml files and outputs of other models.
+
+        Returns
+        -------
+        output_data
+            Dictionary containing all output data resulting from the computation. Contains outputs defined during model instantiation.
+        """
+        years = self.df.index
+        carriers = self._carriers()
+
+        # Pathway massic shares (pathways × years) [%] and carrier × pathway incidence
+        massic_shares = []
+        pathway_names = []
+        incidence = np.zeros((len(carriers), sum(len(p) for _, _, p in carriers)))
+        for c, (aircraft_type, energy_origin, pathways) in enumerate(carriers):
+            incidence[c, len(pathway_names) : len(pathway_names) + len(pathways)] = 1.0
+            for pathway in pathways:
+                pathway_names.append(pathway.name)
+                massic_shares.append(
+                    input_data[f"{pathway.name}_massic_share_{aircraft_type}_{energy_origin}"]
+                    .reindex(years)
+                    .to_numpy(dtype=float)
+                )
+        massic_shares = np.array(massic_shares)
+
+        # Emission indices (species × pathways)
+        emission_indices = np.array(
+            [
+                [input_data[f"{name}_emission_index_{species}"] for name in pathway_names]
+                for species in self.SPECIES
+            ],
+            dtype=float,
+        ).reshape(len(self.SPECIES), len(pathway_names))
+
+        weighted_emission_indices = emission_indices[:, :, None] * massic_shares[None]
+        weighted_emission_indices[np.isnan(weighted_emission_indices)] = 0.0
+        mean_emission_indices = np.einsum("cp,spy->scy", incidence, weighted_emission_indices) / 100
+
+        # Years without any share of the carrier are left undefined
+        cumulative_shares = incidence @ np.where(np.isnan(massic_shares), 0.0, massic_shares) / 100
+        mean_emission_indices *= np.where(cumulative_shares == 0, np.nan, cumulative_shares)
+
+        evolutions = {}
+        for s, species in enumerate(self.SPECIES):
+            if species not in self.EVOLVING_SPECIES:
+                continue
+            for c, (aircraft_type, _, _) in enumerate(carriers):
+                if (species, aircraft_type) not in evolutions:
+                    evolutions[species, aircraft_type] = self._emission_index_evolution(
+                        input_data, species, aircraft_type
+                    )
+                mean_emission_indices[s, c] *= evolutions[species, aircraft_type]
+
+        output_data = {}
+        for c, (aircraft_type, energy_origin, _) in enumerate(carriers):
+            for s, species in enumerate(self.SPECIES):
+                output_data[f"{aircraft_type}_{energy_origin}_mean_emission_index_{species}"] = (
+                    pd.Series(mean_emission_indices[s, c], index=years)
+                )
+
+        # Emissions: historical data up to historic_start_year, then sum over emitting carriers
+        emitting = [
+            c
+            for c, (aircraft_type, _, _) in enumerate(carriers)
+            if aircraft_type in self.EMITTING_AIRCRAFT_TYPES
+        ]
+        mass_consumption = np.array(
+            [
+                (
+                    input_data[f"{carriers[c][0]}_{carriers[c][1]}_energy_consumption"]
+                    / input_data[f"{carriers[c][0]}_{carriers[c][1]}_mean_lhv"]
+                    / 10**9  # convert MJ to Mt
+                )
+                .reindex(years)
+                .to_numpy(dtype=float)
+                for c in emitting
+            ]
+        ).reshape(len(emitting), len(years))
+        species_emissions = mean_emission_indices[:, emitting] * mass_consumption[None]
+        species_emissions[np.isnan(species_emissions)] = 0.0
+        species_emissions = species_emissions.sum(axis=1)
+
+        historical_columns = [self.HISTORICAL_DATA_COLUMNS[species] for species in self.SPECIES]
+        emissions = np.concatenate(
+            (
+                self.climate_historical_data[:, historical_columns].T,
+                species_emissions[:, 1:],
+            ),
+            axis=1,
+        )
+        climate_years = range(self.climate_historic_start_year, self.end_year + 1)
+        for s, species in enumerate(self.SPECIES):
+            output_data[f"{species}_emissions"] = pd.Series(emissions[s], index=climate_years)
+
+        self._store_outputs(
+            output_data,
+            climate_outputs_keys=[f"{species}_emissions" for species in self.SPECIES],
+        )
+
+        return output_data
@@ -4,6 +4,7 @@ energy_consumption
 Module to compute energy consumption from different aircraft types.
 """
 
+import numpy as np
 import pandas as pd
 
 from aeromaps.models.base import AeroMAPSModel
@@ -880,3 +881,155 @@ class EnergyConsumption(AeroMAPSModel):
 
         self._store_outputs(output_data)
         return output_data
+
+
+class EnergyConsumptionFused(AeroMAPSModel):
+    """
+    Class to calculate the energy consumption of all markets and energy carriers in a single discipline.
+
+    Fused alternative to DropInFuelConsumption, HydrogenConsumption, ElectricConsumption
+    and EnergyConsumption. The (market × carrier × year) consumption is computed once as
+    traffic × energy intensity and summed over markets and carriers. Output names are
+    those of the separate models.
+
+    The split of drop-in fuel consumption (DropInFuelDetailledConsumption) is not fused:
+    its shares come from the energy use choice, which itself depends on the totals
+    computed here.
+
+    Parameters
+    --------------
+    name : str
+        Name of the model instance ('energy_consumption_fused' by default).
+
+    Documentation
+    --------------
+    Inputs
+        - ask_<market>_<carrier>: Passenger ASK [ASK].
+        - rtk_<market>_<carrier>: Freight RTK [RTK].
+        - energy_per_ask_without_operations_<market>_<carrier>: Passenger MJ/ASK (no ops).
+        - energy_per_ask_<market>_<carrier>: Passenger MJ/ASK (with ops).
+        - energy_per_rtk_without_operations_<market>_<carrier>: Freight MJ/RTK (no ops).
+        - energy_per_rtk_<market>_<carrier>: Freight MJ/RTK (with ops).
+    Outputs
+        - Outputs of DropInFuelConsumption, HydrogenConsumption, ElectricConsumption and
+          EnergyConsumption.
+    Notes
+        - <market> is the MarketManager id (passenger and freight markets).
+        - <carrier> is one of: dropin_fuel, hydrogen, electric.
+        - I/O names are generated from configuration and passed to GEMSEO via
+            self.input_names and self.output_names grammars.
+    """
+
+    CARRIERS = ("dropin_fuel", "hydrogen", "electric")
+    # Name suffixes of the variants without and with operational improvements
+    OPERATIONS_SUFFIXES = ("_without_operations", "")
+
+    def __init__(self, name="energy_consumption_fused", *args, **kwargs):
+        super().__init__(name=name, model_type="custom", *args, **kwargs)
+        self.markets = None
+
+    def _markets_and_traffic(self):
+        """List (market id, traffic name) for passenger (ASK) then freight (RTK) markets."""
+        return [(market.id, "ask") for market in self.markets.get(traffic_type="passenger")] + [
+            (market.id, "rtk") for market in self.markets.get(traffic_type="freight")
+        ]
+
+    def custom_setup(self):
+        self.input_names = {}
+        self.output_names = {}
+
+        for mid, traffic in self._markets_and_traffic():
+            for carrier in self.CARRIERS:
+                self.input_names[f"{traffic}_{mid}_{carrier}"] = pd.Series([0.0])
+                for suffix in self.OPERATIONS_SUFFIXES:
+                    self.input_names[f"energy_per_{traffic}{suffix}_{mid}_{carrier}"] = pd.Series(
+                        [0.0]
+                    )
+                    self.output_names[f"energy_consumption_{mid}_{carrier}{suffix}"] = pd.Series(
+                        [0.0]
+                    )
+            for suffix in self.OPERATIONS_SUFFIXES:
+                self.output_names[f"energy_consumption_{mid}{suffix}"] = pd.Series([0.0])
+
+        for suffix in self.OPERATIONS_SUFFIXES:
+            for carrier in self.CARRIERS:
+                for scope in ("passenger_", "freight_", ""):
+                    self.output_names[f"energy_consumption_{scope}{carrier}{suffix}"] = pd.Series(
+                        [0.0]
+                    )
+            for scope in ("_passenger", "_freight", ""):
+                self.output_names[f"energy_consumption{scope}{suffix}"] = pd.Series([0.0])
+
+    def compute(self, input_data) -> dict:
+        """
+        Energy consumption per market and carrier, and aggregates.
+
+        The (market × carrier × year) consumption is computed as energy_per_(ask|rtk) *
+        (ask|rtk), zeroed wherever there is no traffic, then summed over carriers,
+        markets and both. Both with-operations and without-operations variants are
+        produced.
+        """
+        output_data = {}
+        index = self.df.index
+        markets_and_traffic = self._markets_and_traffic()
+        is_passenger = np.array(
+            [traffic == "ask" for _, traffic in markets_and_traffic], dtype=bool
+        )
+
+        def stack(name_pattern):
+            # (markets, carriers, years) array of the inputs named by name_pattern.
+            shape = (len(markets_and_traffic), len(self.CARRIERS), len(index))
+            values = np.zeros(shape)
+            for i, (mid, traffic) in enumerate(markets_and_traffic):
+                for j, carrier in enumerate(self.CARRIERS):
+                    values[i, j] = input_data[
+                        name_pattern.format(traffic=traffic, mid=mid, carrier=carrier)
+                    ].to_numpy(dtype=float)
+            return values
+
+        traffic = stack("{traffic}_{mid}_{carrier}")
+
+        for suffix in self.OPERATIONS_SUFFIXES:
+            intensity = stack("energy_per_{traffic}" + suffix + "_{mid}_{carrier}")
+            # Energy is zero wherever there is no traffic, even when the intensity is
+            # NaN/inf from an upstream division-by-zero (see DropInFuelConsumption).
+            with np.errstate(invalid="ignore"):
+                carrier_energy = np.where(traffic != 0.0, intensity * traffic, 0.0)
+            market_energy = carrier_energy.sum(axis=1)
+
+            for i, (mid, _) in enumerate(markets_and_traffic):
+                for j, carrier in enumerate(self.CARRIERS):
+                    output_data[f"energy_consumption_{mid}_{carrier}{suffix}"] = pd.Series(
+                        carrier_energy[i, j], index=index
+                    )
+                output_data[f"energy_consumption_{mid}{suffix}"] = pd.Series(
+                    market_energy[i], index=index
+                )
+
+            passenger_carrier_energy = carrier_energy[is_passenger].sum(axis=0)
+            freight_carrier_energy = carrier_energy[~is_passenger].sum(axis=0)
+            for j, carrier in enumerate(self.CARRIERS):
+                output_data[f"energy_consumption_passenger_{carrier}{suffix}"] = pd.Series(
+                    passenger_carrier_energy[j], index=index
+                )
+                output_data[f"energy_consumption_freight_{carrier}{suffix}"] = pd.Series(
+                    freight_carrier_energy[j], index=index
+                )
+                output_data[f"energy_consumption_{carrier}{suffix}"] = pd.Series(
+                    passenger_carrier_energy[j] + freight_carrier_energy[j], index=index
+                )
+
+            passenger_energy = market_energy[is_passenger].sum(axis=0)
+            freight_energy = market_energy[~is_passenger].sum(axis=0)
+            output_data[f"energy_consumption_passenger{suffix}"] = pd.Series(
+                passenger_energy, index=index
+            )
+            output_data[f"energy_consumption_freight{suffix}"] = pd.Series(
+                freight_energy, index=index
+            )
+            output_data[f"energy_consumption{suffix}"] = pd.Series(
+                passenger_energy + freight_energy, index=index
+            )
+
+        self._store_outputs(output_data)
+        return output_data
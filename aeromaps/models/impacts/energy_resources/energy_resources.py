@@ -4,26 +4,32 @@ energy_resources
 Module to model energy resources consumption.
 """
 
+import numpy as np
 import pandas as pd
+from scipy import sparse
 
 from aeromaps.models.base import AeroMAPSModel
 from aeromaps.models.impacts.generic_energy_model.common.energy_carriers_manager import (
     EnergyCarrierManager,
 )
-from aeromaps.utils.functions import _custom_series_addition
+from aeromaps.utils.functions import _fill_nan, _series_from_grid, _series_on_grid
 
 
-class EnergyResourceConsumption(AeroMAPSModel):
+class EnergyResourcesConsumption(AeroMAPSModel):
     """
-    This class aggregates all pathways consumption for a given resource. Then, it compares it to availability and allocations.
-    A class is instantiated for each resource defined in the resources .yaml file.
+    This class aggregates all pathways consumption for each resource, then by resource origin. It compares them to
+    availability and allocations. A single instance is created for all resources defined in the resources .yaml file.
+
+    The pathways using each resource (directly or through their processes) are gathered at instantiation in a sparse
+    (resource x pathway consumption) incidence matrix, and the resources in a sparse (origin x resource) incidence matrix,
+    so that all sums come out of sparse matrix products over the year arrays.
 
     Parameters
     --------------
     name : str
-        Name of the model instance ('f"{generic_resource}_consumption"' by default).
-    configuration_data : dict
-        Configuration data dictionary for the resource from the resources .yaml file.
+        Name of the model instance ('energy_resources_consumption' by default).
+    resources_data : dict
+        Dictionary containing configuration data for all resources from the resources .yaml file.
     pathways_manager : EnergyCarrierManager
         EnergyCarrierManager instance to manage generic energy pathways and their data.
 
@@ -42,7 +48,7 @@ class EnergyResourceConsumption(AeroMAPSModel):
     def __init__(
         self,
         name,
-        configuration_data,
+        resources_data,
         pathways_manager: EnergyCarrierManager,
         *args,
         **kwargs,
@@ -55,190 +61,88 @@ class EnergyResourceConsumption(AeroMAPSModel):
             **kwargs,
         )
         self.pathways_manager = pathways_manager
-        # Get the name of the resource
-        self.resource_name = configuration_data["name"]
 
         self.input_names = {}
         self.output_names = {}
 
-        if f"{self.resource_name}_availability_global" in configuration_data["specifications"]:
-            self.input_names[f"{self.resource_name}_availability_global"] = configuration_data[
-                "specifications"
-            ][f"{self.resource_name}_availability_global"]
-            self.output_names.update(
-                {
-                    f"{self.resource_name}_consumed_global_share": pd.Series([0.0]),
-                    f"{self.resource_name}_necessary_global_share_with_selectivity": pd.Series(
-                        [0.0]
-                    ),
-                }
-            )
-        if (
-            f"{self.resource_name}_availability_aviation_allocated_share"
-            in configuration_data["specifications"]
-        ):
-            self.input_names[f"{self.resource_name}_availability_aviation_allocated_share"] = (
-                configuration_data[
-                    "specifications"
-                ][f"{self.resource_name}_availability_aviation_allocated_share"]
-            )
-            self.output_names.update(
-                {
-                    f"{self.resource_name}_consumed_aviation_allocated_share": pd.Series([0.0]),
-                }
-            )
+        self.resources_names = [resources_data[resource]["name"] for resource in resources_data]
+        # Consumption inputs of each pathway using a resource, as "{pathway}_{resource}" prefixes
+        self.pathways_resources = []
+        incidence_rows = []
+        incidence_columns = []
+        # Resources compared to availability and allocations, aggregated by origin
+        self.available_resources = []
+        self.resources_origins = []
+        origin_rows = []
+
+        for row, resource in enumerate(self.resources_names):
+            specifications = resources_data[resource]["specifications"]
+            if f"{resource}_availability_global" in specifications:
+                self.input_names[f"{resource}_availability_global"] = specifications[
+                    f"{resource}_availability_global"
+                ]
+                self.output_names.update(
+                    {
+                        f"{resource}_consumed_global_share": pd.Series([0.0]),
+                        f"{resource}_necessary_global_share_with_selectivity": pd.Series([0.0]),
+                    }
+                )
+            if f"{resource}_availability_aviation_allocated_share" in specifications:
+                self.input_names[f"{resource}_availability_aviation_allocated_share"] = (
+                    specifications[f"{resource}_availability_aviation_allocated_share"]
+                )
+                self.output_names.update(
+                    {
+                        f"{resource}_consumed_aviation_allocated_share": pd.Series([0.0]),
+                    }
+                )
 
-        for pathway in self.pathways_manager.get(
-            resources_used=self.resource_name
-        ) + self.pathways_manager.get(resources_used_processes=self.resource_name):
-            self.input_names.update(
+            # A pathway using a resource both directly and through a process is counted twice
+            for pathway in self.pathways_manager.get(
+                resources_used=resource
+            ) + self.pathways_manager.get(resources_used_processes=resource):
+                pathway_resource = f"{pathway.name}_{resource}"
+                if pathway_resource not in self.pathways_resources:
+                    self.pathways_resources.append(pathway_resource)
+                    self.input_names.update(
+                        {
+                            f"{pathway_resource}_total_consumption": pd.Series([0.0]),
+                            f"{pathway_resource}_total_mobilised_with_selectivity": pd.Series(
+                                [0.0]
+                            ),
+                        }
+                    )
+                incidence_rows.append(row)
+                incidence_columns.append(self.pathways_resources.index(pathway_resource))
+
+            self.output_names.update(
                 {
-                    f"{pathway.name}_{self.resource_name}_total_consumption": pd.Series([0.0]),
-                    f"{pathway.name}_{self.resource_name}_total_mobilised_with_selectivity": pd.Series(
-                        [0.0]
-                    ),
+                    f"{resource}_total_consumption": pd.Series([0.0]),
+                    f"{resource}_total_necessary_with_selectivity": pd.Series([0.0]),
                 }
             )
 
-        self.output_names.update(
-            {
-                f"{self.resource_name}_total_consumption": pd.Series([0.0]),
-                f"{self.resource_name}_total_necessary_with_selectivity": pd.Series([0.0]),
-            }
-        )
-
-    def compute(self, input_data) -> dict:
-        """
-        Executes the computation of total resource consumption and comparison to availability and allocations.
-
-        Parameters
-        ----------
-        input_data
-            Dictionary containing all input data required for the computation, completed at model instantiation with information from yaml files and outputs of other models.
-
-        Returns
-        -------
-        output_data
-            Dictionary containing all output data resulting from the computation. Contains outputs defined during model instantiation.
-
-        """
-        output_data = {}
-
-        total_resource_consumption = pd.Series(
-            0.0, index=range(self.prospection_start_year, self.end_year + 1)
-        )
-        total_resource_mobilised_with_selectivity = pd.Series(
-            0.0, index=range(self.prospection_start_year, self.end_year + 1)
-        )
-
-        for pathway in self.pathways_manager.get(
-            resources_used=self.resource_name
-        ) + self.pathways_manager.get(resources_used_processes=self.resource_name):
-            total_resource_consumption = _custom_series_addition(
-                total_resource_consumption,
-                input_data[f"{pathway.name}_{self.resource_name}_total_consumption"],
-            )
-            total_resource_mobilised_with_selectivity = _custom_series_addition(
-                total_resource_mobilised_with_selectivity,
-                input_data[f"{pathway.name}_{self.resource_name}_total_mobilised_with_selectivity"],
-            )
-
-        output_data[f"{self.resource_name}_total_consumption"] = total_resource_consumption
-        output_data[f"{self.resource_name}_total_necessary_with_selectivity"] = (
-            total_resource_mobilised_with_selectivity
-        )
-
-        if f"{self.resource_name}_availability_global" in input_data:
-            output_data[f"{self.resource_name}_consumed_global_share"] = (
-                total_resource_consumption
-                / input_data[f"{self.resource_name}_availability_global"]
-                * 100
-            )
-            output_data[f"{self.resource_name}_necessary_global_share_with_selectivity"] = (
-                total_resource_mobilised_with_selectivity
-                / input_data[f"{self.resource_name}_availability_global"]
-                * 100
-            )
-
-        if f"{self.resource_name}_availability_aviation_allocated_share" in input_data:
-            output_data[f"{self.resource_name}_consumed_aviation_allocated_share"] = (
-                total_resource_consumption
-                / (
-                    input_data[f"{self.resource_name}_availability_global"]
-                    * input_data[f"{self.resource_name}_availability_aviation_allocated_share"]
-                    / 100
+            # keep only resources whose availability is defined for the aggregation by origin
+            if f"{resource}_availability_global" in specifications:
+                origin = resources_data[resource].get("origin", "unknown")
+                if origin not in self.resources_origins:
+                    self.resources_origins.append(origin)
+                self.available_resources.append(row)
+                origin_rows.append(self.resources_origins.index(origin))
+                # Todo make this conditional
+                self.input_names[f"{resource}_availability_aviation_allocated_share"] = (
+                    specifications[f"{resource}_availability_aviation_allocated_share"]
                 )
-                * 100
-            )
-
-        self._store_outputs(output_data)
-
-        return output_data
-
-
-class OverallResourcesConsumption(AeroMAPSModel):
-    """
-    Aggregates total consumption and shares for all resources according to their origin and using outputs from EnergyResourceConsumption.
-    Only one instance of this class is created for all resources.
 
-    Parameters
-    --------------
-    name : str
-        Name of the model instance ('overall_resources_consumption' by default).
-    resources_data : dict
-        Dictionary containing configuration data for all resources from the resources .yaml file.
-
-    Attributes
-    --------------
-    input_names : dict
-        Dictionary of input variable names populated at model initialisation before MDA chain creation.
-    output_names : dict
-        Dictionary of output variable names populated at model initialisation before MDA chain creation.
-
-    Warning
-    --------------
-    - Detailed i/o documentation is not yet provided for models defined wityh generic .yaml files
-    """
-
-    def __init__(
-        self,
-        name,
-        resources_data,
-        *args,
-        **kwargs,
-    ):
-        super().__init__(
-            name=name,
-            model_type="custom",
-            *args,
-            **kwargs,
+        # Duplicated entries are summed
+        self.incidence = sparse.csr_matrix(
+            (np.ones(len(incidence_rows)), (incidence_rows, incidence_columns)),
+            shape=(len(self.resources_names), len(self.pathways_resources)),
+        )
+        self.origin_incidence = sparse.csr_matrix(
+            (np.ones(len(origin_rows)), (origin_rows, range(len(origin_rows)))),
+            shape=(len(self.resources_origins), len(self.available_resources)),
         )
-
-        # keep only resources whose availability is defined
-        self.resources_names_origins = {
-            resource: resources_data[resource].get("origin", "unknown")
-            for resource in resources_data.keys()
-            if f"{resource}_availability_global" in resources_data[resource]["specifications"]
-        }
-
-        # getting the unique origins of the resources
-        self.resources_origins = set(self.resources_names_origins.values())
-
-        self.resources_names = list(self.resources_names_origins.keys())
-
-        # Dynamically build input/output names for all resources
-        self.input_names = {}
-        self.output_names = {}
-        for resource in self.resources_names:
-            self.input_names[f"{resource}_total_consumption"] = pd.Series([0.0])
-            self.input_names[f"{resource}_total_necessary_with_selectivity"] = pd.Series([0.0])
-            self.input_names[f"{resource}_availability_global"] = resources_data[resource][
-                "specifications"
-            ][f"{resource}_availability_global"]
-            # Todo make this conditional
-            self.input_names[f"{resource}_availability_aviation_allocated_share"] = resources_data[
-                resource
-            ]["specifications"][f"{resource}_availability_aviation_allocated_share"]
 
         for origin in self.resources_origins:
             self.output_names[f"{origin}_total_consumption"] = pd.Series([0.0])
@@ -254,7 +158,7 @@ class OverallResourcesConsumption(AeroMAPSModel):
 
     def compute(self, input_data) -> dict:
         """
-        Executes the computation of overall resource consumption for all origins and comparison to availability and allocations.
+        Executes the computation of total consumption of each resource and origin, and comparison to availability and allocations.
 
         Parameters
         ----------
@@ -269,82 +173,194 @@ class OverallResourcesConsumption(AeroMAPSModel):
         """
         output_data = {}
 
-        index = range(self.prospection_start_year, self.end_year + 1)
-
-        # Prepare aggregation by origin
-        origin_consumption = {
-            origin: pd.Series(0.0, index=index) for origin in self.resources_origins
-        }
-        origin_necessary = {
-            origin: pd.Series(0.0, index=index) for origin in self.resources_origins
-        }
-        origin_availability = {
-            origin: pd.Series(0.0, index=index) for origin in self.resources_origins
-        }
-        origin_availability_aviation_allocated = {
-            origin: pd.Series(0.0, index=index) for origin in self.resources_origins
-        }
-
-        # Aggregate by origin
-        for resource in self.resources_names:
-            origin = self.resources_names_origins.get(resource, None)
-            if origin is None:
-                print(
-                    f"Warning: No origin found for resource:{resource}, aggregate shares not computed."
+        # Series are handled as rows on a common year grid, with masks of the years of their indexes
+        prospective_years = pd.RangeIndex(self.prospection_start_year, self.end_year + 1)
+        grid = prospective_years
+        for value in input_data.values():
+            if isinstance(value, pd.Series) and not value.index.equals(grid):
+                grid = grid.union(value.index)
+        in_prospective_years = grid.isin(prospective_years)
+        n_years = len(grid)
+
+        # Totals of each resource, for consumption and mobilised quantities in a single product
+        consumption, consumption_defined = _stack_on_grid(
+            input_data,
+            [f"{prefix}_total_consumption" for prefix in self.pathways_resources],
+            grid,
+        )
+        mobilised, mobilised_defined = _stack_on_grid(
+            input_data,
+            [f"{prefix}_total_mobilised_with_selectivity" for prefix in self.pathways_resources],
+            grid,
+        )
+        totals, totals_defined = _sum_series(
+            self.incidence,
+            np.hstack([consumption, mobilised]),
+            np.hstack([consumption_defined, mobilised_defined]),
+            np.tile(in_prospective_years, 2),
+        )
+        total_consumption, total_necessary = totals[:, :n_years], totals[:, n_years:]
+        total_consumption_defined = totals_defined[:, :n_years]
+        total_necessary_defined = totals_defined[:, n_years:]
+
+        availability, availability_defined = _stack_on_grid(
+            input_data,
+            [f"{resource}_availability_global" for resource in self.resources_names],
+            grid,
+        )
+        allocated_share, allocated_share_defined = _stack_on_grid(
+            input_data,
+            [
+                f"{resource}_availability_aviation_allocated_share"
+                for resource in self.resources_names
+            ],
+            grid,
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for row, resource in enumerate(self.resources_names):
+                output_data[f"{resource}_total_consumption"] = _series_from_grid(
+                    total_consumption[row], total_consumption_defined[row], grid
+                )
+                output_data[f"{resource}_total_necessary_with_selectivity"] = _series_from_grid(
+                    total_necessary[row], total_necessary_defined[row], grid
                 )
-                continue
-            else:
-                origin = origin
-
-            total_consumption = input_data[f"{resource}_total_consumption"]
-            total_necessary = input_data[f"{resource}_total_necessary_with_selectivity"]
-            availability = input_data[f"{resource}_availability_global"]
-            availability_aviation_allocated = (
-                input_data[f"{resource}_availability_aviation_allocated_share"] / 100 * availability
-            )
 
-            origin_consumption[origin] = _custom_series_addition(
-                origin_consumption[origin], total_consumption
+                if f"{resource}_availability_global" in input_data:
+                    output_data[f"{resource}_consumed_global_share"] = _series_from_grid(
+                        total_consumption[row] / availability[row] * 100,
+                        total_consumption_defined[row] | availability_defined[row],
+                        grid,
+                    )
+                    output_data[f"{resource}_necessary_global_share_with_selectivity"] = (
+                        _series_from_grid(
+                            total_necessary[row] / availability[row] * 100,
+                            total_necessary_defined[row] | availability_defined[row],
+                            grid,
+                        )
+                    )
+
+                if f"{resource}_availability_aviation_allocated_share" in input_data:
+                    output_data[f"{resource}_consumed_aviation_allocated_share"] = (
+                        _series_from_grid(
+                            total_consumption[row]
+                            / (availability[row] * allocated_share[row] / 100)
+                            * 100,
+                            total_consumption_defined[row]
+                            | availability_defined[row]
+                            | allocated_share_defined[row],
+                            grid,
+                        )
+                    )
+
+            # Aggregate by origin
+            available = self.available_resources
+            origin_totals, origin_totals_defined = _sum_series(
+                self.origin_incidence,
+                np.hstack([total_consumption[available], total_necessary[available]]),
+                np.hstack(
+                    [total_consumption_defined[available], total_necessary_defined[available]]
+                ),
+                np.tile(in_prospective_years, 2),
             )
-            origin_necessary[origin] = _custom_series_addition(
-                origin_necessary[origin], total_necessary
+            # Availabilities are summed over the prospective years, a missing value giving a missing total
+            origin_availabilities = np.tile(
+                np.where(in_prospective_years, 0.0, np.nan), 2
+            ) + self.origin_incidence @ np.hstack(
+                [
+                    availability[available],
+                    allocated_share[available] / 100 * availability[available],
+                ]
             )
-            origin_availability[origin] += availability
-            origin_availability_aviation_allocated[origin] += availability_aviation_allocated
 
-        # Compute shares for each origin
-        for origin in self.resources_origins:
-            total_consumption = origin_consumption[origin]
-            total_necessary = origin_necessary[origin]
-            total_availability = origin_availability[origin]
-            total_availability_aviation_allocated = origin_availability_aviation_allocated[origin]
-
-            consumed_global_share = total_consumption / total_availability * 100
-            necessary_global_share_with_selectivity = total_necessary / total_availability * 100
-            # Aviation allocated share in percent
-            consumed_aviation_allocated_share = (
-                total_consumption / total_availability_aviation_allocated * 100
-            )
-            overall_aviation_allocated_share = (
-                total_availability_aviation_allocated / total_availability * 100
-            )
+            for row, origin in enumerate(self.resources_origins):
+                origin_consumption = origin_totals[row, :n_years]
+                origin_consumption_defined = origin_totals_defined[row, :n_years]
+                origin_necessary = origin_totals[row, n_years:]
+                origin_necessary_defined = origin_totals_defined[row, n_years:]
+                origin_availability = origin_availabilities[row, :n_years]
+                origin_availability_aviation_allocated = origin_availabilities[row, n_years:]
 
-            output_data[f"{origin}_total_consumption"] = total_consumption
-            output_data[f"{origin}_total_necessary_with_selectivity"] = total_necessary
-            output_data[f"{origin}_consumed_global_share"] = consumed_global_share
-            output_data[f"{origin}_necessary_global_share_with_selectivity"] = (
-                necessary_global_share_with_selectivity
-            )
-            output_data[f"{origin}_overall_aviation_allocated_share"] = (
-                overall_aviation_allocated_share
-            )
-            output_data[f"{origin}_consumed_aviation_allocated_share"] = (
-                consumed_aviation_allocated_share
-            )
-            output_data[f"{origin}_availability_global"] = total_availability
-            output_data[f"{origin}_availability_aviation_allocated"] = (
-                total_availability_aviation_allocated
-            )
+                output_data[f"{origin}_total_consumption"] = _series_from_grid(
+                    origin_consumption, origin_consumption_defined, grid
+                )
+                output_data[f"{origin}_total_necessary_with_selectivity"] = _series_from_grid(
+                    origin_necessary, origin_necessary_defined, grid
+                )
+                output_data[f"{origin}_consumed_global_share"] = _series_from_grid(
+                    origin_consumption / origin_availability * 100, origin_consumption_defined, grid
+                )
+                output_data[f"{origin}_necessary_global_share_with_selectivity"] = (
+                    _series_from_grid(
+                        origin_necessary / origin_availability * 100, origin_necessary_defined, grid
+                    )
+                )
+                # Aviation allocated share in percent
+                output_data[f"{origin}_overall_aviation_allocated_share"] = _series_from_grid(
+                    origin_availability_aviation_allocated / origin_availability * 100,
+                    in_prospective_years,
+                    grid,
+                )
+                output_data[f"{origin}_consumed_aviation_allocated_share"] = _series_from_grid(
+                    origin_consumption / origin_availability_aviation_allocated * 100,
+                    origin_consumption_defined,
+                    grid,
+                )
+                output_data[f"{origin}_availability_global"] = _series_from_grid(
+                    origin_availability, in_prospective_years, grid
+                )
+                output_data[f"{origin}_availability_aviation_allocated"] = _series_from_grid(
+                    origin_availability_aviation_allocated, in_prospective_years, grid
+                )
 
         self._store_outputs(output_data)
+
         return output_data
+
+
+def _stack_on_grid(input_data, names, grid):
+    """
+    Values of inputs on a year grid, one row per input, and masks of their index years.
+
+    Scalar inputs are constant rows with an empty mask as they do not extend the index of the results, and missing inputs
+    are rows of NaN.
+    """
+    values = np.full((len(names), len(grid)), np.nan)
+    defined = np.zeros((len(names), len(grid)), dtype=bool)
+    for row, name in enumerate(names):
+        value = input_data.get(name)
+        if isinstance(value, pd.Series):
+            values[row], defined[row] = _series_on_grid(value, grid)
+        elif value is not None:
+            values[row] = value
+    return values, defined
+
+
+def _sum_series(incidence, values, defined, start):
+    """
+    Array equivalent of `_custom_series_addition` folds, starting from zero series, with an incidence matrix.
+
+    Parameters
+    ----------
+    incidence
+        Sparse matrix of the number of times each row of values is added to each sum.
+    values
+        Values of the terms, NaN where missing.
+    defined
+        Masks of the index years of the terms.
+    start
+        Mask of the index years of the zero series the sums start from.
+
+    Returns
+    -------
+    sums
+        Sums of the terms, NaN where all terms are missing.
+    sums_defined
+        Masks of the index years of the sums (union of the indexes of the terms).
+    """
+    n_columns = values.shape[1]
+    counts = incidence @ np.hstack([_fill_nan(values), ~np.isnan(values), defined])
+    sums = np.where(
+        start | (counts[:, n_columns : 2 * n_columns] > 0), counts[:, :n_columns], np.nan
+    )
+    return sums, start | (counts[:, 2 * n_columns :] > 0)
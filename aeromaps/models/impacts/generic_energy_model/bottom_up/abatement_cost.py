@@ -11,6 +11,8 @@ import numpy as np
 import pandas as pd
 
 from aeromaps.models.base import AeroMAPSModel
+from aeromaps.utils.discounting import carbon_value_factors, compound_factors
+from aeromaps.utils.functions import _values_at_years
 
 
 class EnergyAbatementCost(AeroMAPSModel):
@@ -286,46 +288,26 @@ class ReferenceAbatementCost(AeroMAPSModel):
         pd.Series,
         pd.Series,
     ]:
-        # Print all arguments for debugging:
-        indexes = fossil_emission_factor.index
-        specific_em = pd.Series(np.nan, indexes)
-        generic_discounted_specific_em = pd.Series(np.nan, indexes)
-
-        for year in list(fossil_emission_factor.index):
-            cumul_em = 0
-            generic_discounted_cumul_em = 0
-            for i in range(year, year + int(plant_lifespan)):
-                if i < (self.end_year + 1):
-                    cumul_em += fossil_emission_factor[i]
-
-                    # discounting emissions for non-hotelling scc
-                    generic_discounted_cumul_em += (
-                        fossil_emission_factor[i]
-                        * exogenous_carbon_price_trajectory[i]
-                        / exogenous_carbon_price_trajectory[year]
-                        / (1 + social_discount_rate) ** (i - year)
-                    )
-
-                else:
-                    cumul_em += fossil_emission_factor[self.end_year]
-                    # discounting emissions for non-hotelling scc, keep last year scc growth rate as future scc growth rate
-                    future_scc_growth = (
-                        exogenous_carbon_price_trajectory[self.end_year]
-                        / exogenous_carbon_price_trajectory[self.end_year - 1]
-                    )
-
-                    generic_discounted_cumul_em += (
-                        fossil_emission_factor[self.end_year]
-                        * (
-                            exogenous_carbon_price_trajectory[self.end_year]
-                            / exogenous_carbon_price_trajectory[year]
-                            * (future_scc_growth) ** (i - self.end_year)
-                        )
-                        / (1 + social_discount_rate) ** (i - year)
-                    )
-
-            specific_em[year] = cumul_em
-            generic_discounted_specific_em[year] = generic_discounted_cumul_em
+        vintages = fossil_emission_factor.index.to_numpy()
+        lifespan = int(plant_lifespan)
+        # Emission factor of each operating year, held at its end year value beyond end_year
+        emission_factor = _values_at_years(
+            fossil_emission_factor,
+            np.minimum(vintages[:, None] + np.arange(lifespan), self.end_year),
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # discounting emissions for non-hotelling scc, keep last year scc growth rate as future scc growth rate
+            carbon_value = carbon_value_factors(
+                exogenous_carbon_price_trajectory,
+                social_discount_rate,
+                vintages,
+                lifespan,
+                self.end_year,
+            )
+        specific_em = pd.Series(emission_factor.sum(axis=1), fossil_emission_factor.index)
+        generic_discounted_specific_em = pd.Series(
+            (emission_factor * carbon_value).sum(axis=1), fossil_emission_factor.index
+        )
         return (specific_em, generic_discounted_specific_em)
 
     def _unit_discounted_cumul_costs(
@@ -334,24 +316,16 @@ class ReferenceAbatementCost(AeroMAPSModel):
         plant_lifespan: float,
         social_discount_rate: float,
     ) -> pd.Series:
-        # Constants:
-
-        indexes = kerosene_market_price.index
-
-        specific_cost = pd.Series(np.nan, indexes)
-
-        for year in list(kerosene_market_price.index):
-            discounted_cumul_cost = 0
-            for i in range(year, year + int(plant_lifespan)):
-                if i < (self.end_year + 1):
-                    discounted_cumul_cost += (kerosene_market_price[i]) / (
-                        1 + social_discount_rate
-                    ) ** (i - year)
-
-                else:
-                    discounted_cumul_cost += (kerosene_market_price[self.end_year]) / (
-                        1 + social_discount_rate
-                    ) ** (i - year)
-            specific_cost[year] = discounted_cumul_cost
+        vintages = kerosene_market_price.index.to_numpy()
+        lifespan = int(plant_lifespan)
+        # Market price of each operating year, held at its end year value beyond end_year
+        market_price = _values_at_years(
+            kerosene_market_price,
+            np.minimum(vintages[:, None] + np.arange(lifespan), self.end_year),
+        )
+        specific_cost = pd.Series(
+            (market_price / compound_factors(social_discount_rate, lifespan)).sum(axis=1),
+            kerosene_market_price.index,
+        )
 
         return specific_cost
@@ -11,7 +11,13 @@ import numpy as np
 import pandas as pd
 
 from aeromaps.models.base import AeroMAPSModel
-from aeromaps.utils.functions import _get_value_for_year, _custom_series_addition
+from aeromaps.utils.discounting import compound_factors, levelised_capital_factors
+from aeromaps.utils.functions import (
+    _custom_series_addition,
+    _get_values_for_years,
+    _nan_add,
+    _nan_sum,
+)
 
 
 class BottomUpCost(AeroMAPSModel):
@@ -249,28 +255,16 @@ class BottomUpCost(AeroMAPSModel):
         # Prepare outputs
         output_data = {k: optional_nan_series.copy() for k in self.output_names}
 
-        # First lets compute the core mfsp
-        for year, needed_capacity in energy_production_commissioned.items():
-            # Get the technical inputs
-            private_discount_rate = _get_value_for_year(
-                input_data.get("private_discount_rate"), year, 0.0
-            )
-            lifespan = _get_value_for_year(
-                input_data.get(f"{self.pathway_name}_eis_plant_lifespan"), year, 25
-            )
-            construction_time = _get_value_for_year(
-                input_data.get(f"{self.pathway_name}_eis_construction_time"), year, 3
-            )
-            plant_load_factor = _get_value_for_year(
-                input_data.get(f"{self.pathway_name}_eis_plant_load_factor"), year, 1
-            )
-
-            # plant production is potentially evaluated beyond scenario end year
-            vintage_indexes = range(year, year + lifespan)
-            vintage_mfsp = pd.Series(np.nan, index=vintage_indexes)
+        # Commissioning years (vintages) for which plants are costed
+        vintages = energy_production_commissioned.index.to_numpy()
+        needed_capacity = energy_production_commissioned.to_numpy(dtype=float)
+        vintage_energy_consumption = energy_consumption.reindex(vintages).to_numpy(dtype=float)
+        for year, capacity, consumption in zip(
+            vintages, needed_capacity, vintage_energy_consumption
+        ):
             if (
-                energy_consumption[year] > 0
-                and needed_capacity <= 0
+                consumption > 0
+                and capacity <= 0
                 and self.compute_abatement_cost
                 and not self.compute_all_years
             ):
@@ -278,356 +272,22 @@ class BottomUpCost(AeroMAPSModel):
                     f"\n⚠️ For {self.pathway_name}, no plants commissioned in {year}. Unable to compute "
                     f"CAC: compute_all_years = False. Set it true to avoid NaN values in the MACC for this year."
                 )
-            if needed_capacity > 0 or self.compute_all_years:
-                if needed_capacity < 0:
-                    warnings.warn(
-                        f"Negative needed capacity for {self.pathway_name} in year {year}. "
-                        "This is not expected despite the compute_all_years option being set to True."
-                    )
-                # relative contibution of the vintage
-                relative_share = needed_capacity / (energy_consumption + energy_unused)
-
-                relative_share = relative_share.loc[year : year + lifespan - 1]
-
-                # I -- First lets compute the core MFSP (no resources, no processes)
-                # Get the inputs for the year
-                capex = _get_value_for_year(
-                    input_data.get(f"{self.pathway_name}_eis_capex"), year, 0.0
-                )
-
-                # get the plant load factor for the year: minimum of plant load factor and resource load factors
-                # TODO what shall we do with processes LF? Uncoupling core and processes make sense in many cases.
-                main_process_load_factor = plant_load_factor
-                for key in input_data.get(f"{self.pathway_name}_resource_names", []):
-                    if f"{key}_load_factor" in input_data:
-                        resource_load_factor = _get_value_for_year(
-                            input_data.get(f"{key}_load_factor"), year, 1.0
-                        )
-                        if resource_load_factor is not None:
-                            main_process_load_factor = min(
-                                main_process_load_factor, resource_load_factor
-                            )
-
-                # Compute the capital cost per unit of energy produced. Capex in €/(MJ/Year), mfsp capex in €/MJ
-                mfsp_capex = (
-                    self._spread_capital(capex, private_discount_rate, lifespan, construction_time)
-                    / main_process_load_factor
-                )
-
-                capex_year = capex * needed_capacity
-                output_data[f"{self.pathway_name}_capex_cost"].loc[
-                    year - construction_time : year
-                ] = _custom_series_addition(
-                    output_data[f"{self.pathway_name}_capex_cost"].loc[
-                        year - construction_time : year
-                    ],
-                    capex_year / construction_time / main_process_load_factor,
-                )
-
-                output_data[f"{self.pathway_name}_mean_unit_capex"].loc[
-                    year : year + lifespan - 1
-                ] = _custom_series_addition(
-                    output_data[f"{self.pathway_name}_mean_unit_capex"].loc[
-                        year : year + lifespan - 1
-                    ],
-                    mfsp_capex * relative_share,
-                )
-
-                # compyte the EIS unitary capex
-                output_data[f"{self.pathway_name}_vintage_unit_capex"].loc[year] = mfsp_capex
-
-                # As var opex is in € per MJ we can directly get it
-                variable_opex = _get_value_for_year(
-                    input_data.get(f"{self.pathway_name}_eis_variable_opex"), year, 0.0
-                )
-                output_data[f"{self.pathway_name}_mean_unit_variable_opex"].loc[
-                    year : year + lifespan - 1
-                ] = _custom_series_addition(
-                    output_data[f"{self.pathway_name}_mean_unit_variable_opex"].loc[
-                        year : year + lifespan - 1
-                    ],
-                    variable_opex * relative_share,
-                )
-
-                # compyte the EIS variable opex --> No need, directly from input eis_variable_opex
-                output_data[f"{self.pathway_name}_vintage_unit_variable_opex"].loc[year] = (
-                    variable_opex
-                )
-
-                # As fixed opex is in €/year for a plant of 1 MJ/year, we can directly get it in €/MJ
-                fixed_opex = (
-                    _get_value_for_year(
-                        input_data.get(f"{self.pathway_name}_eis_fixed_opex"), year, 0.0
-                    )
-                    / main_process_load_factor
-                )
-                output_data[f"{self.pathway_name}_mean_unit_fixed_opex"].loc[
-                    year : year + lifespan - 1
-                ] = _custom_series_addition(
-                    output_data[f"{self.pathway_name}_mean_unit_fixed_opex"].loc[
-                        year : year + lifespan - 1
-                    ],
-                    fixed_opex * relative_share,
-                )
-
-                # compyte the EIS fixed opex
-                output_data[f"{self.pathway_name}_vintage_unit_fixed_opex"].loc[year] = fixed_opex
-
-                vintage_mfsp = _custom_series_addition(
-                    vintage_mfsp, mfsp_capex + fixed_opex + variable_opex
-                )
-
-                output_data[f"{self.pathway_name}_mean_mfsp_without_resource"].loc[
-                    year : year + lifespan - 1
-                ] = _custom_series_addition(
-                    output_data[f"{self.pathway_name}_mean_mfsp_without_resource"].loc[
-                        year : year + lifespan - 1
-                    ],
-                    vintage_mfsp * relative_share,
-                )
-
-                # II -- Now lets get the resources as in TopDownCost model
-                for key in self.resource_keys:
-                    # get the specific consumption of the resource
-                    specific_consumption = _get_value_for_year(
-                        input_data.get(
-                            f"{self.pathway_name}_eis_resource_specific_consumption_{key}"
-                        ),
-                        year,
-                        None,
-                    )
-
-                    if specific_consumption is not None:
-                        resource_price = input_data.get(f"{key}_cost", optional_nan_series.copy())
-
-                        # cast mfsp_resource to a series with the same index as
-                        # vintage_mfsp by keeping correct values (<end year) extending last year value to the end of the vintage_mfsp
-                        mfsp_resource = pd.Series(
-                            [
-                                resource_price[year] * specific_consumption
-                                if year <= self.end_year and year in resource_price.index
-                                else resource_price.iloc[-1] * specific_consumption
-                                for year in vintage_mfsp.index
-                            ],
-                            index=vintage_mfsp.index,
-                        )
-
-                        vintage_mfsp = _custom_series_addition(vintage_mfsp, mfsp_resource)
-
-                        # Store the resource cost in the output data
-                        output_data[
-                            f"{self.pathway_name}_excluding_processes_{key}_mean_unit_cost"
-                        ].loc[year : year + lifespan - 1] = _custom_series_addition(
-                            output_data[
-                                f"{self.pathway_name}_excluding_processes_{key}_mean_unit_cost"
-                            ].loc[year : year + lifespan - 1],
-                            mfsp_resource * relative_share,
-                        )
-
-                        # compyte the EIS resource cost (at first year energy cost)
-                        output_data[
-                            f"{self.pathway_name}_excluding_processes_{key}_vintage_unit_cost"
-                        ].loc[year] = mfsp_resource[year]
-
-                    # get processes that use this resource
-                    for process_key in self.process_keys:
-                        specific_consumption = _get_value_for_year(
-                            input_data.get(
-                                f"{process_key}_eis_resource_specific_consumption_{key}"
-                            ),
-                            year,
-                            None,
-                        )
-
-                        if specific_consumption is not None:
-                            process_ressource_price = input_data.get(
-                                f"{key}_cost", optional_nan_series.copy()
-                            )
-                            # cast mfsp_resource to a series with the same index as
-                            # vintage_mfsp by keeping correct values (<end year) extending last year value to the end of the vintage_mfsp
-                            mfsp_process_ressource = pd.Series(
-                                [
-                                    process_ressource_price[year] * specific_consumption
-                                    if year <= self.end_year
-                                    and year in process_ressource_price.index
-                                    else process_ressource_price.iloc[-1] * specific_consumption
-                                    for year in vintage_mfsp.index
-                                ],
-                                index=vintage_mfsp.index,
-                            )
-
-                            vintage_mfsp = _custom_series_addition(
-                                vintage_mfsp, mfsp_process_ressource
-                            )
-
-                            # Store the resource cost in the output data
-                            output_data[
-                                f"{self.pathway_name}_{process_key}_{key}_mean_unit_cost"
-                            ].loc[year : year + lifespan - 1] = _custom_series_addition(
-                                output_data[
-                                    f"{self.pathway_name}_{process_key}_{key}_mean_unit_cost"
-                                ].loc[year : year + lifespan - 1],
-                                mfsp_process_ressource * relative_share,
-                            )
-
-                            # compyte the EIS resource cost (at first year energy cost)
-                            output_data[
-                                f"{self.pathway_name}_{process_key}_{key}_vintage_unit_cost"
-                            ].loc[year] = mfsp_process_ressource[year]
-
-                # III -- Now lets get the processes
-                for process_key in self.process_keys:
-                    process_capex = _get_value_for_year(
-                        input_data.get(f"{process_key}_eis_capex"), year, 0.0
-                    )
-                    process_lifespan = _get_value_for_year(
-                        input_data.get(f"{process_key}_eis_plant_lifespan"), year, 25
-                    )
-                    process_construction_time = _get_value_for_year(
-                        input_data.get(f"{process_key}_eis_construction_time"), year, 3.0
-                    )
-                    process_load_factor = _get_value_for_year(
-                        input_data.get(f"{process_key}_eis_plant_load_factor"), year, 1.0
-                    )
-                    # get the process load factor for the year: minimum of process load factor and resource load factors
-                    for key in input_data.get(f"{process_key}_resource_names", []):
-                        if f"{key}_load_factor" in input_data:
-                            resource_load_factor = _get_value_for_year(
-                                input_data.get(f"{key}_load_factor"), year, 1.0
-                            )
-                            if resource_load_factor is not None:
-                                process_load_factor = min(process_load_factor, resource_load_factor)
-                    # Compute the capital cost per unit of energy produced for the process
-                    mfsp_capex_process = (
-                        self._spread_capital(
-                            process_capex,
-                            private_discount_rate,
-                            process_lifespan,
-                            process_construction_time,
-                        )
-                        / process_load_factor
-                    )
-
-                    output_data[f"{self.pathway_name}_{process_key}_capex_cost"].loc[
-                        year - process_construction_time : year
-                    ] = _custom_series_addition(
-                        output_data[f"{self.pathway_name}_{process_key}_capex_cost"].loc[
-                            year - process_construction_time : year
-                        ],
-                        process_capex * needed_capacity / construction_time / process_load_factor,
-                    )
-
-                    # Get the variable and fixed opex for the process
-                    variable_opex_process = _get_value_for_year(
-                        input_data.get(f"{process_key}_eis_variable_opex"),
-                        year,
-                        0.0,
-                    )
-                    fixed_opex_process = (
-                        _get_value_for_year(
-                            input_data.get(f"{process_key}_eis_fixed_opex"),
-                            year,
-                            0.0,
-                        )
-                        / process_load_factor
-                    )
-                    # Compute the MFSP for the process
-                    mfsp_process = mfsp_capex_process + variable_opex_process + fixed_opex_process
-                    # Add the MFSP for the process to the pathway MFSP
-                    vintage_mfsp = _custom_series_addition(vintage_mfsp, mfsp_process)
-                    # Store the process cost in the output data
-                    output_data[
-                        f"{self.pathway_name}_{process_key}_mean_unit_cost_without_resources"
-                    ].loc[year : year + process_lifespan] = _custom_series_addition(
-                        output_data[
-                            f"{self.pathway_name}_{process_key}_mean_unit_cost_without_resources"
-                        ].loc[year : year + process_lifespan],
-                        mfsp_process * relative_share,
-                    )
-                    output_data[f"{self.pathway_name}_{process_key}_mean_unit_capex"].loc[
-                        year : year + lifespan - 1
-                    ] = _custom_series_addition(
-                        output_data[f"{self.pathway_name}_{process_key}_mean_unit_capex"].loc[
-                            year : year + lifespan - 1
-                        ],
-                        mfsp_capex_process * relative_share,
-                    )
-                    # compyte the EIS unitary capex
-                    output_data[f"{self.pathway_name}_{process_key}_vintage_unit_capex"].loc[
-                        year
-                    ] = mfsp_capex_process
-
-                    output_data[f"{self.pathway_name}_{process_key}_mean_unit_fixed_opex"].loc[
-                        year : year + lifespan - 1
-                    ] = _custom_series_addition(
-                        output_data[f"{self.pathway_name}_{process_key}_mean_unit_fixed_opex"].loc[
-                            year : year + lifespan - 1
-                        ],
-                        fixed_opex_process * relative_share,
-                    )
-                    # compyte the EIS fixed opex
-                    output_data[f"{self.pathway_name}_{process_key}_vintage_unit_fixed_opex"].loc[
-                        year
-                    ] = fixed_opex_process
-
-                    output_data[f"{self.pathway_name}_{process_key}_mean_unit_variable_opex"].loc[
-                        year : year + lifespan - 1
-                    ] = _custom_series_addition(
-                        output_data[
-                            f"{self.pathway_name}_{process_key}_mean_unit_variable_opex"
-                        ].loc[year : year + lifespan - 1],
-                        variable_opex_process * relative_share,
-                    )
-
-                    # compyte the EIS variable opex
-                    output_data[
-                        f"{self.pathway_name}_{process_key}_vintage_unit_variable_opex"
-                    ].loc[year] = variable_opex_process
-
-                output_data[f"{self.pathway_name}_mean_mfsp"].loc[year : year + lifespan - 1] = (
-                    _custom_series_addition(
-                        output_data[f"{self.pathway_name}_mean_mfsp"].loc[
-                            year : year + lifespan - 1
-                        ],
-                        vintage_mfsp * relative_share,
-                    )
-                )
-
-                # marginal mfsp: is the new vintage the marginal one at some point of the scenario?
-                # Slice the relevant part
-                target = output_data[f"{self.pathway_name}_marginal_mfsp"].loc[
-                    year : year + lifespan - 1
-                ]
-                # Find common indices
-                common_index = target.index.intersection(vintage_mfsp.index)
-                # Align both Series
-                target_common = target.loc[common_index]
-                vintage_common = vintage_mfsp.loc[common_index]
-                # Build mask:
-                # (1) vintage > target
-                # (2) or target is NaN and vintage is not NaN
-                mask = (vintage_common > target_common) | (
-                    target_common.isna() & vintage_common.notna()
-                )
-                # Apply the update
-                output_data[f"{self.pathway_name}_marginal_mfsp"].loc[common_index] = (
-                    target_common.where(~mask, vintage_common)
+            if capacity < 0 and self.compute_all_years:
+                warnings.warn(
+                    f"Negative needed capacity for {self.pathway_name} in year {year}. "
+                    "This is not expected despite the compute_all_years option being set to True."
                 )
 
-                # compute discounted costs if necessary
-                if self.compute_abatement_cost:
-                    if vintage_mfsp.notna().any():
-                        discounted_mfsp = self._unitary_cumulative_discounted_costs_vintage(
-                            mfsp_series=vintage_mfsp,
-                            year=year,
-                            plant_lifespan=lifespan,
-                            discount_rate=input_data["social_discount_rate"],
-                        )
-                    else:
-                        discounted_mfsp = np.NaN
-                    output_data[f"{self.pathway_name}_lifespan_unitary_discounted_costs"][year] = (
-                        discounted_mfsp
-                    )
+        costed = (needed_capacity > 0) | self.compute_all_years
+        if costed.any():
+            self._compute_vintage_costs(
+                input_data,
+                output_data,
+                vintages[costed],
+                needed_capacity[costed],
+                energy_consumption + energy_unused,
+                optional_nan_series,
+            )
 
         ### STEP 2: add taxes and subsidies like in TopDownCost model
         # Only pathway subsidies and taxes are considered here, not resources or processes taxes
@@ -689,56 +349,282 @@ class BottomUpCost(AeroMAPSModel):
 
         return output_data
 
-    def _spread_capital(
+    def _compute_vintage_costs(
         self,
-        capex,
-        private_discount_rate,
-        lifespan,
-        construction_time,
+        input_data,
+        output_data,
+        vintages,
+        needed_capacity,
+        energy_production,
+        optional_nan_series,
     ):
         """
-        This function computes the capex share of the MFSP for a given plant, based on the inputs provided.
+        Compute the vintage and mean cost components of the costed plants, in place in output_data.
+
+        Costs are laid out on a vintage × operating-year matrix. Each vintage (row) gets the
+        characteristics of its commissioning year and operates over its lifespan, possibly beyond
+        the scenario end year. Mean costs are the column sums of the vintage costs weighted by the
+        share of each vintage in the annual production; NaN terms are ignored.
+
+        Parameters
+        ----------
+        input_data
+            Dictionary containing all input data required for the computation.
+        output_data
+            Dictionary of output series, updated in place.
+        vintages
+            Commissioning years of the costed plants.
+        needed_capacity
+            Energy production commissioned for each vintage [MJ/year].
+        energy_production
+            Annual energy production of the pathway, consumed and unused [MJ].
+        optional_nan_series
+            NaN series on the scenario years, default for missing resource prices.
         """
-        if private_discount_rate != 0:
-            term = 1 / (1 + private_discount_rate)
-
-            # Construction of the facility
-            # The construction is supposed to span over x years, with a uniform cost repartition
-            # NPV of the capital cost is now calculated as a geometric series instead of a loop
-            # (possible as uniform cost repartition)
-            capital_cost_npv = (
-                capex / construction_time * (1 - term**construction_time) / (1 - term)
+        pathway_name = self.pathway_name
+
+        def vintage_values(name, default):
+            return _get_values_for_years(input_data.get(name), vintages, default)
+
+        # Get the technical inputs
+        private_discount_rate = vintage_values("private_discount_rate", 0.0)
+        lifespan = vintage_values(f"{pathway_name}_eis_plant_lifespan", 25)
+        construction_time = vintage_values(f"{pathway_name}_eis_construction_time", 3)
+        # get the plant load factor for the year: minimum of plant load factor and resource load factors
+        # TODO what shall we do with processes LF? Uncoupling core and processes make sense in many cases.
+        main_process_load_factor = self._resource_limited_load_factor(
+            vintage_values(f"{pathway_name}_eis_plant_load_factor", 1),
+            input_data,
+            input_data.get(f"{pathway_name}_resource_names", []),
+            vintages,
+        )
+
+        # Vintage × operating-year grid. Plant production is potentially evaluated beyond
+        # scenario end year, the first n_years columns are the scenario years.
+        n_years = len(optional_nan_series)
+        years = np.arange(
+            self.historic_start_year, max(self.end_year, int(np.max(vintages + lifespan)) - 1) + 1
+        )
+        ages = years[None, :] - vintages[:, None]
+        operating = (ages >= 0) & (ages < lifespan[:, None])
+
+        # relative contibution of the vintage
+        with np.errstate(divide="ignore", invalid="ignore"):
+            relative_share = np.where(
+                operating,
+                needed_capacity[:, None]
+                / energy_production.reindex(years).to_numpy(dtype=float)[None, :],
+                np.nan,
             )
 
-            # Npv of the unitary production for the whole lifespan obtained by sum of geometric series
-            # (possible as constant production)
-            total_actualised_production = (
-                term**construction_time * (1 - term**lifespan) / (1 - term)
+        def store_mean(name, vintage_cost):
+            # Production-weighted sum of the vintage costs, per scenario year
+            if vintage_cost.ndim == 1:
+                vintage_cost = vintage_cost[:, None]
+            weighted_cost = vintage_cost * relative_share
+            output_data[name] = pd.Series(
+                _nan_sum(weighted_cost[:, :n_years]), index=optional_nan_series.index
             )
 
-            capital_cost_lc = capital_cost_npv / total_actualised_production
+        def store_vintage(name, vintage_cost):
+            output_data[name].loc[vintages] = vintage_cost
 
-        else:
-            # unit production
-            capital_cost_lc = capex / lifespan
+        def store_construction_cost(name, construction_duration, yearly_cost):
+            # Capital expenditure from commissioning year - construction duration to commissioning year
+            lags = vintages[:, None] - optional_nan_series.index.to_numpy()[None, :]
+            spending = (lags >= 0) & (lags <= construction_duration[:, None])
+            output_data[name] = pd.Series(
+                _nan_sum(np.where(spending, yearly_cost[:, None], np.nan)),
+                index=optional_nan_series.index,
+            )
 
-        return capital_cost_lc
+        def resource_cost(price, specific_consumption):
+            # Resource price at each operating year, extending the last price beyond the
+            # scenario end year
+            known = np.isin(years, price.index) & (years <= self.end_year)
+            price = np.where(known, price.reindex(years).to_numpy(dtype=float), price.iloc[-1])
+            return np.where(operating, price[None, :] * specific_consumption[:, None], np.nan)
 
-    def _unitary_cumulative_discounted_costs_vintage(
-        self,
-        mfsp_series,
-        year,
-        plant_lifespan,
-        discount_rate,
+        # I -- First lets compute the core MFSP (no resources, no processes)
+        capex = vintage_values(f"{pathway_name}_eis_capex", 0.0)
+
+        # Compute the capital cost per unit of energy produced. Capex in €/(MJ/Year), mfsp capex in €/MJ
+        mfsp_capex = (
+            self._spread_capital(capex, private_discount_rate, lifespan, construction_time)
+            / main_process_load_factor
+        )
+        store_construction_cost(
+            f"{pathway_name}_capex_cost",
+            construction_time,
+            capex * needed_capacity / construction_time / main_process_load_factor,
+        )
+        store_mean(f"{pathway_name}_mean_unit_capex", mfsp_capex)
+        store_vintage(f"{pathway_name}_vintage_unit_capex", mfsp_capex)
+
+        # As var opex is in € per MJ we can directly get it
+        variable_opex = vintage_values(f"{pathway_name}_eis_variable_opex", 0.0)
+        store_mean(f"{pathway_name}_mean_unit_variable_opex", variable_opex)
+        store_vintage(f"{pathway_name}_vintage_unit_variable_opex", variable_opex)
+
+        # As fixed opex is in €/year for a plant of 1 MJ/year, we can directly get it in €/MJ
+        fixed_opex = (
+            vintage_values(f"{pathway_name}_eis_fixed_opex", 0.0) / main_process_load_factor
+        )
+        store_mean(f"{pathway_name}_mean_unit_fixed_opex", fixed_opex)
+        store_vintage(f"{pathway_name}_vintage_unit_fixed_opex", fixed_opex)
+
+        vintage_mfsp = np.where(
+            operating, (mfsp_capex + fixed_opex + variable_opex)[:, None], np.nan
+        )
+        store_mean(f"{pathway_name}_mean_mfsp_without_resource", vintage_mfsp)
+
+        # II -- Now lets get the resources as in TopDownCost model
+        vintage_indexes = vintages - years[0]
+        for key in self.resource_keys:
+            consumption_name = f"{pathway_name}_eis_resource_specific_consumption_{key}"
+            if consumption_name in input_data:
+                mfsp_resource = resource_cost(
+                    input_data.get(f"{key}_cost", optional_nan_series.copy()),
+                    vintage_values(consumption_name, None),
+                )
+                vintage_mfsp = _nan_add(vintage_mfsp, mfsp_resource)
+
+                # Store the resource cost in the output data, vintage at first year energy cost
+                store_mean(
+                    f"{pathway_name}_excluding_processes_{key}_mean_unit_cost", mfsp_resource
+                )
+                store_vintage(
+                    f"{pathway_name}_excluding_processes_{key}_vintage_unit_cost",
+                    mfsp_resource[np.arange(len(vintages)), vintage_indexes],
+                )
+
+            # get processes that use this resource
+            for process_key in self.process_keys:
+                consumption_name = f"{process_key}_eis_resource_specific_consumption_{key}"
+                if consumption_name in input_data:
+                    mfsp_process_ressource = resource_cost(
+                        input_data.get(f"{key}_cost", optional_nan_series.copy()),
+                        vintage_values(consumption_name, None),
+                    )
+                    vintage_mfsp = _nan_add(vintage_mfsp, mfsp_process_ressource)
+
+                    store_mean(
+                        f"{pathway_name}_{process_key}_{key}_mean_unit_cost",
+                        mfsp_process_ressource,
+                    )
+                    store_vintage(
+                        f"{pathway_name}_{process_key}_{key}_vintage_unit_cost",
+                        mfsp_process_ressource[np.arange(len(vintages)), vintage_indexes],
+                    )
+
+        # III -- Now lets get the processes
+        for process_key in self.process_keys:
+            process_capex = vintage_values(f"{process_key}_eis_capex", 0.0)
+            process_lifespan = vintage_values(f"{process_key}_eis_plant_lifespan", 25)
+            process_construction_time = vintage_values(f"{process_key}_eis_construction_time", 3.0)
+            # get the process load factor for the year: minimum of process load factor and resource load factors
+            process_load_factor = self._resource_limited_load_factor(
+                vintage_values(f"{process_key}_eis_plant_load_factor", 1.0),
+                input_data,
+                input_data.get(f"{process_key}_resource_names", []),
+                vintages,
+            )
+            # Compute the capital cost per unit of energy produced for the process
+            mfsp_capex_process = (
+                self._spread_capital(
+                    process_capex,
+                    private_discount_rate,
+                    process_lifespan,
+                    process_construction_time,
+                )
+                / process_load_factor
+            )
+            store_construction_cost(
+                f"{pathway_name}_{process_key}_capex_cost",
+                process_construction_time,
+                process_capex * needed_capacity / construction_time / process_load_factor,
+            )
+
+            # Get the variable and fixed opex for the process
+            variable_opex_process = vintage_values(f"{process_key}_eis_variable_opex", 0.0)
+            fixed_opex_process = (
+                vintage_values(f"{process_key}_eis_fixed_opex", 0.0) / process_load_factor
+            )
+            # Compute the MFSP for the process and add it to the pathway MFSP
+            mfsp_process = mfsp_capex_process + variable_opex_process + fixed_opex_process
+            vintage_mfsp = np.where(
+                operating,
+                np.where(
+                    np.isnan(vintage_mfsp),
+                    mfsp_process[:, None],
+                    vintage_mfsp + mfsp_process[:, None],
+                ),
+                np.nan,
+            )
+            # Store the process cost in the output data, the process cost runs over the process
+            # lifespan (end year included) within the plant operation
+            store_mean(
+                f"{pathway_name}_{process_key}_mean_unit_cost_without_resources",
+                np.where(ages <= process_lifespan[:, None], mfsp_process[:, None], np.nan),
+            )
+            store_mean(f"{pathway_name}_{process_key}_mean_unit_capex", mfsp_capex_process)
+            store_vintage(f"{pathway_name}_{process_key}_vintage_unit_capex", mfsp_capex_process)
+            store_mean(f"{pathway_name}_{process_key}_mean_unit_fixed_opex", fixed_opex_process)
+            store_vintage(
+                f"{pathway_name}_{process_key}_vintage_unit_fixed_opex", fixed_opex_process
+            )
+            store_mean(
+                f"{pathway_name}_{process_key}_mean_unit_variable_opex", variable_opex_process
+            )
+            store_vintage(
+                f"{pathway_name}_{process_key}_vintage_unit_variable_opex", variable_opex_process
+            )
+
+        store_mean(f"{pathway_name}_mean_mfsp", vintage_mfsp)
+
+        # marginal mfsp: highest mfsp of the vintages operating each year
+        output_data[f"{pathway_name}_marginal_mfsp"] = pd.Series(
+            np.fmax.reduce(vintage_mfsp[:, :n_years], axis=0), index=optional_nan_series.index
+        )
+
+        # compute discounted costs if necessary
+        if self.compute_abatement_cost:
+            operating_ages = np.where(operating, ages, 0)
+            discount = compound_factors(
+                input_data["social_discount_rate"], int(operating_ages.max()) + 1
+            )[operating_ages]
+            discounted_mfsp = np.sum(np.where(operating, vintage_mfsp / discount, 0.0), axis=1)
+            store_vintage(
+                f"{pathway_name}_lifespan_unitary_discounted_costs",
+                np.where(np.isnan(vintage_mfsp).all(axis=1), np.nan, discounted_mfsp),
+            )
+
+    @staticmethod
+    def _resource_limited_load_factor(load_factor, input_data, resource_names, vintages):
+        """
+        Minimum of the plant load factor and of the load factors of its resources, per vintage.
+        """
+        for key in resource_names:
+            if f"{key}_load_factor" in input_data:
+                resource_load_factor = _get_values_for_years(
+                    input_data.get(f"{key}_load_factor"), vintages, 1.0
+                )
+                load_factor = np.where(
+                    resource_load_factor < load_factor, resource_load_factor, load_factor
+                )
+        return load_factor
+
+    @staticmethod
+    def _spread_capital(
+        capex,
+        private_discount_rate,
+        lifespan,
+        construction_time,
     ):
         """
-        Compute the discounted MFSP for a given vintage over its lifespan.
+        This function computes the capex share of the MFSP for a given plant, based on the inputs provided.
+        Inputs can be scalars or arrays of vintage values.
         """
-        discounted_cumul_cost = 0.0
-        for i in range(year, year + int(plant_lifespan)):
-            if i <= self.end_year:
-                cost = mfsp_series[i] if i in mfsp_series.index else mfsp_series.iloc[-1]
-            else:
-                cost = mfsp_series.iloc[-1]
-            discounted_cumul_cost += cost / ((1 + discount_rate) ** (i - year))
-        return discounted_cumul_cost
+        # The construction is supposed to span over x years, with a uniform cost repartition,
+        # followed by a constant production over the lifespan
+        return capex * levelised_capital_factors(private_discount_rate, lifespan, construction_time)
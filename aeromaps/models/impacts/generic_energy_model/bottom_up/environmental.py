@@ -11,7 +11,8 @@ import numpy as np
 import pandas as pd
 
 from aeromaps.models.base import AeroMAPSModel
-from aeromaps.utils.functions import _get_value_for_year, _custom_series_addition
+from aeromaps.utils.discounting import carbon_value_factors
+from aeromaps.utils.functions import _get_values_for_years, _nan_add, _nan_sum
 
 
 class BottomUpEnvironmental(AeroMAPSModel):
@@ -216,19 +217,16 @@ class BottomUpEnvironmental(AeroMAPSModel):
         # Prepare outputs
         output_data = {k: optional_nan_series.copy() for k in self.output_names}
 
-        co2_emission_factor = optional_nan_series.copy()
-
-        # For each vintage, compute its emission factor and contribution
-        for year, needed_capacity in energy_production_commissioned.items():
-            lifespan = _get_value_for_year(
-                input_data.get(f"{self.pathway_name}_eis_plant_lifespan"), year, 25
-            )
-            # The plant will operate from year to year+lifespan (or until end_year)
-            vintage_indexes = range(year, year + lifespan)
-            vintage_emission_factor = pd.Series(np.nan, index=vintage_indexes)
+        # Commissioning years (vintages) for which plant emissions are computed
+        vintages = energy_production_commissioned.index.to_numpy()
+        needed_capacity = energy_production_commissioned.to_numpy(dtype=float)
+        vintage_energy_consumption = energy_consumption.reindex(vintages).to_numpy(dtype=float)
+        for year, capacity, consumption in zip(
+            vintages, needed_capacity, vintage_energy_consumption
+        ):
             if (
-                energy_consumption[year] > 0
-                and needed_capacity <= 0
+                consumption > 0
+                and capacity <= 0
                 and self.compute_abatement_cost
                 and not self.compute_all_years
             ):
@@ -236,276 +234,257 @@ class BottomUpEnvironmental(AeroMAPSModel):
                     f"\n⚠️ For {self.pathway_name}, no plants commissioned in {year}. Unable to compute "
                     f"CAC: compute_all_years = False. Set it true to avoid NaN values in the MACC for this year."
                 )
-            if needed_capacity > 0 or self.compute_all_years:
-                if needed_capacity < 0:
-                    warnings.warn(
-                        f"Negative needed capacity for {self.pathway_name} in year {year}. "
-                        "This is not expected despite the compute_all_years option being set to True."
-                    )
-                # relative contibution of the vintage
-                relative_share = needed_capacity / (energy_consumption + energy_unused)
-                relative_share = relative_share.loc[year : year + lifespan - 1]
-
-                # I -- First lets compute the core MFSP (no resources, no processes)
-                # Get the inputs for the year
-                core_emission_factor = _get_value_for_year(
-                    input_data.get(f"{self.pathway_name}_eis_co2_emission_factor_without_resource"),
-                    year,
-                    0.0,
-                )
-                kerosene_selectivity = _get_value_for_year(
-                    input_data.get(f"{self.pathway_name}_eis_kerosene_selectivity"), year, 1.0
+            if capacity < 0 and self.compute_all_years:
+                warnings.warn(
+                    f"Negative needed capacity for {self.pathway_name} in year {year}. "
+                    "This is not expected despite the compute_all_years option being set to True."
                 )
 
-                vintage_emission_factor = _custom_series_addition(
-                    vintage_emission_factor, core_emission_factor
-                )
-                output_data[f"{self.pathway_name}_mean_co2_emission_factor_without_resource"].loc[
-                    year : year + lifespan - 1
-                ] = _custom_series_addition(
-                    output_data[
-                        f"{self.pathway_name}_mean_co2_emission_factor_without_resource"
-                    ].loc[year : year + lifespan - 1],
-                    core_emission_factor * relative_share,
-                )
+        computed = (needed_capacity > 0) | self.compute_all_years
+        if computed.any():
+            self._compute_vintage_emissions(
+                input_data,
+                output_data,
+                vintages[computed],
+                needed_capacity[computed],
+                energy_consumption + energy_unused,
+                optional_nan_series,
+            )
 
-                # II) Now let's compute the emissions from resources that are linked to the pathway itself
-                for key in self.resource_keys:
-                    specific_consumption = _get_value_for_year(
-                        input_data.get(
-                            f"{self.pathway_name}_eis_resource_specific_consumption_{key}"
-                        ),
-                        year,
-                        None,
-                    )
+        # Compute the total emissions from the vintages
+        total_co2_emissions = (
+            energy_consumption * output_data[f"{self.pathway_name}_mean_co2_emission_factor"]
+        )
+        output_data[f"{self.pathway_name}_total_co2_emissions"] = total_co2_emissions
 
-                    total_ressource_consumption = optional_nan_series.copy()
-                    total_ressource_mobilised_with_selectivity = optional_nan_series.copy()
-
-                    if specific_consumption is not None:
-                        resources_consumption = (
-                            energy_production_commissioned[year] * specific_consumption
-                        )
-                        resources_consumption_with_selectivity = (
-                            resources_consumption * kerosene_selectivity
-                        )
-
-                        total_ressource_consumption.loc[year : year + lifespan - 1] = (
-                            resources_consumption
-                        )
-                        total_ressource_mobilised_with_selectivity.loc[
-                            year : year + lifespan - 1
-                        ] = resources_consumption_with_selectivity
-
-                        output_data[
-                            f"{self.pathway_name}_excluding_processes_{key}_total_consumption"
-                        ].loc[year : year + lifespan - 1] += resources_consumption
-                        output_data[
-                            f"{self.pathway_name}_excluding_processes_{key}_total_mobilised_with_selectivity"
-                        ].loc[year : year + lifespan - 1] += resources_consumption_with_selectivity
-
-                        # Get the CO2 emission factor for the resource
-                        unit_emissions = input_data.get(
-                            f"{key}_co2_emission_factor", optional_nan_series
-                        )
-                        # beyond sceanrio end year, we stick to last known value
-                        unit_emissions = unit_emissions.reindex(
-                            range(year, year + lifespan), method="ffill"
-                        )
-
-                        # get resource emission per unit of energy
-                        co2_emission_factor_ressource = specific_consumption * unit_emissions
-                        vintage_emission_factor = _custom_series_addition(
-                            vintage_emission_factor, co2_emission_factor_ressource
-                        )
-                        output_data[
-                            f"{self.pathway_name}_excluding_processes_{key}_mean_co2_emission_factor"
-                        ].loc[year : year + lifespan - 1] = _custom_series_addition(
-                            output_data[
-                                f"{self.pathway_name}_excluding_processes_{key}_mean_co2_emission_factor"
-                            ].loc[year : year + lifespan - 1],
-                            co2_emission_factor_ressource * relative_share,
-                        )
-                    # III) Now let's compute the emissions from processes that gets a ressource
-                    for process_key in self.process_keys:
-                        specific_consumption = _get_value_for_year(
-                            input_data.get(
-                                f"{process_key}_eis_resource_specific_consumption_{key}"
-                            ),
-                            year,
-                            None,
-                        )
-                        if specific_consumption is not None:
-                            resources_consumption = (
-                                energy_production_commissioned[year] * specific_consumption
-                            )
-                            resources_consumption_with_selectivity = (
-                                resources_consumption * kerosene_selectivity
-                            )
-
-                            total_ressource_consumption.loc[year : year + lifespan - 1] = (
-                                resources_consumption
-                            )
-                            total_ressource_mobilised_with_selectivity.loc[
-                                year : year + lifespan - 1
-                            ] = resources_consumption_with_selectivity
-
-                            output_data[
-                                f"{self.pathway_name}_{process_key}_{key}_total_consumption"
-                            ].loc[year : year + lifespan - 1] += resources_consumption
-                            output_data[
-                                f"{self.pathway_name}_{process_key}_{key}_total_mobilised_with_selectivity"
-                            ].loc[
-                                year : year + lifespan - 1
-                            ] += resources_consumption_with_selectivity
-
-                            # Get the CO2 emission factor for the resource
-                            unit_emissions = input_data.get(
-                                f"{key}_co2_emission_factor", optional_nan_series
-                            )
-                            # beyond sceanrio end year, we stick to last known value
-                            unit_emissions = unit_emissions.reindex(
-                                range(year, year + lifespan), method="ffill"
-                            )
-                            # get resource emission per unit of energy
-                            co2_emission_factor_ressource = specific_consumption * unit_emissions
-                            vintage_emission_factor = _custom_series_addition(
-                                vintage_emission_factor, co2_emission_factor_ressource
-                            )
-                            output_data[
-                                f"{self.pathway_name}_{process_key}_{key}_mean_co2_emission_factor"
-                            ].loc[year : year + lifespan - 1] = _custom_series_addition(
-                                output_data[
-                                    f"{self.pathway_name}_{process_key}_{key}_mean_co2_emission_factor"
-                                ].loc[year : year + lifespan - 1],
-                                co2_emission_factor_ressource * relative_share,
-                            )
-                    # store the total consumption of the resource
-                    output_data[f"{self.pathway_name}_{key}_total_consumption"].loc[
-                        year : year + lifespan - 1
-                    ] = _custom_series_addition(
-                        output_data[f"{self.pathway_name}_{key}_total_consumption"].loc[
-                            year : year + lifespan - 1
-                        ],
-                        total_ressource_consumption.loc[year : year + lifespan - 1],
-                    )
-                    output_data[f"{self.pathway_name}_{key}_total_mobilised_with_selectivity"].loc[
-                        year : year + lifespan - 1
-                    ] = _custom_series_addition(
-                        output_data[
-                            f"{self.pathway_name}_{key}_total_mobilised_with_selectivity"
-                        ].loc[year : year + lifespan - 1],
-                        total_ressource_mobilised_with_selectivity.loc[year : year + lifespan - 1],
-                    )
+        self._store_outputs(output_data)
+        return output_data
 
-                # IV) Now let's compute the emissions from processes themselves
-                for process_key in self.process_keys:
-                    # Get the inputs for the year
-                    process_emission_factor = _get_value_for_year(
-                        input_data.get(f"{process_key}_eis_co2_emission_factor_without_resources"),
-                        year,
-                        0.0,
-                    )
-                    vintage_emission_factor = _custom_series_addition(
-                        vintage_emission_factor, process_emission_factor
+    def _compute_vintage_emissions(
+        self,
+        input_data,
+        output_data,
+        vintages,
+        needed_capacity,
+        energy_production,
+        optional_nan_series,
+    ):
+        """
+        Compute the vintage and mean emission factors and resource consumptions of the plants, in place in output_data.
+
+        Emission factors are laid out on a vintage × operating-year matrix as in `BottomUpCost`.
+        Each vintage (row) gets the characteristics of its commissioning year and operates over its
+        lifespan, possibly beyond the scenario end year, resource emission factors being then kept
+        at their last known value. Mean emission factors are the column sums of the vintage
+        emission factors weighted by the share of each vintage in the annual production; NaN terms
+        are ignored.
+
+        Parameters
+        ----------
+        input_data
+            Dictionary containing all input data required for the computation.
+        output_data
+            Dictionary of output series, updated in place.
+        vintages
+            Commissioning years of the plants.
+        needed_capacity
+            Energy production commissioned for each vintage [MJ/year].
+        energy_production
+            Annual energy production of the pathway, consumed and unused [MJ].
+        optional_nan_series
+            NaN series on the scenario years, default for missing resource emission factors.
+        """
+        pathway_name = self.pathway_name
+
+        def vintage_values(name, default):
+            return _get_values_for_years(input_data.get(name), vintages, default)
+
+        lifespan = vintage_values(f"{pathway_name}_eis_plant_lifespan", 25)
+
+        # Vintage × operating-year grid, the first n_years columns are the scenario years
+        n_years = len(optional_nan_series)
+        years = np.arange(
+            self.historic_start_year, max(self.end_year, int(np.max(vintages + lifespan)) - 1) + 1
+        )
+        ages = years[None, :] - vintages[:, None]
+        operating = (ages >= 0) & (ages < lifespan[:, None])
+        commissioning = (np.arange(len(vintages)), vintages - years[0])
+
+        # relative contibution of the vintage
+        with np.errstate(divide="ignore", invalid="ignore"):
+            relative_share = np.where(
+                operating,
+                needed_capacity[:, None]
+                / energy_production.reindex(years).to_numpy(dtype=float)[None, :],
+                np.nan,
+            )
+
+        def store_mean(name, vintage_emission_factor):
+            # Production-weighted sum of the vintage emission factors, per scenario year
+            if vintage_emission_factor.ndim == 1:
+                vintage_emission_factor = vintage_emission_factor[:, None]
+            weighted_emission_factor = vintage_emission_factor * relative_share
+            output_data[name] = pd.Series(
+                _nan_sum(weighted_emission_factor[:, :n_years]), index=optional_nan_series.index
+            )
+
+        def store_operating_sum(name, vintage_value):
+            # Sum of the values of the vintages operating each scenario year
+            output_data[name] = pd.Series(
+                _nan_sum(np.where(operating, vintage_value[:, None], np.nan)[:, :n_years]),
+                index=optional_nan_series.index,
+            )
+
+        # I -- First lets compute the core emission factor (no resources, no processes)
+        core_emission_factor = vintage_values(
+            f"{pathway_name}_eis_co2_emission_factor_without_resource", 0.0
+        )
+        kerosene_selectivity = vintage_values(f"{pathway_name}_eis_kerosene_selectivity", 1.0)
+        vintage_emission_factor = np.where(operating, core_emission_factor[:, None], np.nan)
+        store_mean(
+            f"{pathway_name}_mean_co2_emission_factor_without_resource", core_emission_factor
+        )
+
+        # II -- Now let's compute the emissions from resources, used by the pathway itself or by its processes
+        for key in self.resource_keys:
+            # beyond scenario end year, we stick to last known value
+            unit_emissions = (
+                input_data.get(f"{key}_co2_emission_factor", optional_nan_series)
+                .reindex(years, method="ffill")
+                .to_numpy(dtype=float)
+            )
+            # resource consumption of each vintage, the last source using the resource prevails
+            resource_consumption = np.full(len(vintages), np.nan)
+
+            for source, consumption_name in [
+                (
+                    "excluding_processes",
+                    f"{pathway_name}_eis_resource_specific_consumption_{key}",
+                )
+            ] + [
+                (process_key, f"{process_key}_eis_resource_specific_consumption_{key}")
+                for process_key in self.process_keys
+            ]:
+                if consumption_name not in input_data:
+                    continue
+                specific_consumption = vintage_values(consumption_name, None)
+                defined = _is_defined_for_years(input_data[consumption_name], vintages)
+                source_consumption = np.where(
+                    defined, needed_capacity * specific_consumption, np.nan
+                )
+                resource_consumption = np.where(defined, source_consumption, resource_consumption)
+                if f"{pathway_name}_{source}_{key}_total_consumption" in output_data:
+                    store_operating_sum(
+                        f"{pathway_name}_{source}_{key}_total_consumption", source_consumption
                     )
-                    output_data[
-                        f"{self.pathway_name}_{process_key}_without_resources_mean_co2_emission_factor"
-                    ].loc[year : year + lifespan - 1] = _custom_series_addition(
-                        output_data[
-                            f"{self.pathway_name}_{process_key}_without_resources_mean_co2_emission_factor"
-                        ].loc[year : year + lifespan - 1],
-                        process_emission_factor * relative_share,
+                    store_operating_sum(
+                        f"{pathway_name}_{source}_{key}_total_mobilised_with_selectivity",
+                        source_consumption * kerosene_selectivity,
                     )
 
-                # Compute the average emission factor from the vintage
-                co2_emission_factor.loc[year : year + lifespan - 1] = _custom_series_addition(
-                    co2_emission_factor.loc[year : year + lifespan - 1],
-                    vintage_emission_factor * relative_share,
+                # get resource emission per unit of energy
+                co2_emission_factor_resource = np.where(
+                    operating, specific_consumption[:, None] * unit_emissions[None, :], np.nan
                 )
-
-                # Store the emission factor for the vintage
-                output_data[f"{self.pathway_name}_vintage_eis_co2_emission_factor"].loc[year] = (
-                    vintage_emission_factor.loc[year]
+                vintage_emission_factor = _nan_add(
+                    vintage_emission_factor, co2_emission_factor_resource
+                )
+                store_mean(
+                    f"{pathway_name}_{source}_{key}_mean_co2_emission_factor",
+                    co2_emission_factor_resource,
                 )
 
-                # compute the cumulative and discounted emissions for the vintage
-                if self.compute_abatement_cost:
-                    if vintage_emission_factor.notna().any():
-                        # Get the exogenous carbon price trajectory and social discount rate
-                        exogenous_carbon_price_trajectory = input_data.get(
-                            "exogenous_carbon_price_trajectory", optional_nan_series
-                        )
-                        social_discount_rate = input_data.get("social_discount_rate", 0.0)
-
-                        # Compute cumulative and discounted emissions for the vintage
-                        cumul_em, generic_discounted_cumul_em = (
-                            self._unitary_cumul_emissions_vintage(
-                                vintage_emission_factor,
-                                exogenous_carbon_price_trajectory,
-                                social_discount_rate,
-                            )
-                        )
-                    else:
-                        cumul_em = np.NaN
-                        generic_discounted_cumul_em = np.NaN
-
-                    # Store the cumulative emissions for the vintage
-                    output_data[f"{self.pathway_name}_lifespan_unitary_emissions"].loc[year] = (
-                        cumul_em
-                    )
-                    output_data[f"{self.pathway_name}_lifespan_discounted_unitary_emissions"].loc[
-                        year
-                    ] = generic_discounted_cumul_em
-
-        # Store the emission factor
-        output_data[f"{self.pathway_name}_mean_co2_emission_factor"] = co2_emission_factor
-        # Compute the total emissions from the vintage
-        total_co2_emissions = energy_consumption * co2_emission_factor
-        output_data[f"{self.pathway_name}_total_co2_emissions"] = total_co2_emissions
+            # store the total consumption of the resource
+            store_operating_sum(f"{pathway_name}_{key}_total_consumption", resource_consumption)
+            store_operating_sum(
+                f"{pathway_name}_{key}_total_mobilised_with_selectivity",
+                resource_consumption * kerosene_selectivity,
+            )
 
-        self._store_outputs(output_data)
-        return output_data
+        # III -- Now let's compute the emissions from processes themselves
+        for process_key in self.process_keys:
+            process_emission_factor = vintage_values(
+                f"{process_key}_eis_co2_emission_factor_without_resources", 0.0
+            )
+            vintage_emission_factor = np.where(
+                operating,
+                np.where(
+                    np.isnan(vintage_emission_factor),
+                    process_emission_factor[:, None],
+                    vintage_emission_factor + process_emission_factor[:, None],
+                ),
+                np.nan,
+            )
+            store_mean(
+                f"{pathway_name}_{process_key}_without_resources_mean_co2_emission_factor",
+                process_emission_factor,
+            )
 
-    def _unitary_cumul_emissions_vintage(
+        # Compute the average emission factor from the vintages
+        store_mean(f"{pathway_name}_mean_co2_emission_factor", vintage_emission_factor)
+        # Store the emission factor for the vintage
+        output_data[f"{pathway_name}_vintage_eis_co2_emission_factor"].loc[vintages] = (
+            vintage_emission_factor[commissioning]
+        )
+
+        # compute the cumulative and discounted emissions for the vintages
+        if self.compute_abatement_cost:
+            cumul_em, generic_discounted_cumul_em = self._unitary_cumul_emissions_vintages(
+                vintage_emission_factor,
+                vintages,
+                lifespan,
+                years,
+                input_data.get("exogenous_carbon_price_trajectory", optional_nan_series),
+                input_data.get("social_discount_rate", 0.0),
+            )
+            output_data[f"{pathway_name}_lifespan_unitary_emissions"].loc[vintages] = cumul_em
+            output_data[f"{pathway_name}_lifespan_discounted_unitary_emissions"].loc[vintages] = (
+                generic_discounted_cumul_em
+            )
+
+    def _unitary_cumul_emissions_vintages(
         self,
-        vintage_emission_factor: pd.Series,
+        vintage_emission_factor,
+        vintages,
+        lifespan,
+        years,
         exogenous_carbon_price_trajectory: pd.Series,
         social_discount_rate: float,
     ):
         """
-        Compute cumulative and discounted emissions for each vintage,
-        using the vintage ef
+        Compute cumulative and discounted emissions over the lifespan of each vintage,
+        using the vintage emission factors.
+        Beyond the scenario end year, emission factors are kept at their end year value.
         """
-        indexes = vintage_emission_factor.index
-        cumul_em = 0
-        generic_discounted_cumul_em = 0
-        for i in indexes:
-            # Use the emission factor of the commissioning year (vintage)
-            if i <= self.end_year:
-                cumul_em += vintage_emission_factor[i]
-                generic_discounted_cumul_em += (
-                    vintage_emission_factor[i]
-                    * exogenous_carbon_price_trajectory[i]
-                    / exogenous_carbon_price_trajectory[indexes[0]]
-                    / (1 + social_discount_rate) ** (i - indexes[0])
-                )
-            else:
-                # After scenario end, keep last known values and extrapolate SCC growth
-                ef_end = vintage_emission_factor[self.end_year]
-                future_scc_growth = (
-                    exogenous_carbon_price_trajectory[self.end_year]
-                    / exogenous_carbon_price_trajectory[self.end_year - 1]
-                )
-                cumul_em += ef_end
-                generic_discounted_cumul_em += (
-                    ef_end
-                    * (
-                        exogenous_carbon_price_trajectory[self.end_year]
-                        / exogenous_carbon_price_trajectory[indexes[0]]
-                        * (future_scc_growth) ** (i - self.end_year)
-                    )
-                    / (1 + social_discount_rate) ** (i - indexes[0])
-                )
+        horizon = int(np.max(lifespan))
+        ages = np.arange(horizon)
+        operating = ages[None, :] < lifespan[:, None]
+        # Emission factor of each vintage at each age, end year value after the scenario end year
+        columns = np.minimum(vintages[:, None] + ages[None, :], self.end_year) - years[0]
+        emission_factor = np.take_along_axis(
+            vintage_emission_factor, np.where(operating, columns, 0), axis=1
+        )
+        carbon_value = carbon_value_factors(
+            exogenous_carbon_price_trajectory,
+            social_discount_rate,
+            vintages,
+            horizon,
+            self.end_year,
+        )
+        cumul_em = np.sum(np.where(operating, emission_factor, 0.0), axis=1)
+        generic_discounted_cumul_em = np.sum(
+            np.where(operating, emission_factor * carbon_value, 0.0), axis=1
+        )
+        # Vintages without any emission factor are not evaluated
+        evaluated = ~np.isnan(vintage_emission_factor).all(axis=1)
+        return (
+            np.where(evaluated, cumul_em, np.nan),
+            np.where(evaluated, generic_discounted_cumul_em, np.nan),
+        )
+
 
-        return cumul_em, generic_discounted_cumul_em
+def _is_defined_for_years(value, years):
+    """Mask of the years for which `_get_value_for_year` does not return its default value."""
+    if isinstance(value, pd.Series):
+        return np.isin(years, value.index)
+    return np.full(len(years), isinstance(value, (int, float)))
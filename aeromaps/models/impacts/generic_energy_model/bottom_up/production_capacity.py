@@ -9,7 +9,7 @@ import numpy as np
 import pandas as pd
 import warnings
 from aeromaps.models.base import AeroMAPSModel
-from aeromaps.utils.functions import _get_value_for_year
+from aeromaps.utils.functions import _get_values_for_years
 
 
 class BottomUpCapacity(AeroMAPSModel):
@@ -138,77 +138,97 @@ class BottomUpCapacity(AeroMAPSModel):
                     energy_required.loc[self.historic_start_year] / first_plant_volume
                 ) ** (1 / (self.historic_start_year - first_plant_year)) - 1
                 # populate the energy_required Series with virtual years
-                for virtual_year in range(first_plant_year, self.historic_start_year):
-                    virtual_demand = first_plant_volume * (1 + virtual_cagr) ** (
-                        virtual_year - first_plant_year
-                    )
-                    energy_required.loc[virtual_year] = virtual_demand
-                energy_required.sort_index(inplace=True)
+                virtual_years = np.arange(first_plant_year, self.historic_start_year)
+                virtual_demand = pd.Series(
+                    first_plant_volume * (1 + virtual_cagr) ** (virtual_years - first_plant_year),
+                    index=virtual_years,
+                )
+                energy_required = pd.concat(
+                    [
+                        virtual_demand,
+                        energy_required.drop(virtual_years, errors="ignore"),
+                    ]
+                ).sort_index()
 
-        years = energy_required.index
+        years = energy_required.index.to_numpy()
+        required_production = energy_required.fillna(0).to_numpy(dtype=float)
 
-        plant_building_scenario = pd.Series(np.zeros(len(years)), years)
-        plant_available_scenario = pd.Series(np.zeros(len(years)), years)
-        energy_produced = pd.Series(np.zeros(len(years)), years)
-        energy_production_commissioned = pd.Series(np.zeros(len(years)), years)
-        energy_unused = pd.Series(np.zeros(len(years)), years)
+        # getting entry into service (eis) plant charcteristics for each commissioning year
+        plant_load_factor = _get_values_for_years(
+            input_data.get(f"{self.pathway_name}_eis_plant_load_factor"), years, 1
+        )
+        plant_lifespan = _get_values_for_years(
+            input_data.get(f"{self.pathway_name}_eis_plant_lifespan"), years, 25
+        )
+        for key in self.resource_keys:
+            if f"{key}_load_factor" in input_data:
+                resource_load_factor = _get_values_for_years(
+                    input_data.get(f"{key}_load_factor"), years, None
+                )
+                plant_load_factor = np.where(
+                    resource_load_factor < plant_load_factor,
+                    resource_load_factor,
+                    plant_load_factor,
+                )
+        # Position of the first year after the lifespan of plants commissioned each year
+        retirement_positions = np.searchsorted(years, years + plant_lifespan - 1, side="right")
 
-        for year in years:
-            # getting entry into service (eis) plant charcteristics
-            plant_load_factor = _get_value_for_year(
-                input_data.get(f"{self.pathway_name}_eis_plant_load_factor"), year, 1
-            )
-            plant_lifespan = _get_value_for_year(
-                input_data.get(f"{self.pathway_name}_eis_plant_lifespan"), year, 25
-            )
+        energy_produced = np.zeros(len(years))
+        energy_production_commissioned = np.zeros(len(years))
+        energy_unused = np.zeros(len(years))
 
-            missing_production = energy_required.fillna(0)[year] - energy_produced.fillna(0)[year]
+        # Plants are commissioned to cover the production missing after retirements of older
+        # vintages: each year depends on the previous ones
+        for position, retirement_position in enumerate(retirement_positions):
+            missing_production = required_production[position] - energy_produced[position]
             if missing_production <= 0.0:
-                energy_unused[year] = missing_production
+                energy_unused[position] = missing_production
             else:
-                # Calculate the required capacity to meet the energy demand
-                for key in self.resource_keys:
-                    if f"{key}_load_factor" in input_data:
-                        resource_load_factor = _get_value_for_year(
-                            input_data.get(f"{key}_load_factor"), year
-                        )
-                        if resource_load_factor is not None:
-                            plant_load_factor = min(plant_load_factor, resource_load_factor)
-
-                energy_production_commissioned[year] = missing_production
-
-                required_capacity = (
-                    missing_production / plant_load_factor
-                )  # Absolute output in MJ per year
-                plant_building_scenario[year] += required_capacity
-                # Update the available capacity and production for plant lifespan
-                plant_available_scenario.loc[year : year + plant_lifespan - 1] += required_capacity
-                energy_produced.loc[year : year + plant_lifespan - 1] += missing_production
+                energy_production_commissioned[position] = missing_production
+                # Update the production for plant lifespan
+                energy_produced[position:retirement_position] += missing_production
+
+        # Calculate the required capacity (absolute output in MJ per year) to meet the energy
+        # demand, and the capacity available each year from the vintages in operation
+        plant_building_scenario = np.where(
+            energy_production_commissioned > 0.0,
+            energy_production_commissioned / plant_load_factor,
+            0.0,
+        )
+        positions = np.arange(len(years))
+        vintage_operating = (positions[None, :] >= positions[:, None]) & (
+            positions[None, :] < retirement_positions[:, None]
+        )
+        plant_available_scenario = plant_building_scenario @ vintage_operating
 
         # Warning for years where there is an excess of energy production
         if (energy_unused < 0).any():
-            years_excess = energy_unused.index[energy_unused < 0].tolist()
+            years_excess = years[energy_unused < 0].tolist()
             warnings.warn(
                 f"\n⚠️ Excess {self.pathway_name} production in years: {years_excess}. Scaling down."
             )
 
+        plant_building_scenario = pd.Series(plant_building_scenario, years)
+        plant_available_scenario = pd.Series(plant_available_scenario, years)
+        energy_production_commissioned = pd.Series(energy_production_commissioned, years)
+        energy_unused = pd.Series(energy_unused, years)
+
         # computing additions for processes
         for process_key in self.process_keys:
-            process_building_scenario = pd.Series(np.zeros(len(years)), years)
-            for year in years:
-                process_load_factor = _get_value_for_year(
-                    input_data.get(f"{process_key}_load_factor", 1), year
-                )
-                for resource in self.process_resource_keys[process_key]:
-                    if f"{resource}_load_factor" in input_data:
-                        resource_load_factor = _get_value_for_year(
-                            input_data.get(f"{resource}_load_factor"), year
-                        )
-                        if resource_load_factor is not None:
-                            process_load_factor = min(process_load_factor, resource_load_factor)
-                process_building_scenario[year] = (
-                    energy_production_commissioned[year] / process_load_factor
-                )
+            process_load_factor = _get_values_for_years(
+                input_data.get(f"{process_key}_load_factor", 1), years, None
+            )
+            for resource in self.process_resource_keys[process_key]:
+                if f"{resource}_load_factor" in input_data:
+                    resource_load_factor = _get_values_for_years(
+                        input_data.get(f"{resource}_load_factor"), years, None
+                    )
+                    process_load_factor = np.where(
+                        resource_load_factor < process_load_factor,
+                        resource_load_factor,
+                        process_load_factor,
+                    )
+            process_building_scenario = energy_production_commissioned / process_load_factor
             process_building_scenario = process_building_scenario.loc[
                 self.prospection_start_year : self.end_year
             ]
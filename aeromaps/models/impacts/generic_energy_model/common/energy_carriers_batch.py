@@ -0,0 +1,142 @@
+"""
+energy_carriers_batch
+
+=====================
+Module to evaluate a family of generic energy models (e.g. the unit cost models of all pathways) in a single discipline.
+"""
+
+import pandas as pd
+
+from aeromaps.models.base import AeroMAPSModel
+
+
+class BatchedEnergyModels(AeroMAPSModel):
+    """
+    Single discipline evaluating a family of generic energy models, one per pathway, resource or interpolated input.
+
+    The batch publishes the outputs of all its models under their usual names, so that large energy configurations
+    give one MDA node per model family instead of one node per pathway.
+
+    Parameters
+    ----------
+    name : str
+        Name of the model instance.
+    models : list
+        Models of the family, with dictionaries of input and output names.
+
+    Attributes
+    ----------
+    models : list
+        Models of the family, in evaluation order.
+    input_names : dict
+        Inputs of the models that are not computed by another model of the batch.
+    output_names : dict
+        Outputs of all the models.
+    """
+
+    def __init__(
+        self,
+        name,
+        models,
+        *args,
+        **kwargs,
+    ):
+        super().__init__(
+            name=name,
+            model_type="custom",
+            *args,
+            **kwargs,
+        )
+        self.models = self._evaluation_order(models)
+
+        for model in self.models:
+            self.output_names.update(model.output_names)
+        for model in self.models:
+            self.input_names.update(
+                {
+                    key: value
+                    for key, value in model.input_names.items()
+                    if key not in self.output_names
+                }
+            )
+            self.default_input_data.update(model.default_input_data)
+
+    @staticmethod
+    def _evaluation_order(models):
+        """
+        Sort models so that each one is evaluated after the models of the batch computing its inputs.
+
+        Parameters
+        ----------
+        models
+            Models of the family.
+
+        Returns
+        -------
+        ordered_models
+            Models in evaluation order.
+
+        Raises
+        ------
+        ValueError
+            If the models are coupled to each other and cannot be evaluated sequentially.
+        """
+        producers = {output_name: model for model in models for output_name in model.output_names}
+        ordered_models = []
+        remaining_models = list(models)
+        while remaining_models:
+            ready_models = [
+                model
+                for model in remaining_models
+                if all(
+                    producers[input_name] in ordered_models or producers[input_name] is model
+                    for input_name in model.input_names
+                    if input_name in producers
+                )
+            ]
+            if not ready_models:
+                raise ValueError(
+                    "Coupled models cannot be batched: "
+                    + ", ".join(model.name for model in remaining_models)
+                )
+            ordered_models.extend(ready_models)
+            remaining_models = [model for model in remaining_models if model not in ready_models]
+        return ordered_models
+
+    def _initialize_df(self):
+        super()._initialize_df()
+        for model in self.models:
+            model.parameters = self.parameters
+            model._initialize_df()
+
+    def compute(self, input_data) -> dict:
+        """
+        Evaluate all models of the batch.
+
+        Parameters
+        ----------
+        input_data
+            Dictionary containing all input data required for the computation, completed at model instantiation with information from
+            yaml files and outputs of other models.
+
+        Returns
+        -------
+        output_data
+            Dictionary containing all output data resulting from the computation. Contains outputs defined during model instantiation.
+        """
+        data = dict(input_data)
+        output_data = {}
+        for model in self.models:
+            model_output_data = model.compute(
+                {input_name: data[input_name] for input_name in model.input_names}
+            )
+            data.update(model_output_data)
+            output_data.update(model_output_data)
+
+        # Models store their own outputs, the batch gathers them for the process
+        self.df = pd.concat([self.df[[]]] + [model.df for model in self.models], axis=1)
+        self.float_outputs = {}
+        for model in self.models:
+            self.float_outputs.update(model.float_outputs)
+
+        return output_data
@@ -10,6 +10,9 @@ from aeromaps.models.impacts.generic_energy_model.bottom_up.abatement_cost impor
 from aeromaps.models.impacts.generic_energy_model.bottom_up.abatement_effective import (
     EnergyAbatementEffective,
 )
+from aeromaps.models.impacts.generic_energy_model.common.energy_carriers_batch import (
+    BatchedEnergyModels,
+)
 from aeromaps.models.impacts.generic_energy_model.common.energy_carriers_means import (
     EnergyCarriersMeans,
     EnergyCarriersMeanLHV,
@@ -31,10 +34,10 @@ from aeromaps.models.impacts.generic_energy_model.bottom_up.production_capacity
     BottomUpCapacity,
 )
 from aeromaps.models.impacts.energy_resources.energy_resources import (
-    EnergyResourceConsumption,
-    OverallResourcesConsumption,
+    EnergyResourcesConsumption,
 )
 
+import re
 import warnings
 
 
@@ -206,21 +209,47 @@ class AviationEnergyCarriersFactory:
         dict
             Dictionary of instantiated energy resource consumption models.
         """
-        models = {}
-        for resource in resources_data.keys():
-            models.update(
-                {
-                    f"{resource}_consumption": EnergyResourceConsumption(
-                        f"{resource}_consumption", resources_data[resource], pathways_manager
-                    )
-                }
+        return {
+            "energy_resources_consumption": EnergyResourcesConsumption(
+                "energy_resources_consumption", resources_data, pathways_manager
+            ),
+        }
+
+    @staticmethod
+    def batch_models(models):
+        """
+        Group the models of each family (e.g. the unit cost models of all pathways) in a single batched model.
+
+        Parameters
+        ----------
+        models : dict
+            Dictionary of instantiated generic energy models.
+
+        Returns
+        -------
+        dict
+            Dictionary of batched models, and of the models that are alone in their family or coupled to models of their
+            family.
+        """
+        families = {}
+        for name, model in models.items():
+            families.setdefault(type(model), {})[name] = model
+
+        batched_models = {}
+        for family, family_models in families.items():
+            if len(family_models) < 2:
+                batched_models.update(family_models)
+                continue
+            # e.g. BottomUpCost -> bottom_up_cost_batch
+            name = (
+                re.sub(
+                    r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", family.__name__
+                ).lower()
+                + "_batch"
             )
-        models.update(
-            {
-                "overall_resources_consumption": OverallResourcesConsumption(
-                    "overall_resources_consumption",
-                    resources_data,
-                ),
-            }
-        )
-        return models
+            try:
+                batched_models[name] = BatchedEnergyModels(name, list(family_models.values()))
+            except ValueError as error:
+                warnings.warn(f"\n⚠️ {error}. They are kept as separate disciplines.")
+                batched_models.update(family_models)
+        return batched_models
@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, fields
+from typing import List, Tuple
 
 
 @dataclass
@@ -44,10 +44,14 @@ class EnergyCarrierManager:
     """
     Manager class to handle a collection of energy carriers and provide methods to add and retrieve them based on various criteria.
 
+    Carriers are indexed by the values of their attributes when they are added (by each element for list attributes and
+    by each value for dictionary attributes), so that queries do not scan all carriers. Query results are cached until a
+    new carrier is added; carriers should not be modified once added.
+
     Attributes
     ----------
-    carriers : List[EnergyCarrierMetadata]
-        List of energy carrier metadata instances.
+    carriers : Tuple[EnergyCarrierMetadata, ...]
+        Energy carrier metadata instances, in registration order.
     """
 
     def __init__(self, carriers: List[EnergyCarrierMetadata] = None):
@@ -59,7 +63,15 @@ class EnergyCarrierManager:
         carriers : List[EnergyCarrierMetadata], optional
             Initial list of energy carrier metadata instances.
         """
-        self.carriers = carriers if carriers is not None else []
+        self.carriers = ()
+        # attribute -> value -> positions of the carriers matching the value
+        self._indexes = {field.name: {} for field in fields(EnergyCarrierMetadata)}
+        # attributes with unhashable values, queried by scanning all carriers
+        self._unindexed = set()
+        self._queries = {}
+        self._types = {}
+        for carrier in carriers if carriers is not None else []:
+            self.add(carrier)
 
     def add(self, carrier: EnergyCarrierMetadata):
         """
@@ -70,9 +82,25 @@ class EnergyCarrierManager:
         carrier
             Energy carrier metadata instance to add.
         """
-        self.carriers.append(carrier)
-
-    def get(self, **criteria) -> List[EnergyCarrierMetadata]:
+        position = len(self.carriers)
+        self.carriers = self.carriers + (carrier,)
+        for attr, index in self._indexes.items():
+            value = getattr(carrier, attr, None)
+            if isinstance(value, dict):
+                keys = value.values()
+            elif isinstance(value, list):
+                keys = value
+            else:
+                keys = (value,)
+            try:
+                for key in keys:
+                    index.setdefault(key, set()).add(position)
+            except TypeError:
+                self._unindexed.add(attr)
+        self._queries.clear()
+        self._types.clear()
+
+    def get(self, **criteria) -> Tuple[EnergyCarrierMetadata, ...]:
         """
         Retrieve energy carriers that match all specified criteria.
 
@@ -84,9 +112,43 @@ class EnergyCarrierManager:
         Returns
         -------
         matches
-            Energy carrier metadata instances that match the given criteria.
+            Energy carrier metadata instances that match the given criteria, in registration order.
+        """
+        try:
+            query = tuple(sorted(criteria.items()))
+            return self._queries[query]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable criteria values
+            return self._scan(criteria)
+
+        if any(attr not in self._indexes or attr in self._unindexed for attr in criteria):
+            matches = self._scan(criteria)
+        else:
+            candidates = sorted(
+                (self._indexes[attr].get(val, set()) for attr, val in criteria.items()), key=len
+            )
+            positions = set.intersection(*candidates) if candidates else range(len(self.carriers))
+            matches = tuple(self.carriers[position] for position in sorted(positions))
+        self._queries[query] = matches
+        return matches
+
+    def _scan(self, criteria) -> Tuple[EnergyCarrierMetadata, ...]:
         """
-        return [
+        Retrieve energy carriers that match all specified criteria by checking each carrier.
+
+        Parameters
+        ----------
+        criteria
+            Keyword arguments used to match attributes of energy carriers.
+
+        Returns
+        -------
+        matches
+            Energy carrier metadata instances that match the given criteria, in registration order.
+        """
+        return tuple(
             c
             for c in self.carriers
             if all(
@@ -97,7 +159,7 @@ class EnergyCarrierManager:
                 else getattr(c, attr, None) == val
                 for attr, val in criteria.items()
             )
-        ]
+        )
 
     def get_all(self):
         """
@@ -122,12 +184,14 @@ class EnergyCarrierManager:
         Returns
         -------
         values
-            Unique values of the specified parameter across all energy carriers.
+            Unique values of the specified parameter across all energy carriers, in registration order.
         """
-        return list(
-            {
-                getattr(carrier, parameter, None)
-                for carrier in self.carriers
-                if getattr(carrier, parameter, None) is not None
-            }
-        )
+        if parameter not in self._types:
+            self._types[parameter] = tuple(
+                dict.fromkeys(
+                    getattr(carrier, parameter, None)
+                    for carrier in self.carriers
+                    if getattr(carrier, parameter, None) is not None
+                )
+            )
+        return list(self._types[parameter])
@@ -11,6 +11,7 @@ import numpy as np
 import pandas as pd
 
 from aeromaps.models.base import AeroMAPSModel
+from aeromaps.utils.functions import _fill_nan, _series_from_grid, _series_on_grid
 
 
 class EnergyUseChoice(AeroMAPSModel):
@@ -126,10 +127,44 @@ class EnergyUseChoice(AeroMAPSModel):
             }
         )
 
+        # Pathway groups as rows of the (pathway x year) consumption matrix built in compute
+        self._pathway_names = [pathway.name for pathway in self.pathways_manager.get_all()]
+        rows = {id(pathway): i for i, pathway in enumerate(self.pathways_manager.get_all())}
+
+        def _rows(**criteria):
+            return [rows[id(pathway)] for pathway in self.pathways_manager.get(**criteria)]
+
+        self._aircraft_types = self.pathways_manager.get_all_types("aircraft_type")
+        self._energy_origins = self.pathways_manager.get_all_types("energy_origin")
+        self._type_rows = {
+            aircraft_type: {
+                "all": _rows(aircraft_type=aircraft_type),
+                "default": _rows(aircraft_type=aircraft_type, default=True),
+                "quantity": _rows(aircraft_type=aircraft_type, mandate_type="quantity"),
+                "share": _rows(aircraft_type=aircraft_type, mandate_type="share"),
+            }
+            for aircraft_type in self._aircraft_types
+        }
+        self._origin_rows = {
+            energy_origin: _rows(energy_origin=energy_origin)
+            for energy_origin in self._energy_origins
+        }
+        self._origin_type_rows = {
+            (energy_origin, aircraft_type): _rows(
+                energy_origin=energy_origin, aircraft_type=aircraft_type
+            )
+            for energy_origin in self._energy_origins
+            for aircraft_type in self._aircraft_types
+        }
+
     def compute(self, input_data) -> dict:
         """
         Compute the energy consumption of each energy carrier based on the defined pathways and mandates and priority rules.
 
+        Pathway consumptions are allocated in a (pathway x year) matrix: quantity mandates first, then share mandates,
+        each group being scaled down homogeneously in the years where it exceeds the remaining consumption, and the
+        default pathway completes the remaining consumption. All shares are then derived from this matrix.
+
         Parameters
         ----------
         input_data
@@ -141,253 +176,219 @@ class EnergyUseChoice(AeroMAPSModel):
         output_data
             Dictionary containing all output data resulting from the computation. Contains outputs defined during model instantiation.
         """
-        # Get inputs from the configuration file
         output_data = {}
-        # For each energy type, compute an energy quantity to be produced based on priority order.
 
-        for aircraft_type in self.pathways_manager.get_all_types("aircraft_type"):
-            # Get the energy consumption for the given aircraft type
-            try:
-                energy_consumption = input_data[f"energy_consumption_{aircraft_type}"]
-            except KeyError:
-                raise KeyError(
-                    f"Aircraft type <{aircraft_type}> specified in energy_carriers_data.yaml not supported by AeroMAPS aircraft models."
-                )
-            remaining_energy_consumption = energy_consumption.copy()
+        # Common year grid of all inputs; each row of the matrices below comes with a mask of the years its series is defined on
+        years = pd.RangeIndex(start=self.historic_start_year, stop=self.end_year + 1)
+        grid = years
+        for value in input_data.values():
+            if isinstance(value, pd.Series) and not value.index.equals(grid):
+                grid = grid.union(value.index)
+        in_years = grid.isin(years)
+
+        consumption = np.full((len(self._pathway_names), len(grid)), np.nan)
+        defined = np.zeros(consumption.shape, dtype=bool)
+
+        # Divisions by zero consumptions give NaN or infinite values, as with pandas operations
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # For each energy type, compute an energy quantity to be produced based on priority order.
+            type_consumptions = {}
+            for aircraft_type in self._aircraft_types:
+                # Get the energy consumption for the given aircraft type
+                try:
+                    energy_consumption = input_data[f"energy_consumption_{aircraft_type}"]
+                except KeyError:
+                    raise KeyError(
+                        f"Aircraft type <{aircraft_type}> specified in energy_carriers_data.yaml not supported by AeroMAPS aircraft models."
+                    )
+                type_consumption, in_type = _series_on_grid(energy_consumption, grid)
+                type_consumptions[aircraft_type] = (type_consumption, in_type)
+                type_rows = self._type_rows[aircraft_type]
+
+                # No need to define pathways if there is no fuel consumption
+                if not (energy_consumption.notna().any() and energy_consumption.sum() != 0):
+                    # If there is no energy consumption, set all energy consumption to 0
+                    consumption[type_rows["all"]] = np.where(in_years, 0.0, np.nan)
+                    defined[type_rows["all"]] = in_years
+                    continue
 
-            # No need to define pathways if there is no fuel consumption
-            if energy_consumption.notna().any() and energy_consumption.sum() != 0:
                 # Default pathway should be defined
-                type_default_pathway = self.pathways_manager.get(
-                    aircraft_type=aircraft_type, default=True
-                )
-                if not type_default_pathway:
+                if not type_rows["default"]:
                     raise ValueError(
                         f"It is mandatory to define a default {aircraft_type} fuel pathway defined in the energy_carriers_data.yaml"
                     )
-                elif len(type_default_pathway) > 1:
+                elif len(type_rows["default"]) > 1:
                     raise ValueError(
                         f"There should be only one default {aircraft_type} fuel pathway defined in the energy_carriers_data.yaml"
                     )
-                else:
-                    # First case: quantity-defined pathways
-                    type_quantity_pathways = self.pathways_manager.get(
-                        aircraft_type=aircraft_type, mandate_type="quantity"
+
+                remaining_energy_consumption = type_consumption.copy()
+
+                # First case: quantity-defined pathways
+                quantity_rows = type_rows["quantity"]
+                if quantity_rows:
+                    quantities, given = self._stack_inputs(
+                        input_data, quantity_rows, "quantity", grid
                     )
-                    if type_quantity_pathways:
-                        total_quantity = (
-                            sum(
-                                input_data[f"{pathway.name}_mandate_quantity"]
-                                for pathway in type_quantity_pathways
-                            )
-                            .reindex(energy_consumption.index)
-                            .fillna(0)
+                    total_quantity = _fill_nan(quantities.sum(axis=0))
+                    if (total_quantity[in_type] <= _fill_nan(type_consumption)[in_type]).all():
+                        # If the sum of quantities is less than or equal to the total, keep the quantities as output
+                        consumption[quantity_rows] = quantities
+                        defined[quantity_rows] = given
+                    else:
+                        # If the sum exceeds the total, decrease them homogeneously
+                        scaling_factor = _scaling_factor(
+                            total_quantity, remaining_energy_consumption, in_type
                         )
-                        if (total_quantity <= energy_consumption.fillna(0)).all():
-                            # If the sum of quantities is less than or equal to the total, keep the quantities as output
-                            for pathway in type_quantity_pathways:
-                                pathway_consumption = input_data[f"{pathway.name}_mandate_quantity"]
-                                output_data[f"{pathway.name}_energy_consumption"] = (
-                                    pathway_consumption
-                                )
-                                remaining_energy_consumption -= pathway_consumption.reindex(
-                                    energy_consumption.index
-                                ).fillna(0)
-                        else:
-                            # If the sum exceeds the total, decrease them homogeneously
-                            scaling_factor = pd.Series(
-                                np.where(
-                                    total_quantity > remaining_energy_consumption,
-                                    remaining_energy_consumption / total_quantity,
-                                    1,
-                                ),
-                                index=total_quantity.index,
-                            )
-                            for pathway in type_quantity_pathways:
-                                original = input_data[f"{pathway.name}_mandate_quantity"].fillna(0)
-                                pathway_consumption = (original * scaling_factor).fillna(0)
-                                output_data[f"{pathway.name}_energy_consumption"] = (
-                                    pathway_consumption
-                                )
-                                remaining_energy_consumption -= pathway_consumption.reindex(
-                                    energy_consumption.index
-                                ).fillna(0)
-
-                                modified_years = pathway_consumption.loc[original.index][
-                                    pathway_consumption.loc[original.index] != original.loc[original.index]
-                                ]
-
-                                if not modified_years.empty:
-                                    msg = (
-                                        f"\nThe sum of the quantity-defined {aircraft_type} fuel pathways exceeds the total {aircraft_type} energy consumption.\n"
-                                        f"→ Pathway '{pathway.name}' energy consumption was adjusted in the following years:\n"
-                                    )
-                                    for year in modified_years.index:
-                                        msg += f"   - {year}: {pathway_consumption[year]:.2e} MJ instead of {original[year]:.2e} MJ\n"
-
-                                    warnings.warn(msg)
-
-                    # Second case : blending mandate pathways
-                    type_share_pathways = self.pathways_manager.get(
-                        aircraft_type=aircraft_type, mandate_type="share"
-                    )
-                    if type_share_pathways:
-                        total_share_quantity = (
-                            sum(
-                                input_data[f"{pathway.name}_mandate_share"]
-                                / 100
-                                * energy_consumption
-                                for pathway in type_share_pathways
-                            )
-                            .reindex(energy_consumption.index)
-                            .fillna(0)
+                        original = np.where(given, _fill_nan(quantities), np.nan)
+                        consumption[quantity_rows] = _fill_nan(original * scaling_factor)
+                        defined[quantity_rows] = given | in_type
+                        self._warn_adjusted(
+                            quantity_rows,
+                            consumption[quantity_rows],
+                            original,
+                            given,
+                            grid,
+                            header=f"\nThe sum of the quantity-defined {aircraft_type} fuel pathways exceeds the total {aircraft_type} energy consumption.\n",
+                            adjustment="energy consumption",
+                            line=lambda year, adjusted, requested: (
+                                f"   - {year}: {adjusted:.2e} MJ instead of {requested:.2e} MJ\n"
+                            ),
                         )
-                        if (
-                            total_share_quantity.fillna(0) <= remaining_energy_consumption.fillna(0)
-                        ).all():
-                            # If the sum of quantities is less than or equal to the total, keep the quantities as output
-                            for pathway in type_share_pathways:
-                                pathway_consumption = (
-                                    input_data[f"{pathway.name}_mandate_share"]
-                                    / 100
-                                    * energy_consumption
-                                )
-                                output_data[f"{pathway.name}_energy_consumption"] = (
-                                    pathway_consumption
-                                )
-                                remaining_energy_consumption -= pathway_consumption.reindex(
-                                    energy_consumption.index
-                                ).fillna(0)
-                        else:
-                            # If the sum exceeds the total, decrease them homogeneously
-                            scaling_factor = pd.Series(
-                                np.where(
-                                    total_share_quantity > remaining_energy_consumption,
-                                    remaining_energy_consumption / total_share_quantity,
-                                    1,
-                                ),
-                                index=total_share_quantity.index,
-                            )
-                            for pathway in type_share_pathways:
-                                original_share = input_data[f"{pathway.name}_mandate_share"].fillna(
-                                    0
-                                )
-                                pathway_consumption = (
-                                    original_share / 100 * energy_consumption * scaling_factor
-                                ).fillna(0)
-                                output_data[f"{pathway.name}_energy_consumption"] = (
-                                    pathway_consumption
-                                )
-                                remaining_energy_consumption -= pathway_consumption.reindex(
-                                    energy_consumption.index
-                                ).fillna(0)
-
-                                modified_years = pathway_consumption.loc[original_share.index][
-                                    pathway_consumption.loc[original_share.index]
-                                    != (
-                                        original_share
-                                        / 100
-                                        * energy_consumption.loc[original_share.index]
-                                    )
-                                ]
-
-                                if not modified_years.empty:
-                                    msg = (
-                                        f"\nThe sum of the share-defined {aircraft_type} fuel pathways exceeds the total {aircraft_type} energy consumption (minus quantity-based pathways).\n"
-                                        f"→ Pathway '{pathway.name}' share was adjusted in the following years:\n"
-                                    )
-                                    for year in modified_years.index:
-                                        msg += f"   - {year}: {(pathway_consumption[year] * 100 / energy_consumption[year]):.1f} % instead of {(original_share[year]):.1f} %\n"
-
-                                    warnings.warn(msg)
-
-                    # Third case: default pathway completes to fill the remaining energy consumption
-                    pathway = type_default_pathway[0]
-                    output_data[f"{pathway.name}_energy_consumption"] = (
-                        remaining_energy_consumption.copy()
-                    )
-                    remaining_energy_consumption -= remaining_energy_consumption
-
-            else:
-                # If there is no energy consumption, set all energy consumption to 0
-                for pathway in self.pathways_manager.get(aircraft_type=aircraft_type):
-                    output_data[f"{pathway.name}_energy_consumption"] = pd.Series(
-                        [0.0] * (self.end_year - self.historic_start_year + 1),
-                        index=pd.RangeIndex(start=self.historic_start_year, stop=self.end_year + 1),
+                    remaining_energy_consumption = _subtract_rows(
+                        remaining_energy_consumption, consumption[quantity_rows]
                     )
 
-        # compute metrics derived from each patwhay consumption
-        total_energy_consumption = input_data["energy_consumption"]
+                # Second case : blending mandate pathways
+                share_rows = type_rows["share"]
+                if share_rows:
+                    shares, given = self._stack_inputs(input_data, share_rows, "share", grid)
+                    share_quantities = shares / 100 * type_consumption
+                    total_share_quantity = _fill_nan(share_quantities.sum(axis=0))
+                    if (
+                        total_share_quantity[in_type]
+                        <= _fill_nan(remaining_energy_consumption)[in_type]
+                    ).all():
+                        # If the sum of quantities is less than or equal to the total, keep the quantities as output
+                        consumption[share_rows] = share_quantities
+                        defined[share_rows] = given | in_type
+                    else:
+                        # If the sum exceeds the total, decrease them homogeneously
+                        scaling_factor = _scaling_factor(
+                            total_share_quantity, remaining_energy_consumption, in_type
+                        )
+                        original_share = np.where(given, _fill_nan(shares), np.nan)
+                        consumption[share_rows] = _fill_nan(
+                            original_share / 100 * type_consumption * scaling_factor
+                        )
+                        defined[share_rows] = given | in_type
+                        adjusted_share = consumption[share_rows] * 100 / type_consumption
+                        self._warn_adjusted(
+                            share_rows,
+                            consumption[share_rows],
+                            original_share / 100 * type_consumption,
+                            given,
+                            grid,
+                            header=f"\nThe sum of the share-defined {aircraft_type} fuel pathways exceeds the total {aircraft_type} energy consumption (minus quantity-based pathways).\n",
+                            adjustment="share",
+                            line=lambda year, adjusted, requested: (
+                                f"   - {year}: {adjusted:.1f} % instead of {requested:.1f} %\n"
+                            ),
+                            reported=(adjusted_share, original_share),
+                        )
+                    remaining_energy_consumption = _subtract_rows(
+                        remaining_energy_consumption, _fill_nan(consumption[share_rows])
+                    )
 
-        # Compute share of each pathway in the total energy consumption
-        for pathway in self.pathways_manager.get_all():
-            output_data[f"{pathway.name}_share_total_energy"] = (
-                output_data[f"{pathway.name}_energy_consumption"] / total_energy_consumption * 100
-            )
+                # Third case: default pathway completes to fill the remaining energy consumption
+                default_row = type_rows["default"][0]
+                consumption[default_row] = np.where(in_type, remaining_energy_consumption, np.nan)
+                defined[default_row] = in_type
 
-        # Compute share of each pathway in a given aircraft type energy consumption
-        for aircraft_type in self.pathways_manager.get_all_types("aircraft_type"):
-            type_energy_consumption = input_data[f"energy_consumption_{aircraft_type}"].fillna(0)
-            for pathway in self.pathways_manager.get(aircraft_type=aircraft_type):
-                output_data[f"{pathway.name}_share_{aircraft_type}"] = (
-                    output_data[f"{pathway.name}_energy_consumption"]
-                    / type_energy_consumption.replace(0, np.nan)
-                    * 100
+            for i, name in enumerate(self._pathway_names):
+                output_data[f"{name}_energy_consumption"] = _series_from_grid(
+                    consumption[i], defined[i], grid
                 )
 
-        for energy_origin in self.pathways_manager.get_all_types("energy_origin"):
-            # Get the total energy consumption for each energy origin
-            origin_energy_consumption = sum(
-                output_data[f"{pathway.name}_energy_consumption"].fillna(0)
-                for pathway in self.pathways_manager.get(energy_origin=energy_origin)
+            # compute metrics derived from each pathway consumption
+            total_energy_consumption, in_total = _series_on_grid(
+                input_data["energy_consumption"], grid
             )
-            for pathway in self.pathways_manager.get(energy_origin=energy_origin):
-                output_data[f"{pathway.name}_share_{energy_origin}"] = (
-                    output_data[f"{pathway.name}_energy_consumption"]
-                    / origin_energy_consumption.replace(0, np.nan)
-                    * 100
-                )
-            output_data[f"{energy_origin}_share_total_energy"] = (
-                origin_energy_consumption / total_energy_consumption * 100
+            summable_consumption = np.where(defined, _fill_nan(consumption), np.nan)
+
+            # Compute share of each pathway in the total energy consumption
+            self._store_rows(
+                output_data,
+                "{}_share_total_energy",
+                range(len(self._pathway_names)),
+                consumption / total_energy_consumption * 100,
+                defined | in_total,
+                grid,
             )
 
-            # get detail for each aircraft type
-            for aircraft_type in self.pathways_manager.get_all_types("aircraft_type"):
-                if self.pathways_manager.get(
-                    aircraft_type=aircraft_type, energy_origin=energy_origin
-                ):
-                    type_energy_consumption = input_data[f"energy_consumption_{aircraft_type}"]
+            # Compute share of each pathway in a given aircraft type energy consumption
+            for aircraft_type in self._aircraft_types:
+                type_consumption, in_type = type_consumptions[aircraft_type]
+                rows = self._type_rows[aircraft_type]["all"]
+                self._store_rows(
+                    output_data,
+                    f"{{}}_share_{aircraft_type}",
+                    rows,
+                    consumption[rows] / _zero_to_nan(_fill_nan(type_consumption)) * 100,
+                    defined[rows] | in_type,
+                    grid,
+                )
 
-                    origin_type_energy_consumption = sum(
-                        output_data[f"{pathway.name}_energy_consumption"].fillna(0)
-                        for pathway in self.pathways_manager.get(
-                            energy_origin=energy_origin, aircraft_type=aircraft_type
-                        )
-                    )
+            for energy_origin in self._energy_origins:
+                # Get the total energy consumption for each energy origin
+                rows = self._origin_rows[energy_origin]
+                origin_consumption = np.add.reduce(summable_consumption[rows], axis=0)
+                in_origin = defined[rows].any(axis=0)
+                self._store_rows(
+                    output_data,
+                    f"{{}}_share_{energy_origin}",
+                    rows,
+                    consumption[rows] / _zero_to_nan(origin_consumption) * 100,
+                    defined[rows] | in_origin,
+                    grid,
+                )
+                output_data[f"{energy_origin}_share_total_energy"] = _series_from_grid(
+                    origin_consumption / total_energy_consumption * 100,
+                    in_origin | in_total,
+                    grid,
+                )
+
+                # get detail for each aircraft type
+                for aircraft_type in self._aircraft_types:
+                    rows = self._origin_type_rows[(energy_origin, aircraft_type)]
+                    if not rows:
+                        continue
+                    type_consumption, in_type = type_consumptions[aircraft_type]
+                    origin_type_consumption = np.add.reduce(summable_consumption[rows], axis=0)
+                    in_origin_type = defined[rows].any(axis=0)
 
                     output_data[f"{aircraft_type}_{energy_origin}_energy_consumption"] = (
-                        origin_type_energy_consumption
+                        _series_from_grid(origin_type_consumption, in_origin_type, grid)
                     )
-
-                    output_data[f"{energy_origin}_share_{aircraft_type}"] = (
-                        origin_type_energy_consumption
-                        / type_energy_consumption.replace(0, np.nan)
-                        * 100
+                    output_data[f"{energy_origin}_share_{aircraft_type}"] = _series_from_grid(
+                        origin_type_consumption / _zero_to_nan(type_consumption) * 100,
+                        in_origin_type | in_type,
+                        grid,
                     )
-
-                    output_data[f"{aircraft_type}_share_{energy_origin}"] = (
-                        origin_type_energy_consumption
-                        / origin_energy_consumption.replace(0, np.nan)
-                        * 100
+                    output_data[f"{aircraft_type}_share_{energy_origin}"] = _series_from_grid(
+                        origin_type_consumption / _zero_to_nan(origin_consumption) * 100,
+                        in_origin_type | in_origin,
+                        grid,
                     )
-                    for pathway in self.pathways_manager.get(
-                        energy_origin=energy_origin, aircraft_type=aircraft_type
-                    ):
-                        output_data[f"{pathway.name}_share_{aircraft_type}_{energy_origin}"] = (
-                            output_data[f"{pathway.name}_energy_consumption"]
-                            / origin_type_energy_consumption.replace(0, np.nan)
-                            * 100
-                        )
+                    self._store_rows(
+                        output_data,
+                        f"{{}}_share_{aircraft_type}_{energy_origin}",
+                        rows,
+                        consumption[rows] / _zero_to_nan(origin_type_consumption) * 100,
+                        defined[rows] | in_origin_type,
+                        grid,
+                    )
+
         # Fill with mandatory inputs for aeromaps models (non_co2) to work even if no pathway is defined for a given type
         mandatory_outputs = [
             "biomass_share_dropin_fuel",
@@ -403,3 +404,119 @@ class EnergyUseChoice(AeroMAPSModel):
         self._store_outputs(output_data)
 
         return output_data
+
+    def _stack_inputs(self, input_data, rows, mandate_type, grid):
+        """
+        Stack the mandates of the given pathways on the year grid.
+
+        Parameters
+        ----------
+        input_data
+            Dictionary containing all input data.
+        rows
+            Rows of the pathways in the consumption matrix.
+        mandate_type
+            Mandate type of the pathways ('quantity' or 'share').
+        grid
+            Year grid of the consumption matrix.
+
+        Returns
+        -------
+        values
+            Mandates, NaN in the years they are not defined for.
+        defined
+            Mask of the years each mandate is defined for.
+        """
+        stacked = [
+            _series_on_grid(input_data[f"{self._pathway_names[row]}_mandate_{mandate_type}"], grid)
+            for row in rows
+        ]
+        return (
+            np.vstack([values for values, _ in stacked]),
+            np.vstack([defined for _, defined in stacked]),
+        )
+
+    def _warn_adjusted(
+        self, rows, adjusted, requested, given, grid, header, adjustment, line, reported=None
+    ):
+        """
+        Warn, for each pathway, about the mandated years in which its consumption was scaled down.
+
+        Parameters
+        ----------
+        rows
+            Rows of the pathways in the consumption matrix.
+        adjusted
+            Scaled pathway consumptions.
+        requested
+            Pathway consumptions resulting from the mandates.
+        given
+            Mask of the years each mandate is defined for.
+        grid
+            Year grid of the consumption matrix.
+        header
+            First line of the warning.
+        adjustment
+            Name of the adjusted quantity.
+        line
+            Formatter of the warning line of an adjusted year.
+        reported
+            Adjusted and requested values reported in the warning, the consumptions by default.
+        """
+        reported_adjusted, reported_requested = reported or (adjusted, requested)
+        modified = given & (adjusted != requested)
+        for i, row in enumerate(rows):
+            if not modified[i].any():
+                continue
+            msg = (
+                header
+                + f"→ Pathway '{self._pathway_names[row]}' {adjustment} was adjusted in the following years:\n"
+            )
+            for position in np.flatnonzero(modified[i]):
+                msg += line(
+                    grid[position],
+                    reported_adjusted[i, position],
+                    reported_requested[i, position],
+                )
+            warnings.warn(msg)
+
+    def _store_rows(self, output_data, name_pattern, rows, values, defined, grid):
+        """
+        Add one output per pathway from the rows of a derived matrix.
+
+        Parameters
+        ----------
+        output_data
+            Dictionary of outputs to complete.
+        name_pattern
+            Output name with a placeholder for the pathway name.
+        rows
+            Rows of the pathways in the consumption matrix.
+        values
+            Derived values, one row per pathway of ``rows``.
+        defined
+            Mask of the years each output is defined for.
+        grid
+            Year grid of the consumption matrix.
+        """
+        for i, row in enumerate(rows):
+            output_data[name_pattern.format(self._pathway_names[row])] = _series_from_grid(
+                values[i], defined[i], grid
+            )
+
+
+def _zero_to_nan(values):
+    """Array equivalent of ``replace(0, np.nan)``."""
+    return np.where(values == 0, np.nan, values)
+
+
+def _scaling_factor(total, remaining, in_type):
+    """Homogeneous scaling of a group of mandates exceeding the remaining consumption."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scaling_factor = np.where(total > remaining, remaining / total, 1.0)
+    return np.where(in_type, scaling_factor, np.nan)
+
+
+def _subtract_rows(remaining, consumption):
+    """Remaining consumption after each pathway, subtracted in priority order."""
+    return np.subtract.reduce(np.vstack([remaining, _fill_nan(consumption)]), axis=0)
@@ -9,6 +9,8 @@ import numpy as np
 import pandas as pd
 
 from aeromaps.models.base import AeroMAPSModel
+from aeromaps.utils.discounting import carbon_value_factors
+from aeromaps.utils.functions import _nan_sum, _series_from_grid, _series_on_grid
 
 
 class TopDownEnvironmental(AeroMAPSModel):
@@ -182,9 +184,15 @@ class TopDownEnvironmental(AeroMAPSModel):
             0.0, index=range(self.historic_start_year, self.end_year + 1)
         )
 
-        co2_emission_factor = input_data.get(
-            f"{self.pathway_name}_mean_co2_emission_factor_without_resource", optional_null_series
-        )
+        # Contributions to the emission factor, summed at the end: resource contributions are
+        # added ignoring missing values, process contributions are not
+        resource_emission_factors = [
+            input_data.get(
+                f"{self.pathway_name}_mean_co2_emission_factor_without_resource",
+                optional_null_series,
+            )
+        ]
+        process_emission_factors = []
 
         # Get the total energy consumption of the pathway
         energy_consumption = input_data[f"{self.pathway_name}_energy_consumption"]
@@ -195,14 +203,27 @@ class TopDownEnvironmental(AeroMAPSModel):
         )
 
         for key in self.resource_keys:
-            # 1 ) --> pathway gets directly a resource
-            specific_consumption = input_data.get(
-                f"{self.pathway_name}_resource_specific_consumption_{key}", None
-            )
             total_ressource_consumption = optional_null_series.copy()
             total_ressource_mobilised_with_selectivity = optional_null_series.copy()
-
-            if specific_consumption is not None:
+            unit_emissions = input_data.get(f"{key}_co2_emission_factor", optional_null_series)
+
+            # 1 ) --> pathway gets directly a resource, 2 ) --> pathway gets a process that uses a resource
+            for source, specific_consumption in [
+                (
+                    "excluding_processes",
+                    input_data.get(
+                        f"{self.pathway_name}_resource_specific_consumption_{key}", None
+                    ),
+                )
+            ] + [
+                (
+                    process_key,
+                    input_data.get(f"{process_key}_resource_specific_consumption_{key}"),
+                )
+                for process_key in self.process_keys
+            ]:
+                if specific_consumption is None:
+                    continue
                 ressource_consumption = energy_consumption * specific_consumption
                 ressource_required_with_selectivity = (
                     ressource_consumption / pathway_kerosene_selectivity
@@ -216,62 +237,20 @@ class TopDownEnvironmental(AeroMAPSModel):
                     )
                 )
 
-                output_data[f"{self.pathway_name}_excluding_processes_{key}_total_consumption"] = (
+                output_data[f"{self.pathway_name}_{source}_{key}_total_consumption"] = (
                     ressource_consumption
                 )
                 output_data[
-                    f"{self.pathway_name}_excluding_processes_{key}_total_mobilised_with_selectivity"
+                    f"{self.pathway_name}_{source}_{key}_total_mobilised_with_selectivity"
                 ] = ressource_required_with_selectivity
 
-                unit_emissions = input_data.get(f"{key}_co2_emission_factor", optional_null_series)
                 # get resource emission per unit of energy
                 co2_emission_factor_ressource = specific_consumption * unit_emissions
-
-                output_data[
-                    f"{self.pathway_name}_excluding_processes_{key}_mean_co2_emission_factor"
-                ] = co2_emission_factor_ressource
-                co2_emission_factor = co2_emission_factor.add(
-                    co2_emission_factor_ressource, fill_value=0
+                output_data[f"{self.pathway_name}_{source}_{key}_mean_co2_emission_factor"] = (
+                    co2_emission_factor_ressource
                 )
-            # 2 ) --> pathway gets a process that uses a resource
-            for process_key in self.process_keys:
-                specific_consumption = input_data.get(
-                    f"{process_key}_resource_specific_consumption_{key}"
-                )
-                if specific_consumption is not None:
-                    ressource_consumption = energy_consumption * specific_consumption
-                    ressource_required_with_selectivity = (
-                        ressource_consumption / pathway_kerosene_selectivity
-                    )
+                resource_emission_factors.append(co2_emission_factor_ressource)
 
-                    total_ressource_consumption = total_ressource_consumption.add(
-                        ressource_consumption, fill_value=0
-                    )
-                    total_ressource_mobilised_with_selectivity = (
-                        total_ressource_mobilised_with_selectivity.add(
-                            ressource_required_with_selectivity, fill_value=0
-                        )
-                    )
-
-                    output_data[f"{self.pathway_name}_{process_key}_{key}_total_consumption"] = (
-                        ressource_consumption
-                    )
-                    output_data[
-                        f"{self.pathway_name}_{process_key}_{key}_total_mobilised_with_selectivity"
-                    ] = ressource_required_with_selectivity
-
-                    unit_emissions = input_data.get(
-                        f"{key}_co2_emission_factor", optional_null_series
-                    )
-                    # get resource emission per unit of energy
-                    co2_emission_factor_ressource = specific_consumption * unit_emissions
-
-                    output_data[
-                        f"{self.pathway_name}_{process_key}_{key}_mean_co2_emission_factor"
-                    ] = co2_emission_factor_ressource
-                    co2_emission_factor = co2_emission_factor.add(
-                        co2_emission_factor_ressource, fill_value=0
-                    )
             # Store the total resource consumption
             output_data[f"{self.pathway_name}_{key}_total_consumption"] = (
                 total_ressource_consumption
@@ -289,10 +268,12 @@ class TopDownEnvironmental(AeroMAPSModel):
             output_data[
                 f"{self.pathway_name}_{process_key}_without_resources_mean_co2_emission_factor"
             ] = co2_emission_factor_process
-
-            co2_emission_factor = co2_emission_factor.add(co2_emission_factor_process)
+            process_emission_factors.append(co2_emission_factor_process)
 
         # Store the total CO2 emission factor in the dataframe
+        co2_emission_factor = _sum_emission_factors(
+            resource_emission_factors, process_emission_factors
+        )
         output_data[f"{self.pathway_name}_mean_co2_emission_factor"] = co2_emission_factor
 
         # compute the cumulative and discounted emissions for the vintage NOT RECOMMENDED WITH TOP-DOWN MODELS
@@ -303,32 +284,18 @@ class TopDownEnvironmental(AeroMAPSModel):
             )
             social_discount_rate = input_data.get("social_discount_rate", 0.0)
 
-            # Initialize the output series for cumulative emissions
-            output_data[f"{self.pathway_name}_lifespan_unitary_emissions"] = pd.Series(
-                np.NaN, index=range(self.historic_start_year, self.end_year + 1)
-            )
-            output_data[f"{self.pathway_name}_lifespan_discounted_unitary_emissions"] = pd.Series(
-                np.NaN, index=range(self.historic_start_year, self.end_year + 1)
+            # Compute cumulative and discounted emissions for the vintages
+            cumul_em, generic_discounted_cumul_em = self._unitary_cumul_emissions(
+                co2_emission_factor,
+                exogenous_carbon_price_trajectory,
+                social_discount_rate,
             )
 
-            for year in range(self.historic_start_year, self.end_year + 1):
-                if year in co2_emission_factor.index:
-                    # Compute cumulative and discounted emissions for the vintage
-                    cumul_em, generic_discounted_cumul_em = self._unitary_cumul_emissions(
-                        co2_emission_factor.loc[year],
-                        exogenous_carbon_price_trajectory,
-                        social_discount_rate,
-                        year,  # Assuming a default lifespan of 25 years for the vintage
-                    )
-                else:
-                    cumul_em = np.NaN
-                    generic_discounted_cumul_em = np.NaN
-
-                # Store the cumulative emissions for the vintage
-                output_data[f"{self.pathway_name}_lifespan_unitary_emissions"].loc[year] = cumul_em
-                output_data[f"{self.pathway_name}_lifespan_discounted_unitary_emissions"].loc[
-                    year
-                ] = generic_discounted_cumul_em
+            # Store the cumulative emissions for the vintages
+            output_data[f"{self.pathway_name}_lifespan_unitary_emissions"] = cumul_em
+            output_data[f"{self.pathway_name}_lifespan_discounted_unitary_emissions"] = (
+                generic_discounted_cumul_em
+            )
 
         # Calculate the total CO2 emissions
         total_co2_emissions = energy_consumption * co2_emission_factor
@@ -340,45 +307,61 @@ class TopDownEnvironmental(AeroMAPSModel):
 
     def _unitary_cumul_emissions(
         self,
-        emission_factor: float,
+        co2_emission_factor: pd.Series,
         exogenous_carbon_price_trajectory: pd.Series,
         social_discount_rate: float,
-        year,
         lifespan: int = 25,  # Default lifespan of the vintage in years
     ):
         """
-        Compute cumulative and discounted emissions for each vintage,
-        using the vintage ef
+        Compute cumulative and discounted emissions for each vintage (scenario year),
+        using the vintage ef over the whole vintage lifespan
         """
-        indexes = range(year, year + lifespan)
-        cumul_em = 0
-        generic_discounted_cumul_em = 0
-        for i in indexes:
-            # Use the emission factor of the commissioning year (vintage)
-            if i <= self.end_year:
-                cumul_em += emission_factor
-                generic_discounted_cumul_em += (
-                    emission_factor
-                    * exogenous_carbon_price_trajectory[i]
-                    / exogenous_carbon_price_trajectory[indexes[0]]
-                    / (1 + social_discount_rate) ** (i - indexes[0])
-                )
-            else:
-                # After scenario end, keep last known values and extrapolate SCC growth
-                ef_end = emission_factor
-                future_scc_growth = (
-                    exogenous_carbon_price_trajectory[self.end_year]
-                    / exogenous_carbon_price_trajectory[self.end_year - 1]
-                )
-                cumul_em += ef_end
-                generic_discounted_cumul_em += (
-                    ef_end
-                    * (
-                        exogenous_carbon_price_trajectory[self.end_year]
-                        / exogenous_carbon_price_trajectory[indexes[0]]
-                        * (future_scc_growth) ** (i - self.end_year)
-                    )
-                    / (1 + social_discount_rate) ** (i - indexes[0])
-                )
-
+        index = pd.RangeIndex(self.historic_start_year, self.end_year + 1)
+        vintages = index[index.isin(co2_emission_factor.index)].to_numpy()
+        emission_factor = co2_emission_factor.reindex(vintages).to_numpy(dtype=float)
+
+        cumul_em = pd.Series(np.nan, index=index)
+        generic_discounted_cumul_em = pd.Series(np.nan, index=index)
+        if len(vintages):
+            cumul_em.loc[vintages] = np.sum(
+                np.broadcast_to(emission_factor[:, None], (len(vintages), lifespan)), axis=1
+            )
+            generic_discounted_cumul_em.loc[vintages] = np.sum(
+                emission_factor[:, None]
+                * carbon_value_factors(
+                    exogenous_carbon_price_trajectory,
+                    social_discount_rate,
+                    vintages,
+                    lifespan,
+                    self.end_year,
+                ),
+                axis=1,
+            )
         return cumul_em, generic_discounted_cumul_em
+
+
+def _sum_emission_factors(resource_emission_factors, process_emission_factors):
+    """
+    Sum emission factors on the union of their indexes, missing resource terms being ignored.
+
+    Array equivalent of chained ``Series.add`` calls, with ``fill_value=0`` for the resource terms.
+    """
+    if len(resource_emission_factors) == 1 and not process_emission_factors:
+        return resource_emission_factors[0]
+
+    grid = resource_emission_factors[0].index
+    for emission_factor in resource_emission_factors + process_emission_factors:
+        if isinstance(emission_factor, pd.Series) and not emission_factor.index.equals(grid):
+            grid = grid.union(emission_factor.index)
+
+    values, defined = zip(
+        *(_series_on_grid(emission_factor, grid) for emission_factor in resource_emission_factors)
+    )
+    values, defined = np.array(values), np.any(defined, axis=0)
+    total = _nan_sum(values)
+    for emission_factor in process_emission_factors:
+        if isinstance(emission_factor, pd.Series):
+            emission_factor, process_defined = _series_on_grid(emission_factor, grid)
+            defined = defined | process_defined
+        total = total + emission_factor
+    return _series_from_grid(total, defined, grid)
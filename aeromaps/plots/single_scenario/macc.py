@@ -1,3 +1,5 @@
+import weakref
+
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import numpy as np
@@ -12,6 +14,7 @@ from mpl_toolkits.axes_grid1 import make_axes_locatable
 from aeromaps.plots.single_scenario_plot import SingleScenarioPlot
 from aeromaps.plots.single_scenario_plot import plot_3_x
 from aeromaps.plots.single_scenario_plot import plot_3_y
+from aeromaps.utils.discounting import compound_factors
 
 
 # Hard-coded MACC bar colors for the default passenger markets. Custom market
@@ -30,6 +33,222 @@ def _aircraft_color(fleet, category_name: str) -> str:
     return _MARKET_AIRCRAFT_COLORS.get(market_id, _DEFAULT_AIRCRAFT_COLOR)
 
 
+MACC_METRICS = (
+    "carbon_abatement_cost",
+    "specific_carbon_abatement_cost",
+    "generic_specific_carbon_abatement_cost",
+)
+
+
+def _aircraft_columns(prefix="", suffix=""):
+    """Abatement volume and cost columns of an aircraft lever, metrics in ``MACC_METRICS`` order."""
+    return (
+        f"{prefix}aircraft_carbon_abatement_volume{suffix}",
+        f"{prefix}aircraft_carbon_abatement_cost{suffix}",
+        f"{prefix}aircraft_specific_carbon_abatement_cost{suffix}",
+        f"{prefix}aircraft_generic_specific_carbon_abatement_cost{suffix}",
+    )
+
+
+def _operations_columns(lever, suffix=""):
+    """Abatement volume and cost columns of an operations or load factor lever."""
+    return (
+        f"{lever}_abatement_effective{suffix}",
+        f"{lever}_abatement_cost{suffix}",
+        f"{lever}_specific_abatement_cost{suffix}",
+        f"{lever}_generic_specific_abatement_cost{suffix}",
+    )
+
+
+def _pathway_columns(df, pathway_name):
+    """Abatement volume and cost columns of an energy pathway, checked against ``df``."""
+    columns = (
+        f"{pathway_name}_abatement_effective",
+        f"{pathway_name}_carbon_abatement_cost",
+        f"{pathway_name}_specific_carbon_abatement_cost",
+        f"{pathway_name}_generic_specific_carbon_abatement_cost",
+    )
+    descriptions = (
+        "abatement",
+        "carbon abatement cost",
+        "specific carbon abatement cost",
+        "generic specific carbon abatement cost",
+    )
+    for column, description in zip(columns, descriptions):
+        if column not in df.columns:
+            raise ValueError(
+                f"Pathway {pathway_name} {description} is not defined. Pathways must be defined with bottom-up model."
+            )
+    return columns
+
+
+# Freighter, operations and load factor levers, common to all MACCs: (name, color, columns)
+_FREIGHT_AND_OPERATIONS_LEVERS = (
+    ("Freighter - Drop in", "khaki", _aircraft_columns(suffix="_freight_dropin")),
+    ("Freighter - Hydrogen", "khaki", _aircraft_columns(suffix="_freight_hydrogen")),
+    ("Freighter - Electric", "khaki", _aircraft_columns(suffix="_freight_electric")),
+    ("OPS", "orange", _operations_columns("operations")),
+    ("OPS - Freight", "orange", _operations_columns("operations", suffix="_freight")),
+    ("Load Factor", "orange", _operations_columns("load_factor")),
+)
+
+# MACC data of the last run of each process, see MACCData.from_process
+_MACC_DATA_CACHE = weakref.WeakKeyDictionary()
+
+
+class MACCData:
+    """
+    Abatement volumes and costs of the MACC levers, as (lever, year) matrices.
+
+    Levers are sorted by each cost metric, year by year, when the data is built, so that
+    MACC widget updates only slice precomputed arrays. Use ``from_process`` to share the
+    data between all MACC plots of a process run.
+
+    Parameters
+    ----------
+    names
+        Lever names.
+    colors
+        Lever bar colors.
+    years
+        Years of the matrices columns.
+    abatement_effective
+        Effective carbon abatement of the levers [MtCO2], shape (lever, year).
+    costs
+        Carbon abatement costs of the levers [€/tCO2] for each metric of ``MACC_METRICS``,
+        shape (lever, year).
+    fleet_levers
+        Mask of the levers read from the fleet model (discrete aircraft).
+    """
+
+    def __init__(self, names, colors, years, abatement_effective, costs, fleet_levers=None):
+        self.names = np.asarray(names, dtype=object)
+        self.colors = np.asarray(colors, dtype=object)
+        self.years = np.asarray(years)
+        self.abatement_effective = abatement_effective
+        self.costs = costs
+        if fleet_levers is None:
+            fleet_levers = np.zeros(len(self.names), dtype=bool)
+        self.fleet_levers = fleet_levers
+
+        # Levers by increasing cost for each year (NaN costs are sorted last and left out)
+        self._orders = {}
+        self._defined_counts = {}
+        for metric, cost in costs.items():
+            self._orders[metric] = np.argsort(cost, axis=0, kind="stable")
+            self._defined_counts[metric] = np.count_nonzero(~np.isnan(cost), axis=0)
+
+    @classmethod
+    def from_process(cls, process, simple=False):
+        """
+        MACC data of the last computation of ``process``, built on first use.
+
+        Parameters
+        ----------
+        process
+            Computed AeroMAPS process.
+        simple
+            Whether passenger aircraft are aggregated in a single mean lever (simple fleet
+            models) rather than read aircraft by aircraft from the fleet model.
+        """
+        # Vector outputs are updated in place by each computation, which is counted by the process
+        data_updates = process._data_updates
+        cached = _MACC_DATA_CACHE.setdefault(process, {})
+        if simple not in cached or cached[simple][0] != data_updates:
+            cached[simple] = (data_updates, cls._build(process, simple))
+        return cached[simple][1]
+
+    @classmethod
+    def _build(cls, process, simple):
+        df = process.data["vector_outputs"]
+        years = process.data["years"]["prospective_years"]
+
+        pathway_levers = [
+            (pathway.name, "yellowgreen", _pathway_columns(df, pathway.name))
+            for pathway in process.pathways_manager.get_all()
+            # hard coded for cac now, may be parametrized later
+            if pathway.name != "fossil_kerosene"
+        ]
+        if simple:
+            levers = [
+                ("Passenger - Mean", "goldenrod", _aircraft_columns(suffix="_passenger_mean")),
+                *_FREIGHT_AND_OPERATIONS_LEVERS,
+                *pathway_levers,
+            ]
+            aircraft_levers = []
+        else:
+            levers = [*pathway_levers, *_FREIGHT_AND_OPERATIONS_LEVERS]
+            fleet = process.fleet_model.fleet
+            aircraft_levers = []
+            for category, sets in fleet.all_aircraft_elements.items():
+                for aircraft_var in sets:
+                    if hasattr(aircraft_var, "parameters"):
+                        aircraft_var_name = aircraft_var.parameters.full_name
+                    else:
+                        aircraft_var_name = aircraft_var.full_name
+                    aircraft_levers.append(
+                        (
+                            aircraft_var_name.split(":")[-1],
+                            _aircraft_color(fleet, category),
+                            _aircraft_columns(prefix=aircraft_var_name + ":"),
+                        )
+                    )
+
+        # (lever, column, year) values, discrete aircraft first
+        values = [
+            df.loc[years, [column for lever in levers for column in lever[2]]]
+            .to_numpy(dtype=float)
+            .T.reshape(len(levers), 4, len(years))
+        ]
+        if aircraft_levers:
+            aircraft_values = process.fleet_model.df.loc[
+                years, [column for lever in aircraft_levers for column in lever[2]]
+            ].to_numpy(dtype=float)
+            values.insert(0, aircraft_values.T.reshape(len(aircraft_levers), 4, len(years)))
+            levers = aircraft_levers + levers
+        values = np.concatenate(values)
+
+        fleet_levers = np.zeros(len(levers), dtype=bool)
+        fleet_levers[: len(aircraft_levers)] = True
+        return cls(
+            names=[lever[0] for lever in levers],
+            colors=[lever[1] for lever in levers],
+            years=years,
+            abatement_effective=values[:, 0] / 1000000,
+            costs={metric: values[:, i + 1] for i, metric in enumerate(MACC_METRICS)},
+            fleet_levers=fleet_levers,
+        )
+
+    def curve(self, year, metric, positive=True):
+        """
+        Levers of the MACC of a year, by increasing cost.
+
+        Parameters
+        ----------
+        year
+            Year of the curve.
+        metric
+            Cost metric, one of ``MACC_METRICS``.
+        positive
+            Whether to return the levers abating emissions, or the ones adding emissions.
+
+        Returns
+        -------
+        names, abatement_effective, costs, colors
+            Arrays over the selected levers; levers with an undefined cost are left out.
+        """
+        j = year - self.years[0]
+        order = self._orders[metric][: self._defined_counts[metric][j], j]
+        abatement_effective = self.abatement_effective[order, j]
+        order = order[abatement_effective > 0 if positive else abatement_effective < 0]
+        return (
+            self.names[order],
+            self.abatement_effective[order, j],
+            self.costs[metric][order, j],
+            self.colors[order],
+        )
+
+
 class AnnualMACC(SingleScenarioPlot):
     def __init__(self, process, figsize=None, **kwargs):
         figsize = figsize or self._get_default_figsize()
@@ -88,228 +307,22 @@ class AnnualMACC(SingleScenarioPlot):
         interact(self.update, year=year_widget, metric=metric_widget, scc_start=scc_widget)
 
     def create_plot_data(self):
-        self.macc_dict = {}
-
-        for year in range(self.prospective_years[0], self.prospective_years[-1] + 1):
-            name = []
-            vol = []
-            cost = []
-            spe_cost = []
-            g_spe_cost = []
-
-            colors = []
-
-            # Start with discrete aircraft from the fleet model
-            for category, sets in self.fleet_model.fleet.all_aircraft_elements.items():
-                for aircraft_var in sets:
-                    if hasattr(aircraft_var, "parameters"):
-                        aircraft_var_name = aircraft_var.parameters.full_name
-                    else:
-                        aircraft_var_name = aircraft_var.full_name
-
-                    vol.append(
-                        self.fleet_model.df.loc[
-                            year, aircraft_var_name + ":aircraft_carbon_abatement_volume"
-                        ]
-                        / 1000000
-                    )
-                    cost.append(
-                        self.fleet_model.df.loc[
-                            year, aircraft_var_name + ":aircraft_carbon_abatement_cost"
-                        ]
-                    )
-
-                    spe_cost.append(
-                        self.fleet_model.df.loc[
-                            year, aircraft_var_name + ":aircraft_specific_carbon_abatement_cost"
-                        ]
-                    )
-
-                    g_spe_cost.append(
-                        self.fleet_model.df.loc[
-                            year,
-                            aircraft_var_name + ":aircraft_generic_specific_carbon_abatement_cost",
-                        ]
-                    )
-                    colors.append(_aircraft_color(self.fleet_model.fleet, category))
-                    name.append(aircraft_var_name.split(":")[-1])
-
-            # continue with generic energy production pathways
-
-            for pathway in self.pathways_manager.get_all():
-                if (
-                    pathway.name != "fossil_kerosene"
-                ):  # hard coded for cac now, may be parametrized later
-                    name.append(pathway.name)
-                    abatement_col = f"{pathway.name}_abatement_effective"
-                    if abatement_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} abatement is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    vol.append(self.df[f"{pathway.name}_abatement_effective"][year] / 1000000)
-                    cac_col = f"{pathway.name}_carbon_abatement_cost"
-                    if cac_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} carbon abatement cost is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    cost.append(self.df[f"{pathway.name}_carbon_abatement_cost"][year])
-                    spe_cac_col = f"{pathway.name}_specific_carbon_abatement_cost"
-                    if spe_cac_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} specific carbon abatement cost is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    spe_cost.append(self.df[f"{pathway.name}_specific_carbon_abatement_cost"][year])
-                    g_spe_cac_col = f"{pathway.name}_generic_specific_carbon_abatement_cost"
-                    if g_spe_cac_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} generic specific carbon abatement cost is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    g_spe_cost.append(
-                        self.df[f"{pathway.name}_generic_specific_carbon_abatement_cost"][year]
-                    )
-                    colors.append("yellowgreen")
-
-            name.extend(
-                [
-                    el
-                    for el in [
-                        "Freighter - Drop in",
-                        "Freighter - Hydrogen",
-                        "Freighter - Electric",
-                        "OPS",
-                        "OPS - Freight",
-                        "Load Factor",
-                    ]
-                ]
-            )
-
-            # Abatement effective in MtCO2e
-            vol.extend(
-                [
-                    elt / 1000000
-                    for elt in [
-                        self.df.loc[year, "aircraft_carbon_abatement_volume_freight_dropin"],
-                        self.df.loc[year, "aircraft_carbon_abatement_volume_freight_hydrogen"],
-                        self.df.loc[year, "aircraft_carbon_abatement_volume_freight_electric"],
-                        self.df.loc[year, "operations_abatement_effective"],
-                        self.df.loc[year, "operations_abatement_effective_freight"],
-                        self.df.loc[year, "load_factor_abatement_effective"],
-                    ]
-                ]
-            )
-
-            # carbon abatement cost in (€/tCO2e)
-            cost.extend(
-                [
-                    el
-                    for el in [
-                        self.df.loc[year, "aircraft_carbon_abatement_cost_freight_dropin"],
-                        self.df.loc[year, "aircraft_carbon_abatement_cost_freight_hydrogen"],
-                        self.df.loc[year, "aircraft_carbon_abatement_cost_freight_electric"],
-                        self.df.loc[year, "operations_abatement_cost"],
-                        self.df.loc[year, "operations_abatement_cost_freight"],
-                        self.df.loc[year, "load_factor_abatement_cost"],
-                    ]
-                ]
-            )
-
-            spe_cost.extend(
-                [
-                    el
-                    for el in [
-                        self.df.loc[year, "aircraft_specific_carbon_abatement_cost_freight_dropin"],
-                        self.df.loc[
-                            year, "aircraft_specific_carbon_abatement_cost_freight_hydrogen"
-                        ],
-                        self.df.loc[
-                            year, "aircraft_specific_carbon_abatement_cost_freight_electric"
-                        ],
-                        self.df.loc[year, "operations_specific_abatement_cost"],
-                        self.df.loc[year, "operations_specific_abatement_cost_freight"],
-                        self.df.loc[year, "load_factor_specific_abatement_cost"],
-                    ]
-                ]
-            )
-
-            g_spe_cost.extend(
-                [
-                    el
-                    for el in [
-                        self.df.loc[
-                            year, "aircraft_generic_specific_carbon_abatement_cost_freight_dropin"
-                        ],
-                        self.df.loc[
-                            year, "aircraft_generic_specific_carbon_abatement_cost_freight_hydrogen"
-                        ],
-                        self.df.loc[
-                            year, "aircraft_generic_specific_carbon_abatement_cost_freight_electric"
-                        ],
-                        self.df.loc[year, "operations_generic_specific_abatement_cost"],
-                        self.df.loc[year, "operations_generic_specific_abatement_cost_freight"],
-                        self.df.loc[year, "load_factor_generic_specific_abatement_cost"],
-                    ]
-                ]
-            )
-
-            colors.extend(
-                [
-                    el
-                    for el in [
-                        "khaki",
-                        "khaki",
-                        "khaki",
-                        "orange",
-                        "orange",
-                        "orange",
-                    ]
-                ]
-            )
-
-            macc_df = pd.DataFrame(
-                data=[vol, cost, spe_cost, g_spe_cost, colors],
-                columns=name,
-                index=[
-                    "abatement_effective",
-                    "carbon_abatement_cost",
-                    "specific_carbon_abatement_cost",
-                    "generic_specific_carbon_abatement_cost",
-                    "colors",
-                ],
-            )
-
-            macc_df = macc_df.transpose()
-
-            self.macc_dict[year] = macc_df
+        self.macc_data = MACCData.from_process(self.process)
 
     def update(self, year, scc_start, metric):
         self.ax.cla()
 
-        macc_df = self.macc_dict[year]
-
-        macc_df = macc_df.sort_values(by=metric)
-
-        # Dropping NaN on costs or abatements
-        macc_df = macc_df.dropna(subset=metric)
-
-        maccneg_df = macc_df[macc_df["abatement_effective"] < -0]
-        maccpos_df = macc_df[macc_df["abatement_effective"] > 0]
-
         ##### POS ######
 
-        heights_pos = maccpos_df[metric].to_list()
-        names_pos = maccpos_df.index.to_list()
-        heights_pos.insert(0, 0)
-        heights_pos.append(0)
+        names_pos, widths_pos, costs_pos, colors_pos = self.macc_data.curve(year, metric)
+        heights_pos = [0, *costs_pos, 0]
 
         # # MAx effective maccpos
-        widths_effective_pos = maccpos_df["abatement_effective"].to_list()
-        widths_effective_pos.insert(0, 0)
+        widths_effective_pos = [0, *widths_pos]
         widths_effective_pos.append(widths_effective_pos[-1])
 
         cumwidths_effective_pos = np.cumsum(widths_effective_pos)
 
-        colors_pos = maccpos_df["colors"].to_list()
-
         scc_year = None
         if metric == "specific_carbon_abatement_cost":
             scc_year = scc_start * (
@@ -412,22 +425,16 @@ class AnnualMACC(SingleScenarioPlot):
 
         ##### NEG #####
 
-        heights_neg = maccneg_df[metric].to_list()
-        names_neg = maccneg_df.index.to_list()
-
-        heights_neg.append(0)
-        heights_neg.insert(0, 0)
+        names_neg, widths_neg, costs_neg, colors_neg = self.macc_data.curve(
+            year, metric, positive=False
+        )
+        heights_neg = [0, *costs_neg, 0]
 
         # # MAx effective maccneg
-        widths_effective_neg = maccneg_df["abatement_effective"].to_list()
-
-        widths_effective_neg.insert(0, 0)
-        widths_effective_neg.append(0)
+        widths_effective_neg = [0, *widths_neg, 0]
 
         cumwidths_effective_neg = np.cumsum(widths_effective_neg)
 
-        colors_neg = maccneg_df["colors"].to_list()
-
         self.ax.step(
             cumwidths_effective_neg[-1] - cumwidths_effective_neg + widths_effective_neg,
             heights_neg,
@@ -616,273 +623,41 @@ class CumulativeMACC(SingleScenarioPlot):
         start_year = self.prospective_years[1]  # not 2019
         end_year = self.prospective_years[-1]
 
-        # macc_dict = {}
-
-        name_list = []
-        cumvol_list = []
-        cumcost_list = []
-        discounted_cumcost_list = []
-        # undiscounted_cac_list = []
-        # discounted_cac_list = []
-
-        colors_list = []
-
-        for category, sets in self.fleet_model.fleet.all_aircraft_elements.items():
-            for aircraft_var in sets:
-                if hasattr(aircraft_var, "parameters"):
-                    aircraft_var_name = aircraft_var.parameters.full_name
-                else:
-                    aircraft_var_name = aircraft_var.full_name
-
-                cumvol = 0
-                cumcost = 0
-                discountedcumcost = 0
-                for year in range(start_year, end_year + 1):
-                    year_vol = (
-                        self.fleet_model.df.loc[
-                            year, aircraft_var_name + ":aircraft_carbon_abatement_volume"
-                        ]
-                        / 1000000
-                    )
-
-                    year_cost = (
-                        year_vol
-                        * 1000000
-                        * self.fleet_model.df.loc[
-                            year, aircraft_var_name + ":aircraft_carbon_abatement_cost"
-                        ]
-                    )
-
-                    cumvol += year_vol
-                    cumcost += year_cost
-                    discountedcumcost += year_cost / (1 + social_discount_rate) ** (
-                        year - start_year
-                    )
-                cumvol_list.append(cumvol)
-                cumcost_list.append(cumcost)
-                discounted_cumcost_list.append(discountedcumcost)
-
-                colors_list.append(_aircraft_color(self.fleet_model.fleet, category))
-                name_list.append(aircraft_var_name.split(":")[-1])
-
-        name_list.extend(
-            [
-                el
-                for el in [
-                    "Freighter - Dropin",
-                    "Freighter - Hydrogen",
-                    "Freighter - Electric",
-                    "OPS",
-                    "OPS - Freighter",
-                    "LF",
-                ]
-            ]
-        )
-
-        # Abatement effective in MtCO2e
-        cumvol_list.extend(
-            [
-                elt / 1000000
-                for elt in [
-                    self.df.loc[
-                        start_year:end_year, "aircraft_carbon_abatement_volume_freight_dropin"
-                    ].sum(),
-                    self.df.loc[
-                        start_year:end_year, "aircraft_carbon_abatement_volume_freight_hydrogen"
-                    ].sum(),
-                    self.df.loc[
-                        start_year:end_year, "aircraft_carbon_abatement_volume_freight_electric"
-                    ].sum(),
-                    self.df.loc[start_year:end_year, "operations_abatement_effective"].sum(),
-                    self.df.loc[
-                        start_year:end_year, "operations_abatement_effective_freight"
-                    ].sum(),
-                    self.df.loc[start_year:end_year, "load_factor_abatement_effective"].sum(),
-                ]
-            ]
-        )
-
-        # carbon abatement cost in (€/tCO2e)
-        cumcost_list.extend(
-            [
-                el
-                for el in [
-                    (
-                        self.df.loc[
-                            start_year:end_year, "aircraft_carbon_abatement_cost_freight_dropin"
-                        ]
-                        * self.df.loc[
-                            start_year:end_year, "aircraft_carbon_abatement_volume_freight_dropin"
-                        ]
-                    ).sum(),
-                    (
-                        self.df.loc[
-                            start_year:end_year, "aircraft_carbon_abatement_cost_freight_hydrogen"
-                        ]
-                        * self.df.loc[
-                            start_year:end_year, "aircraft_carbon_abatement_volume_freight_hydrogen"
-                        ]
-                    ).sum(),
-                    (
-                        self.df.loc[
-                            start_year:end_year, "aircraft_carbon_abatement_cost_freight_electric"
-                        ]
-                        * self.df.loc[
-                            start_year:end_year, "aircraft_carbon_abatement_volume_freight_electric"
-                        ]
-                    ).sum(),
-                    (
-                        self.df.loc[start_year:end_year, "operations_abatement_cost"]
-                        * self.df.loc[start_year:end_year, "operations_abatement_effective"]
-                    ).sum(),
-                    (
-                        self.df.loc[start_year:end_year, "operations_abatement_cost_freight"]
-                        * self.df.loc[start_year:end_year, "operations_abatement_effective_freight"]
-                    ).sum(),
-                    (
-                        self.df.loc[start_year:end_year, "load_factor_abatement_cost"]
-                        * self.df.loc[start_year:end_year, "load_factor_abatement_effective"]
-                    ).sum(),
-                ]
-            ]
-        )
-
-        power_series = pd.Series(
-            [
-                (1 + social_discount_rate) ** (year - start_year)
-                for year in range(start_year, end_year + 1)
-            ],
-            index=range(start_year, end_year + 1),
+        macc_data = MACCData.from_process(self.process)
+        in_scope = slice(start_year - macc_data.years[0], end_year - macc_data.years[0] + 1)
+        abatement = macc_data.abatement_effective[:, in_scope]
+        cost = abatement * 1000000 * macc_data.costs["carbon_abatement_cost"][:, in_scope]
+        discounted_cost = cost / compound_factors(social_discount_rate, end_year - start_year + 1)
+
+        # Undefined yearly values are skipped, except for discrete aircraft
+        fleet_levers = macc_data.fleet_levers
+        cumvol = np.where(fleet_levers, abatement.sum(axis=1), np.nansum(abatement, axis=1))
+        cumcost = np.where(fleet_levers, cost.sum(axis=1), np.nansum(cost, axis=1))
+        discounted_cumcost = np.where(
+            fleet_levers, discounted_cost.sum(axis=1), np.nansum(discounted_cost, axis=1)
         )
 
-        discounted_cumcost_list.extend(
-            [
-                el
-                for el in [
-                    (
-                        self.df.loc[
-                            start_year:end_year, "aircraft_carbon_abatement_cost_freight_dropin"
-                        ]
-                        * self.df.loc[
-                            start_year:end_year, "aircraft_carbon_abatement_volume_freight_dropin"
-                        ]
-                        / power_series
-                    ).sum(),
-                    (
-                        self.df.loc[
-                            start_year:end_year, "aircraft_carbon_abatement_cost_freight_hydrogen"
-                        ]
-                        * self.df.loc[
-                            start_year:end_year, "aircraft_carbon_abatement_volume_freight_hydrogen"
-                        ]
-                        / power_series
-                    ).sum(),
-                    (
-                        self.df.loc[
-                            start_year:end_year, "aircraft_carbon_abatement_cost_freight_electric"
-                        ]
-                        * self.df.loc[
-                            start_year:end_year, "aircraft_carbon_abatement_volume_freight_electric"
-                        ]
-                        / power_series
-                    ).sum(),
-                    (
-                        self.df.loc[start_year:end_year, "operations_abatement_cost"]
-                        * self.df.loc[start_year:end_year, "operations_abatement_effective"]
-                        / power_series
-                    ).sum(),
-                    (
-                        self.df.loc[start_year:end_year, "operations_abatement_cost_freight"]
-                        * self.df.loc[start_year:end_year, "operations_abatement_effective_freight"]
-                        / power_series
-                    ).sum(),
-                    (
-                        self.df.loc[start_year:end_year, "load_factor_abatement_cost"]
-                        * self.df.loc[start_year:end_year, "load_factor_abatement_effective"]
-                        / power_series
-                    ).sum(),
-                ]
-            ]
+        defined = (cumvol != 0) & ~np.isnan(cumvol)
+        undiscounted_cac = np.divide(
+            cumcost, cumvol * 1000000, out=np.full_like(cumcost, np.nan), where=defined
         )
-
-        colors_list.extend(
-            [
-                el
-                for el in [
-                    "khaki",
-                    "khaki",
-                    "khaki",
-                    "orange",
-                    "orange",
-                    "orange",
-                ]
-            ]
+        discounted_cac = np.divide(
+            discounted_cumcost, cumvol * 1000000, out=np.full_like(cumcost, np.nan), where=defined
         )
 
-        # now add generic energy production pathways
-        for pathway in self.pathways_manager.get_all():
-            if pathway.name != "fossil_kerosene":
-                name_list.append(pathway.name)
-                abatement_col = f"{pathway.name}_abatement_effective"
-                if abatement_col not in self.df.columns:
-                    raise ValueError(
-                        f"Pathway {pathway.name} abatement is not defined. Pathways must be defined with bottom-up model."
-                    )
-                cumvol = self.df[abatement_col].loc[start_year:end_year].sum() / 1000000
-                cumvol_list.append(cumvol)
-
-                cac_col = f"{pathway.name}_carbon_abatement_cost"
-                if cac_col not in self.df.columns:
-                    raise ValueError(
-                        f"Pathway {pathway.name} carbon abatement cost is not defined. Pathways must be defined with bottom-up model."
-                    )
-                cumcost = (
-                    self.df[cac_col].loc[start_year:end_year]
-                    * self.df[abatement_col].loc[start_year:end_year]
-                ).sum()
-                cumcost_list.append(cumcost)
-
-                discounted_cumcost = (
-                    self.df[cac_col].loc[start_year:end_year]
-                    * self.df[abatement_col].loc[start_year:end_year]
-                    / power_series
-                ).sum()
-                discounted_cumcost_list.append(discounted_cumcost)
-
-                colors_list.append("yellowgreen")
-
-        undiscounted_cac_list = [
-            a / (b * 1000000) if (b != 0 and not np.isnan(b)) else np.NaN
-            for a, b in zip(cumcost_list, cumvol_list)
-        ]
-        discounted_cac_list = [
-            a / (b * 1000000) if (b != 0 and not np.isnan(b)) else np.NaN
-            for a, b in zip(discounted_cumcost_list, cumvol_list)
-        ]
-
         macc_df = pd.DataFrame(
-            data=[
-                cumvol_list,
-                cumcost_list,
-                discounted_cumcost_list,
-                undiscounted_cac_list,
-                discounted_cac_list,
-                colors_list,
-            ],
-            columns=name_list,
-            index=[
-                "abatement_effective",
-                "cumulative_abatement_cost",
-                "discoutend_cumulative_abatement_cost",
-                "undiscounted_carbon_abatement_cost",
-                "carbon_abatement_cost",
-                "colors",
-            ],
+            {
+                "abatement_effective": cumvol,
+                "cumulative_abatement_cost": cumcost,
+                "discoutend_cumulative_abatement_cost": discounted_cumcost,
+                "undiscounted_carbon_abatement_cost": undiscounted_cac,
+                "carbon_abatement_cost": discounted_cac,
+                "colors": macc_data.colors,
+            },
+            index=macc_data.names,
         )
-        self.macc_df = (
-            macc_df.transpose()
-            .sort_values(by="carbon_abatement_cost")
-            .dropna(subset="carbon_abatement_cost")
+        self.macc_df = macc_df.sort_values(by="carbon_abatement_cost", kind="stable").dropna(
+            subset="carbon_abatement_cost"
         )
 
     def update(self):
@@ -1222,198 +997,7 @@ class ScenarioMACC(SingleScenarioPlot):
         interact(self.update, metric=metric_widget, scc_start=scc_widget)
 
     def create_plot_data(self):
-        self.macc_dict = {}
-
-        for year in range(self.prospective_years[0], self.prospective_years[-1] + 1):
-            name = []
-            vol = []
-            cost = []
-            spe_cost = []
-            g_spe_cost = []
-
-            colors = []
-
-            # Start with discrete aircraft from the fleet model
-            for category, sets in self.fleet_model.fleet.all_aircraft_elements.items():
-                for aircraft_var in sets:
-                    if hasattr(aircraft_var, "parameters"):
-                        aircraft_var_name = aircraft_var.parameters.full_name
-                    else:
-                        aircraft_var_name = aircraft_var.full_name
-
-                    vol.append(
-                        self.fleet_model.df.loc[
-                            year, aircraft_var_name + ":aircraft_carbon_abatement_volume"
-                        ]
-                        / 1000000
-                    )
-                    cost.append(
-                        self.fleet_model.df.loc[
-                            year, aircraft_var_name + ":aircraft_carbon_abatement_cost"
-                        ]
-                    )
-
-                    spe_cost.append(
-                        self.fleet_model.df.loc[
-                            year, aircraft_var_name + ":aircraft_specific_carbon_abatement_cost"
-                        ]
-                    )
-
-                    g_spe_cost.append(
-                        self.fleet_model.df.loc[
-                            year,
-                            aircraft_var_name + ":aircraft_generic_specific_carbon_abatement_cost",
-                        ]
-                    )
-                    colors.append(_aircraft_color(self.fleet_model.fleet, category))
-                    name.append(aircraft_var_name.split(":")[-1])
-
-            # continue with generic energy production pathways
-
-            for pathway in self.pathways_manager.get_all():
-                if (
-                    pathway.name != "fossil_kerosene"
-                ):  # hard coded for cac now, may be parametrized later
-                    name.append(pathway.name)
-                    abatement_col = f"{pathway.name}_abatement_effective"
-                    if abatement_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} abatement is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    vol.append(self.df[f"{pathway.name}_abatement_effective"][year] / 1000000)
-                    cac_col = f"{pathway.name}_carbon_abatement_cost"
-                    if cac_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} carbon abatement cost is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    cost.append(self.df[f"{pathway.name}_carbon_abatement_cost"][year])
-                    spe_cac_col = f"{pathway.name}_specific_carbon_abatement_cost"
-                    if spe_cac_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} specific carbon abatement cost is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    spe_cost.append(self.df[f"{pathway.name}_specific_carbon_abatement_cost"][year])
-                    g_spe_cac_col = f"{pathway.name}_generic_specific_carbon_abatement_cost"
-                    if g_spe_cac_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} generic specific carbon abatement cost is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    g_spe_cost.append(
-                        self.df[f"{pathway.name}_generic_specific_carbon_abatement_cost"][year]
-                    )
-                    colors.append("yellowgreen")
-
-            name.extend(
-                [
-                    el
-                    for el in [
-                        "Freighter - Drop in",
-                        "Freighter - Hydrogen",
-                        "Freighter - Electric",
-                        "OPS",
-                        "OPS - Freight",
-                        "Load Factor",
-                    ]
-                ]
-            )
-
-            # Abatement effective in MtCO2e
-            vol.extend(
-                [
-                    elt / 1000000
-                    for elt in [
-                        self.df.loc[year, "aircraft_carbon_abatement_volume_freight_dropin"],
-                        self.df.loc[year, "aircraft_carbon_abatement_volume_freight_hydrogen"],
-                        self.df.loc[year, "aircraft_carbon_abatement_volume_freight_electric"],
-                        self.df.loc[year, "operations_abatement_effective"],
-                        self.df.loc[year, "operations_abatement_effective_freight"],
-                        self.df.loc[year, "load_factor_abatement_effective"],
-                    ]
-                ]
-            )
-
-            # carbon abatement cost in (€/tCO2e)
-            cost.extend(
-                [
-                    el
-                    for el in [
-                        self.df.loc[year, "aircraft_carbon_abatement_cost_freight_dropin"],
-                        self.df.loc[year, "aircraft_carbon_abatement_cost_freight_hydrogen"],
-                        self.df.loc[year, "aircraft_carbon_abatement_cost_freight_electric"],
-                        self.df.loc[year, "operations_abatement_cost"],
-                        self.df.loc[year, "operations_abatement_cost_freight"],
-                        self.df.loc[year, "load_factor_abatement_cost"],
-                    ]
-                ]
-            )
-
-            spe_cost.extend(
-                [
-                    el
-                    for el in [
-                        self.df.loc[year, "aircraft_specific_carbon_abatement_cost_freight_dropin"],
-                        self.df.loc[
-                            year, "aircraft_specific_carbon_abatement_cost_freight_hydrogen"
-                        ],
-                        self.df.loc[
-                            year, "aircraft_specific_carbon_abatement_cost_freight_electric"
-                        ],
-                        self.df.loc[year, "operations_specific_abatement_cost"],
-                        self.df.loc[year, "operations_specific_abatement_cost_freight"],
-                        self.df.loc[year, "load_factor_specific_abatement_cost"],
-                    ]
-                ]
-            )
-
-            g_spe_cost.extend(
-                [
-                    el
-                    for el in [
-                        self.df.loc[
-                            year, "aircraft_generic_specific_carbon_abatement_cost_freight_dropin"
-                        ],
-                        self.df.loc[
-                            year, "aircraft_generic_specific_carbon_abatement_cost_freight_hydrogen"
-                        ],
-                        self.df.loc[
-                            year, "aircraft_generic_specific_carbon_abatement_cost_freight_electric"
-                        ],
-                        self.df.loc[year, "operations_generic_specific_abatement_cost"],
-                        self.df.loc[year, "operations_generic_specific_abatement_cost_freight"],
-                        self.df.loc[year, "load_factor_generic_specific_abatement_cost"],
-                    ]
-                ]
-            )
-
-            colors.extend(
-                [
-                    el
-                    for el in [
-                        "khaki",
-                        "khaki",
-                        "khaki",
-                        "orange",
-                        "orange",
-                        "orange",
-                    ]
-                ]
-            )
-
-            macc_df = pd.DataFrame(
-                data=[vol, cost, spe_cost, g_spe_cost, colors],
-                columns=name,
-                index=[
-                    "abatement_effective",
-                    "carbon_abatement_cost",
-                    "specific_carbon_abatement_cost",
-                    "generic_specific_carbon_abatement_cost",
-                    "colors",
-                ],
-            )
-
-            macc_df = macc_df.transpose()
-
-            self.macc_dict[year] = macc_df
+        self.macc_data = MACCData.from_process(self.process)
 
     def update(self, metric, scc_start):
         self.ax.cla()
@@ -1423,19 +1007,9 @@ class ScenarioMACC(SingleScenarioPlot):
         scc_list = []
 
         for year in range(self.prospective_years[0], self.prospective_years[-1] + 1):
-            macc_df = self.macc_dict[year]
-
-            macc_df = macc_df.sort_values(by=metric)
-
-            macc_df = macc_df.dropna(subset=metric)
-
-            maccneg_df = macc_df[macc_df["abatement_effective"] < 0]
-            maccpos_df = macc_df[macc_df["abatement_effective"] > 0]
-
             ##### POS ######
 
-            heights_pos = maccpos_df[metric].to_numpy()
-            widths_effective_pos = maccpos_df["abatement_effective"].to_numpy()
+            _, widths_effective_pos, heights_pos, _ = self.macc_data.curve(year, metric)
 
             cumwidths_pos = np.cumsum(widths_effective_pos)
 
@@ -1481,8 +1055,9 @@ class ScenarioMACC(SingleScenarioPlot):
                 )
 
             ##### NEG ######
-            heights_neg = maccneg_df[metric].to_numpy()
-            widths_effective_neg = maccneg_df["abatement_effective"].to_numpy()
+            _, widths_effective_neg, heights_neg, _ = self.macc_data.curve(
+                year, metric, positive=False
+            )
 
             cumwidths_neg = np.cumsum(widths_effective_neg)
 
@@ -1603,197 +1178,7 @@ class ShadowCarbonPrice(SingleScenarioPlot):
         interact(self.update, metric=metric_widget, scc_start=scc_widget)
 
     def create_plot_data(self):
-        self.macc_dict = {}
-
-        for year in range(self.prospective_years[0], self.prospective_years[-1] + 1):
-            name = []
-            vol = []
-            cost = []
-            spe_cost = []
-            g_spe_cost = []
-
-            colors = []
-            # Start with discrete aircraft from the fleet model
-            for category, sets in self.fleet_model.fleet.all_aircraft_elements.items():
-                for aircraft_var in sets:
-                    if hasattr(aircraft_var, "parameters"):
-                        aircraft_var_name = aircraft_var.parameters.full_name
-                    else:
-                        aircraft_var_name = aircraft_var.full_name
-
-                    vol.append(
-                        self.fleet_model.df.loc[
-                            year, aircraft_var_name + ":aircraft_carbon_abatement_volume"
-                        ]
-                        / 1000000
-                    )
-                    cost.append(
-                        self.fleet_model.df.loc[
-                            year, aircraft_var_name + ":aircraft_carbon_abatement_cost"
-                        ]
-                    )
-
-                    spe_cost.append(
-                        self.fleet_model.df.loc[
-                            year, aircraft_var_name + ":aircraft_specific_carbon_abatement_cost"
-                        ]
-                    )
-
-                    g_spe_cost.append(
-                        self.fleet_model.df.loc[
-                            year,
-                            aircraft_var_name + ":aircraft_generic_specific_carbon_abatement_cost",
-                        ]
-                    )
-                    colors.append(_aircraft_color(self.fleet_model.fleet, category))
-                    name.append(aircraft_var_name.split(":")[-1])
-
-            # continue with generic energy production pathways
-
-            for pathway in self.pathways_manager.get_all():
-                if (
-                    pathway.name != "fossil_kerosene"
-                ):  # hard coded for cac now, may be parametrized later
-                    name.append(pathway.name)
-                    abatement_col = f"{pathway.name}_abatement_effective"
-                    if abatement_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} abatement is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    vol.append(self.df[f"{pathway.name}_abatement_effective"][year] / 1000000)
-                    cac_col = f"{pathway.name}_carbon_abatement_cost"
-                    if cac_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} carbon abatement cost is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    cost.append(self.df[f"{pathway.name}_carbon_abatement_cost"][year])
-                    spe_cac_col = f"{pathway.name}_specific_carbon_abatement_cost"
-                    if spe_cac_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} specific carbon abatement cost is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    spe_cost.append(self.df[f"{pathway.name}_specific_carbon_abatement_cost"][year])
-                    g_spe_cac_col = f"{pathway.name}_generic_specific_carbon_abatement_cost"
-                    if g_spe_cac_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} generic specific carbon abatement cost is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    g_spe_cost.append(
-                        self.df[f"{pathway.name}_generic_specific_carbon_abatement_cost"][year]
-                    )
-                    colors.append("yellowgreen")
-
-            name.extend(
-                [
-                    el
-                    for el in [
-                        "Freighter - Drop in",
-                        "Freighter - Hydrogen",
-                        "Freighter - Electric",
-                        "OPS",
-                        "OPS - Freight",
-                        "Load Factor",
-                    ]
-                ]
-            )
-
-            # Abatement effective in MtCO2e
-            vol.extend(
-                [
-                    elt / 1000000
-                    for elt in [
-                        self.df.loc[year, "aircraft_carbon_abatement_volume_freight_dropin"],
-                        self.df.loc[year, "aircraft_carbon_abatement_volume_freight_hydrogen"],
-                        self.df.loc[year, "aircraft_carbon_abatement_volume_freight_electric"],
-                        self.df.loc[year, "operations_abatement_effective"],
-                        self.df.loc[year, "operations_abatement_effective_freight"],
-                        self.df.loc[year, "load_factor_abatement_effective"],
-                    ]
-                ]
-            )
-
-            # carbon abatement cost in (€/tCO2e)
-            cost.extend(
-                [
-                    el
-                    for el in [
-                        self.df.loc[year, "aircraft_carbon_abatement_cost_freight_dropin"],
-                        self.df.loc[year, "aircraft_carbon_abatement_cost_freight_hydrogen"],
-                        self.df.loc[year, "aircraft_carbon_abatement_cost_freight_electric"],
-                        self.df.loc[year, "operations_abatement_cost"],
-                        self.df.loc[year, "operations_abatement_cost_freight"],
-                        self.df.loc[year, "load_factor_abatement_cost"],
-                    ]
-                ]
-            )
-
-            spe_cost.extend(
-                [
-                    el
-                    for el in [
-                        self.df.loc[year, "aircraft_specific_carbon_abatement_cost_freight_dropin"],
-                        self.df.loc[
-                            year, "aircraft_specific_carbon_abatement_cost_freight_hydrogen"
-                        ],
-                        self.df.loc[
-                            year, "aircraft_specific_carbon_abatement_cost_freight_electric"
-                        ],
-                        self.df.loc[year, "operations_specific_abatement_cost"],
-                        self.df.loc[year, "operations_specific_abatement_cost_freight"],
-                        self.df.loc[year, "load_factor_specific_abatement_cost"],
-                    ]
-                ]
-            )
-
-            g_spe_cost.extend(
-                [
-                    el
-                    for el in [
-                        self.df.loc[
-                            year, "aircraft_generic_specific_carbon_abatement_cost_freight_dropin"
-                        ],
-                        self.df.loc[
-                            year, "aircraft_generic_specific_carbon_abatement_cost_freight_hydrogen"
-                        ],
-                        self.df.loc[
-                            year, "aircraft_generic_specific_carbon_abatement_cost_freight_electric"
-                        ],
-                        self.df.loc[year, "operations_generic_specific_abatement_cost"],
-                        self.df.loc[year, "operations_generic_specific_abatement_cost_freight"],
-                        self.df.loc[year, "load_factor_generic_specific_abatement_cost"],
-                    ]
-                ]
-            )
-
-            colors.extend(
-                [
-                    el
-                    for el in [
-                        "khaki",
-                        "khaki",
-                        "khaki",
-                        "orange",
-                        "orange",
-                        "orange",
-                    ]
-                ]
-            )
-
-            macc_df = pd.DataFrame(
-                data=[vol, cost, spe_cost, g_spe_cost, colors],
-                columns=name,
-                index=[
-                    "abatement_effective",
-                    "carbon_abatement_cost",
-                    "specific_carbon_abatement_cost",
-                    "generic_specific_carbon_abatement_cost",
-                    "colors",
-                ],
-            )
-
-            macc_df = macc_df.transpose()
-
-            self.macc_dict[year] = macc_df
+        self.macc_data = MACCData.from_process(self.process)
 
     def update(self, metric, scc_start):
         self.ax.cla()
@@ -1807,19 +1192,8 @@ class ShadowCarbonPrice(SingleScenarioPlot):
         years = range(self.prospective_years[0], self.prospective_years[-1] + 1)
 
         for year in years:
-            macc_df = self.macc_dict[year]
-
-            macc_df = macc_df.sort_values(by=metric)
-
-            macc_df = macc_df.dropna(subset=metric)
-
             # Plot only made for positive abatements
-            maccpos_df = macc_df[macc_df["abatement_effective"] > 0]
-
-            ##### POS ######
-
-            heights_pos = maccpos_df[metric].to_numpy()
-            widths_effective_pos = maccpos_df["abatement_effective"].to_numpy()
+            _, widths_effective_pos, heights_pos, _ = self.macc_data.curve(year, metric)
 
             if metric == "specific_carbon_abatement_cost":
                 scc_year = scc_start * (
@@ -1943,199 +1317,22 @@ class AnnualMACCSimple(SingleScenarioPlot):
         interact(self.update, year=year_widget, metric=metric_widget, scc_start=scc_widget)
 
     def create_plot_data(self):
-        self.macc_dict = {}
-
-        for year in range(self.prospective_years[0], self.prospective_years[-1] + 1):
-            name = []
-            vol = []
-            cost = []
-            spe_cost = []
-            g_spe_cost = []
-
-            colors = []
-            name.extend(
-                [
-                    el
-                    for el in [
-                        "Passenger - Mean",
-                        "Freighter - Drop in",
-                        "Freighter - Hydrogen",
-                        "Freighter - Electric",
-                        "OPS",
-                        "OPS - Freight",
-                        "Load Factor",
-                    ]
-                ]
-            )
-
-            # Abatement effective in MtCO2e
-
-            vol.extend(
-                [
-                    elt / 1000000
-                    for elt in [
-                        self.df.loc[year, "aircraft_carbon_abatement_volume_passenger_mean"],
-                        self.df.loc[year, "aircraft_carbon_abatement_volume_freight_dropin"],
-                        self.df.loc[year, "aircraft_carbon_abatement_volume_freight_hydrogen"],
-                        self.df.loc[year, "aircraft_carbon_abatement_volume_freight_electric"],
-                        self.df.loc[year, "operations_abatement_effective"],
-                        self.df.loc[year, "operations_abatement_effective_freight"],
-                        self.df.loc[year, "load_factor_abatement_effective"],
-                    ]
-                ]
-            )
-
-            # carbon abatement cost in (€/tCO2e)
-            cost.extend(
-                [
-                    el
-                    for el in [
-                        self.df.loc[year, "aircraft_carbon_abatement_cost_passenger_mean"],
-                        self.df.loc[year, "aircraft_carbon_abatement_cost_freight_dropin"],
-                        self.df.loc[year, "aircraft_carbon_abatement_cost_freight_hydrogen"],
-                        self.df.loc[year, "aircraft_carbon_abatement_cost_freight_electric"],
-                        self.df.loc[year, "operations_abatement_cost"],
-                        self.df.loc[year, "operations_abatement_cost_freight"],
-                        self.df.loc[year, "load_factor_abatement_cost"],
-                    ]
-                ]
-            )
-
-            spe_cost.extend(
-                [
-                    el
-                    for el in [
-                        self.df.loc[year, "aircraft_specific_carbon_abatement_cost_passenger_mean"],
-                        self.df.loc[year, "aircraft_specific_carbon_abatement_cost_freight_dropin"],
-                        self.df.loc[
-                            year, "aircraft_specific_carbon_abatement_cost_freight_hydrogen"
-                        ],
-                        self.df.loc[
-                            year, "aircraft_specific_carbon_abatement_cost_freight_electric"
-                        ],
-                        self.df.loc[year, "operations_specific_abatement_cost"],
-                        self.df.loc[year, "operations_specific_abatement_cost_freight"],
-                        self.df.loc[year, "load_factor_specific_abatement_cost"],
-                    ]
-                ]
-            )
-
-            g_spe_cost.extend(
-                [
-                    el
-                    for el in [
-                        self.df.loc[
-                            year, "aircraft_generic_specific_carbon_abatement_cost_passenger_mean"
-                        ],
-                        self.df.loc[
-                            year, "aircraft_generic_specific_carbon_abatement_cost_freight_dropin"
-                        ],
-                        self.df.loc[
-                            year, "aircraft_generic_specific_carbon_abatement_cost_freight_hydrogen"
-                        ],
-                        self.df.loc[
-                            year, "aircraft_generic_specific_carbon_abatement_cost_freight_electric"
-                        ],
-                        self.df.loc[year, "operations_generic_specific_abatement_cost"],
-                        self.df.loc[year, "operations_generic_specific_abatement_cost_freight"],
-                        self.df.loc[year, "load_factor_generic_specific_abatement_cost"],
-                    ]
-                ]
-            )
-
-            colors.extend(
-                [
-                    el
-                    for el in [
-                        "goldenrod",
-                        "khaki",
-                        "khaki",
-                        "khaki",
-                        "orange",
-                        "orange",
-                        "orange",
-                    ]
-                ]
-            )
-
-            for pathway in self.pathways_manager.get_all():
-                if (
-                    pathway.name != "fossil_kerosene"
-                ):  # hard coded for cac now, may be parametrized later
-                    name.append(pathway.name)
-                    abatement_col = f"{pathway.name}_abatement_effective"
-                    if abatement_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} abatement is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    vol.append(self.df[f"{pathway.name}_abatement_effective"][year] / 1000000)
-                    cac_col = f"{pathway.name}_carbon_abatement_cost"
-                    if cac_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} carbon abatement cost is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    cost.append(self.df[f"{pathway.name}_carbon_abatement_cost"][year])
-                    spe_cac_col = f"{pathway.name}_specific_carbon_abatement_cost"
-                    if spe_cac_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} specific carbon abatement cost is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    spe_cost.append(self.df[f"{pathway.name}_specific_carbon_abatement_cost"][year])
-                    g_spe_cac_col = f"{pathway.name}_generic_specific_carbon_abatement_cost"
-                    if g_spe_cac_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} generic specific carbon abatement cost is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    g_spe_cost.append(
-                        self.df[f"{pathway.name}_generic_specific_carbon_abatement_cost"][year]
-                    )
-                    colors.append("yellowgreen")
-
-            macc_df = pd.DataFrame(
-                data=[vol, cost, spe_cost, g_spe_cost, colors],
-                columns=name,
-                index=[
-                    "abatement_effective",
-                    "carbon_abatement_cost",
-                    "specific_carbon_abatement_cost",
-                    "generic_specific_carbon_abatement_cost",
-                    "colors",
-                ],
-            )
-
-            macc_df = macc_df.transpose()
-
-            self.macc_dict[year] = macc_df
+        self.macc_data = MACCData.from_process(self.process, simple=True)
 
     def update(self, year, scc_start, metric):
         self.ax.cla()
 
-        macc_df = self.macc_dict[year]
-
-        macc_df = macc_df.sort_values(by=metric)
-
-        # dropping NaN on costs or abatements
-        macc_df = macc_df.dropna(subset=metric)
-
-        maccneg_df = macc_df[macc_df["abatement_effective"] < -0]
-        maccpos_df = macc_df[macc_df["abatement_effective"] > 0]
-
         ##### POS ######
 
-        heights_pos = maccpos_df[metric].to_list()
-        names_pos = maccpos_df.index.to_list()
-        heights_pos.insert(0, 0)
-        heights_pos.append(0)
+        names_pos, widths_pos, costs_pos, colors_pos = self.macc_data.curve(year, metric)
+        heights_pos = [0, *costs_pos, 0]
 
         # # MAx effective maccpos
-        widths_effective_pos = maccpos_df["abatement_effective"].to_list()
-        widths_effective_pos.insert(0, 0)
+        widths_effective_pos = [0, *widths_pos]
         widths_effective_pos.append(widths_effective_pos[-1])
 
         cumwidths_effective_pos = np.cumsum(widths_effective_pos)
 
-        colors_pos = maccpos_df["colors"].to_list()
-
         scc_year = None
         if metric == "specific_carbon_abatement_cost":
             scc_year = scc_start * (
@@ -2217,22 +1414,16 @@ class AnnualMACCSimple(SingleScenarioPlot):
 
         ##### NEG #####
 
-        heights_neg = maccneg_df[metric].to_list()
-        names_neg = maccneg_df.index.to_list()
-
-        heights_neg.append(0)
-        heights_neg.insert(0, 0)
+        names_neg, widths_neg, costs_neg, colors_neg = self.macc_data.curve(
+            year, metric, positive=False
+        )
+        heights_neg = [0, *costs_neg, 0]
 
         # # MAx effective maccneg
-        widths_effective_neg = maccneg_df["abatement_effective"].to_list()
-
-        widths_effective_neg.insert(0, 0)
-        widths_effective_neg.append(0)
+        widths_effective_neg = [0, *widths_neg, 0]
 
         cumwidths_effective_neg = np.cumsum(widths_effective_neg)
 
-        colors_neg = maccneg_df["colors"].to_list()
-
         self.ax.step(
             cumwidths_effective_neg[-1] - cumwidths_effective_neg + widths_effective_neg,
             heights_neg,
@@ -2445,169 +1636,7 @@ class ShadowCarbonPriceSimple(SingleScenarioPlot):
         interact(self.update, metric=metric_widget, scc_start=scc_widget)
 
     def create_plot_data(self):
-        self.macc_dict = {}
-
-        for year in range(self.prospective_years[0], self.prospective_years[-1] + 1):
-            name = []
-            vol = []
-            cost = []
-            spe_cost = []
-            g_spe_cost = []
-
-            colors = []
-
-            name.extend(
-                [
-                    el
-                    for el in [
-                        "Passenger - Mean",
-                        "Freighter - Drop in",
-                        "Freighter - Hydrogen",
-                        "Freighter - Electric",
-                        "OPS",
-                        "OPS - Freight",
-                        "Load Factor",
-                    ]
-                ]
-            )
-
-            # Abatement effective in MtCO2e
-            vol.extend(
-                [
-                    elt / 1000000
-                    for elt in [
-                        self.df.loc[year, "aircraft_carbon_abatement_volume_passenger_mean"],
-                        self.df.loc[year, "aircraft_carbon_abatement_volume_freight_dropin"],
-                        self.df.loc[year, "aircraft_carbon_abatement_volume_freight_hydrogen"],
-                        self.df.loc[year, "aircraft_carbon_abatement_volume_freight_electric"],
-                        self.df.loc[year, "operations_abatement_effective"],
-                        self.df.loc[year, "operations_abatement_effective_freight"],
-                        self.df.loc[year, "load_factor_abatement_effective"],
-                    ]
-                ]
-            )
-
-            # carbon abatement cost in (€/tCO2e)
-            cost.extend(
-                [
-                    el
-                    for el in [
-                        self.df.loc[year, "aircraft_carbon_abatement_cost_passenger_mean"],
-                        self.df.loc[year, "aircraft_carbon_abatement_cost_freight_dropin"],
-                        self.df.loc[year, "aircraft_carbon_abatement_cost_freight_hydrogen"],
-                        self.df.loc[year, "aircraft_carbon_abatement_cost_freight_electric"],
-                        self.df.loc[year, "operations_abatement_cost"],
-                        self.df.loc[year, "operations_abatement_cost_freight"],
-                        self.df.loc[year, "load_factor_abatement_cost"],
-                    ]
-                ]
-            )
-
-            spe_cost.extend(
-                [
-                    el
-                    for el in [
-                        self.df.loc[year, "aircraft_specific_carbon_abatement_cost_passenger_mean"],
-                        self.df.loc[year, "aircraft_specific_carbon_abatement_cost_freight_dropin"],
-                        self.df.loc[
-                            year, "aircraft_specific_carbon_abatement_cost_freight_hydrogen"
-                        ],
-                        self.df.loc[
-                            year, "aircraft_specific_carbon_abatement_cost_freight_electric"
-                        ],
-                        self.df.loc[year, "operations_specific_abatement_cost"],
-                        self.df.loc[year, "operations_specific_abatement_cost_freight"],
-                        self.df.loc[year, "load_factor_specific_abatement_cost"],
-                    ]
-                ]
-            )
-
-            g_spe_cost.extend(
-                [
-                    el
-                    for el in [
-                        self.df.loc[
-                            year, "aircraft_generic_specific_carbon_abatement_cost_passenger_mean"
-                        ],
-                        self.df.loc[
-                            year, "aircraft_generic_specific_carbon_abatement_cost_freight_dropin"
-                        ],
-                        self.df.loc[
-                            year, "aircraft_generic_specific_carbon_abatement_cost_freight_hydrogen"
-                        ],
-                        self.df.loc[
-                            year, "aircraft_generic_specific_carbon_abatement_cost_freight_electric"
-                        ],
-                        self.df.loc[year, "operations_generic_specific_abatement_cost"],
-                        self.df.loc[year, "operations_generic_specific_abatement_cost_freight"],
-                        self.df.loc[year, "load_factor_generic_specific_abatement_cost"],
-                    ]
-                ]
-            )
-
-            colors.extend(
-                [
-                    el
-                    for el in [
-                        "goldenrod",
-                        "khaki",
-                        "khaki",
-                        "khaki",
-                        "orange",
-                        "orange",
-                        "orange",
-                    ]
-                ]
-            )
-
-            for pathway in self.pathways_manager.get_all():
-                if (
-                    pathway.name != "fossil_kerosene"
-                ):  # hard coded for cac now, may be parametrized later
-                    name.append(pathway.name)
-                    abatement_col = f"{pathway.name}_abatement_effective"
-                    if abatement_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} abatement is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    vol.append(self.df[f"{pathway.name}_abatement_effective"][year] / 1000000)
-                    cac_col = f"{pathway.name}_carbon_abatement_cost"
-                    if cac_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} carbon abatement cost is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    cost.append(self.df[f"{pathway.name}_carbon_abatement_cost"][year])
-                    spe_cac_col = f"{pathway.name}_specific_carbon_abatement_cost"
-                    if spe_cac_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} specific carbon abatement cost is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    spe_cost.append(self.df[f"{pathway.name}_specific_carbon_abatement_cost"][year])
-                    g_spe_cac_col = f"{pathway.name}_generic_specific_carbon_abatement_cost"
-                    if g_spe_cac_col not in self.df.columns:
-                        raise ValueError(
-                            f"Pathway {pathway.name} generic specific carbon abatement cost is not defined. Pathways must be defined with bottom-up model."
-                        )
-                    g_spe_cost.append(
-                        self.df[f"{pathway.name}_generic_specific_carbon_abatement_cost"][year]
-                    )
-                    colors.append("yellowgreen")
-
-            macc_df = pd.DataFrame(
-                data=[vol, cost, spe_cost, g_spe_cost, colors],
-                columns=name,
-                index=[
-                    "abatement_effective",
-                    "carbon_abatement_cost",
-                    "specific_carbon_abatement_cost",
-                    "generic_specific_carbon_abatement_cost",
-                    "colors",
-                ],
-            )
-
-            macc_df = macc_df.transpose()
-
-            self.macc_dict[year] = macc_df
+        self.macc_data = MACCData.from_process(self.process, simple=True)
 
     def update(self, metric, scc_start):
         self.ax.cla()
@@ -2621,19 +1650,8 @@ class ShadowCarbonPriceSimple(SingleScenarioPlot):
         years = range(self.prospective_years[0], self.prospective_years[-1] + 1)
 
         for year in years:
-            macc_df = self.macc_dict[year]
-
-            macc_df = macc_df.sort_values(by=metric)
-
-            macc_df = macc_df.dropna(subset=metric)
-
             # Plot only made for positive abatements
-            maccpos_df = macc_df[macc_df["abatement_effective"] > 0]
-
-            ##### POS ######
-
-            heights_pos = maccpos_df[metric].to_numpy()
-            widths_effective_pos = maccpos_df["abatement_effective"].to_numpy()
+            _, widths_effective_pos, heights_pos, _ = self.macc_data.curve(year, metric)
 
             if metric == "specific_carbon_abatement_cost":
                 scc_year = scc_start * (
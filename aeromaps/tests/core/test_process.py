@@ -7,6 +7,7 @@ groups can be instantiated and run without errors.
 
 from pathlib import Path
 
+import pandas as pd
 import pytest
 from aeromaps import create_process
 
@@ -116,3 +117,20 @@ def test_process_models_are_independent():
         assert proc1.models[model_name] is not proc2.models[model_name], (
             f"Model {model_name} should be independent between processes"
         )
+
+
+def test_compute_twice():
+    """Test that a second computation gives the results of a new process."""
+    config_file = CONFIG_DIR / "config_advanced_simplified.yaml"
+    proc = create_process(configuration_file=config_file)
+    proc.compute()
+    proc.parameters.operations_final_gain += 4.0
+    proc.compute()
+
+    new_proc = create_process(configuration_file=config_file)
+    new_proc.parameters.operations_final_gain += 4.0
+    new_proc.compute()
+
+    pd.testing.assert_frame_equal(
+        proc.data["vector_outputs"], new_proc.data["vector_outputs"], check_like=True
+    )
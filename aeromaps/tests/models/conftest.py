@@ -0,0 +1,37 @@
+"""Shared fixtures for model tests."""
+
+import pytest
+import yaml
+
+from aeromaps.tests.models.helpers import CONFIG_DIR
+
+
+def _absolute_paths(node):
+    if isinstance(node, dict):
+        return {key: _absolute_paths(value) for key, value in node.items()}
+    if isinstance(node, str) and node.startswith(("./", "../")):
+        return str(CONFIG_DIR / node)
+    return node
+
+
+@pytest.fixture
+def config_variant(tmp_path):
+    """Write a copy of a tested configuration with extra ``models`` options.
+
+    Options given as dictionaries are merged into the existing ones. Relative paths of the tested configuration are made absolute so that the copy can
+    live in a temporary directory.
+    """
+
+    def write(config_name, **model_options):
+        with open(CONFIG_DIR / config_name) as f:
+            config = _absolute_paths(yaml.safe_load(f))
+        for key, value in model_options.items():
+            if isinstance(value, dict) and isinstance(config["models"].get(key), dict):
+                value = {**config["models"][key], **value}
+            config["models"][key] = value
+        config_file = tmp_path / config_name
+        with open(config_file, "w") as f:
+            yaml.safe_dump(config, f)
+        return config_file
+
+    return write
@@ -0,0 +1,69 @@
+"""Constants and helpers shared by the model tests."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+CONFIG_DIR = Path(__file__).parent.parent / "tested_configs"
+
+# Parameters of the models tested on their own, and their historic and prospective years
+PARAMETERS = SimpleNamespace(
+    climate_historic_start_year=1940,
+    historic_start_year=2000,
+    prospection_start_year=2020,
+    end_year=2050,
+)
+YEARS = pd.RangeIndex(PARAMETERS.historic_start_year, PARAMETERS.end_year + 1)
+PROSPECTIVE_YEARS = pd.RangeIndex(PARAMETERS.prospection_start_year, PARAMETERS.end_year + 1)
+
+CARBON_PRICE = pd.Series(np.linspace(20.0, 300.0, len(YEARS)), index=YEARS)
+SOCIAL_DISCOUNT_RATE = 0.032
+
+# Synthetic climate simulation: historical years up to CLIMATE_LAST_HISTORIC_YEAR, then prospective
+CLIMATE_START_YEAR = 1990
+CLIMATE_LAST_HISTORIC_YEAR = 2019
+CLIMATE_END_YEAR = 2040
+
+
+def lifespan_sums(values, year, lifespan):
+    """
+    Sums of yearly values over the lifespan of a vintage, year by year.
+
+    Beyond the end year, the values are kept at their end year value and CARBON_PRICE grows at its
+    last annual rate.
+
+    Returns
+    -------
+    tuple
+        Sum of the values, and sums discounted at SOCIAL_DISCOUNT_RATE without and with the values
+        weighted by the carbon price relative to the vintage year.
+    """
+    end_year = PARAMETERS.end_year
+    growth = CARBON_PRICE[end_year] / CARBON_PRICE[end_year - 1]
+    cumul = discounted_cumul = carbon_discounted_cumul = 0.0
+    for i in range(year, year + lifespan):
+        j = min(i, end_year)
+        discount = (1 + SOCIAL_DISCOUNT_RATE) ** (i - year)
+        price_ratio = CARBON_PRICE[j] / CARBON_PRICE[year] * growth ** max(i - end_year, 0)
+        cumul += values[j]
+        discounted_cumul += values[j] / discount
+        carbon_discounted_cumul += values[j] * price_ratio / discount
+    return cumul, discounted_cumul, carbon_discounted_cumul
+
+
+def climate_species_inventory(prospective_factor=1.0):
+    """Inventory of each AeroCM species, growing linearly and scaled on the prospective years."""
+    years = np.arange(CLIMATE_START_YEAR, CLIMATE_END_YEAR + 1)
+    growth = np.linspace(1.0, 2.0, len(years))
+    growth[years > CLIMATE_LAST_HISTORIC_YEAR] *= prospective_factor
+    return {
+        "CO2": 0.8e12 * growth,  # in kg
+        "Contrails": 4.0e10 * growth,  # in km
+        "NOx - ST O3 increase": 3.5e9 * growth,  # in kg
+        "NOx - CH4 decrease and induced": 3.5e9 * growth,  # in kg
+        "H2O": 3.1e11 * growth,  # in kg
+        "Soot": 8.0e6 * growth,  # in kg
+        "Sulfur": 1.0e8 * growth,  # in kg
+    }
@@ -0,0 +1,76 @@
+"""Commissioning kernel of the bottom-up production capacity model (``BottomUpCapacity``)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aeromaps.models.impacts.generic_energy_model.bottom_up.production_capacity import (
+    BottomUpCapacity,
+)
+from aeromaps.tests.models.helpers import PARAMETERS, YEARS
+
+
+def _legacy_commissioning(energy_required, lifespan, load_factor):
+    """Year-by-year Series loop that the vintage arrays replaced."""
+    years = energy_required.index
+    plant_available_scenario = pd.Series(np.zeros(len(years)), years)
+    energy_produced = pd.Series(np.zeros(len(years)), years)
+    energy_production_commissioned = pd.Series(np.zeros(len(years)), years)
+    energy_unused = pd.Series(np.zeros(len(years)), years)
+    for year in years:
+        missing_production = energy_required.fillna(0)[year] - energy_produced[year]
+        if missing_production <= 0.0:
+            energy_unused[year] = missing_production
+        else:
+            energy_production_commissioned[year] = missing_production
+            plant_available_scenario.loc[year : year + lifespan - 1] += (
+                missing_production / load_factor
+            )
+            energy_produced.loc[year : year + lifespan - 1] += missing_production
+    return energy_production_commissioned, plant_available_scenario, -energy_unused
+
+
+@pytest.mark.filterwarnings("ignore:.*Excess test production")
+@pytest.mark.parametrize("lifespan", [4, 12, 25])
+def test_commissioning_matches_year_loop(lifespan):
+    rng = np.random.default_rng(lifespan)
+    # Growth with a dip, so that some vintages retire while production is in excess
+    demand = pd.Series(
+        1e9 * (1 + np.arange(len(YEARS))) * (1 + 0.4 * np.sin(np.arange(len(YEARS)) / 3)),
+        index=YEARS,
+    ) * rng.uniform(0.95, 1.05, len(YEARS))
+    model = BottomUpCapacity(
+        "test_production_capacity",
+        configuration_data={
+            "name": "test",
+            "inputs": {
+                "technical": {
+                    "test_eis_plant_lifespan": lifespan,
+                    "test_eis_plant_load_factor": 0.8,
+                    "test_technology_introduction_year": 1990,
+                    "test_technology_introduction_volume": 1e8,
+                }
+            },
+        },
+        processes_data={},
+        parameters=PARAMETERS,
+    )
+    input_data = dict(model.input_names, test_energy_consumption=demand)
+
+    output_data = model.compute(input_data)
+
+    # Virtual demand since the technology introduction year, growing to the 2000 demand
+    cagr = (demand[2000] / 1e8) ** (1 / 10) - 1
+    virtual_demand = pd.Series(1e8 * (1 + cagr) ** np.arange(10), index=range(1990, 2000))
+    commissioned, capacity, unused = _legacy_commissioning(
+        pd.concat([virtual_demand, demand]), lifespan, 0.8
+    )
+    prospective = slice(PARAMETERS.prospection_start_year, PARAMETERS.end_year)
+    for name, expected in [
+        ("test_energy_production_commissioned", commissioned),
+        ("test_plant_operating_capacity", capacity),
+        ("test_energy_unused", unused),
+    ]:
+        pd.testing.assert_series_equal(
+            output_data[name], expected.loc[prospective], check_names=False, rtol=1e-12
+        )
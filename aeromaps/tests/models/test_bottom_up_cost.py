@@ -0,0 +1,46 @@
+"""Vintage-matrix kernels of the bottom-up cost model (``BottomUpCost``)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aeromaps.models.impacts.generic_energy_model.bottom_up.cost import BottomUpCost
+from aeromaps.utils.functions import _get_value_for_year, _get_values_for_years
+
+
+def _levelised_capex_loop(capex, discount_rate, lifespan, construction_time):
+    """Discounted capex over discounted production, year by year."""
+    capital = sum(
+        capex / construction_time / (1 + discount_rate) ** t for t in range(construction_time)
+    )
+    production = sum(
+        1 / (1 + discount_rate) ** t for t in range(construction_time, construction_time + lifespan)
+    )
+    return capital / production
+
+
+def test_spread_capital_is_vectorised_over_vintages():
+    capex = np.array([1200.0, 950.0, 800.0, 640.0])
+    discount_rate = np.array([0.0, 0.03, 0.07, 0.1])
+    lifespan = np.array([25.0, 20.0, 30.0, 15.0])
+    construction_time = np.array([3.0, 2.0, 4.0, 1.0])
+
+    spread = BottomUpCost._spread_capital(capex, discount_rate, lifespan, construction_time)
+
+    expected = [
+        _levelised_capex_loop(*map(float, args[:2]), *map(int, args[2:]))
+        for args in zip(capex, discount_rate, lifespan, construction_time)
+    ]
+    assert spread.shape == capex.shape
+    np.testing.assert_allclose(spread, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [0.4, 3, pd.Series([1.0, np.nan, 3.0], index=[2025, 2026, 2027]), None, "n/a"],
+)
+def test_values_for_years_match_scalar_lookup(value):
+    years = np.arange(2024, 2029)
+    values = _get_values_for_years(value, years, 7.0)
+    expected = [_get_value_for_year(value, year, 7.0) for year in years]
+    np.testing.assert_array_equal(values, np.array(expected, dtype=float))
@@ -0,0 +1,53 @@
+"""Carbon price trajectories (``CarbonTax``, ``ExogenousCarbonPriceTrajectory``)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aeromaps.models.base import aeromaps_interpolation_function
+from aeromaps.models.impacts.costs.carbon_tax.carbon_tax import CarbonTax
+from aeromaps.models.impacts.costs.scenario.exogneous_carbon_price import (
+    ExogenousCarbonPriceTrajectory,
+)
+from aeromaps.tests.models.helpers import PARAMETERS
+from aeromaps.utils.functions import _values_at_years
+
+REFERENCE_YEARS = [2020, 2030, 2040, 2050]
+REFERENCE_YEARS_VALUES = [60.0, 120.0, 250.0, 400.0]
+
+
+def test_carbon_tax_trajectory():
+    model = CarbonTax(parameters=PARAMETERS)
+    carbon_tax = model.compute(REFERENCE_YEARS, REFERENCE_YEARS_VALUES)
+
+    expected = aeromaps_interpolation_function(model, REFERENCE_YEARS, REFERENCE_YEARS_VALUES)
+    expected.loc[:2019] = 5.0
+    np.testing.assert_array_equal(carbon_tax.to_numpy(), expected.to_numpy())
+    assert list(carbon_tax.index) == list(range(2000, 2051))
+
+
+def test_exogenous_carbon_price_is_memoised_and_held_over_historic_years():
+    model = ExogenousCarbonPriceTrajectory(parameters=PARAMETERS)
+    price = model.compute(REFERENCE_YEARS, REFERENCE_YEARS_VALUES)
+
+    assert (price.loc[:2019] == 60.0).all()
+    assert price[2035] == pytest.approx(185.0)
+
+    # Same reference years and values give the same shared trajectory
+    other = ExogenousCarbonPriceTrajectory(parameters=PARAMETERS)
+    other.compute(list(REFERENCE_YEARS), np.array(REFERENCE_YEARS_VALUES))
+    np.testing.assert_array_equal(other.df["exogenous_carbon_price_trajectory"], price)
+    price_changed = other.compute(REFERENCE_YEARS, [60.0, 120.0, 250.0, 500.0])
+    assert price_changed[2050] == 500.0
+    assert price[2050] == 400.0
+
+
+def test_values_at_years_reads_consecutive_years_by_position():
+    series = pd.Series(np.arange(5.0), index=range(2018, 2023))
+    years = np.array([[2017, 2018], [2022, 2023]])
+    np.testing.assert_array_equal(
+        _values_at_years(series, years), np.array([[np.nan, 0.0], [4.0, np.nan]])
+    )
+
+    sparse = pd.Series([1.0, 2.0], index=[2020, 2030])
+    np.testing.assert_array_equal(_values_at_years(sparse, [2030, 2025]), [2.0, np.nan])
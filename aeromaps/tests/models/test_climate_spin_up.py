@@ -0,0 +1,47 @@
+"""Historical spin-up of the climate simulations (``HistoricalSpinUp``)."""
+
+import numpy as np
+import pytest
+from aerocm.climate_models.aviation_climate_simulation import AviationClimateSimulation
+
+from aeromaps.models.impacts.climate.spin_up import HistoricalSpinUp
+from aeromaps.tests.models.helpers import (
+    CLIMATE_END_YEAR,
+    CLIMATE_LAST_HISTORIC_YEAR,
+    CLIMATE_START_YEAR,
+    climate_species_inventory,
+)
+
+
+@pytest.mark.parametrize("climate_model", HistoricalSpinUp.available_climate_models)
+def test_spin_up_matches_full_simulation(climate_model):
+    spin_up = HistoricalSpinUp(
+        climate_model, CLIMATE_START_YEAR, CLIMATE_LAST_HISTORIC_YEAR, CLIMATE_END_YEAR
+    )
+
+    for prospective_factor in [1.0, 0.5]:
+        species_inventory = climate_species_inventory(prospective_factor)
+        results = AviationClimateSimulation(
+            spin_up,
+            CLIMATE_START_YEAR,
+            CLIMATE_END_YEAR,
+            species_inventory,
+            spin_up.species_settings,
+            spin_up.model_settings,
+        ).run()
+        expected = AviationClimateSimulation(
+            climate_model, CLIMATE_START_YEAR, CLIMATE_END_YEAR, species_inventory
+        ).run()
+
+        for specie, specie_results in expected.items():
+            for key, value in specie_results.items():
+                value = np.ravel(value)
+                np.testing.assert_allclose(
+                    results[specie][key], value, rtol=0, atol=1e-10 * np.max(np.abs(value))
+                )
+
+        # The historical simulations are reused for the second prospective inventory
+        if prospective_factor == 1.0:
+            historical = dict(spin_up._historical)
+        else:
+            assert all(spin_up._historical[specie] is historical[specie] for specie in historical)
@@ -0,0 +1,57 @@
+"""Impulse-response surrogate of the climate simulations (``ImpulseResponseSurrogate``)."""
+
+import numpy as np
+import pytest
+from aerocm.climate_models.aviation_climate_simulation import AviationClimateSimulation
+
+from aeromaps.models.impacts.climate.spin_up import HistoricalSpinUp
+from aeromaps.models.impacts.climate.surrogate import ImpulseResponseSurrogate, surrogate_errors
+from aeromaps.tests.models.helpers import (
+    CLIMATE_END_YEAR,
+    CLIMATE_LAST_HISTORIC_YEAR,
+    CLIMATE_START_YEAR,
+    climate_species_inventory,
+)
+
+# Largest relative error of the total response; the linear models are only approximate for the
+# methane response to NOx, whose lifetime depends on the emission year
+TOLERANCES = {"IPCC": 1e-2, "GWP*": 1e-10, "LWE": 1e-2, "FaIR": 5e-2}
+
+
+def _run(climate_model, species_inventory):
+    return AviationClimateSimulation(
+        climate_model,
+        CLIMATE_START_YEAR,
+        CLIMATE_END_YEAR,
+        species_inventory,
+        climate_model.species_settings,
+        climate_model.model_settings,
+    ).run()
+
+
+@pytest.mark.parametrize("climate_model", HistoricalSpinUp.available_climate_models)
+def test_surrogate_matches_full_simulation(climate_model, tmp_path):
+    spin_up = HistoricalSpinUp(
+        climate_model, CLIMATE_START_YEAR, CLIMATE_LAST_HISTORIC_YEAR, CLIMATE_END_YEAR
+    )
+    surrogate = ImpulseResponseSurrogate(spin_up, cache_directory=tmp_path)
+
+    for prospective_factor in [1.0, 0.5]:
+        species_inventory = climate_species_inventory(prospective_factor)
+        errors = surrogate_errors(
+            _run(surrogate, species_inventory), _run(spin_up, species_inventory)
+        )
+        assert errors.loc["Total"].max() < TOLERANCES[climate_model]
+        assert errors.loc[["CO2", "Contrails", "H2O"]].to_numpy().max() < TOLERANCES[climate_model]
+
+    # The kernels are cached on disk and reloaded for the same model settings
+    assert len(list(tmp_path.glob("climate_kernels_*.npz"))) == 1
+    reloaded = ImpulseResponseSurrogate(
+        HistoricalSpinUp(
+            climate_model, CLIMATE_START_YEAR, CLIMATE_LAST_HISTORIC_YEAR, CLIMATE_END_YEAR
+        ),
+        cache_directory=tmp_path,
+    )
+    assert reloaded.kernels.keys() == surrogate.kernels.keys()
+    for specie, kernel in surrogate.kernels.items():
+        np.testing.assert_array_equal(reloaded.kernels[specie], kernel)
@@ -0,0 +1,33 @@
+"""Cumulative CO2 emissions with incremental suffix updates (``_incremental_cumsum``)."""
+
+import numpy as np
+import pandas as pd
+
+from aeromaps.utils.functions import _incremental_cumsum
+
+
+def _emissions(values):
+    return pd.Series(values, index=range(2025, 2025 + len(values)), name="co2_emissions")
+
+
+def test_incremental_cumsum_matches_full_cumsum_after_suffix_changes():
+    rng = np.random.default_rng(0)
+    values = rng.uniform(0.5, 1.5, size=26)
+    values[[0, 7]] = np.nan  # skipped as by pd.Series.cumsum
+    cumulative, state = _incremental_cumsum(_emissions(values))
+    pd.testing.assert_series_equal(cumulative, _emissions(values).cumsum())
+
+    for start in [20, 3, 25, 0, 26]:
+        values = values.copy()
+        values[start:] *= 1.1
+        emissions = _emissions(values)
+        cumulative, state = _incremental_cumsum(emissions, state)
+        # Same summation order as a full cumulative sum: results are bitwise identical.
+        pd.testing.assert_series_equal(cumulative, emissions.cumsum(), rtol=0, atol=0)
+
+
+def test_incremental_cumsum_restarts_on_new_index():
+    _, state = _incremental_cumsum(_emissions([1.0, 2.0, 3.0]))
+    emissions = pd.Series([1.0, 2.0, 3.0], index=[2030, 2031, 2032])
+    cumulative, _ = _incremental_cumsum(emissions, state)
+    pd.testing.assert_series_equal(cumulative, emissions.cumsum())
@@ -0,0 +1,50 @@
+"""Shared discounting tables (``aeromaps.utils.discounting``)."""
+
+import numpy as np
+import pytest
+
+from aeromaps.utils.discounting import (
+    annuity_factor,
+    compound_factors,
+    discount_factors,
+    geometric_series_sum,
+    levelised_capital_factors,
+)
+
+
+@pytest.mark.parametrize("rate", [0.0, 0.03, 0.045])
+def test_tables_match_powers_and_are_shared(rate):
+    table = compound_factors(rate, 30, -5)
+    # Same values as the (1 + r) ** (i - year) expressions they replace in cost loops
+    assert list(table) == [(1 + rate) ** t for t in range(-5, 25)]
+    np.testing.assert_allclose(discount_factors(rate, 30, -5) * table, 1.0, rtol=1e-15)
+
+    assert compound_factors(rate, 30, -5) is table
+    with pytest.raises(ValueError):
+        table[0] = 0.0
+
+
+@pytest.mark.parametrize("rate", [0.0, 0.03, 0.1])
+def test_series_sums_and_annuity(rate):
+    explicit = sum(1 / (1 + rate) ** t for t in range(3, 3 + 20))
+    assert geometric_series_sum(rate, 20, 3) == pytest.approx(explicit, rel=1e-13)
+
+    # Twenty yearly annuities from year 1 repay a unit present value
+    payments = annuity_factor(rate, 20) * discount_factors(rate, 20, 1)
+    assert payments.sum() == pytest.approx(1.0, rel=1e-13)
+
+
+def test_levelised_capital_factors_broadcast():
+    factors = levelised_capital_factors([0.0, 0.05], 25, 3)
+    assert factors.shape == (2,)
+    assert factors[0] == pytest.approx(1 / 25)
+    assert factors[1] == pytest.approx(
+        geometric_series_sum(0.05, 3) / 3 / geometric_series_sum(0.05, 25, 3)
+    )
+
+
+def test_caches_are_bounded_for_rate_sweeps():
+    compound_factors.cache_clear()
+    for rate in np.linspace(0.0, 0.1, 1000):
+        compound_factors(float(rate), 50)
+    assert compound_factors.cache_info().currsize == compound_factors.cache_info().maxsize
@@ -0,0 +1,50 @@
+"""Batched generic energy models (``models.energy.batched``).
+
+The batched disciplines must publish the same per-pathway, per-resource and
+interpolated outputs as the per-pathway models they group.
+"""
+
+import numpy as np
+import pytest
+
+from aeromaps import create_process
+from aeromaps.models.base import AeroMapsCustomDataType
+from aeromaps.models.impacts.generic_energy_model.common.energy_carriers_batch import (
+    BatchedEnergyModels,
+)
+from aeromaps.models.yaml_interpolator import YAMLInterpolator
+from aeromaps.tests.models.helpers import CONFIG_DIR
+
+
+def test_batched_disciplines_match_per_pathway_models(config_variant):
+    config_name = "config_advanced_simplified.yaml"
+    reference = create_process(configuration_file=CONFIG_DIR / config_name)
+    reference.compute()
+    batched = create_process(
+        configuration_file=config_variant(config_name, energy={"batched": True})
+    )
+    batched.compute()
+
+    batches = [d.model for d in batched.disciplines if isinstance(d.model, BatchedEnergyModels)]
+    assert {"bottom_up_cost_batch", "yaml_interpolator_batch"} <= {b.name for b in batches}
+    assert len(batched.disciplines) < len(reference.disciplines) - 2 * len(batches)
+
+    for batch in batches:
+        for name in batch.output_names:
+            expected = reference.data["vector_outputs"][name]
+            actual = batched.data["vector_outputs"][name]
+            np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=0, err_msg=name)
+
+
+def test_coupled_models_are_not_batched():
+    first = YAMLInterpolator("first", AeroMapsCustomDataType({"years": [], "values": [1.0]}))
+    second = YAMLInterpolator("second", AeroMapsCustomDataType({"years": [], "values": [1.0]}))
+    second.input_names["first"] = first.output_names["first"]
+
+    batch = BatchedEnergyModels("batch", [second, first])
+    assert batch.models == [first, second]
+    assert "first" not in batch.input_names
+
+    first.input_names["second"] = second.output_names["second"]
+    with pytest.raises(ValueError, match="Coupled models cannot be batched"):
+        BatchedEnergyModels("batch", [first, second])
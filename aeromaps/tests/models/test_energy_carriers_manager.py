@@ -0,0 +1,118 @@
+"""Indexed queries of the energy carrier manager (``EnergyCarrierManager``).
+
+Queries are checked against the linear scan they replaced on a large synthetic
+pathway set, whose timings are reported as properties of the test.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from aeromaps.models.impacts.generic_energy_model.common.energy_carriers_manager import (
+    EnergyCarrierManager,
+    EnergyCarrierMetadata,
+)
+
+AIRCRAFT_TYPES = ["dropin_fuel", "hydrogen", "electric"]
+ENERGY_ORIGINS = ["fossil", "biomass", "electricity"]
+MANDATE_TYPES = ["share", "quantity", None]
+RESOURCES = [f"resource_{i}" for i in range(20)]
+PROCESSES = [f"process_{i}" for i in range(10)]
+
+
+def _synthetic_pathways(n_pathways, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        EnergyCarrierMetadata(
+            name=f"pathway_{i}",
+            aircraft_type=AIRCRAFT_TYPES[i % 3],
+            default=bool(i < 3) or None,
+            mandate_type=MANDATE_TYPES[rng.integers(3)],
+            energy_origin=ENERGY_ORIGINS[rng.integers(3)],
+            resources_used=list(rng.choice(RESOURCES, size=rng.integers(4), replace=False)),
+            resources_used_processes={
+                process: RESOURCES[rng.integers(20)]
+                for process in rng.choice(PROCESSES, size=rng.integers(3), replace=False)
+            },
+            cost_model="bottom-up" if i % 2 else "top-down",
+        )
+        for i in range(n_pathways)
+    ]
+
+
+def _legacy_get(carriers, **criteria):
+    """Linear scan that the indexes replaced."""
+    return [
+        c
+        for c in carriers
+        if all(
+            val in getattr(c, attr, {}).values()
+            if isinstance(getattr(c, attr, None), dict)
+            else val in getattr(c, attr, [])
+            if isinstance(getattr(c, attr, None), list)
+            else getattr(c, attr, None) == val
+            for attr, val in criteria.items()
+        )
+    ]
+
+
+QUERIES = [
+    {},
+    {"aircraft_type": "hydrogen"},
+    {"aircraft_type": "dropin_fuel", "default": True},
+    {"aircraft_type": "electric", "mandate_type": "share"},
+    {"energy_origin": "biomass", "aircraft_type": "dropin_fuel"},
+    {"mandate_type": None},
+    {"default": False},
+    {"resources_used": "resource_3"},
+    {"resources_used_processes": "resource_7", "energy_origin": "electricity"},
+    {"name": "pathway_42"},
+    {"aircraft_type": "kerosene"},
+    {"unknown_attribute": None},
+    {"resources_used": ["resource_1"]},
+]
+
+
+@pytest.mark.parametrize("criteria", QUERIES)
+def test_indexed_queries_match_linear_scan(criteria):
+    carriers = _synthetic_pathways(300)
+    manager = EnergyCarrierManager(carriers)
+    matches = manager.get(**criteria)
+    assert isinstance(matches, tuple)
+    assert list(matches) == _legacy_get(carriers, **criteria)
+    assert manager.get(**criteria) is matches
+
+
+def test_queries_are_refreshed_when_adding_carriers():
+    carriers = _synthetic_pathways(30)
+    manager = EnergyCarrierManager(carriers[:20])
+    assert manager.get_all_types("aircraft_type") == AIRCRAFT_TYPES
+    before = manager.get(aircraft_type="hydrogen")
+    for carrier in carriers[20:]:
+        manager.add(carrier)
+    assert list(manager.get(aircraft_type="hydrogen")) == _legacy_get(
+        carriers, aircraft_type="hydrogen"
+    )
+    assert len(manager.get(aircraft_type="hydrogen")) > len(before)
+    assert manager.get_all() == tuple(carriers)
+
+
+def test_indexed_queries_on_large_pathway_set(record_property):
+    carriers = _synthetic_pathways(5000)
+    manager = EnergyCarrierManager(carriers)
+    # Typical compute-loop pattern: the same few queries at every evaluation
+    queries = QUERIES[1:10] * 20
+
+    start = time.perf_counter()
+    expected = [_legacy_get(carriers, **criteria) for criteria in queries]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matches = [manager.get(**criteria) for criteria in queries]
+    indexed_time = time.perf_counter() - start
+
+    assert [list(match) for match in matches] == expected
+    # Timings are reported, not asserted, as they depend on the load of the machine
+    record_property("scan_time", scan_time)
+    record_property("indexed_time", indexed_time)
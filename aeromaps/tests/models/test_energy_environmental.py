@@ -0,0 +1,207 @@
+"""Environmental models of the generic energy carriers (``BottomUpEnvironmental`` and ``TopDownEnvironmental``)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aeromaps import create_process
+from aeromaps.models.impacts.generic_energy_model.bottom_up.environmental import (
+    BottomUpEnvironmental,
+)
+from aeromaps.models.impacts.generic_energy_model.top_down.environmental import (
+    TopDownEnvironmental,
+)
+from aeromaps.tests.models.helpers import (
+    CARBON_PRICE,
+    CONFIG_DIR,
+    PARAMETERS,
+    PROSPECTIVE_YEARS,
+    SOCIAL_DISCOUNT_RATE,
+    YEARS,
+    lifespan_sums,
+)
+
+# Emission factors in 2030 and 2050 and total emissions in 2050 of the default energy carriers
+DEFAULT_ENERGY_CARRIERS = {
+    "hefa_fog": (20.7, 20.7, 679521690691.3573),
+    "hefa_others": (61.0, 61.0, 10870471214786.52),
+    "ft_msw": (27.6, 27.6, 9578020021173.42),
+    "ft_others": (7.7, 7.7, 27551814251075.184),
+    "atj": (52.2, 52.2, 28886002801811.492),
+    "electrofuel": (128.76, 19.256, 90302758288148.9),
+    "fossil_kerosene": (88.7, 88.7, 356542880593454.2),
+    "hydrogen_electrolysis": (107.67, 16.102, 0.0),
+    "hydrogen_gas": (113.875, 102.075, 0.0),
+    "hydrogen_gas_ccs": (113.875, 102.075, 0.0),
+    "hydrogen_coal": (205.475, 193.675, 0.0),
+    "hydrogen_coal_ccs": (205.475, 193.675, 0.0),
+    "battery_electric": (55.5, 8.3, 0.0),
+}
+
+
+def test_default_energy_carriers_emissions_are_unchanged():
+    process = create_process(configuration_file=CONFIG_DIR / "config_basic_full.yaml")
+    process.compute()
+    df = process.data["vector_outputs"]
+
+    for pathway, (factor_2030, factor_2050, emissions_2050) in DEFAULT_ENERGY_CARRIERS.items():
+        assert df.loc[2030, f"{pathway}_mean_co2_emission_factor"] == pytest.approx(
+            factor_2030, rel=1e-12
+        )
+        assert df.loc[2050, f"{pathway}_mean_co2_emission_factor"] == pytest.approx(
+            factor_2050, rel=1e-12
+        )
+        assert df.loc[2050, f"{pathway}_total_co2_emissions"] == pytest.approx(
+            emissions_2050, rel=1e-12
+        )
+
+
+def test_bottom_up_vintages():
+    configuration_data = {
+        "name": "demo",
+        "abatement_cost": True,
+        "inputs": {
+            "technical": {
+                "demo_resource_names": ["biomass"],
+                "demo_eis_plant_lifespan": 20,
+                "demo_eis_resource_specific_consumption_biomass": 2.0,
+                "demo_eis_kerosene_selectivity": 0.5,
+            },
+            "environmental": {"demo_eis_co2_emission_factor_without_resource": 10.0},
+        },
+    }
+    resources_data = {"biomass": {"specifications": {"biomass_co2_emission_factor": 1.0}}}
+    model = BottomUpEnvironmental(
+        "demo_bottom_up_unit_environmental",
+        configuration_data,
+        resources_data,
+        {},
+        parameters=PARAMETERS,
+    )
+
+    # Two plants of 100 commissioned in 2030 and 2040, operating 20 years
+    commissioned = pd.Series(0.0, index=YEARS)
+    commissioned.loc[[2030, 2040]] = 100.0
+    production = pd.Series(0.0, index=YEARS)
+    production.loc[2030:] = 100.0
+    production.loc[2040:2049] = 200.0
+    resource_emission_factor = pd.Series(1.0, index=PROSPECTIVE_YEARS)
+    resource_emission_factor.loc[2045:] = 0.5
+    input_data = {
+        **model.input_names,
+        "demo_energy_production_commissioned": commissioned,
+        "demo_energy_consumption": production,
+        "demo_energy_unused": pd.Series(0.0, index=YEARS),
+        "biomass_co2_emission_factor": resource_emission_factor,
+        "exogenous_carbon_price_trajectory": CARBON_PRICE,
+        "social_discount_rate": SOCIAL_DISCOUNT_RATE,
+    }
+    with pytest.warns(UserWarning, match="no plants commissioned"):
+        outputs = model.compute(input_data)
+
+    mean_factor = outputs["demo_mean_co2_emission_factor"]
+    assert mean_factor.loc[:2029].isna().all()
+    np.testing.assert_allclose(mean_factor.loc[2030:2044], 12.0, rtol=1e-15)
+    np.testing.assert_allclose(mean_factor.loc[2045:], 11.0, rtol=1e-15)
+    np.testing.assert_allclose(
+        outputs["demo_excluding_processes_biomass_mean_co2_emission_factor"].loc[2045:], 1.0
+    )
+    assert outputs["demo_vintage_eis_co2_emission_factor"][[2030, 2040]].tolist() == [12.0, 12.0]
+    consumption = outputs["demo_biomass_total_consumption"]
+    assert consumption.loc[2030:2039].eq(200.0).all()
+    assert consumption.loc[2040:2049].eq(400.0).all()
+    assert consumption[2050] == 200.0
+    # The pathway itself is the only source of biomass consumption
+    pd.testing.assert_series_equal(
+        outputs["demo_excluding_processes_biomass_total_consumption"], consumption
+    )
+    pd.testing.assert_series_equal(
+        outputs["demo_excluding_processes_biomass_total_mobilised_with_selectivity"],
+        0.5 * consumption,
+    )
+    pd.testing.assert_series_equal(
+        outputs["demo_biomass_total_mobilised_with_selectivity"], 0.5 * consumption
+    )
+    np.testing.assert_allclose(
+        outputs["demo_total_co2_emissions"].loc[2040:],
+        production.loc[2040:] * mean_factor.loc[2040:],
+    )
+
+    # Emission factors beyond the scenario end year are kept at their end year value
+    vintage_factor = 10.0 + 2.0 * resource_emission_factor
+    for year in (2030, 2040):
+        cumul_em, _, discounted_cumul_em = lifespan_sums(vintage_factor, year, 20)
+        assert outputs["demo_lifespan_unitary_emissions"][year] == pytest.approx(
+            cumul_em, rel=1e-12
+        )
+        assert outputs["demo_lifespan_discounted_unitary_emissions"][year] == pytest.approx(
+            discounted_cumul_em, rel=1e-12
+        )
+    assert outputs["demo_lifespan_unitary_emissions"][2030] == pytest.approx(15 * 12.0 + 5 * 11.0)
+    assert outputs["demo_lifespan_unitary_emissions"].drop([2030, 2040]).isna().all()
+
+
+def test_top_down_emission_factor_and_lifespan_emissions():
+    configuration_data = {
+        "name": "demo",
+        "abatement_cost": True,
+        "inputs": {
+            "technical": {
+                "demo_resource_names": ["electricity"],
+                "demo_processes_names": ["compression"],
+                "demo_resource_specific_consumption_electricity": 1.5,
+            },
+        },
+    }
+    processes_data = {
+        "compression": {
+            "inputs": {
+                "technical": {"compression_resource_names": ["electricity"]},
+                "economics": {},
+            }
+        }
+    }
+    resources_data = {"electricity": {"specifications": {"electricity_co2_emission_factor": 0.0}}}
+    model = TopDownEnvironmental(
+        "demo_top_down_unit_environmental",
+        configuration_data,
+        resources_data,
+        processes_data,
+        parameters=PARAMETERS,
+    )
+
+    electricity_emission_factor = pd.Series(np.linspace(100.0, 20.0, 31), index=PROSPECTIVE_YEARS)
+    input_data = {
+        **model.input_names,
+        "demo_mean_co2_emission_factor_without_resource": pd.Series(5.0, index=YEARS),
+        "demo_energy_consumption": pd.Series(10.0, index=YEARS),
+        "compression_resource_specific_consumption_electricity": 0.1,
+        "compression_co2_emission_factor_without_resource": pd.Series(2.0, index=YEARS),
+        "electricity_co2_emission_factor": electricity_emission_factor,
+        "exogenous_carbon_price_trajectory": CARBON_PRICE,
+        "social_discount_rate": SOCIAL_DISCOUNT_RATE,
+    }
+    outputs = model.compute(input_data)
+
+    # Resource terms are only defined over the prospective years: the base factor remains before
+    emission_factor = outputs["demo_mean_co2_emission_factor"]
+    pd.testing.assert_index_equal(emission_factor.index, YEARS, exact=False)
+    np.testing.assert_allclose(emission_factor.loc[:2019], 7.0)
+    np.testing.assert_allclose(
+        emission_factor.loc[2020:], 7.0 + 1.6 * electricity_emission_factor, rtol=1e-15
+    )
+    np.testing.assert_allclose(
+        outputs["demo_compression_electricity_mean_co2_emission_factor"],
+        0.1 * electricity_emission_factor,
+    )
+    np.testing.assert_allclose(outputs["demo_electricity_total_consumption"].loc[2020:], 16.0)
+
+    for year in (2000, 2020, 2035, 2050):
+        constant_factor = pd.Series(emission_factor[year], index=YEARS)
+        cumul_em, _, discounted_cumul_em = lifespan_sums(constant_factor, year, 25)
+        assert outputs["demo_lifespan_unitary_emissions"][year] == pytest.approx(
+            cumul_em, rel=1e-12
+        )
+        assert outputs["demo_lifespan_discounted_unitary_emissions"][year] == pytest.approx(
+            discounted_cumul_em, rel=1e-12
+        )
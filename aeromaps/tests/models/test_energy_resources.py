@@ -0,0 +1,125 @@
+"""Resource and origin accounting of ``EnergyResourcesConsumption`` on hand-checkable consumptions."""
+
+import numpy as np
+import pandas as pd
+
+from aeromaps.models.impacts.energy_resources.energy_resources import EnergyResourcesConsumption
+from aeromaps.models.impacts.generic_energy_model.common.energy_carriers_manager import (
+    EnergyCarrierManager,
+    EnergyCarrierMetadata,
+)
+from aeromaps.tests.models.helpers import PARAMETERS, PROSPECTIVE_YEARS, YEARS
+
+RESOURCES_DATA = {
+    "biomass": {
+        "name": "biomass",
+        "origin": "renewable",
+        "specifications": {
+            "biomass_availability_global": 100.0,
+            "biomass_availability_aviation_allocated_share": 50.0,
+        },
+    },
+    "electricity": {
+        "name": "electricity",
+        "origin": "renewable",
+        "specifications": {
+            "electricity_availability_global": 80.0,
+            "electricity_availability_aviation_allocated_share": 50.0,
+        },
+    },
+    "water": {"name": "water", "specifications": {}},
+}
+
+
+def _model():
+    pathways = EnergyCarrierManager(
+        [
+            EnergyCarrierMetadata("hefa", "dropin_fuel", resources_used=["biomass"]),
+            EnergyCarrierMetadata(
+                "atj",
+                "dropin_fuel",
+                resources_used=["biomass"],
+                resources_used_processes={"drying": "electricity"},
+            ),
+            # Used directly and through a process: counted twice
+            EnergyCarrierMetadata(
+                "efuel",
+                "dropin_fuel",
+                resources_used=["electricity"],
+                resources_used_processes={"electrolysis": "electricity"},
+            ),
+        ]
+    )
+    return EnergyResourcesConsumption(
+        "energy_resources_consumption", RESOURCES_DATA, pathways, parameters=PARAMETERS
+    )
+
+
+def _inputs():
+    consumptions = {
+        "hefa_biomass": pd.Series(np.where(YEARS < 2020, np.nan, 10.0), index=YEARS),
+        "atj_biomass": pd.Series(5.0, index=PROSPECTIVE_YEARS),
+        "atj_electricity": pd.Series(2.0, index=PROSPECTIVE_YEARS),
+        "efuel_electricity": pd.Series(3.0, index=PROSPECTIVE_YEARS),
+    }
+    input_data = {
+        "biomass_availability_global": 100.0,
+        "biomass_availability_aviation_allocated_share": 50.0,
+        "electricity_availability_global": pd.Series(80.0, index=PROSPECTIVE_YEARS),
+        "electricity_availability_aviation_allocated_share": 50.0,
+    }
+    for prefix, consumption in consumptions.items():
+        input_data[f"{prefix}_total_consumption"] = consumption
+        input_data[f"{prefix}_total_mobilised_with_selectivity"] = 2 * consumption
+    return input_data
+
+
+def test_resource_totals_and_shares():
+    model = _model()
+    assert set(model.input_names) == set(_inputs())
+    outputs = model.compute(_inputs())
+
+    # Totals keep the union of the indexes of the consumptions
+    biomass = outputs["biomass_total_consumption"]
+    pd.testing.assert_index_equal(biomass.index, YEARS, exact=False)
+    assert biomass.loc[:2019].isna().all()
+    assert biomass.loc[2020:].eq(15.0).all()
+    assert outputs["biomass_total_necessary_with_selectivity"].loc[2020:].eq(30.0).all()
+    electricity = outputs["electricity_total_consumption"]
+    pd.testing.assert_index_equal(electricity.index, PROSPECTIVE_YEARS, exact=False)
+    assert electricity.eq(8.0).all()
+    # Unused resources are zero over the prospective years
+    assert outputs["water_total_consumption"].eq(0.0).all()
+    assert "water_consumed_global_share" not in outputs
+
+    assert outputs["biomass_consumed_global_share"].loc[2020:].eq(15.0).all()
+    assert outputs["biomass_necessary_global_share_with_selectivity"].loc[2020:].eq(30.0).all()
+    assert outputs["biomass_consumed_aviation_allocated_share"].loc[2020:].eq(30.0).all()
+    assert outputs["electricity_consumed_global_share"].eq(10.0).all()
+    assert outputs["electricity_consumed_aviation_allocated_share"].eq(20.0).all()
+
+
+def test_origin_totals_and_shares():
+    outputs = _model().compute(_inputs())
+
+    consumption = outputs["renewable_total_consumption"]
+    pd.testing.assert_index_equal(consumption.index, YEARS, exact=False)
+    assert consumption.loc[:2019].isna().all()
+    assert consumption.loc[2020:].eq(23.0).all()
+    assert outputs["renewable_total_necessary_with_selectivity"].loc[2020:].eq(46.0).all()
+
+    # Availabilities are only defined over the prospective years
+    availability = outputs["renewable_availability_global"]
+    pd.testing.assert_index_equal(availability.index, PROSPECTIVE_YEARS, exact=False)
+    assert availability.eq(180.0).all()
+    assert outputs["renewable_availability_aviation_allocated"].eq(90.0).all()
+    assert outputs["renewable_overall_aviation_allocated_share"].eq(50.0).all()
+
+    share = outputs["renewable_consumed_global_share"]
+    pd.testing.assert_index_equal(share.index, YEARS, exact=False)
+    assert share.loc[:2019].isna().all()
+    np.testing.assert_allclose(share.loc[2020:], 23.0 / 180.0 * 100)
+    np.testing.assert_allclose(
+        outputs["renewable_consumed_aviation_allocated_share"].loc[2020:], 23.0 / 90.0 * 100
+    )
+    assert "unknown_total_consumption" not in outputs
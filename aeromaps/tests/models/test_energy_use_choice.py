@@ -0,0 +1,83 @@
+"""Priority-fill allocation of ``EnergyUseChoice`` on hand-checkable mandates."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aeromaps.models.impacts.generic_energy_model.common.energy_carriers_manager import (
+    EnergyCarrierManager,
+    EnergyCarrierMetadata,
+)
+from aeromaps.models.impacts.generic_energy_model.common.energy_use_choice import (
+    EnergyUseChoice,
+)
+from aeromaps.tests.models.helpers import PARAMETERS, PROSPECTIVE_YEARS, YEARS
+
+
+def _model():
+    pathways = EnergyCarrierManager(
+        [
+            EnergyCarrierMetadata("kerosene", "dropin_fuel", True, None, "fossil"),
+            EnergyCarrierMetadata("hefa", "dropin_fuel", False, "share", "biomass"),
+            EnergyCarrierMetadata("atj", "dropin_fuel", False, "share", "biomass"),
+            EnergyCarrierMetadata("efuel", "dropin_fuel", False, "quantity", "electricity"),
+            EnergyCarrierMetadata("h2_gas", "hydrogen", True, None, "fossil"),
+            EnergyCarrierMetadata("h2_electrolysis", "hydrogen", False, "share", "electricity"),
+        ]
+    )
+    return EnergyUseChoice("test_energy_use_choice", {}, pathways, parameters=PARAMETERS)
+
+
+def _inputs(efuel_quantity, hefa_share, atj_share):
+    dropin_fuel = pd.Series(100.0, index=YEARS)
+    return {
+        "efuel_mandate_quantity": pd.Series(efuel_quantity, index=PROSPECTIVE_YEARS),
+        "hefa_mandate_share": pd.Series(hefa_share, index=PROSPECTIVE_YEARS),
+        "atj_mandate_share": pd.Series(atj_share, index=PROSPECTIVE_YEARS),
+        "h2_electrolysis_mandate_share": pd.Series(50.0, index=PROSPECTIVE_YEARS),
+        "energy_consumption_dropin_fuel": dropin_fuel,
+        "energy_consumption_hydrogen": pd.Series(0.0, index=YEARS),
+        "energy_consumption_electric": pd.Series(0.0, index=YEARS),
+        "energy_consumption": dropin_fuel,
+    }
+
+
+def test_mandates_within_consumption_are_kept():
+    outputs = _model().compute(_inputs(20.0, 30.0, 10.0))
+
+    # Quantity mandates are passed through on their own years
+    pd.testing.assert_index_equal(
+        outputs["efuel_energy_consumption"].index, PROSPECTIVE_YEARS, exact=False
+    )
+    assert outputs["efuel_energy_consumption"].eq(20.0).all()
+    assert outputs["hefa_energy_consumption"].loc[2020:].eq(30.0).all()
+    assert outputs["hefa_energy_consumption"].loc[:2019].isna().all()
+    kerosene = outputs["kerosene_energy_consumption"]
+    assert kerosene.loc[:2019].eq(100.0).all()
+    assert kerosene.loc[2020:].eq(40.0).all()
+
+    assert outputs["biomass_share_total_energy"].loc[2020:].eq(40.0).all()
+    assert outputs["hefa_share_biomass"].loc[2020:].eq(75.0).all()
+    assert outputs["dropin_fuel_biomass_energy_consumption"].loc[2020:].eq(40.0).all()
+    # No hydrogen consumption: all hydrogen pathways are zero over the scenario years
+    assert outputs["h2_electrolysis_energy_consumption"].eq(0.0).all()
+    assert outputs["h2_electrolysis_share_hydrogen"].isna().all()
+
+
+def test_exceeding_mandates_are_scaled_in_priority_order():
+    with pytest.warns(UserWarning) as record:
+        outputs = _model().compute(_inputs(80.0, 30.0, 10.0))
+
+    # Quantities fit, shares are scaled homogeneously to the remaining 20
+    assert outputs["efuel_energy_consumption"].eq(80.0).all()
+    np.testing.assert_allclose(outputs["hefa_energy_consumption"].loc[2020:], 15.0)
+    np.testing.assert_allclose(outputs["atj_energy_consumption"].loc[2020:], 5.0)
+    np.testing.assert_allclose(outputs["kerosene_energy_consumption"].loc[2020:], 0.0, atol=1e-12)
+    assert outputs["hefa_energy_consumption"].loc[:2019].eq(0.0).all()
+    assert [str(warning.message).count("% instead of") for warning in record] == [31, 31]
+
+    with pytest.warns(UserWarning) as record:
+        outputs = _model().compute(_inputs(150.0, 30.0, 10.0))
+    assert "quantity-defined dropin_fuel" in str(record[0].message)
+    np.testing.assert_allclose(outputs["efuel_energy_consumption"].loc[2020:], 100.0)
+    assert outputs["hefa_energy_consumption"].loc[2020:].eq(0.0).all()
@@ -0,0 +1,69 @@
+"""Lifespan abatement costs of aircraft vintages (``_lifespan_abatement_costs``)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aeromaps.models.impacts.costs.efficiency_abatement_cost.fleet_abatement_cost import (
+    _lifespan_abatement_costs,
+)
+from aeromaps.tests.models.helpers import (
+    CARBON_PRICE,
+    PARAMETERS,
+    PROSPECTIVE_YEARS,
+    SOCIAL_DISCOUNT_RATE,
+    YEARS,
+    lifespan_sums,
+)
+
+REFERENCE_MFSP = pd.Series(np.linspace(0.02, 0.035, len(YEARS)), index=YEARS)
+REFERENCE_EMISSION_FACTOR = pd.Series(np.linspace(89.0, 60.0, len(YEARS)), index=YEARS)
+
+
+def _specific_costs(year, aircraft_life, extra_cost_non_fuel, extra_cost_fuel, emissions):
+    """Specific and generic specific abatement costs of a vintage, from the yearly sums."""
+    costs = extra_cost_non_fuel + extra_cost_fuel * REFERENCE_MFSP / REFERENCE_MFSP[year]
+    vintage_emissions = emissions * REFERENCE_EMISSION_FACTOR / REFERENCE_EMISSION_FACTOR[year]
+    _, discounted_cumul_cost, _ = lifespan_sums(costs, year, aircraft_life)
+    cumul_em, _, generic_discounted_cumul_em = lifespan_sums(vintage_emissions, year, aircraft_life)
+    return (
+        discounted_cumul_cost / cumul_em,
+        discounted_cumul_cost / generic_discounted_cumul_em,
+    )
+
+
+def test_lifespan_abatement_costs_match_yearly_sums():
+    # Two aircraft with different lives: vintages after 2025 operate beyond the end year
+    aircraft_lives = [25, 30]
+    extra_cost_non_fuel = np.array([[0.001], [-0.002]]) * np.ones(len(PROSPECTIVE_YEARS))
+    energy_delta = np.array([[-0.1], [-0.3]]) * np.linspace(1.0, 1.5, len(PROSPECTIVE_YEARS))
+    prices = REFERENCE_MFSP.loc[2020:].to_numpy()
+    factors = REFERENCE_EMISSION_FACTOR.loc[2020:].to_numpy()
+    extra_cost_fuel = energy_delta * prices
+    emissions = -energy_delta * factors / 1000000
+
+    specific_cost, generic_specific_cost = _lifespan_abatement_costs(
+        extra_cost_non_fuel,
+        extra_cost_fuel,
+        emissions,
+        REFERENCE_MFSP,
+        REFERENCE_EMISSION_FACTOR,
+        CARBON_PRICE,
+        SOCIAL_DISCOUNT_RATE,
+        aircraft_lives,
+        PROSPECTIVE_YEARS,
+        PARAMETERS.end_year,
+    )
+
+    assert specific_cost.shape == generic_specific_cost.shape == (2, len(PROSPECTIVE_YEARS))
+    for i, aircraft_life in enumerate(aircraft_lives):
+        for j, year in enumerate(PROSPECTIVE_YEARS):
+            expected = _specific_costs(
+                year,
+                aircraft_life,
+                extra_cost_non_fuel[i, j],
+                extra_cost_fuel[i, j],
+                emissions[i, j],
+            )
+            assert specific_cost[i, j] == pytest.approx(expected[0], rel=1e-12)
+            assert generic_specific_cost[i, j] == pytest.approx(expected[1], rel=1e-12)
@@ -0,0 +1,81 @@
+"""Numerical kernels of the push fleet engine (``fleet_model_push_calculations``).
+
+The delivery-profile integrals are evaluated in closed form; these tests pin them
+against adaptive quadrature, including the γ → 0 limit where the analytic
+antiderivatives cancel. The retirement-exponent solver is checked for convergence
+from cold, warm and undershooting starts.
+"""
+
+import numpy as np
+import pytest
+from scipy import integrate
+
+from aeromaps.models.air_transport.aircraft_fleet_and_operations.fleet_push.fleet_model_push_calculations import (
+    fleet_content,
+    i1,
+    i2,
+    i_d,
+    solve_deliv,
+)
+
+GAMMAS = [-10.0, -2.0, -1.0, -1e-7, 0.0, 1e-9, 0.3, 1.0, 4.0, 10.0]
+DURATIONS = [1.0, 5.0, 12.0, 30.0]
+
+
+def _quad(f, a, b):
+    return integrate.quad(f, a, b, epsabs=0.0, epsrel=1e-13)[0]
+
+
+@pytest.mark.parametrize("gamma", GAMMAS)
+@pytest.mark.parametrize("m", DURATIONS)
+def test_profile_integrals_match_quadrature(gamma, m):
+    ref_1 = _quad(lambda t: t * (m - t) * np.exp(gamma * t), 0, m)
+    ref_2 = _quad(lambda t: t**2 * (m - t) * np.exp(gamma * t), 0, m)
+    assert i1(gamma, m) == pytest.approx(ref_1, rel=1e-11)
+    assert i2(gamma, m) == pytest.approx(ref_2, rel=1e-11)
+
+
+@pytest.mark.parametrize("gamma", GAMMAS)
+def test_yearly_slices_are_vectorised_and_sum_to_total(gamma):
+    m = 12.0
+    t = np.arange(int(m))
+    slices = i_d(gamma, m, t, t + 1)
+    ref = [_quad(lambda s: s * (m - s) * np.exp(gamma * s), a, a + 1) for a in t]
+    assert slices.shape == t.shape
+    np.testing.assert_allclose(slices, ref, rtol=1e-10, atol=1e-12 * np.max(np.abs(ref)))
+    assert slices.sum() == pytest.approx(i1(gamma, m), rel=1e-11)
+
+
+def test_solve_deliv_matches_mean_delivery_time_and_is_cached():
+    solve_deliv.cache_clear()
+    mu, gamma = solve_deliv(4.0, 10)
+    assert mu * i1(gamma, 10) == pytest.approx(1.0)
+    assert i2(gamma, 10) / i1(gamma, 10) == pytest.approx(4.0)
+    assert solve_deliv(4.0, 10) == (mu, gamma)
+    assert solve_deliv.cache_info().hits == 1
+
+
+def _retirement_problem(seed=0):
+    rng = np.random.default_rng(seed)
+    fleet_obs_t = rng.uniform(0.0, 1e9, size=(72, 30))
+    retirement_coeffs = rng.uniform(-1.0, 6.0, size=(72, 30))
+    return fleet_obs_t, retirement_coeffs
+
+
+@pytest.mark.parametrize("x_start", [1.0, 0.5, 1e-12, 1e3])
+def test_fleet_content_meets_constraint(x_start):
+    fleet_obs_t, retirement_coeffs = _retirement_problem()
+    constraint = 0.4 * fleet_obs_t.sum()
+    fleets, x = fleet_content(x_start, fleet_obs_t, retirement_coeffs, constraint, epsilon=1e-10)
+    assert fleets.sum() == pytest.approx(constraint, rel=1e-10)
+    np.testing.assert_allclose(fleets, x ** np.exp(-retirement_coeffs) * fleet_obs_t, rtol=1e-9)
+
+
+def test_fleet_content_expands_bracket_above_start():
+    # Constraint above the fleet sum at x_start = 1: the exponent must grow past 1
+    # ("temporary aircraft parking").
+    fleet_obs_t, retirement_coeffs = _retirement_problem(1)
+    constraint = 1.5 * fleet_obs_t.sum()
+    fleets, x = fleet_content(1.0, fleet_obs_t, retirement_coeffs, constraint, epsilon=1e-8)
+    assert x > 1.0
+    assert fleets.sum() == pytest.approx(constraint, rel=1e-8)
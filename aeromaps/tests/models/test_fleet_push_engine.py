@@ -0,0 +1,146 @@
+"""Push fleet engine run through a real process (tutorial 14 scenario).
+
+Checks that the execution options of :class:`PassengerAircraftEfficiencyFleetPush`
+do not change its results, and that the array kernels of :func:`market_process` match
+the baseline per-period loop and recursive retirement solver.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aeromaps import create_process
+from aeromaps.models.air_transport.aircraft_fleet_and_operations.fleet_push import (
+    fleet_model_push,
+)
+
+PUSH_CONFIG = (
+    Path(__file__).parents[2]
+    / "notebooks"
+    / "tutorials"
+    / "14_push_fleet_model"
+    / "data"
+    / "config_push_2025.yaml"
+)
+
+
+def _push_outputs(proc):
+    model = proc.push_fleet_model
+    return pd.DataFrame({name: model.df[name] for name in model.output_names})
+
+
+@pytest.fixture(scope="module")
+def sequential_process():
+    proc = create_process(configuration_file=str(PUSH_CONFIG))
+    proc.compute()
+    return proc
+
+
+def test_parallel_segments_match_sequential(sequential_process):
+    proc = create_process(configuration_file=str(PUSH_CONFIG))
+    assert proc.push_fleet_model.parallel is False
+    proc.push_fleet_model.parallel = True
+    proc.push_fleet_model.max_workers = 2
+    proc.compute()
+
+    pd.testing.assert_frame_equal(_push_outputs(proc), _push_outputs(sequential_process))
+    assert list(proc.push_fleet_model._engine_results) == list(
+        sequential_process.push_fleet_model._engine_results
+    )
+
+
+def _baseline_fleet_content(a, b, fleet_obs_t, retirement_coeffs, constraint, epsilon, first=False):
+    """Recursive bisection retirement solver, as before the iterative solver."""
+    if first:
+        fleets_b = b ** (np.exp(-retirement_coeffs)) * fleet_obs_t
+        if fleets_b.sum().sum() < constraint:
+            return _baseline_fleet_content(
+                b, b * 2, fleet_obs_t, retirement_coeffs, constraint, epsilon, first=True
+            )
+
+    fleets = ((a + b) / 2) ** (np.exp(-retirement_coeffs)) * fleet_obs_t
+    e = (fleets.sum().sum() - constraint) / constraint
+    if np.abs(e) < epsilon:
+        return fleets, (a + b) / 2
+    elif e > 0:
+        return _baseline_fleet_content(
+            a, (a + b) / 2, fleet_obs_t, retirement_coeffs, constraint, epsilon
+        )
+    else:
+        return _baseline_fleet_content(
+            (a + b) / 2, b, fleet_obs_t, retirement_coeffs, constraint, epsilon
+        )
+
+
+def _baseline_fleet_composition(
+    fleet_delivered_activity_type_y,
+    ret_year_delay_type_y,
+    period_utilisation_array,
+    age_utilisation_array,
+    kms_array,
+    yearly_traffic,
+    modeled_periods,
+):
+    """Per-period copy/zero/rescale loop that ``_fleet_composition`` replaced."""
+    aircraft_seats_volumes = []
+    ask_volumes = []
+    x_eq = 1
+    for t in range(modeled_periods):
+        fleet_delivered_activity_type_y_t = fleet_delivered_activity_type_y.copy()
+        fleet_delivered_activity_type_y_t[-modeled_periods + t :, :] = 0
+        fleet_delivered_activity_type_y_t = (
+            fleet_delivered_activity_type_y_t * period_utilisation_array[t]
+        )
+        ask_volumes_type_y_t, x_eq = _baseline_fleet_content(
+            0,
+            x_eq,
+            fleet_delivered_activity_type_y_t,
+            ret_year_delay_type_y,
+            yearly_traffic[t],
+            epsilon=1e-6,
+            first=True,
+        )
+        if x_eq < 1e-30:
+            x_eq = x_eq ** (1 / 8)
+            ret_year_delay_type_y = ret_year_delay_type_y - 3 * np.log(2)
+        aircraft_seats_volumes.append(
+            ask_volumes_type_y_t
+            / period_utilisation_array[t]
+            / age_utilisation_array[:, None]
+            / kms_array[None, :]
+        )
+        ask_volumes.append(ask_volumes_type_y_t)
+    return np.array(ask_volumes), np.array(aircraft_seats_volumes)
+
+
+def test_fleet_composition_kernel_matches_baseline_loop(sequential_process, monkeypatch):
+    calls = []
+    kernel = fleet_model_push._fleet_composition
+
+    def spy(*args):
+        result = kernel(*args)
+        calls.append((args, result))
+        return result
+
+    monkeypatch.setattr(fleet_model_push, "_fleet_composition", spy)
+    # Re-run the scenario so the kernel sees the default push inputs and the
+    # AeroMAPS-injected ASK of every segment.
+    sequential_process.compute()
+    model = sequential_process.push_fleet_model
+
+    assert len(calls) == len(model._engine_inputs)
+    for args, (ask_volumes, aircraft_seats_volumes) in calls:
+        baseline_ask, baseline_seats = _baseline_fleet_composition(*args)
+        assert ask_volumes.shape == baseline_ask.shape
+        # Both solvers stop within 1e-6 of the traffic constraint, at different exponents
+        for volumes, baseline_volumes in [
+            (ask_volumes, baseline_ask),
+            (aircraft_seats_volumes, baseline_seats),
+        ]:
+            np.testing.assert_allclose(
+                volumes.sum(axis=(1, 2)), baseline_volumes.sum(axis=(1, 2)), rtol=1e-5
+            )
+            scale = baseline_volumes.max(axis=(1, 2), keepdims=True)
+            assert np.all(np.abs(volumes - baseline_volumes) <= 1e-5 * scale)
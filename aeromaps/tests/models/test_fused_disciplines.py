@@ -0,0 +1,96 @@
+"""Fused disciplines (``models.<group>.fused`` configuration options).
+
+Each fused discipline must publish the same outputs as the models it replaces.
+"""
+
+import numpy as np
+import pytest
+
+from aeromaps import create_process
+from aeromaps.tests.models.helpers import CONFIG_DIR
+
+NON_CO2_EMISSIONS = (
+    "non_co2_emissions",
+    ("models_non_co2_emissions_fused", "non_co2_emissions_fused"),
+    {"NonCO2Emissions", "NOxEmissionIndex", "NOxEmissionIndexComplex"},
+)
+ENERGY_CONSUMPTION = (
+    "energy_consumption",
+    ("models_energy_consumption_fused", "energy_consumption_fused"),
+    {"DropInFuelConsumption", "HydrogenConsumption", "EnergyConsumption"},
+)
+DIRECT_OPERATING_COSTS = (
+    "direct_operating_costs",
+    ("models_direct_operating_costs_fused", "passenger_aircraft_doc_energy_fused"),
+    {
+        "PassengerAircraftDocEnergy",
+        "PassengerAircraftDocEnergyCarbonTax",
+        "PassengerAircraftDocEnergySubsidy",
+        "PassengerAircraftDocEnergyTax",
+        "PassengerAircraftTotalDoc",
+    },
+)
+
+
+@pytest.mark.parametrize(
+    "config_name, option, fused_model_key, replaced_model_names",
+    [
+        ("config_basic.yaml", *NON_CO2_EMISSIONS),
+        # Fleet-based (bottom-up) emission indices
+        ("config_advanced.yaml", *NON_CO2_EMISSIONS),
+        ("config_basic.yaml", *ENERGY_CONSUMPTION),
+        ("config_advanced.yaml", *ENERGY_CONSUMPTION),
+        ("config_basic.yaml", *DIRECT_OPERATING_COSTS),
+        ("config_elasticity_demand.yaml", *DIRECT_OPERATING_COSTS),
+    ],
+)
+def test_fused_discipline_matches_replaced_models(
+    config_name, option, fused_model_key, replaced_model_names, config_variant
+):
+    reference = create_process(configuration_file=CONFIG_DIR / config_name)
+    reference.compute()
+    fused = create_process(
+        configuration_file=config_variant(config_name, **{option: {"fused": True}})
+    )
+    fused.compute()
+
+    group, name = fused_model_key
+    fused_model = fused.models[group][name]
+    model_names = {type(d.model).__name__ for d in fused.disciplines if hasattr(d, "model")}
+    assert type(fused_model).__name__ in model_names
+    assert not replaced_model_names & model_names
+
+    for name in fused_model.output_names:
+        # Emissions are published in the climate outputs
+        outputs = (
+            "vector_outputs" if name in reference.data["vector_outputs"] else "climate_outputs"
+        )
+        expected, actual = reference.data[outputs][name], fused.data[outputs][name]
+        np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=0, err_msg=name)
+
+
+@pytest.mark.parametrize(
+    "emission_index_models, fleet_based_species",
+    [
+        ({"nox_emission_index", "soot_emission_index"}, set()),
+        ({"nox_emission_index_complex", "soot_emission_index"}, {"nox"}),
+        ({"nox_emission_index", "soot_emission_index_complex"}, {"soot"}),
+        ({"nox_emission_index_complex", "soot_emission_index_complex"}, {"nox", "soot"}),
+    ],
+)
+def test_fused_non_co2_emissions_follow_each_replaced_emission_index_model(
+    emission_index_models, fleet_based_species
+):
+    process = create_process(configuration_file=CONFIG_DIR / "config_basic.yaml")
+    models = {
+        "models_emissions": {
+            "emission_indices": {name: None for name in emission_index_models},
+            "non_co2_emissions": None,
+        }
+    }
+
+    fused_models = process._fuse_non_co2_emissions(models)
+
+    assert fused_models["models_emissions"] == {"emission_indices": {}}
+    fused_model = fused_models["models_non_co2_emissions_fused"]["non_co2_emissions_fused"]
+    assert fused_model.fleet_based_species == fleet_based_species
@@ -0,0 +1,55 @@
+"""Spreading of aircraft non-recurring costs over development years (``_spread_non_recurring_costs``)."""
+
+import numpy as np
+import pandas as pd
+
+from aeromaps.models.impacts.costs.manufacturers.non_recurring_costs import (
+    _spread_non_recurring_costs,
+)
+from aeromaps.tests.models.helpers import YEARS
+
+DEVELOPMENT_TIME = 5
+
+
+def _legacy_compute_nrc(nrc_tot_aircraft_type, entry_into_service_year):
+    """Non-recurring costs of an aircraft, development year by development year."""
+    costs = []
+    years = []
+    sigma = DEVELOPMENT_TIME / 6.0
+    for i in range(1, DEVELOPMENT_TIME + 1):
+        years.append(entry_into_service_year - DEVELOPMENT_TIME + i)
+        weight = np.exp(-0.5 * ((i - DEVELOPMENT_TIME / 2) / sigma) ** 2)
+        costs.append(round(nrc_tot_aircraft_type * weight))
+    scaling_factor = nrc_tot_aircraft_type / sum(costs)
+    costs = [round(cost * scaling_factor) for cost in costs]
+    nrc_distributed = pd.Series(costs, index=years, dtype=float)
+    return nrc_distributed[
+        (nrc_distributed.index >= YEARS[0]) & (nrc_distributed.index <= YEARS[-1])
+    ]
+
+
+def test_spread_matches_development_year_loop():
+    # Old aircraft, partially and fully in scope, and one entering after the end year
+    nrc_costs = [1.5e10, 2.0e10, 1.234567e9, 8.0e9, 3.0e10]
+    entry_into_service_years = [1990, 2003, 2035, 2050, 2053]
+
+    costs, development = _spread_non_recurring_costs(
+        nrc_costs, entry_into_service_years, DEVELOPMENT_TIME, YEARS
+    )
+
+    assert costs.shape == development.shape == (5, len(YEARS))
+    for i, (nrc_cost, eis) in enumerate(zip(nrc_costs, entry_into_service_years)):
+        expected = _legacy_compute_nrc(nrc_cost, eis)
+        actual = pd.Series(costs[i, development[i]], index=YEARS[development[i]])
+        pd.testing.assert_series_equal(actual, expected, check_index_type=False)
+        assert np.isnan(costs[i, ~development[i]]).all()
+    assert not development[0].any()
+    assert development[1].sum() == 4
+    assert development[4].sum() == 2
+
+
+def test_zero_nrc_is_spread_as_zeros():
+    costs, development = _spread_non_recurring_costs([0.0], [2030], DEVELOPMENT_TIME, YEARS)
+
+    assert (costs[development] == 0.0).all()
+    assert list(YEARS[development[0]]) == [2026, 2027, 2028, 2029, 2030]
@@ -0,0 +1,102 @@
+"""Welfare accounting of the scenario (surplus and loss models of ``scenario_cost``)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aeromaps.models.impacts.costs.scenario.scenario_cost import (
+    AirlineSurplusLoss,
+    ConsumerSurplusLoss,
+    TaxRevenueLoss,
+    TotalAirlineCost,
+    TotalSurplusLoss,
+    TotalWelfareLoss,
+)
+from aeromaps.tests.models.helpers import PARAMETERS, SOCIAL_DISCOUNT_RATE, YEARS
+
+RPK_NO_ELASTICITY = pd.Series(np.linspace(3.0e12, 9.0e12, len(YEARS)), index=YEARS)
+RPK = RPK_NO_ELASTICITY * np.linspace(1.0, 0.8, len(YEARS))
+TOTAL_COST_PER_RPK = pd.Series(np.linspace(0.08, 0.11, len(YEARS)), index=YEARS)
+AIRFARE_PER_RPK = TOTAL_COST_PER_RPK * 1.05
+TOTAL_EXTRA_TAX_PER_RPK = pd.Series(np.linspace(0.0, 0.02, len(YEARS)), index=YEARS)
+
+
+def _discounted(series):
+    return series / (1 + SOCIAL_DISCOUNT_RATE) ** (series.index - 2020)
+
+
+def _objective(discounted_series):
+    return discounted_series.cumsum()[2050] - discounted_series.cumsum()[2025]
+
+
+def _demand_terms(price_elasticity):
+    """Area and consumer surplus losses under a constant elasticity demand curve."""
+    beta = AIRFARE_PER_RPK[2025] / (RPK_NO_ELASTICITY ** (1 / price_elasticity))
+    if price_elasticity == -1:
+        area_loss = beta * np.log(RPK_NO_ELASTICITY / RPK)
+        return area_loss, area_loss
+    exponent = 1 + 1 / price_elasticity
+    delta = RPK_NO_ELASTICITY**exponent - RPK**exponent
+    return beta * (1 / exponent) * delta, beta * (-1 / (1 + price_elasticity)) * delta
+
+
+@pytest.mark.parametrize("price_elasticity", [-1.0, -0.8])
+def test_welfare_components(price_elasticity):
+    area_loss, delta_consumer_surplus = _demand_terms(price_elasticity)
+    total_airline_surplus = (AIRFARE_PER_RPK - TOTAL_COST_PER_RPK) * RPK
+    delta_airline_surplus = (AIRFARE_PER_RPK[2019] - TOTAL_COST_PER_RPK[2019]) * (
+        RPK_NO_ELASTICITY
+    ) - total_airline_surplus
+    delta_tax_revenue = TOTAL_EXTRA_TAX_PER_RPK[2019] * RPK_NO_ELASTICITY - (
+        TOTAL_EXTRA_TAX_PER_RPK * RPK
+    )
+    total_airline_cost_increase = TOTAL_COST_PER_RPK * RPK - (
+        TOTAL_COST_PER_RPK[2019] * RPK_NO_ELASTICITY
+    )
+
+    airline_cost = TotalAirlineCost(parameters=PARAMETERS).compute(
+        TOTAL_COST_PER_RPK, RPK, RPK_NO_ELASTICITY, SOCIAL_DISCOUNT_RATE
+    )
+    np.testing.assert_allclose(airline_cost[3], total_airline_cost_increase.cumsum(), rtol=1e-12)
+    assert airline_cost[5] == pytest.approx(
+        _objective(_discounted(total_airline_cost_increase)), rel=1e-12
+    )
+
+    surplus_loss = TotalSurplusLoss(parameters=PARAMETERS).compute(
+        RPK,
+        RPK_NO_ELASTICITY,
+        airline_cost[3],
+        airline_cost[4],
+        AIRFARE_PER_RPK,
+        price_elasticity,
+        SOCIAL_DISCOUNT_RATE,
+    )
+    np.testing.assert_allclose(surplus_loss[0], area_loss, rtol=1e-12)
+    assert surplus_loss[3] == pytest.approx(
+        _discounted(area_loss).sum() + _objective(_discounted(total_airline_cost_increase)),
+        rel=1e-12,
+    )
+
+    consumer = ConsumerSurplusLoss(parameters=PARAMETERS).compute(
+        RPK, RPK_NO_ELASTICITY, AIRFARE_PER_RPK, price_elasticity, SOCIAL_DISCOUNT_RATE
+    )
+    airline = AirlineSurplusLoss(parameters=PARAMETERS).compute(
+        TOTAL_COST_PER_RPK, RPK, RPK_NO_ELASTICITY, SOCIAL_DISCOUNT_RATE, AIRFARE_PER_RPK
+    )
+    tax = TaxRevenueLoss(parameters=PARAMETERS).compute(
+        TOTAL_EXTRA_TAX_PER_RPK, RPK, RPK_NO_ELASTICITY, SOCIAL_DISCOUNT_RATE
+    )
+    np.testing.assert_allclose(consumer[0], delta_consumer_surplus, rtol=1e-12)
+    np.testing.assert_allclose(airline[0], delta_airline_surplus, rtol=1e-12)
+    np.testing.assert_allclose(airline[2], total_airline_surplus, rtol=1e-12)
+    np.testing.assert_allclose(tax[1], delta_tax_revenue, rtol=1e-12)
+    assert consumer[2] == pytest.approx(_objective(_discounted(delta_consumer_surplus)), rel=1e-12)
+    assert airline[3] == pytest.approx(_objective(_discounted(delta_airline_surplus)), rel=1e-12)
+    assert tax[3] == pytest.approx(_objective(_discounted(delta_tax_revenue)), rel=1e-12)
+
+    welfare = TotalWelfareLoss(parameters=PARAMETERS).compute(
+        tax[1], consumer[0], airline[0], SOCIAL_DISCOUNT_RATE
+    )
+    total_welfare_loss = delta_consumer_surplus + delta_airline_surplus + delta_tax_revenue
+    np.testing.assert_allclose(welfare[0], total_welfare_loss, rtol=1e-12)
+    assert welfare[3] == pytest.approx(_objective(_discounted(total_welfare_loss)), rel=1e-12)
@@ -0,0 +1,82 @@
+"""MACC levers sorted year by year (``MACCData``)."""
+
+import numpy as np
+
+from aeromaps import create_process
+from aeromaps.plots.single_scenario.macc import MACCData
+from aeromaps.tests.models.helpers import CONFIG_DIR
+
+NAN = np.nan
+
+
+def _macc_data():
+    # Four levers over three years: costs are the same for all metrics
+    abatement_effective = np.array(
+        [
+            [1.0, 2.0, 3.0],
+            [2.0, -1.0, 1.0],
+            [0.5, 0.5, NAN],
+            [-3.0, 4.0, 2.0],
+        ]
+    )
+    cost = np.array(
+        [
+            [100.0, 50.0, NAN],
+            [20.0, 30.0, 40.0],
+            [20.0, 300.0, 10.0],
+            [-50.0, NAN, 5.0],
+        ]
+    )
+    return MACCData(
+        names=["a", "b", "c", "d"],
+        colors=["gold", "khaki", "orange", "yellowgreen"],
+        years=[2019, 2020, 2021],
+        abatement_effective=abatement_effective,
+        costs={"carbon_abatement_cost": cost, "specific_carbon_abatement_cost": -cost},
+    )
+
+
+def test_curve_sorts_levers_by_cost():
+    data = _macc_data()
+
+    names, abatement_effective, costs, colors = data.curve(2019, "carbon_abatement_cost")
+    # Equal costs keep the lever order
+    assert list(names) == ["b", "c", "a"]
+    assert list(abatement_effective) == [2.0, 0.5, 1.0]
+    assert list(costs) == [20.0, 20.0, 100.0]
+    assert list(colors) == ["khaki", "orange", "gold"]
+
+    names, _, costs, _ = data.curve(2019, "specific_carbon_abatement_cost")
+    assert list(names) == ["a", "b", "c"]
+    assert list(costs) == [-100.0, -20.0, -20.0]
+
+
+def test_curve_splits_abatements_and_leaves_out_undefined_values():
+    data = _macc_data()
+
+    names, _, _, _ = data.curve(2019, "carbon_abatement_cost", positive=False)
+    assert list(names) == ["d"]
+
+    # Undefined costs (d in 2020, a in 2021) and abatements (c in 2021) are left out
+    names, _, _, _ = data.curve(2020, "carbon_abatement_cost")
+    assert list(names) == ["a", "c"]
+    names, _, _, _ = data.curve(2020, "carbon_abatement_cost", positive=False)
+    assert list(names) == ["b"]
+    names, _, _, _ = data.curve(2021, "carbon_abatement_cost")
+    assert list(names) == ["d", "b"]
+
+
+def test_from_process_is_rebuilt_after_a_new_computation():
+    process = create_process(configuration_file=CONFIG_DIR / "config_advanced_simplified.yaml")
+    process.compute()
+    data = MACCData.from_process(process, simple=True)
+    assert MACCData.from_process(process, simple=True) is data
+    operations = data.abatement_effective[list(data.names).index("OPS")]
+
+    # The vector outputs are updated in place by the new computation
+    process.parameters.operations_final_gain += 4.0
+    process.compute()
+    new_data = MACCData.from_process(process, simple=True)
+    assert new_data is not data
+    new_operations = new_data.abatement_effective[list(new_data.names).index("OPS")]
+    assert not np.allclose(new_operations, operations, equal_nan=True)
@@ -0,0 +1,222 @@
+"""
+discounting
+===========
+
+Discounting tables shared by the cost and environmental models.
+
+Tables are memoised on their scalar arguments (rate, horizon, lifespan, construction time):
+cost models evaluate the same few discount rates and plant or aircraft lifespans for every
+vintage and every scenario year. The caches are bounded, since an optimiser may sweep the
+discount rates. Returned arrays are read-only as they are shared between callers.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from aeromaps.utils.functions import _values_at_years
+
+# Number of tables kept for each helper
+_CACHE_SIZE = 256
+
+
+def _read_only(array):
+    array.setflags(write=False)
+    return array
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def compound_factors(rate, horizon, start=0):
+    """
+    Compounding factors (1 + rate) ** t for t in range(start, start + horizon).
+
+    Discounting a cost incurred t years after the reference year is a division by the t-th factor.
+
+    Parameters
+    ----------
+    rate
+        Discount rate [-].
+    horizon
+        Number of years.
+    start
+        Offset of the first year from the reference year (can be negative).
+
+    Returns
+    -------
+    np.ndarray
+        Read-only array of compounding factors.
+    """
+    # Scalar powers, computed once per table, give the same values as the (1 + rate) ** t
+    # expressions evaluated in cost loops
+    return _read_only(
+        np.array([(1 + rate) ** t for t in range(start, start + horizon)], dtype=float)
+    )
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def discount_factors(rate, horizon, start=0):
+    """
+    Discount factors 1 / (1 + rate) ** t for t in range(start, start + horizon).
+
+    Parameters
+    ----------
+    rate
+        Discount rate [-].
+    horizon
+        Number of years.
+    start
+        Offset of the first year from the reference year (can be negative).
+
+    Returns
+    -------
+    np.ndarray
+        Read-only array of discount factors.
+    """
+    return _read_only(1 / compound_factors(rate, horizon, start))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def geometric_series_sum(rate, periods, start=0):
+    """
+    Sum of the discount factors 1 / (1 + rate) ** t for t in range(start, start + periods).
+
+    Closed form of the geometric series, ``periods`` can be non-integer.
+
+    Parameters
+    ----------
+    rate
+        Discount rate [-].
+    periods
+        Number of years.
+    start
+        Offset of the first year from the reference year.
+
+    Returns
+    -------
+    float
+        Discounted sum of a unit yearly flow.
+    """
+    if rate == 0:
+        return float(periods)
+    term = 1 / (1 + rate)
+    return term**start * (1 - term**periods) / (1 - term)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def annuity_factor(rate, lifespan):
+    """
+    Constant yearly payment, from the first to the last year of ``lifespan``, whose present value
+    is one (capital recovery factor).
+
+    Parameters
+    ----------
+    rate
+        Discount rate [-].
+    lifespan
+        Number of yearly payments.
+
+    Returns
+    -------
+    float
+        Annuity per unit of present value.
+    """
+    return 1 / geometric_series_sum(rate, lifespan, 1)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def levelised_capital_factor(rate, lifespan, construction_time):
+    """
+    Capital cost per unit of production for a plant of unit capex.
+
+    The capex is spent uniformly over ``construction_time`` years, then the plant produces one
+    unit per year over ``lifespan`` years. The factor is the present value of the capex over the
+    present value of the production, 1 / lifespan without discounting.
+
+    Parameters
+    ----------
+    rate
+        Discount rate [-].
+    lifespan
+        Plant lifespan [years].
+    construction_time
+        Plant construction time [years].
+
+    Returns
+    -------
+    float
+        Levelised capital cost per unit of capex.
+    """
+    if rate == 0:
+        return 1 / lifespan
+    capital_cost_npv = geometric_series_sum(rate, construction_time) / construction_time
+    total_actualised_production = geometric_series_sum(rate, lifespan, construction_time)
+    return capital_cost_npv / total_actualised_production
+
+
+def levelised_capital_factors(rates, lifespans, construction_times):
+    """
+    Array form of `levelised_capital_factor`, e.g. over plant vintages.
+
+    Parameters
+    ----------
+    rates
+        Discount rates [-].
+    lifespans
+        Plant lifespans [years].
+    construction_times
+        Plant construction times [years].
+
+    Returns
+    -------
+    np.ndarray
+        Levelised capital cost per unit of capex.
+    """
+    rates, lifespans, construction_times = np.broadcast_arrays(
+        np.asarray(rates, dtype=float),
+        np.asarray(lifespans, dtype=float),
+        np.asarray(construction_times, dtype=float),
+    )
+    return np.array(
+        [
+            levelised_capital_factor(*args)
+            for args in zip(rates.ravel(), lifespans.ravel(), construction_times.ravel())
+        ]
+    ).reshape(rates.shape)
+
+
+def carbon_value_factors(carbon_price, rate, vintages, horizon, end_year):
+    """
+    Discounted carbon value of a unit emission in each operating year of plant vintages, relative
+    to the carbon price of their commissioning year.
+
+    The factor of an emission ``a`` years after commissioning year ``y`` is
+    p(y + a) / p(y) / (1 + rate) ** a, p being the carbon price. Beyond ``end_year`` the carbon
+    price keeps growing at its last yearly rate.
+
+    Parameters
+    ----------
+    carbon_price
+        Carbon price trajectory, indexed by year [€/tCO2].
+    rate
+        Discount rate [-].
+    vintages
+        Commissioning years.
+    horizon
+        Number of operating years.
+    end_year
+        Last year of the carbon price trajectory.
+
+    Returns
+    -------
+    np.ndarray
+        Vintage × age array of factors, NaN where the carbon price is not defined.
+    """
+    years = np.asarray(vintages)[:, None] + np.arange(horizon)[None, :]
+    last_price, end_price = _values_at_years(carbon_price, [end_year - 1, end_year])
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        price = np.where(
+            years <= end_year,
+            _values_at_years(carbon_price, years),
+            end_price * (end_price / last_price) ** (years - end_year),
+        )
+        return price / price[:, :1] / compound_factors(rate, horizon)
@@ -556,6 +556,110 @@ def _get_value_for_year(value, year, default_return=None):
     return default_return
 
 
+def _get_values_for_years(value, years, default_return=np.nan):
+    """
+    Utility function for generic bottom up model.
+    Array form of `_get_value_for_year` over several years.
+
+    Parameters
+    ----------
+    value
+        The value to retrieve from (can be int, float, or pd.Series).
+    years
+        The years for which to retrieve the value.
+    default_return
+        The default value for years not found in the Series (None is returned as NaN).
+
+    Returns
+    -------
+    result
+        Array of the values for the specified years, filled with the default return value.
+    """
+    years = np.asarray(years)
+    default_return = np.nan if default_return is None else default_return
+    if isinstance(value, (int, float)):
+        return np.full(len(years), value, dtype=float)
+    elif isinstance(value, pd.Series):
+        return np.where(
+            np.isin(years, value.index),
+            value.reindex(years).to_numpy(dtype=float),
+            default_return,
+        )
+    return np.full(len(years), default_return, dtype=float)
+
+
+def _compound_yearly_gains(initial_value, gains):
+    """
+    Compound yearly relative gains onto an initial value.
+
+    Array form of the recurrence ``x[k] = x[k-1] * (1 - gains[k] / 100)`` started from
+    ``x[-1] = initial_value``.
+
+    Parameters
+    ----------
+    initial_value
+        Value of the year preceding the first gain.
+    gains
+        Yearly gains [%].
+
+    Returns
+    -------
+    np.ndarray
+        Compounded values, one per gain.
+    """
+    return initial_value * np.cumprod(1 - np.asarray(gains, dtype=float) / 100)
+
+
+def _incremental_cumsum(values, previous_state=None):
+    """
+    Cumulative sum of a series, re-summing only the suffix that changed since a previous call.
+
+    NaN values are skipped as in ``pd.Series.cumsum``. When ``previous_state`` comes from a
+    call on a series with the same index, the running sum is kept up to the first changed
+    value and only accumulated again from there, with the same summation order as a full
+    cumulative sum.
+
+    Parameters
+    ----------
+    values
+        Series to sum.
+    previous_state
+        State returned by a previous call, or None for a full cumulative sum.
+
+    Returns
+    -------
+    cumulative_values
+        Cumulative sum of values.
+    state
+        State to pass to the next call.
+    """
+    index = values.index
+    array = values.to_numpy(dtype=float)
+    is_nan = np.isnan(array)
+    terms = np.where(is_nan, 0.0, array)
+
+    start = 0
+    if previous_state is not None and previous_state[0].equals(index):
+        _, previous_array, previous_running_sum = previous_state
+        unchanged = (array == previous_array) | (is_nan & np.isnan(previous_array))
+        changed = np.flatnonzero(~unchanged)
+        start = changed[0] if changed.size else len(array)
+
+    if start == 0:
+        running_sum = np.cumsum(terms)
+    else:
+        running_sum = previous_running_sum.copy()
+        if start < len(array):
+            running_sum[start:] = np.cumsum(
+                np.concatenate(([previous_running_sum[start - 1]], terms[start:]))
+            )[1:]
+
+    cumulative_values = pd.Series(
+        np.where(is_nan, np.nan, running_sum), index=index, name=values.name
+    )
+    return cumulative_values, (index, array, running_sum)
+
+
 def _custom_series_addition(s1, s2) -> pd.Series:
     """
     Adds two pandas Series, handling missing indices (NaN) gracefully.
@@ -606,6 +710,107 @@ def _custom_series_addition(s1, s2) -> pd.Series:
     )
 
 
+def _series_on_grid(series, grid):
+    """
+    Values of a Series on a year grid containing its index, and mask of its index years.
+
+    Together with `_series_from_grid`, this lets Series with different indexes be combined as
+    arrays while keeping the indexes pandas operations would give (e.g. the union of the
+    operand indexes for an addition).
+
+    Parameters
+    ----------
+    series
+        Series to place on the grid.
+    grid
+        Year grid, containing the index of the Series.
+
+    Returns
+    -------
+    values
+        Values of the Series, NaN in the grid years outside its index.
+    defined
+        Boolean mask of the grid years in the index of the Series.
+    """
+    if series.index.equals(grid):
+        return series.to_numpy(dtype=float, copy=True), np.ones(len(grid), dtype=bool)
+    return series.reindex(grid).to_numpy(dtype=float), grid.isin(series.index)
+
+
+def _series_from_grid(values, defined, grid) -> pd.Series:
+    """
+    Series of the values on the years of the grid where they are defined.
+
+    Parameters
+    ----------
+    values
+        Values on the grid.
+    defined
+        Boolean mask of the years of the grid to keep in the index.
+    grid
+        Year grid.
+
+    Returns
+    -------
+    pd.Series
+        Series indexed by the defined years.
+    """
+    if defined.all():
+        return pd.Series(values, index=grid)
+    return pd.Series(values[defined], index=grid[defined])
+
+
+def _values_at_years(series, years):
+    """
+    Values of a year-indexed Series at an array of years, NaN outside its index.
+
+    Series indexed by consecutive years, as model outputs are, are read by position in a view
+    of their values rather than reindexed.
+
+    Parameters
+    ----------
+    series
+        Series indexed by year.
+    years
+        Years to read, array of any shape.
+
+    Returns
+    -------
+    np.ndarray
+        Values with the shape of ``years``.
+    """
+    years = np.asarray(years)
+    index = series.index
+    if not (
+        len(index)
+        and pd.api.types.is_integer_dtype(index)
+        and pd.api.types.is_integer_dtype(years)
+        and index.is_monotonic_increasing
+        and index.is_unique
+        and index[-1] - index[0] + 1 == len(index)
+    ):
+        return series.reindex(years.ravel()).to_numpy(dtype=float).reshape(years.shape)
+    values = series.to_numpy(dtype=float)
+    positions = years - index[0]
+    inside = (positions >= 0) & (positions < len(values))
+    return np.where(inside, values[np.clip(positions, 0, len(values) - 1)], np.nan)
+
+
+def _fill_nan(values):
+    """Array equivalent of ``fillna(0)`` (infinite values are kept)."""
+    return np.where(np.isnan(values), 0.0, values)
+
+
+def _nan_add(a, b):
+    """Element-wise sum of two arrays where NaN terms are ignored (NaN if both are NaN)."""
+    return np.where(np.isnan(a), b, np.where(np.isnan(b), a, a + b))
+
+
+def _nan_sum(values):
+    """Column sum of a vintage × year array ignoring NaN terms (NaN for all-NaN columns)."""
+    return np.where(np.isnan(values).all(axis=0), np.nan, np.nansum(values, axis=0))
+
+
 def custom_logger_config(logger):
     """
     Configure logging and docstring parsing for GEMSEO disciplines.